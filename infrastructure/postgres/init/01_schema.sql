@@ -113,6 +113,7 @@ CREATE INDEX idx_tracks_album ON music.tracks(album_id);
 CREATE INDEX idx_tracks_isrc ON music.tracks(isrc);
 CREATE INDEX idx_tracks_bpm ON music.tracks(bpm);
 CREATE INDEX idx_tracks_key ON music.tracks(key);
+CREATE INDEX idx_tracks_updated ON music.tracks(updated_at);
 
 -- Genres table
 CREATE TABLE IF NOT EXISTS music.genres (
@@ -266,31 +267,85 @@ INSERT INTO music.genres (name) VALUES
 ON CONFLICT (name) DO NOTHING;
 
 -- Create materialized view for track search
+-- Rekordbox-synced tracks carry their artist/album in the rekordbox mirror
 CREATE MATERIALIZED VIEW IF NOT EXISTS music.track_search AS
 SELECT 
     t.id,
     t.title,
-    a.name as artist_name,
-    al.title as album_title,
+    COALESCE(a.name, r.artist) as artist_name,
+    COALESCE(al.title, r.album) as album_title,
+    r.genre,
     t.bpm,
     t.key,
     t.energy,
     t.danceability,
+    t.duration_ms,
+    t.file_path,
+    lower(concat_ws(' ', t.title, COALESCE(a.name, r.artist), COALESCE(al.title, r.album))) as search_text,
     to_tsvector('english', 
         COALESCE(t.title, '') || ' ' || 
-        COALESCE(a.name, '') || ' ' || 
-        COALESCE(al.title, '')
+        COALESCE(a.name, r.artist, '') || ' ' || 
+        COALESCE(al.title, r.album, '')
     ) as search_vector
 FROM music.tracks t
 LEFT JOIN music.artists a ON t.artist_id = a.id
-LEFT JOIN music.albums al ON t.album_id = al.id;
+LEFT JOIN music.albums al ON t.album_id = al.id
+LEFT JOIN rekordbox.tracks r ON t.metadata->>'rekordbox_id' = 'rekordbox_' || r.id;
 
+-- REFRESH ... CONCURRENTLY requires a unique index
+CREATE UNIQUE INDEX idx_track_search_id ON music.track_search(id);
 CREATE INDEX idx_track_search_vector ON music.track_search USING gin(search_vector);
+CREATE INDEX idx_track_search_text ON music.track_search USING gin(search_text gin_trgm_ops);
+CREATE INDEX idx_track_search_bpm ON music.track_search(bpm);
+CREATE INDEX idx_track_search_key ON music.track_search(key);
+
+-- Catalog state at the last refresh
+CREATE TABLE IF NOT EXISTS music.search_refresh_state (
+    view_name VARCHAR(100) PRIMARY KEY,
+    watermark TIMESTAMP WITH TIME ZONE,
+    row_count BIGINT,
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
 
 -- Refresh function for materialized view
-CREATE OR REPLACE FUNCTION refresh_track_search()
-RETURNS void AS $$
+-- Skips the rebuild when no catalog row changed since the last refresh;
+-- returns whether the view was refreshed. The old zero-argument void
+-- version is dropped first: next to it, SELECT refresh_track_search()
+-- would be ambiguous (databases created before this change: see
+-- infrastructure/postgres/migrations/001_track_search.sql)
+DROP FUNCTION IF EXISTS refresh_track_search();
+CREATE OR REPLACE FUNCTION refresh_track_search(force BOOLEAN DEFAULT FALSE)
+RETURNS BOOLEAN AS $$
+DECLARE
+    current_watermark TIMESTAMP WITH TIME ZONE;
+    current_rows BIGINT;
 BEGIN
+    SELECT GREATEST(
+            (SELECT max(updated_at) FROM music.tracks),
+            (SELECT max(updated_at) FROM music.artists),
+            (SELECT max(updated_at) FROM music.albums),
+            (SELECT max(last_modified) FROM rekordbox.tracks)::timestamptz
+        ),
+        (SELECT count(*) FROM music.tracks) + (SELECT count(*) FROM rekordbox.tracks)
+    INTO current_watermark, current_rows;
+
+    IF NOT force AND EXISTS (
+        SELECT 1 FROM music.search_refresh_state
+        WHERE view_name = 'track_search'
+        AND watermark IS NOT DISTINCT FROM current_watermark
+        AND row_count = current_rows
+    ) THEN
+        RETURN FALSE;
+    END IF;
+
     REFRESH MATERIALIZED VIEW CONCURRENTLY music.track_search;
+
+    INSERT INTO music.search_refresh_state (view_name, watermark, row_count, refreshed_at)
+    VALUES ('track_search', current_watermark, current_rows, CURRENT_TIMESTAMP)
+    ON CONFLICT (view_name) DO UPDATE SET
+        watermark = EXCLUDED.watermark,
+        row_count = EXCLUDED.row_count,
+        refreshed_at = EXCLUDED.refreshed_at;
+    RETURN TRUE;
 END;
-$$ LANGUAGE plpgsql;
\ No newline at end of file
+$$ LANGUAGE plpgsql;
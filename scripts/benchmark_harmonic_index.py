@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark the harmonic mixing index on a synthetic library.
+
+Generates a library (default 100,000 tracks with Rekordbox-style keys,
+tempos from hip-hop to DnB and some tracks without analysis), builds
+a HarmonicIndex and compares:
+
+- scan: checking every track's key and tempo in Python (what finding
+  compatible tracks took without an index)
+- index: binary searches in the Camelot buckets
+
+Checks that both find the same tracks, that every path transition is
+compatible, and reports build time, memory and per-query latency.
+
+Usage:
+    python scripts/benchmark_harmonic_index.py [--tracks 100000] [--queries 500]
+"""
+
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.rekordbox.harmonic import (
+    DEFAULT_TOLERANCE, HarmonicIndex, camelot_slot, compatible_slots
+)
+
+MUSICAL_KEYS = ["C", "G", "D", "A", "E", "B", "F#", "Db", "Ab", "Eb", "Bb", "F",
+                "Am", "Em", "Bm", "F#m", "C#m", "G#m", "Ebm", "Bbm", "Fm", "Cm", "Gm", "Dm"]
+TEMPO_RANGES = [(118, 130), (125, 140), (160, 178), (85, 100), (100, 118), (140, 160)]
+
+
+def make_tracks(count: int, seed: int = 7) -> list:
+    """Synthetic iter_tracks rows (BPM times 100, like master.db)."""
+    rng = random.Random(seed)
+    tracks = []
+    for i in range(count):
+        low, high = rng.choice(TEMPO_RANGES)
+        analyzed = rng.random() > 0.03
+        tracks.append({
+            "id": str(i + 1),
+            "title": f"Track {i}",
+            "artist": f"Artist {i % 5000}",
+            "bpm": int(rng.uniform(low, high) * 100) if analyzed else 0,
+            "key": rng.choice(MUSICAL_KEYS) if analyzed else None,
+        })
+    return tracks
+
+
+def scan(tracks: list, bpm: float, slot: int, tolerance: float, exclude: str) -> set:
+    """Compatible track IDs by checking every track."""
+    slots = set(compatible_slots(slot))
+    found = set()
+    for track in tracks:
+        if track["id"] == exclude or not track["bpm"]:
+            continue
+        if camelot_slot(track["key"]) not in slots:
+            continue
+        candidate = track["bpm"] / 100
+        for tempo in (1.0, 0.5, 2.0):
+            target = bpm * tempo
+            if abs(target / candidate - 1) <= tolerance:  # Pitch change needed
+                found.add(track["id"])
+                break
+    return found
+
+
+def percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    return f"p50 {p50 * 1000:.3f} ms, p99 {p99 * 1000:.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"Generating {args.tracks:,} tracks...")
+    tracks = make_tracks(args.tracks)
+    rng = random.Random(1)
+    analyzed = [t for t in tracks if t["bpm"]]
+
+    start = time.perf_counter()
+    index = HarmonicIndex.from_tracks(tracks, bpm_scale=0.01)
+    build = time.perf_counter() - start
+    stats = index.get_stats()
+    print(f"Built index in {build:.2f}s: {stats['indexed']:,} of {stats['tracks']:,} tracks indexed, "
+          f"{stats['memory_bytes'] / 1024 / 1024:.1f} MB of arrays")
+
+    print("\nCompatible tracks (all results, no limit):")
+    references = [rng.choice(analyzed) for _ in range(args.queries)]
+    timings, sizes = [], []
+    for track in references:
+        start = time.perf_counter()
+        matches = index.compatible(track["id"], limit=None)
+        timings.append(time.perf_counter() - start)
+        sizes.append(len(matches))
+    print(f"  index: {percentiles(timings)} ({statistics.mean(sizes):.0f} matches on average)")
+
+    timings = []
+    limited = []
+    for track in references:
+        start = time.perf_counter()
+        index.compatible(track["id"], limit=20)
+        limited.append(time.perf_counter() - start)
+    print(f"  index, top 20: {percentiles(limited)}")
+
+    mismatches = 0
+    for track in references[:20]:
+        start = time.perf_counter()
+        expected = scan(tracks, track["bpm"] / 100, camelot_slot(track["key"]), DEFAULT_TOLERANCE, track["id"])
+        timings.append(time.perf_counter() - start)
+        found = {m.track_id for m in index.compatible(track["id"], limit=None)}
+        mismatches += found != expected
+    print(f"  scan:  {percentiles(timings)}")
+    print(f"  {'✅' if not mismatches else '❌'} Index and scan agree on {20 - mismatches}/20 queries")
+
+    print("\nPaths between random tracks:")
+    timings, lengths, failures, invalid = [], [], 0, 0
+    for _ in range(args.queries):
+        first, last = rng.choice(analyzed), rng.choice(analyzed)
+        start = time.perf_counter()
+        chain = index.path(first["id"], last["id"])
+        timings.append(time.perf_counter() - start)
+        if not chain:
+            failures += 1
+            continue
+        lengths.append(len(chain))
+        for previous, step in zip(chain, chain[1:]):
+            keys_ok = camelot_slot(step.key) in compatible_slots(camelot_slot(previous.key))
+            tempo_ok = abs(previous.bpm * step.tempo / step.bpm - 1) <= DEFAULT_TOLERANCE + 1e-9
+            invalid += not (keys_ok and tempo_ok)
+    print(f"  index: {percentiles(timings)}, {len(lengths)} found "
+          f"({statistics.mean(lengths):.1f} tracks on average), {failures} without a path")
+    print(f"  {'✅' if not invalid else '❌'} {invalid} incompatible transitions")
+
+
+if __name__ == "__main__":
+    main()
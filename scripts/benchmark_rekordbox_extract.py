@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Benchmark Rekordbox playlist and cue extraction.
+
+Builds a synthetic master.db-shaped SQLite database (default 20,000 tracks,
+1,000 playlists of ~50 tracks, 4 cues per track) with ANLZ beat-grid files,
+then extracts playlists and cue points two ways:
+
+- per playlist: one track query per playlist, cues with fetchall (the old
+  RekordboxSync path)
+- streamed: one ordered query each, grouped while streaming (rekordbox.extract)
+
+Checks both see the same playlist entries and cue counts, and reports time
+and peak memory (tracemalloc). Beat grids are read from the generated ANLZ
+files and, when pyrekordbox is installed, checked against its parser, and
+library statistics are computed with SQL aggregates.
+
+Usage:
+    python scripts/benchmark_rekordbox_extract.py [--tracks 20000] [--playlists 1000] [--size 50]
+"""
+
+import sys
+import time
+import random
+import struct
+import sqlite3
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.rekordbox.extract import (
+    iter_beat_grids, iter_playlists, iter_track_cues, library_stats, read_beat_grid,
+)
+
+SCHEMA = """
+CREATE TABLE djmdArtist (ID TEXT PRIMARY KEY, Name TEXT);
+CREATE TABLE djmdAlbum (ID TEXT PRIMARY KEY, Name TEXT);
+CREATE TABLE djmdGenre (ID TEXT PRIMARY KEY, Name TEXT);
+CREATE TABLE djmdKey (ID TEXT PRIMARY KEY, ScaleName TEXT);
+CREATE TABLE djmdContent (
+    ID TEXT PRIMARY KEY, Title TEXT, ArtistID TEXT, AlbumID TEXT, GenreID TEXT, KeyID TEXT,
+    BPM INTEGER, Rating INTEGER, ColorID INTEGER, Commnt TEXT, AnalysisDataPath TEXT,
+    FolderPath TEXT, DateCreated TEXT, DJPlayCount INTEGER, Length INTEGER, ImagePath TEXT,
+    created_at TEXT, updated_at TEXT, rb_local_deleted INTEGER DEFAULT 0
+);
+CREATE TABLE djmdPlaylist (
+    ID TEXT PRIMARY KEY, Name TEXT, ParentID TEXT, Seq INTEGER, Attribute INTEGER,
+    created_at TEXT, updated_at TEXT, rb_local_deleted INTEGER DEFAULT 0
+);
+CREATE TABLE djmdSongPlaylist (
+    ID TEXT PRIMARY KEY, PlaylistID TEXT, ContentID TEXT, TrackNo INTEGER,
+    rb_local_deleted INTEGER DEFAULT 0
+);
+CREATE INDEX djmd_song_playlist_playlist_id ON djmdSongPlaylist (PlaylistID);
+CREATE TABLE djmdCue (
+    ID TEXT PRIMARY KEY, ContentID TEXT, Kind INTEGER, InMsec INTEGER, OutMsec INTEGER,
+    Color INTEGER, ActiveLoop INTEGER, Comment TEXT, rb_local_deleted INTEGER DEFAULT 0
+);
+CREATE INDEX djmd_cue_content_id ON djmdCue (ContentID);
+"""
+
+
+def anlz_file(bpm: float, first_beat_ms: int, beats: int = 64) -> bytes:
+    """A minimal ANLZ .DAT file: PMAI header and a PQTZ beat grid."""
+    interval = 60000 / bpm
+    entries = b"".join(
+        struct.pack(">HHI", i % 4 + 1, int(bpm * 100), int(first_beat_ms + i * interval))
+        for i in range(beats)
+    )
+    pqtz = struct.pack(">4sIIIII", b"PQTZ", 24, 24 + len(entries), 0, 0x80000, beats) + entries
+    return struct.pack(">4sII", b"PMAI", 28, 28 + len(pqtz)) + b"\0" * 16 + pqtz
+
+
+def build_library(path: Path, share: Path, tracks: int, playlists: int, size: int, seed: int = 3) -> None:
+    """Write a synthetic master.db and its ANLZ files."""
+    rng = random.Random(seed)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    db.executemany("INSERT INTO djmdArtist VALUES (?, ?)", [(str(i), f"Artist {i}") for i in range(500)])
+    db.executemany("INSERT INTO djmdAlbum VALUES (?, ?)", [(str(i), f"Album {i}") for i in range(2000)])
+    db.executemany("INSERT INTO djmdGenre VALUES (?, ?)", [(str(i), f"Genre {i}") for i in range(40)])
+    db.executemany("INSERT INTO djmdKey VALUES (?, ?)", [(str(i), f"{i % 12 + 1}A") for i in range(24)])
+
+    content = []
+    for i in range(tracks):
+        analysis = f"/PIONEER/USBANLZ/{i % 256:03x}/{i:08d}/ANLZ0000.DAT" if i % 10 else ""
+        content.append((
+            str(i), f"Track {i}", str(i % 500), str(i % 2000), str(i % 40), str(i % 24),
+            rng.randint(9000, 17500), rng.randint(0, 5), rng.randint(0, 8), "", analysis,
+            f"/Music/{i}.mp3", "2024-01-31", rng.randint(0, 50), rng.randint(120, 600),
+            f"/PIONEER/Artwork/{i}.jpg" if i % 3 else "",
+            "2024-01-31 12:00:00.000 +00:00", "2024-02-01 12:00:00.000 +00:00",
+            1 if i % 97 == 0 else 0,
+        ))
+    db.executemany(f"INSERT INTO djmdContent VALUES ({', '.join('?' * 19)})", content)
+
+    for row in content[:1000]:
+        if row[10]:
+            anlz = share / row[10].lstrip("/")
+            anlz.parent.mkdir(parents=True, exist_ok=True)
+            anlz.write_bytes(anlz_file(row[6] / 100, rng.randint(0, 900)))
+
+    db.executemany(
+        "INSERT INTO djmdPlaylist VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+        [
+            (str(p), f"Playlist {p}", "root" if p < 20 else str(p % 20), p, 1 if p < 20 else 0,
+             "2024-01-01 00:00:00.000 +00:00", "2024-01-02 00:00:00.000 +00:00")
+            for p in range(playlists)
+        ]
+    )
+    entries = []
+    for p in range(20, playlists):
+        for position, track in enumerate(rng.sample(range(tracks), size), 1):
+            entries.append((f"{p}-{position}", str(p), str(track), position, 0))
+    db.executemany("INSERT INTO djmdSongPlaylist VALUES (?, ?, ?, ?, ?)", entries)
+
+    cues = []
+    for i in range(tracks):
+        for kind in (0, 1, 2, 3):
+            start = rng.randint(0, 300_000)
+            out = start + 8000 if kind == 3 else -1
+            cues.append((f"{i}-{kind}", str(i), kind, start, out, rng.randint(-1, 7), 0, ""))
+    db.executemany("INSERT INTO djmdCue VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)", cues)
+    db.commit()
+    db.close()
+
+
+def extract_per_playlist(db_path: Path) -> tuple:
+    """The previous path: a query per playlist, every cue loaded at once."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT p.ID as id, p.Name as name, p.ParentID as parent_id, p.Seq as position FROM djmdPlaylist p")
+    entries = 0
+    for playlist in cursor.fetchall():
+        cursor.execute(
+            "SELECT s.ContentID as track_id, s.TrackNo as position FROM djmdSongPlaylist s "
+            "WHERE s.PlaylistID = ? ORDER BY s.TrackNo",
+            (playlist["id"],)
+        )
+        entries += len(cursor.fetchall())
+
+    cursor.execute(
+        "SELECT c.ContentID as track_id, c.Kind as cue_type, c.InMsec as position_ms, "
+        "c.OutMsec as out_position_ms, c.Color as color, c.Comment as comment "
+        "FROM djmdCue c WHERE c.ContentID IS NOT NULL"
+    )
+    cues = [dict(cue) for cue in cursor.fetchall()]
+    conn.close()
+    return entries, len(cues)
+
+
+def extract_streamed(db_path: Path) -> tuple:
+    """rekordbox.extract: one ordered query each, grouped while streaming."""
+    conn = sqlite3.connect(db_path)
+    entries = sum(len(playlist.track_ids) for playlist in iter_playlists(conn))
+    cues = sum(
+        len(track.hot_cues) + len(track.memory_cues) + len(track.loops)
+        for track in iter_track_cues(conn)
+    )
+    conn.close()
+    return entries, cues
+
+
+def measure(fn, *args) -> tuple:
+    """Run twice, timed and then traced; returns (result, seconds, peak MB)."""
+    start = time.perf_counter()
+    value = fn(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, peak / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=20_000)
+    parser.add_argument("--playlists", type=int, default=1_000)
+    parser.add_argument("--size", type=int, default=50, help="Tracks per playlist")
+    args = parser.parse_args()
+
+    work = Path(tempfile.mkdtemp(prefix="rekordbox_bench_"))
+    db_path, share = work / "master.db", work / "share"
+    build_library(db_path, share, args.tracks, args.playlists, args.size)
+    print(f"{args.tracks} tracks, {args.playlists} playlists x {args.size}, 4 cues per track\n")
+
+    (old_entries, old_cues), old_seconds, old_peak = measure(extract_per_playlist, db_path)
+    print(f"per playlist: {old_seconds * 1000:8.1f} ms, peak {old_peak:6.1f} MB, "
+          f"{old_entries} entries, {old_cues} cues")
+
+    (new_entries, new_cues), new_seconds, new_peak = measure(extract_streamed, db_path)
+    print(f"streamed:     {new_seconds * 1000:8.1f} ms, peak {new_peak:6.1f} MB, "
+          f"{new_entries} entries, {new_cues} cues")
+
+    # The old path also counted deleted tracks; hot loops are both a hot cue and a loop
+    conn = sqlite3.connect(db_path)
+    live_entries, live_cues, hot_loops = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM djmdSongPlaylist s JOIN djmdContent c ON c.ID = s.ContentID
+             WHERE c.rb_local_deleted = 0),
+            (SELECT COUNT(*) FROM djmdCue q JOIN djmdContent c ON c.ID = q.ContentID
+             WHERE c.rb_local_deleted = 0),
+            (SELECT COUNT(*) FROM djmdCue q JOIN djmdContent c ON c.ID = q.ContentID
+             WHERE c.rb_local_deleted = 0 AND q.Kind > 0 AND q.OutMsec > 0)
+    """).fetchone()
+
+    start = time.perf_counter()
+    grids = list(iter_beat_grids(conn, share))
+    grid_seconds = time.perf_counter() - start
+    print(f"\nbeat grids:   {grid_seconds * 1000:8.1f} ms for {len(grids)} ANLZ files")
+
+    start = time.perf_counter()
+    stats = library_stats(conn)
+    stats_seconds = time.perf_counter() - start
+    conn.close()
+    print(f"stats:        {stats_seconds * 1000:8.1f} ms, {stats['total_tracks']} tracks, "
+          f"{stats['total_seconds'] / 3600:.0f} hours, top genre {stats['top_genres'][0]}")
+
+    same = new_entries == live_entries and new_cues == live_cues + hot_loops
+    print(f"\n{'✅' if same else '❌'} Streamed extraction sees every live entry and cue")
+
+    try:
+        from pyrekordbox.anlz import AnlzFile
+        sample = next(share.rglob("*.DAT"))
+        beats = AnlzFile.parse_file(sample).get("beat_grid")
+        grid = read_beat_grid(sample)
+        matches = abs(beats[1][0] - grid.bpm) < 0.01 and beats[2][0] * 1000 == grid.first_beat
+        print(f"{'✅' if matches else '❌'} Beat grid matches pyrekordbox's ANLZ parser")
+        same = same and matches
+    except ImportError:
+        print("pyrekordbox not installed, skipping ANLZ cross-check")
+
+    # Local SQLite makes per-playlist queries cheap, and the streamed path
+    # also builds TrackCues objects the old path never did, so it stays
+    # slower here (~1.4x); the gap flips with round-trip cost (pyrekordbox
+    # sessions, a Graphiti call per playlist)
+    print(f"Time {new_seconds / old_seconds:.1f}x of per playlist ({args.playlists} queries -> 2), "
+          f"peak memory {new_peak / old_peak:.0%}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark ranking of large Soulseek search results.
+
+Generates a synthetic slskd response set (default 50,000 files from 1,000
+peers) and ranks it two ways:
+
+- objects: a SearchResponse/FileInfo per file, sorted by quality_score and
+  filtered by walking the list (the old SearchResult)
+- columnar: SearchResultTable scoring, filtering and top-k on NumPy arrays,
+  FileInfo built only for the returned rows
+
+Checks that both return the same files in the same order, and reports time
+and peak memory (tracemalloc) for each.
+
+Usage:
+    python scripts/benchmark_soulseek_ranking.py [--files 50000] [--peers 1000] [--limit 50]
+"""
+
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.soulseek.models import SearchResponse, SearchResult
+
+EXTENSIONS = [".mp3", ".mp3", ".mp3", ".flac", ".wav", ".m4a", ".aiff"]
+BITRATES = [None, 128, 192, 256, 320, 320, 320, 1411]
+
+
+def make_responses(files: int, peers: int, seed: int = 7) -> list:
+    """Synthetic slskd search responses."""
+    rng = random.Random(seed)
+    responses = [
+        {
+            "username": f"peer{p:05d}",
+            "hasFreeUploadSlot": rng.random() < 0.4,
+            "uploadSpeed": rng.choice([None, rng.randint(10_000, 5_000_000)]),
+            "queueLength": rng.randint(0, 30),
+            "responseTime": rng.random(),
+            "files": [],
+        }
+        for p in range(peers)
+    ]
+    for i in range(files):
+        extension = rng.choice(EXTENSIONS)
+        bitrate = rng.choice(BITRATES)
+        responses[rng.randrange(peers)]["files"].append({
+            "filename": f"@@music\\Artist {i % 300}\\Album {i % 50}\\{i:06d} - Track{extension}",
+            "size": rng.randint(2_000_000, 120_000_000),
+            "extension": extension.lstrip(".") if rng.random() < 0.5 else "",
+            "bitRate": bitrate,
+            "sampleRate": 44100,
+            "length": rng.randint(120, 600),
+        })
+    return responses
+
+
+def rank_objects(responses: list, min_bitrate: int, limit: int) -> tuple:
+    """The previous object-per-file path."""
+    search_responses = [SearchResponse.from_api(r) for r in responses]
+    all_files = [f for r in search_responses for f in r.files]
+
+    filtered = []
+    for file_info in all_files:
+        if file_info.file.bitrate:
+            if file_info.file.bitrate >= min_bitrate:
+                filtered.append(file_info)
+        elif file_info.file.is_lossless:
+            filtered.append(file_info)
+
+    best = sorted(filtered, key=lambda f: f.quality_score, reverse=True)[:limit]
+    return len(filtered), best
+
+
+def rank_columnar(responses: list, min_bitrate: int, limit: int) -> tuple:
+    """SearchResult on the columnar table."""
+    result = SearchResult.from_api({"id": "bench", "searchText": "bench", "state": "completed"}, responses)
+    result.apply_bitrate_filter(min_bitrate)
+    return result.file_count, result.get_best_files(limit)
+
+
+def measure(fn, *args) -> tuple:
+    """Run once; returns (result, seconds, peak MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, peak / (1024 * 1024)
+
+
+def key(file_info) -> tuple:
+    return file_info.username, file_info.file.filename
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--peers", type=int, default=1_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--min-bitrate", type=int, default=320)
+    args = parser.parse_args()
+
+    responses = make_responses(args.files, args.peers)
+    print(f"{args.files} files from {args.peers} peers, min bitrate {args.min_bitrate}, top {args.limit}\n")
+
+    (old_count, old_best), old_seconds, old_peak = measure(rank_objects, responses, args.min_bitrate, args.limit)
+    print(f"objects:  {old_seconds * 1000:8.1f} ms, peak {old_peak:6.1f} MB, {old_count} files pass the filter")
+
+    (new_count, new_best), new_seconds, new_peak = measure(rank_columnar, responses, args.min_bitrate, args.limit)
+    print(f"columnar: {new_seconds * 1000:8.1f} ms, peak {new_peak:6.1f} MB, {new_count} files pass the filter")
+
+    # Re-ranking an existing result (e.g. a different limit) skips the build
+    result = SearchResult.from_api({"id": "bench", "searchText": "bench", "state": "completed"}, responses)
+    result.table.quality_scores()
+    start = time.perf_counter()
+    result.get_best_files(args.limit)
+    result.get_best_per_user(args.limit)
+    result.table.group_by_user(result.table.bitrate_mask(args.min_bitrate))
+    rerank = time.perf_counter() - start
+    print(f"\nre-rank (top-k, best per user, group by user): {rerank * 1000:.2f} ms, "
+          f"columns {result.table.nbytes / (1024 * 1024):.1f} MB")
+
+    same = old_count == new_count and [key(f) for f in old_best] == [key(f) for f in new_best]
+    print(f"\n{'✅' if same else '❌'} Same files in the same order")
+    print(f"Speedup {old_seconds / new_seconds:.1f}x, peak memory {new_peak / old_peak:.0%} of objects")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark tag writing for downloaded files.
+
+Tags 1,000 generated MP3 files two ways while a heartbeat task measures how
+long the event loop is stalled:
+
+- on-loop: mutagen load/save called directly from coroutines (the old
+  download managers), tags and artwork saved separately
+- pipeline: the shared TagWriter pool, tags and artwork submitted as two
+  edits that are coalesced into one save
+
+It then adds a later edit (BPM, key and a cue-point comment) to every file
+and counts how many saves had to rewrite the whole file because the tags
+no longer fit in the reserved padding.
+
+Usage:
+    python scripts/benchmark_tagging.py [--files 1000] [--frames 120] [--workers 4]
+"""
+
+import os
+import sys
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.utils.tagging import MUTAGEN_AVAILABLE, TagWriter, TagWriterConfig, ensure_tags
+
+# One silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz, 417 bytes)
+MP3_FRAME = b"\xff\xfb\x90\x64" + bytes(413)
+ARTWORK = b"\xff\xd8\xff\xe0" + os.urandom(80 * 1024)
+
+
+class CountingTagWriter(TagWriter):
+    """Tag writer that counts saves needing a full rewrite."""
+
+    rewrites = 0
+
+    def _padding(self, info) -> int:
+        if info.padding < 0:
+            self.rewrites += 1
+        return super()._padding(info)
+
+
+def make_files(directory: Path, count: int, frames: int) -> list:
+    """Write ``count`` untagged MP3 files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    audio = MP3_FRAME * frames
+    paths = []
+    for i in range(count):
+        path = directory / f"track_{i:04d}.mp3"
+        path.write_bytes(audio)
+        paths.append(path)
+    return paths
+
+
+def apply_tags(audio, i: int) -> None:
+    from mutagen.id3 import TIT2, TPE1, TALB, TRCK
+    tags = ensure_tags(audio)
+    tags.add(TIT2(encoding=3, text=f"Track {i}"))
+    tags.add(TPE1(encoding=3, text="Benchmark Artist"))
+    tags.add(TALB(encoding=3, text="Benchmark Album"))
+    tags.add(TRCK(encoding=3, text=str(i + 1)))
+
+
+def apply_artwork(audio) -> None:
+    from mutagen.id3 import APIC
+    ensure_tags(audio).add(APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=ARTWORK))
+
+
+def apply_later_edit(audio) -> None:
+    from mutagen.id3 import COMM, TBPM, TKEY
+    tags = ensure_tags(audio)
+    tags.add(TBPM(encoding=3, text="128"))
+    tags.add(TKEY(encoding=3, text="8A"))
+    cues = "; ".join(f"cue {n}: {n * 7.5:.1f}s" for n in range(400))
+    tags.add(COMM(encoding=3, lang="eng", desc="Cues", text=cues))
+
+
+async def heartbeat(stalls: list, stop: asyncio.Event, interval: float = 0.005) -> None:
+    """Record how late each tick runs (event loop stall)."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        stalls.append(max(0.0, loop.time() - expected))
+
+
+async def measure(work) -> tuple:
+    """Run ``work`` alongside the heartbeat; returns (seconds, p99 and max stall ms)."""
+    stalls: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stalls, stop))
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    stalls = sorted(stalls) or [0.0]
+    return elapsed, stalls[int(len(stalls) * 0.99)] * 1000, stalls[-1] * 1000
+
+
+async def run(args) -> int:
+    from mutagen import File
+
+    root = Path(tempfile.mkdtemp(prefix="tag_benchmark_"))
+    try:
+        on_loop_files = make_files(root / "on_loop", args.files, args.frames)
+        pipeline_files = make_files(root / "pipeline", args.files, args.frames)
+        size_kb = len(MP3_FRAME) * args.frames / 1024
+        print(f"{args.files} MP3 files of {size_kb:.0f} KB, artwork {len(ARTWORK) // 1024} KB")
+
+        # On-loop: what the download managers used to do
+        async def tag_on_loop(path: Path, i: int) -> None:
+            audio = File(path)
+            apply_tags(audio, i)
+            audio.save()
+            audio = File(path)
+            apply_artwork(audio)
+            audio.save()
+
+        async def on_loop():
+            await asyncio.gather(*(tag_on_loop(path, i) for i, path in enumerate(on_loop_files)))
+
+        seconds, p99, longest = await measure(on_loop)
+        print(f"\non-loop:  {seconds:6.2f}s, {args.files * 2} saves, "
+              f"loop stalls p99 {p99:7.1f} ms, longest {longest:7.1f} ms")
+
+        # Pipeline
+        writer = CountingTagWriter(TagWriterConfig(max_workers=args.workers))
+
+        async def pipeline():
+            updates = []
+            for i, path in enumerate(pipeline_files):
+                updates.append(writer.update(path, lambda audio, i=i: apply_tags(audio, i)))
+                updates.append(writer.update(path, apply_artwork))
+            await asyncio.gather(*updates)
+
+        seconds, p99, longest = await measure(pipeline)
+        stats = writer.get_stats()
+        print(f"pipeline: {seconds:6.2f}s, {stats['saves']} saves, "
+              f"loop stalls p99 {p99:7.1f} ms, longest {longest:7.1f} ms "
+              f"({stats['coalesced']} edits coalesced)")
+
+        # Later edits on both sets, through the pool
+        for name, paths in (("on-loop files", on_loop_files), ("pipeline files", pipeline_files)):
+            editor = CountingTagWriter(TagWriterConfig(max_workers=args.workers))
+            start = time.perf_counter()
+            await asyncio.gather(*(editor.update(path, apply_later_edit) for path in paths))
+            seconds = time.perf_counter() - start
+            print(f"\nlater edit, {name}: {seconds:5.2f}s, "
+                  f"{editor.rewrites}/{len(paths)} saves rewrote the whole file")
+            editor.shutdown()
+
+        writer.shutdown()
+        return 0
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=120, help="MP3 frames per file (417 bytes each)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if not MUTAGEN_AVAILABLE:
+        print("mutagen is not installed: pip install mutagen")
+        return 1
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark the tracklist page parsers.
+
+Checks that the lxml backend produces exactly the BeautifulSoup output on
+the saved sample page and a synthetic 100-track page, then times both.
+Also reports which fields differ on malformed markup, where libxml2 and
+html.parser repair the tree differently (expected, not a failure).
+
+Usage:
+    python scripts/benchmark_tracklist_parser.py [page.html ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.tracklists_parser import (
+    SoupTracklistParser,
+    LxmlTracklistParser,
+    LXML_AVAILABLE,
+)
+
+ROOT = Path(__file__).parent.parent
+ITERATIONS = 20
+
+
+def synthetic_page(track_count: int = 100) -> str:
+    """Build a tracklist page exercising every extracted field."""
+    tracks = []
+    for i in range(1, track_count + 1):
+        if i % 17 == 0:
+            body = '<span class="trackValue">ID - ID</span>'
+        elif i % 5 == 0:
+            body = (f'<span class="trackValue">Artist {i} - Track {i} (Remix {i})</span> '
+                    f'<span class="trackLabel">[Label {i}]</span>')
+        else:
+            body = (f'<span class="trackValue">Artist {i} w/ Guest - Track {i}</span>\n'
+                    f'  <!-- cue {i} --> <span class="label">Label {i}</span>')
+        cue = f'<span class="cueValueField">{i // 60:02d}:{i % 60:02d}</span>' if i % 3 else ''
+        tracks.append(f'<div class="tlpItem tlpTog" id="tlp_{i}">\n  <span class="fontXL">{i}</span>'
+                      f' {cue}\n  {body}\n</div>')
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta property="og:title" content="Amelie Lens @ Mainstage, Awakenings Festival 2023">
+  <meta name="description" content="Tracklist of Amelie Lens at Awakenings Festival, Hilvarenbeek">
+  <title>Amelie Lens @ Awakenings</title>
+  <style>.badge.views {{ content: "views 999"; }}</style>
+  <script>var plays = 12345;</script>
+</head>
+<body>
+  <h1>Amelie <b>Lens</b> @ Awakenings</h1>
+  <span class="djName">Amelie&nbsp;Lens</span>
+  <span class="eventName">Awakenings   Festival</span>
+  <time datetime="2023-07-01">1 July 2023</time>
+  <a class="genreTag" href="/genre/techno/">Techno</a>
+  <a class="tag" href="/genre/acid/">Acid</a>
+  <a class="genreTag" href="/genre/techno/">Techno</a>
+  <a href="https://soundcloud.com/amelielens/awakenings">Listen</a>
+  <iframe src="https://w.soundcloud.com/player/?url=awakenings"></iframe>
+  <a href="https://youtu.be/abc123">Watch</a>
+  <a href="https://www.mixcloud.com/amelie/set/">Mixcloud</a>
+  <div class="stats"><span>Total views</span> 4,312 <span>likes: 87</span></div>
+  <pre>   </pre>
+  {''.join(tracks)}
+</body>
+</html>"""
+
+
+# Invalid nesting the two tree builders repair differently
+MALFORMED_PAGES = {
+    'block element in <h1>': (
+        '<html><body><h1>Amelie <p>Lens</p> @ Awakenings</h1>'
+        '<div class="tlpItem"><span class="trackValue">A - B</span></div></body></html>'
+    ),
+    'unclosed <tr> rows': (
+        '<html><body><h1>Set</h1><table><tr class="tlpItem"><td>A - B'
+        '<tr class="tlpItem"><td>C - D</table></body></html>'
+    ),
+    'unclosed <span>': (
+        '<html><body><h1>Set</h1><div class="tlpItem"><span class="trackValue">A - B</div>'
+        '<div class="tlpItem"><span class="trackValue">C - D</span></div></body></html>'
+    ),
+    'stray closing tags': (
+        '<html><body></div><h1>Set</h1></span>'
+        '<div class="tlpItem"><span class="trackValue">A - B</span></div></body></html>'
+    ),
+}
+
+
+def strip_volatile(data: dict) -> dict:
+    """Drop fields that differ between runs."""
+    return {key: value for key, value in data.items() if key != 'extracted_at'}
+
+
+def time_parser(parser, html: str) -> float:
+    """Mean parse time in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        parser.parse('https://www.1001tracklists.com/tracklist/x/', html)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    if not LXML_AVAILABLE:
+        print("lxml is not installed: pip install lxml")
+        return 1
+
+    pages = {'synthetic (100 tracks)': synthetic_page()}
+    paths = [Path(arg) for arg in sys.argv[1:]] or [ROOT / 'tracklist_sample.html']
+    for path in paths:
+        if path.exists():
+            pages[path.name] = path.read_text(encoding='utf-8')
+
+    soup_parser = SoupTracklistParser()
+    lxml_parser = LxmlTracklistParser()
+
+    failures = 0
+    for name, html in pages.items():
+        url = 'https://www.1001tracklists.com/tracklist/x/'
+        expected = strip_volatile(soup_parser.parse(url, html))
+        actual = strip_volatile(lxml_parser.parse(url, html))
+
+        print(f"\n{name}: {len(html) / 1024:.0f} KB, {len(expected['tracks'])} tracks")
+        if expected == actual:
+            print("  output: identical")
+        else:
+            failures += 1
+            for key in expected:
+                if expected[key] != actual.get(key):
+                    print(f"  output differs in '{key}':")
+                    print(f"    soup: {expected[key]!r:.300}")
+                    print(f"    lxml: {actual.get(key)!r:.300}")
+
+        soup_ms = time_parser(soup_parser, html)
+        lxml_ms = time_parser(lxml_parser, html)
+        print(f"  soup: {soup_ms:.2f} ms/page")
+        print(f"  lxml: {lxml_ms:.2f} ms/page ({soup_ms / lxml_ms:.1f}x)")
+
+    print("\nmalformed markup (TRACKLISTS_PARSER=soup gives the reference output):")
+    for name, html in MALFORMED_PAGES.items():
+        url = 'https://www.1001tracklists.com/tracklist/x/'
+        expected = strip_volatile(soup_parser.parse(url, html))
+        actual = strip_volatile(lxml_parser.parse(url, html))
+        differing = [key for key in expected if expected[key] != actual.get(key)]
+        print(f"  {name}: {'differs in ' + ', '.join(differing) if differing else 'identical'}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
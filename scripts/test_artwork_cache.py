@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test the shared artwork service against a local image server: one download
+per cover for a whole album, resizing, and reuse across service instances
+(no network needed).
+"""
+
+import io
+import os
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from aiohttp import web
+
+CACHE_DIR = tempfile.mkdtemp(prefix="artwork_cache_test_")
+
+# Configure before the service reads its settings
+os.environ["ARTWORK_CACHE_DIR"] = CACHE_DIR
+os.environ["ARTWORK_MAX_DIMENSION"] = "600"
+
+requests_seen = {"cover": 0}
+
+
+def make_cover(size: int) -> bytes:
+    """A JPEG cover of the given size (or stand-in bytes without Pillow)."""
+    from src.music_agent.services.artwork_service import PIL_AVAILABLE
+    if not PIL_AVAILABLE:
+        return b"\xff\xd8\xff" + os.urandom(200_000)
+
+    from PIL import Image
+    output = io.BytesIO()
+    Image.new("RGB", (size, size), (200, 40, 90)).save(output, format="JPEG", quality=95)
+    return output.getvalue()
+
+
+async def start_server(cover: bytes):
+    async def serve_cover(request: web.Request) -> web.Response:
+        requests_seen["cover"] += 1
+        await asyncio.sleep(0.05)
+        return web.Response(body=cover, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/cover_xl.jpg", serve_cover)
+    app.router.add_get("/missing.jpg", lambda request: web.Response(status=404))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def test_artwork_cache():
+    """A 20-track album should download its cover once."""
+    print("=" * 60)
+    print("Testing shared artwork cache")
+    print("=" * 60)
+
+    from src.music_agent.services.artwork_service import ArtworkService, PIL_AVAILABLE
+
+    cover = make_cover(1400)
+    runner, base_url = await start_server(cover)
+    url = f"{base_url}/cover_xl.jpg"
+
+    service = ArtworkService()
+
+    print("\n1. 20 tracks of one album fetch the cover concurrently...")
+    results = await asyncio.gather(*(service.fetch(url) for _ in range(20)))
+    same = all(result is not None and result.data is results[0].data for result in results)
+    print(f"   {'✅' if requests_seen['cover'] == 1 else '❌'} Downloads: {requests_seen['cover']} (expected 1)")
+    print(f"   {'✅' if same else '❌'} All tracks share the same bytes")
+
+    print("\n2. Resized once to the configured maximum...")
+    artwork = results[0]
+    if PIL_AVAILABLE:
+        from PIL import Image
+        with Image.open(io.BytesIO(artwork.data)) as image:
+            dimensions = image.size
+        print(f"   {'✅' if max(dimensions) == 600 else '❌'} {dimensions[0]}x{dimensions[1]}, "
+              f"{len(cover) // 1024} KB -> {artwork.size // 1024} KB")
+    else:
+        print("   Pillow not installed, stored as downloaded")
+    print(f"   Cached at: {artwork.path}")
+
+    print("\n3. Later tracks hit memory...")
+    await service.fetch(url)
+    print(f"   {'✅' if requests_seen['cover'] == 1 else '❌'} Downloads: {requests_seen['cover']} (expected 1)")
+
+    print("\n4. A new service instance reads the disk store...")
+    await service.close()
+    service = ArtworkService()
+    again = await service.fetch(url)
+    print(f"   {'✅' if requests_seen['cover'] == 1 and again.data == artwork.data else '❌'} "
+          f"Downloads: {requests_seen['cover']} (expected 1)")
+
+    print("\n5. Missing artwork...")
+    missing = await service.fetch(f"{base_url}/missing.jpg")
+    print(f"   {'✅' if missing is None else '❌'} Returns None")
+    print(f"   Stats: {service.get_stats()}")
+
+    await service.close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_artwork_cache())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test local catalog search against the docker-compose PostgreSQL (POSTGRES_*
+env vars): ranked full-text and fuzzy matches, BPM/key filters, and the
+refresh that only rebuilds music.track_search when the catalog changed.
+Test rows are removed afterwards. The unreachable-database step runs
+without PostgreSQL; the rest is skipped if it isn't running.
+"""
+
+import sys
+import time
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.catalog_search import CatalogConfig, CatalogSearch
+
+TRACKS = [
+    ("Archangel", "CS Test Burial", 139.0, "6A"),
+    ("Near Dark", "CS Test Burial", 138.0, "7A"),
+    ("Windowlicker", "CS Test Aphex Twin", 127.0, "8A"),
+    ("Xtal", "CS Test Aphex Twin", 126.0, "9A"),
+    ("Strings of Life", "CS Test Rhythim Is Rhythim", 124.0, "8A"),
+]
+
+
+async def cleanup(pool):
+    await pool.execute(
+        "DELETE FROM music.tracks WHERE artist_id IN "
+        "(SELECT id FROM music.artists WHERE name LIKE 'CS Test %')"
+    )
+    await pool.execute("DELETE FROM music.artists WHERE name LIKE 'CS Test %'")
+
+
+async def seed(pool):
+    for title, artist, bpm, key in TRACKS:
+        artist_id = await pool.fetchval(
+            "SELECT id FROM music.artists WHERE name = $1", artist
+        ) or await pool.fetchval(
+            "INSERT INTO music.artists (name) VALUES ($1) RETURNING id", artist
+        )
+        await pool.execute(
+            "INSERT INTO music.tracks (title, artist_id, bpm, key) VALUES ($1, $2, $3, $4)",
+            title, artist_id, Decimal(str(bpm)), key
+        )
+
+
+async def test_catalog_search():
+    print("=" * 60)
+    print("Testing local catalog search")
+    print("=" * 60)
+
+    print("\n0. Unreachable database fails fast and is skipped...")
+    # Accepts connections but never answers, like a firewalled host
+    silent = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+    port = silent.sockets[0].getsockname()[1]
+    unreachable = CatalogSearch(CatalogConfig(host="127.0.0.1", port=port, connect_timeout=1.0))
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        try:
+            await unreachable.connect()
+        except ConnectionError:
+            pass
+        timings.append(time.perf_counter() - start)
+    silent.close()
+    ok = timings[0] < 2.0 and max(timings[1:]) < 0.05
+    print(f"   {'✅' if ok else '❌'} First connect {timings[0]:.2f}s, "
+          f"retries {max(timings[1:]) * 1000:.1f} ms")
+
+    catalog = CatalogSearch()
+    try:
+        pool = await catalog.connect()
+    except ConnectionError as e:
+        print(f"\n⚠️ {e}, skipping the live tests")
+        return
+
+    try:
+        await cleanup(pool)
+        await seed(pool)
+
+        print("\n1. Refresh after the catalog changed...")
+        refreshed = await catalog.refresh()
+        again = await catalog.refresh()
+        print(f"   {'✅' if refreshed and not again else '❌'} Refreshed: {refreshed}, "
+              f"second call skipped: {not again}")
+
+        print("\n2. Full-text search...")
+        results = await catalog.search("burial archangel")
+        ok = results and results[0]["title"] == "Archangel"
+        print(f"   {'✅' if ok else '❌'} {len(results)} results, top: "
+              f"{results[0]['artist'] + ' - ' + results[0]['title'] if results else None}")
+
+        print("\n3. Fuzzy search with a typo...")
+        results = await catalog.search("windowliker")
+        ok = any(r["title"] == "Windowlicker" for r in results)
+        print(f"   {'✅' if ok else '❌'} {[r['title'] for r in results]}")
+
+        print("\n4. BPM range and key filters...")
+        results = await catalog.search("cs test", bpm_min=120, bpm_max=130, keys=["8A"])
+        titles = sorted(r["title"] for r in results)
+        ok = titles == ["Strings of Life", "Windowlicker"]
+        print(f"   {'✅' if ok else '❌'} 120-130 BPM in 8A: {titles}")
+
+        results = await catalog.search(bpm_min=138, bpm_max=140)
+        titles = [r["title"] for r in results if r["artist"].startswith("CS Test")]
+        print(f"   {'✅' if titles == ['Near Dark', 'Archangel'] else '❌'} Browse 138-140 BPM: {titles}")
+
+        print("\n5. Latency...")
+        start = time.perf_counter()
+        for _ in range(50):
+            await catalog.search("aphex", bpm_min=120)
+        elapsed = (time.perf_counter() - start) / 50
+        print(f"   {'✅' if elapsed < 0.05 else '❌'} {elapsed * 1000:.1f} ms per search")
+
+        print(f"\n   Stats: {await catalog.get_stats()}")
+
+    finally:
+        await cleanup(pool)
+        await catalog.refresh()
+        await catalog.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_catalog_search())
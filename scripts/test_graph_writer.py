@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test structured graph ingestion against a live Neo4j (NEO4J_* env vars):
+batched UNWIND-MERGE of tracks, artists, albums, labels and playlists,
+ISRC de-duplication across sources, stable per-source keys when an ISRC
+arrives later or is shared, idempotent re-runs and throughput.
+No LLM calls are made. Test nodes are removed afterwards.
+"""
+
+import os
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
+from src.music_agent.integrations.graph_writer import StructuredGraphWriter
+
+GROUP = "graph_writer_test"
+TRACKS = 5000
+
+
+def rekordbox_tracks():
+    for i in range(TRACKS):
+        yield {
+            "rekordbox_id": 900_000 + i,
+            "isrc": f"gbtst{i:07d}" if i % 2 == 0 else None,
+            "title": f"Test Track {i}",
+            "artist": f"GW Test Artist {i % 200}",
+            "album": f"GW Test Album {i % 500}",
+            "label": f"GW Test Label {i % 20}",
+            "bpm": 120 + i % 10,
+            "key": f"{i % 12 + 1}A",
+        }
+
+
+def deezer_tracks():
+    # Same recordings as the even Rekordbox tracks (shared ISRC)
+    for i in range(0, 1000, 2):
+        yield {
+            "deezer_id": 7_000_000 + i,
+            "isrc": f"GBTST{i:07d}",
+            "title": f"Test Track {i}",
+            "artist": f"gw test artist {i % 200}",
+        }
+
+
+def playlists():
+    for p in range(50):
+        yield (
+            {"name": f"GW Test Playlist {p}", "platform": "rekordbox", "platform_id": 990_000 + p},
+            [900_000 + (p * 37 + n) % TRACKS for n in range(100)],
+        )
+
+
+async def count(driver, query: str) -> int:
+    result = await driver.execute_query(query, group_id=GROUP)
+    return result.records[0]["n"]
+
+
+async def cleanup(driver):
+    await driver.execute_query("MATCH (n {group_id: $group_id}) DETACH DELETE n", group_id=GROUP)
+    await driver.execute_query(
+        "MATCH (n) WHERE (n:Artist OR n:Label) AND n.name STARTS WITH 'GW Test' DETACH DELETE n"
+    )
+    await driver.execute_query("MATCH (n:Album) WHERE n.title STARTS WITH 'GW Test' DETACH DELETE n")
+
+
+async def test_graph_writer():
+    print("=" * 60)
+    print("Testing structured graph writer")
+    print("=" * 60)
+
+    driver = Neo4jDriver(
+        uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        user=os.getenv("NEO4J_USERNAME", "neo4j"),
+        password=os.getenv("NEO4J_PASSWORD", "deezmusic123"),
+        database=os.getenv("NEO4J_DATABASE", "music"),
+    )
+    writer = StructuredGraphWriter(driver, group_id=GROUP)
+
+    try:
+        await cleanup(driver)
+        await writer.ensure_indexes()
+
+        print(f"\n1. Writing {TRACKS} Rekordbox tracks...")
+        start = time.perf_counter()
+        written = await writer.write_tracks(rekordbox_tracks())
+        elapsed = time.perf_counter() - start
+        print(f"   {'✅' if written == TRACKS else '❌'} {written} tracks in {elapsed:.2f}s "
+              f"({written / elapsed:.0f}/s, {writer.stats.transactions} transactions)")
+
+        artists = await count(driver, "MATCH (a:Artist) WHERE a.name STARTS WITH 'GW Test' RETURN count(a) AS n")
+        labels = await count(driver, "MATCH (l:Label) WHERE l.name STARTS WITH 'GW Test' RETURN count(l) AS n")
+        print(f"   {'✅' if artists == 200 and labels == 20 else '❌'} {artists} artists, {labels} labels")
+
+        print("\n2. Deezer tracks with the same ISRCs merge into existing nodes...")
+        await writer.write_tracks(deezer_tracks())
+        tracks = await count(driver, "MATCH (t:Track {group_id: $group_id}) RETURN count(t) AS n")
+        both = await count(
+            driver,
+            "MATCH (t:Track {group_id: $group_id}) WHERE t.deezer_id IS NOT NULL "
+            "AND t.rekordbox_id IS NOT NULL RETURN count(t) AS n"
+        )
+        print(f"   {'✅' if tracks == TRACKS and both == 500 else '❌'} {tracks} track nodes, "
+              f"{both} with both Rekordbox and Deezer IDs")
+
+        print("\n3. Playlists with ordered entries...")
+        start = time.perf_counter()
+        written = await writer.write_playlists(playlists())
+        elapsed = time.perf_counter() - start
+        entries = await count(
+            driver,
+            "MATCH (p:Playlist {group_id: $group_id})-[r:CONTAINS_TRACK]->() RETURN count(r) AS n"
+        )
+        print(f"   {'✅' if written == 50 and entries == 5000 else '❌'} {written} playlists, "
+              f"{entries} entries in {elapsed:.2f}s")
+
+        print("\n4. Re-running is idempotent...")
+        await writer.write_tracks(rekordbox_tracks())
+        await writer.write_playlists(playlists())
+        tracks = await count(driver, "MATCH (t:Track {group_id: $group_id}) RETURN count(t) AS n")
+        entries_again = await count(
+            driver,
+            "MATCH (p:Playlist {group_id: $group_id})-[r:CONTAINS_TRACK]->() RETURN count(r) AS n"
+        )
+        print(f"   {'✅' if tracks == TRACKS and entries_again == entries else '❌'} "
+              f"{tracks} tracks, {entries_again} entries")
+
+        print("\n5. An ISRC added later updates the existing node...")
+        late = {"rekordbox_id": 980_001, "title": "GW Late ISRC", "artist": "GW Test Artist 0"}
+        await writer.write_tracks([late])
+        await writer.write_tracks([{**late, "isrc": "GBTST9800001"}])
+        nodes = await count(
+            driver,
+            "MATCH (t:Track {group_id: $group_id}) WHERE t.title = 'GW Late ISRC' RETURN count(t) AS n"
+        )
+        isrc = await count(
+            driver,
+            "MATCH (t:Track {rekordbox_id: '980001', isrc: 'GBTST9800001'}) RETURN count(t) AS n"
+        )
+        print(f"   {'✅' if nodes == 1 and isrc == 1 else '❌'} {nodes} node, ISRC set: {isrc == 1}")
+
+        print("\n6. Rekordbox tracks sharing an ISRC stay separate...")
+        shared = [
+            {"rekordbox_id": 980_002 + n, "isrc": "GBTST9800002", "title": f"GW Shared ISRC {n}",
+             "artist": "GW Test Artist 0"}
+            for n in range(2)
+        ]
+        await writer.write_tracks(shared)
+        await writer.write_playlists([
+            ({"name": f"GW Shared Playlist {n}", "platform": "rekordbox", "platform_id": 990_100 + n},
+             [980_002 + n])
+            for n in range(2)
+        ])
+        nodes = await count(
+            driver,
+            "MATCH (t:Track {group_id: $group_id, isrc: 'GBTST9800002'}) RETURN count(t) AS n"
+        )
+        linked = await count(
+            driver,
+            "MATCH (p:Playlist {group_id: $group_id})-[:CONTAINS_TRACK]->(t:Track) "
+            "WHERE p.name STARTS WITH 'GW Shared Playlist' "
+            "AND toInteger(t.rekordbox_id) - 980002 = toInteger(p.platform_id) - 990100 "
+            "RETURN count(t) AS n"
+        )
+        print(f"   {'✅' if nodes == 2 and linked == 2 else '❌'} {nodes} nodes, "
+              f"{linked} playlists linked to their own track")
+
+        print(f"\n   Stats: {writer.get_stats()}")
+
+    finally:
+        await cleanup(driver)
+        await driver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_graph_writer())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test the Graphiti ingestion queue against a fake Graphiti: coalescing of
+track discoveries, bounded concurrency, backpressure, retries, and
+recovery of spooled episodes after a restart (no Neo4j or LLM needed).
+"""
+
+import sys
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.graphiti_memory import MusicMemory
+from src.music_agent.integrations.graphiti_ingest import GraphitiIngestQueue, IngestConfig
+
+SPOOL_DIR = Path(tempfile.mkdtemp(prefix="graphiti_ingest_test_"))
+
+
+class FakeGraphiti:
+    """Records episodes; each call takes as long as an LLM extraction would (scaled down)."""
+
+    def __init__(self, latency: float = 0.05, fail_names=()):
+        self.latency = latency
+        self.fail_names = set(fail_names)
+        self.episodes = []
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def _call(self, names):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail_names & set(names):
+                raise RuntimeError("LLM extraction failed")
+            self.episodes.extend(names)
+            return names
+        finally:
+            self.active -= 1
+
+    async def add_episode(self, name, episode_body, source_description, reference_time, group_id=None):
+        return await self._call([name])
+
+    async def add_episode_bulk(self, bulk_episodes, group_id=None):
+        return await self._call([episode.name for episode in bulk_episodes])
+
+
+def make_memory(graphiti) -> MusicMemory:
+    memory = MusicMemory()
+    memory.graphiti = graphiti
+    memory.initialized = True
+    memory.session_id = "test_session"
+    return memory
+
+
+def config(spool: str = "spool.db", **overrides) -> IngestConfig:
+    values = dict(spool_path=str(SPOOL_DIR / spool), max_concurrency=4, batch_size=25, flush_interval=0.2,
+                  max_pending=2000, retry_delay=0.05)
+    values.update(overrides)
+    return IngestConfig(**values)
+
+
+def track(i: int) -> dict:
+    return {"id": i, "title": f"Track {i}", "artist": f"Artist {i % 50}", "bpm": 124, "key": "8A"}
+
+
+async def test_ingest():
+    print("=" * 60)
+    print("Testing Graphiti ingestion queue")
+    print("=" * 60)
+
+    print("\n1. Serial baseline: 200 track discoveries, one episode each...")
+    graphiti = FakeGraphiti()
+    memory = make_memory(graphiti)
+    start = time.perf_counter()
+    for i in range(200):
+        await memory.add_track_discovery(track(i), source="rekordbox", action="synced")
+    serial = time.perf_counter() - start
+    print(f"   {graphiti.calls} Graphiti calls in {serial:.2f}s")
+
+    print("\n2. Queued: 1,000 tracks, a playlist summary and a preference...")
+    graphiti = FakeGraphiti()
+    memory = make_memory(graphiti)
+    await memory.start_ingest(config())
+    start = time.perf_counter()
+    for i in range(1000):
+        await memory.add_track_discovery(track(i), source="rekordbox", action="synced")
+    submitted = time.perf_counter() - start
+    await memory.add_playlists([{"name": "Warmup", "track_count": 40}], source="rekordbox")
+    await memory.add_preference("artist", "Burial", "likes", 0.9)
+    await memory.ingest.drain()
+    elapsed = time.perf_counter() - start
+    stats = memory.ingest.get_stats()
+    ok = stats["completed"] == 1002 and stats["bulk_calls"] == 40 and len(graphiti.episodes) == 1002
+    print(f"   {'✅' if ok else '❌'} {stats['completed']} episodes in {graphiti.calls} calls "
+          f"({stats['bulk_calls']} bulk, {stats['episode_calls']} single), {elapsed:.2f}s "
+          f"(submit {submitted * 1000:.0f} ms)")
+    print(f"   {'✅' if graphiti.max_active <= 4 else '❌'} Max concurrent calls: {graphiti.max_active} (limit 4)")
+    await memory.close()
+
+    print("\n3. Backpressure with max_pending=50 and slow Graphiti...")
+    graphiti = FakeGraphiti(latency=0.2)
+    queue = GraphitiIngestQueue(graphiti, group_id="test", config=config("backpressure.db", max_pending=50, batch_size=10))
+    await queue.start()
+    for i in range(300):
+        await queue.submit_track(f"track_{i}", f"Discovered track {i}", "test")
+        assert queue.get_stats()["pending"] <= 50
+    await queue.drain()
+    stats = queue.get_stats()
+    print(f"   {'✅' if stats['backpressure_waits'] > 0 and stats['max_pending'] <= 50 else '❌'} "
+          f"{stats['backpressure_waits']} waits, {stats['backpressure_seconds']:.2f}s waiting, "
+          f"peak pending {stats['max_pending']}")
+    await queue.close()
+
+    print("\n4. Retries: a failing batch is retried one episode at a time...")
+    graphiti = FakeGraphiti(fail_names={"track_7"})
+    queue = GraphitiIngestQueue(graphiti, group_id="test", config=config("retries.db", batch_size=10, max_attempts=2))
+    await queue.start()
+    for i in range(10):
+        await queue.submit_track(f"track_{i}", f"Discovered track {i}", "test")
+    await queue.drain()
+    stats = queue.get_stats()
+    ok = stats["completed"] == 9 and stats["failed"] == 1 and stats["spool_failed"] == 1
+    print(f"   {'✅' if ok else '❌'} {stats['completed']} written, {stats['failed']} gave up "
+          f"(kept in spool), {stats['retried']} retries")
+    await queue.close()
+
+    print("\n5. Restart: pending episodes survive in the spool...")
+    graphiti = FakeGraphiti(latency=10)  # Never finishes before shutdown
+    queue = GraphitiIngestQueue(graphiti, group_id="test", config=config("restart.db", batch_size=10))
+    await queue.start()
+    for i in range(30):
+        await queue.submit_track(f"restart_{i}", f"Discovered track {i}", "test")
+    await queue.close(timeout=0.3)
+
+    graphiti = FakeGraphiti()
+    queue = GraphitiIngestQueue(graphiti, group_id="test", config=config("restart.db", batch_size=10))
+    recovered = await queue.start()
+    await queue.drain()
+    restarted = sorted(name for name in graphiti.episodes if name.startswith("restart_"))
+    print(f"   {'✅' if recovered == 30 and len(restarted) == 30 else '❌'} "
+          f"Recovered {recovered}, written after restart {len(restarted)}")
+    print(f"   Stats: {queue.get_stats()}")
+    await queue.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_ingest())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test the background job pool with stand-in work (no agent or network):
+immediate job IDs, progress updates, global and per-platform concurrency
+caps (including jobs that use several platforms), cancelling queued and
+running jobs, and failures.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.utils.jobs import JobConfig, JobManager, JobStatus
+
+
+class Concurrency:
+    """Tracks the most jobs running at once, overall and per platform."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+
+    def enter(self, key):
+        with self.lock:
+            self.running[key] = self.running.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.running[key])
+
+    def exit(self, key):
+        with self.lock:
+            self.running[key] -= 1
+
+
+def test_jobs():
+    print("=" * 60)
+    print("Testing background jobs")
+    print("=" * 60)
+
+    manager = JobManager(JobConfig(max_workers=6, default_platform_limit=4,
+                                   platform_limits={"conversation": 1, "deezer": 2, "soulseek": 3}))
+    seen = Concurrency()
+
+    def lookup(query, platform, job=None):
+        seen.enter("all")
+        seen.enter(platform)
+        try:
+            for step in range(3):
+                job.report(f"{query}: step {step + 1}", step=step)
+                time.sleep(0.05)
+            return {"query": query, "platform": platform}
+        finally:
+            seen.exit(platform)
+            seen.exit("all")
+
+    try:
+        print("\n1. Submitting 24 lookups...")
+        start = time.perf_counter()
+        platforms = ["deezer", "soulseek", "youtube"]
+        ids = [
+            manager.submit("research", lookup, f"Track {i}", platforms[i % 3],
+                           platform=platforms[i % 3], description=f"Track {i}")
+            for i in range(24)
+        ]
+        submitted = time.perf_counter() - start
+        print(f"   {'✅' if submitted < 0.5 else '❌'} {len(ids)} job IDs in {submitted * 1000:.1f} ms")
+
+        for job_id in ids:
+            manager.wait(job_id, timeout=30)
+        elapsed = time.perf_counter() - start
+        done = [manager.get(job_id) for job_id in ids]
+        ok = all(job.status == JobStatus.COMPLETED for job in done)
+        print(f"   {'✅' if ok else '❌'} All completed in {elapsed:.2f}s "
+              f"(sequential: {24 * 0.15:.2f}s)")
+
+        print("\n2. Concurrency caps...")
+        ok = (seen.peak["all"] <= 6 and seen.peak["deezer"] <= 2
+              and seen.peak["soulseek"] <= 3 and seen.peak["youtube"] <= 4)
+        print(f"   {'✅' if ok else '❌'} Peak running: {seen.peak}")
+
+        print("\n3. Progress updates...")
+        job = done[0]
+        updates = manager.updates(job.id)
+        later = manager.updates(job.id, since=1)
+        ok = [u.seq for u in updates] == [1, 2, 3] and [u.seq for u in later] == [2, 3]
+        print(f"   {'✅' if ok else '❌'} {[u.message for u in updates]}")
+        print(f"   {'✅' if manager.get(job.id[:6]) is job else '❌'} Lookup by ID prefix")
+
+        print("\n4. Cancelling...")
+        gate = threading.Event()
+
+        def blocked(job=None):
+            while not gate.wait(0.02):
+                job.raise_if_cancelled()
+            return "finished"
+
+        async def slow(job=None):
+            job.report("sleeping")
+            await asyncio.sleep(30)
+
+        running = manager.submit("download", blocked, platform="deezer")
+        sleeping = manager.submit("research", slow, platform="spotify")
+        queued = [manager.submit("download", blocked, platform="deezer") for _ in range(2)]
+        time.sleep(0.2)
+        states = [manager.get(job_id).status.value for job_id in [running, sleeping] + queued]
+        print(f"   Before: {states}")
+
+        for job_id in [queued[0], running, sleeping]:
+            manager.cancel(job_id)
+        for job_id in [queued[0], running, sleeping]:
+            manager.wait(job_id, timeout=5)
+        gate.set()
+        manager.wait(queued[1], timeout=5)
+
+        states = [manager.get(job_id).status for job_id in [running, sleeping] + queued]
+        ok = states == [JobStatus.CANCELLED] * 3 + [JobStatus.COMPLETED]
+        print(f"   {'✅' if ok else '❌'} After: {[s.value for s in states]}")
+        print(f"   {'✅' if not manager.cancel(queued[1]) else '❌'} Finished jobs can't be cancelled")
+
+        turns = Concurrency()
+
+        def turn(seconds, job=None):
+            turns.enter("conversation")
+            time.sleep(seconds)  # Never checks for cancellation
+            turns.exit("conversation")
+            return "answered"
+
+        first = manager.submit("chat", turn, 0.3, platform="conversation")
+        time.sleep(0.05)
+        manager.cancel(first)
+        still_running = manager.get(first).status == JobStatus.RUNNING
+        second = manager.wait(manager.submit("chat", turn, 0.05, platform="conversation"), timeout=5)
+        ok = (still_running and turns.peak["conversation"] == 1
+              and manager.get(first).status == JobStatus.CANCELLED
+              and second.status == JobStatus.COMPLETED)
+        print(f"   {'✅' if ok else '❌'} A cancelled turn keeps its slot until its thread returns "
+              f"(peak {turns.peak['conversation']} turn at once)")
+
+        print("\n5. Multi-platform jobs take a slot on each platform...")
+        seen = Concurrency()
+
+        def multi(platforms, job=None):
+            for platform in platforms:
+                seen.enter(platform)
+            time.sleep(0.05)
+            for platform in platforms:
+                seen.exit(platform)
+            return threading.current_thread().name
+
+        async def pooled(job=None):
+            return await manager.run_in_executor(lambda: threading.current_thread().name)
+
+        ids = [
+            manager.submit("research", multi, ["deezer", "youtube"], platforms=["youtube", "Deezer"])
+            for _ in range(8)
+        ] + [manager.submit("download", multi, ["deezer"], platform="deezer") for _ in range(4)]
+        jobs = [manager.wait(job_id, timeout=10) for job_id in ids]
+        ok = (all(job.status == JobStatus.COMPLETED for job in jobs)
+              and seen.peak["deezer"] <= 2 and jobs[0].platforms == ["deezer", "youtube"])
+        print(f"   {'✅' if ok else '❌'} Peak running: {seen.peak}, slots: {jobs[0].platforms}")
+
+        job = manager.wait(manager.submit("research", pooled), timeout=5)
+        ok = job.status == JobStatus.COMPLETED and job.result.startswith("music-agent-job")
+        print(f"   {'✅' if ok else '❌'} Blocking steps of async jobs run in the job pool ({job.result})")
+
+        print("\n6. Failures...")
+
+        def broken():
+            raise ValueError("platform unavailable")
+
+        job = manager.wait(manager.submit("research", broken))
+        ok = job.status == JobStatus.FAILED and "unavailable" in job.error
+        print(f"   {'✅' if ok else '❌'} {job.status.value}: {job.error}")
+
+        print(f"\n   Stats: {manager.get_stats()}")
+
+    finally:
+        manager.shutdown()
+
+
+if __name__ == "__main__":
+    test_jobs()
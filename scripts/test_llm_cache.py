@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test the LLM response cache, batched embeddings, streaming and request
+concurrency limits against a local fake OpenAI-compatible server (no API
+key or network needed).
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from aiohttp import web
+
+CACHE_DIR = tempfile.mkdtemp(prefix="llm_cache_test_")
+
+# Configure before the service reads its settings
+os.environ["OPENAI_API_KEY"] = "test-key"
+os.environ["LLM_CACHE_PATH"] = os.path.join(CACHE_DIR, "llm.db")
+os.environ["EMBEDDING_BATCH_SIZE"] = "4"
+os.environ["OPENAI_MAX_CONCURRENCY"] = "3"
+
+requests_seen = {"chat": 0, "embeddings": 0, "embedding_inputs": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+async def stream_completion(request: web.Request, body: dict, content: str) -> web.StreamResponse:
+    """Send the completion word by word as server-sent events."""
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+
+    def chunk(delta: dict, finish_reason=None, usage=None) -> bytes:
+        payload = {
+            "id": f"chatcmpl-{requests_seen['chat']}",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": body["model"],
+            "choices": [] if usage else [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            "usage": usage,
+        }
+        return f"data: {json.dumps(payload)}\n\n".encode()
+
+    for i, word in enumerate(content.split(" ")):
+        await response.write(chunk({"content": word if i == 0 else f" {word}"}))
+        await asyncio.sleep(0.01)
+    await response.write(chunk({}, finish_reason="stop"))
+    await response.write(chunk({}, usage={"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30}))
+    await response.write(b"data: [DONE]\n\n")
+    await response.write_eof()
+    return response
+
+
+async def chat_completions(request: web.Request) -> web.StreamResponse:
+    """Echo the last user message back as the completion."""
+    body = await request.json()
+    requests_seen["chat"] += 1
+    requests_seen["in_flight"] += 1
+    requests_seen["max_in_flight"] = max(requests_seen["max_in_flight"], requests_seen["in_flight"])
+    try:
+        await asyncio.sleep(0.05)
+        wants_json = body.get("response_format", {}).get("type") == "json_object"
+        content = '{"category": "techno"}' if wants_json else f"echo: {body['messages'][-1]['content'][:40]}"
+        if body.get("stream"):
+            return await stream_completion(request, body, content)
+    finally:
+        requests_seen["in_flight"] -= 1
+
+    return web.json_response({
+        "id": f"chatcmpl-{requests_seen['chat']}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30},
+    })
+
+
+async def embeddings(request: web.Request) -> web.Response:
+    """Return a deterministic vector per input."""
+    body = await request.json()
+    inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+    requests_seen["embeddings"] += 1
+    requests_seen["embedding_inputs"] += len(inputs)
+    return web.json_response({
+        "object": "list",
+        "model": body["model"],
+        "data": [
+            {"object": "embedding", "index": i, "embedding": [float(len(text)), float(i), 0.5]}
+            for i, text in enumerate(inputs)
+        ],
+        "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+    })
+
+
+async def start_server() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_post("/v1/embeddings", embeddings)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    return runner
+
+
+async def test_llm_cache():
+    """Repeated requests should be served from the cache."""
+    print("=" * 60)
+    print("Testing LLM response cache")
+    print("=" * 60)
+
+    runner = await start_server()
+
+    from src.music_agent.services.llm_service import LLMService
+
+    service = LLMService()
+
+    print("\n1. Identical completions...")
+    first = await service.complete("Describe acid techno", temperature=0.1)
+    second = await service.complete("Describe acid techno", temperature=0.1)
+    print(f"   Content: {first.content}")
+    print(f"   {'✅' if first == second and requests_seen['chat'] == 1 else '❌'} "
+          f"API calls: {requests_seen['chat']} (expected 1)")
+
+    print("\n2. Different parameters are separate entries...")
+    await service.complete("Describe acid techno", temperature=0.9)
+    print(f"   {'✅' if requests_seen['chat'] == 2 else '❌'} API calls: {requests_seen['chat']} (expected 2)")
+
+    print("\n3. Repeated classification...")
+    for _ in range(3):
+        scores = await service.classify("303 squelch at 135 BPM", ["techno", "house"], confidence_scores=True)
+    print(f"   Scores: {scores}")
+    print(f"   {'✅' if requests_seen['chat'] == 3 else '❌'} API calls: {requests_seen['chat']} (expected 3)")
+
+    print("\n4. Batched embeddings...")
+    texts = [f"track {i}" for i in range(10)] + ["track 0", "track 1"]
+    vectors = await service.embed_many(texts)
+    print(f"   {'✅' if len(vectors) == 12 and vectors[10] == vectors[0] else '❌'} {len(vectors)} vectors in input order")
+    print(f"   {'✅' if requests_seen['embeddings'] == 3 else '❌'} "
+          f"Requests: {requests_seen['embeddings']} for {requests_seen['embedding_inputs']} unique inputs (expected 3 for 10)")
+
+    vectors = await service.embed_many(texts + ["track 10"])
+    single = await service.generate_embedding("track 3")
+    print(f"   {'✅' if requests_seen['embedding_inputs'] == 11 and single == vectors[3] else '❌'} "
+          f"Re-embedding sent only the new input ({requests_seen['embedding_inputs']} inputs total)")
+
+    print("\n5. Cache survives a new service instance...")
+    await service.cache.close()
+    service = LLMService()
+    await service.complete("Describe acid techno", temperature=0.1)
+    print(f"   {'✅' if requests_seen['chat'] == 3 else '❌'} API calls: {requests_seen['chat']} (expected 3)")
+    print(f"   Cache stats: {service.get_cache_stats()}")
+
+    print("\n6. Streaming...")
+    fragments = [fragment async for fragment in service.stream("Name three acid techno labels")]
+    print(f"   Fragments: {fragments}")
+    print(f"   {'✅' if len(fragments) > 1 and ''.join(fragments).startswith('echo: Name') else '❌'} "
+          f"{len(fragments)} fragments")
+    replay = [fragment async for fragment in service.stream("Name three acid techno labels")]
+    completed = await service.complete("Name three acid techno labels")
+    print(f"   {'✅' if replay == [''.join(fragments)] and completed.content == replay[0] and requests_seen['chat'] == 4 else '❌'} "
+          f"Streamed response cached for stream and complete (API calls: {requests_seen['chat']}, expected 4)")
+
+    print("\n7. Concurrency limit...")
+    await asyncio.gather(*(service.complete(f"Track {i}", cache=False) for i in range(9)))
+    print(f"   {'✅' if requests_seen['max_in_flight'] <= 3 else '❌'} "
+          f"Max in flight: {requests_seen['max_in_flight']} (limit 3)")
+
+    print("\n8. Slow stream readers don't hold a slot...")
+    service._semaphore = asyncio.Semaphore(1)  # One slot, so a held slot would block everything
+    stream = service.stream("Slow reader", cache=False)
+    first = await stream.__anext__()
+    await asyncio.sleep(0.5)  # Server has finished; the reader hasn't
+    start = time.monotonic()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(service.complete(f"Meanwhile {i}", cache=False) for i in range(3))), 2
+        )
+        waited = f"{time.monotonic() - start:.2f}s"
+    except asyncio.TimeoutError:
+        waited = None
+    rest = [fragment async for fragment in stream]
+    print(f"   {'✅' if waited and ''.join([first] + rest).startswith('echo: Slow') else '❌'} "
+          f"3 completions with a stream half-read: {waited or 'blocked'}")
+
+    await service.cache.close()
+
+    print("\n9. Tokens-per-minute budget...")
+    from src.music_agent.utils.rate_limit import TokenBudget
+    service = LLMService()
+    service.budget = TokenBudget(1200)  # OPENAI_TPM=1200: 20 tokens per second
+    service.budget.settle(0, 1200)  # Spent by earlier requests
+    start = time.monotonic()
+    await asyncio.gather(*(service.complete(f"Budget {i}", max_tokens=10, cache=False) for i in range(2)))
+    elapsed = time.monotonic() - start
+    print(f"   Tokens used: {service.get_token_usage()}, budget left: {service.budget.available:.0f}")
+    print(f"   {'✅' if elapsed >= 2.0 else '❌'} 2 requests on an exhausted 1200 tokens/min budget "
+          f"waited {elapsed:.1f}s for it to refill")
+
+    await service.cache.close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_llm_cache())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test MusicMemory's indexed read paths against a live Neo4j (NEO4J_* env vars):
+typed Preference/Discovery writes, get_user_preferences and
+analyze_listening_patterns as index-backed Cypher, per-session caching
+with invalidation on write, and backfilling preferences stored only as
+episodes. Episodes are not sent to Graphiti (no LLM calls). Test nodes are
+removed afterwards. Skips if Neo4j doesn't answer within NEO4J_TIMEOUT
+seconds (default 5).
+"""
+
+import os
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
+from src.music_agent.integrations.graphiti_memory import MusicMemory
+from src.music_agent.integrations.graph_writer import StructuredGraphWriter
+
+SESSION = "memory_queries_test"
+CONNECT_TIMEOUT = float(os.getenv("NEO4J_TIMEOUT", "5"))
+
+
+class NoEpisodes:
+    """Stands in for the ingestion queue so no episodes reach the LLM."""
+
+    async def submit_track(self, **kwargs):
+        return None
+
+    async def submit_episode(self, **kwargs):
+        return None
+
+    async def close(self, timeout=None):
+        return None
+
+
+class Graph:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+async def cleanup(driver):
+    await driver.execute_query("MATCH (n:Preference {group_id: $group_id}) DELETE n", group_id=SESSION)
+    await driver.execute_query("MATCH (n:Discovery {group_id: $group_id}) DELETE n", group_id=SESSION)
+    await driver.execute_query("MATCH (n:Episodic {group_id: $group_id}) DETACH DELETE n", group_id=SESSION)
+
+
+async def test_memory_queries():
+    print("=" * 60)
+    print("Testing indexed memory queries")
+    print("=" * 60)
+
+    driver = Neo4jDriver(
+        uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        user=os.getenv("NEO4J_USERNAME", "neo4j"),
+        password=os.getenv("NEO4J_PASSWORD", "deezmusic123"),
+        database=os.getenv("NEO4J_DATABASE", "music"),
+    )
+    try:
+        await asyncio.wait_for(driver.client.verify_connectivity(), timeout=CONNECT_TIMEOUT)
+    except Exception as e:
+        print(f"⚠️ Neo4j not reachable at {os.getenv('NEO4J_URI', 'bolt://localhost:7687')} "
+              f"({type(e).__name__}), skipping")
+        await driver.close()
+        return
+
+    memory = MusicMemory()
+    memory.graphiti = Graph(driver)
+    memory.session_id = SESSION
+    memory.initialized = True
+    memory.ingest = NoEpisodes()
+    memory.graph = StructuredGraphWriter(driver, group_id=SESSION)
+
+    try:
+        await cleanup(driver)
+        await memory.graph.ensure_indexes()
+
+        print("\n1. Recording preferences and discoveries...")
+        await memory.add_preference("artist", "Burial", "likes", 0.9, "Late-night sets")
+        await memory.add_preference("genre", "Gabber", "dislikes", 0.1)
+        for i in range(20):
+            await memory.add_track_discovery(
+                {"id": i, "title": f"MQ Track {i}", "artist": "MQ Artist", "bpm": 120 + i % 5, "key": "8A"},
+                source="deezer" if i % 2 else "rekordbox",
+                action="played"
+            )
+        print(f"   {memory.graph.stats.events} typed events written")
+
+        print("\n2. get_user_preferences...")
+        preferences = await memory.get_user_preferences()
+        likes = await memory.get_user_preferences(preference_type="likes")
+        artists = await memory.get_user_preferences(preference_type="artist")
+        ok = (len(preferences) == 2 and preferences[0]["entity_name"] == "Gabber"
+              and [p["entity_name"] for p in likes] == ["Burial"]
+              and [p["entity_name"] for p in artists] == ["Burial"])
+        print(f"   {'✅' if ok else '❌'} {len(preferences)} preferences (newest first), "
+              f"{len(likes)} likes, {len(artists)} artist")
+
+        print("\n3. analyze_listening_patterns...")
+        patterns = await memory.analyze_listening_patterns("week")
+        ok = (patterns["total_discoveries"] >= 20
+              and patterns["by_source"].get("deezer", 0) >= 10
+              and patterns["buckets"])
+        print(f"   {'✅' if ok else '❌'} {patterns['total_discoveries']} discoveries, "
+              f"avg BPM {patterns['average_bpm']}, by source {patterns['by_source']}, "
+              f"{len(patterns['buckets'])} daily buckets")
+
+        print("\n4. Cached reads and invalidation on write...")
+        start = time.perf_counter()
+        await memory.get_user_preferences()
+        await memory.analyze_listening_patterns("week")
+        cached = time.perf_counter() - start
+        hits = memory._reads.stats.hits
+        await memory.add_preference("label", "Hyperdub", "likes", 0.8)
+        preferences = await memory.get_user_preferences()
+        ok = hits >= 2 and len(preferences) == 3 and preferences[0]["entity_name"] == "Hyperdub"
+        print(f"   {'✅' if ok else '❌'} {hits} cache hits ({cached * 1000:.2f} ms), "
+              f"{len(preferences)} preferences after write")
+
+        print("\n5. Preferences stored only as episodes are backfilled...")
+        await driver.execute_query(
+            """
+            CREATE (e:Episodic {uuid: 'mq-legacy-1', name: 'preference_artist_likes_120000',
+                                group_id: $group_id, created_at: datetime() - duration('P30D'),
+                                content: $content})
+            """,
+            group_id=SESSION,
+            content="User preference recorded:\nType: likes artist\nEntity: Kode9\nScore: 0.7\n"
+                    "Preference Type: preference\nEntity Type: artist\nTimestamp: 2025-01-01T00:00:00"
+        )
+        memory._preferences_migrated = False
+        preferences = await memory.get_user_preferences()
+        again = await memory.migrate_preference_episodes()
+        legacy = [p for p in preferences if p["entity_name"] == "Kode9"]
+        ok = (len(preferences) == 4 and preferences[-1]["entity_name"] == "Kode9"
+              and legacy[0]["preference_type"] == "likes" and again == 0)
+        print(f"   {'✅' if ok else '❌'} {len(preferences)} preferences, legacy entry: {legacy}, "
+              f"{again} added on a second run")
+
+        print("\n6. Query plans use the indexes...")
+        plan = await driver.execute_query(
+            "EXPLAIN MATCH (p:Preference) WHERE p.group_id = $group_id RETURN p", group_id=SESSION
+        )
+        operators = str(plan.summary.plan)
+        print(f"   {'✅' if 'NodeIndexSeek' in operators else '❌'} Preference lookup by group_id")
+        plan = await driver.execute_query(
+            "EXPLAIN MATCH (d:Discovery) WHERE d.created_at >= datetime() - duration('P7D') RETURN d"
+        )
+        operators = str(plan.summary.plan)
+        print(f"   {'✅' if 'NodeIndexSeekByRange' in operators else '❌'} Discovery range scan by created_at")
+
+    finally:
+        await cleanup(driver)
+        await driver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_memory_queries())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test the Soulseek peer share cache with generated 100k-file listings:
+one browse per peer, indexed lookups, reuse across client instances,
+cross-peer queries and TTL expiry (no slskd server needed).
+"""
+
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.music_agent.integrations.soulseek import (
+    SoulseekClient, SoulseekConfig, ShareCacheConfig, FileInfo, File,
+)
+
+CACHE_DIR = tempfile.mkdtemp(prefix="soulseek_shares_test_")
+browses = {"count": 0}
+
+
+def make_listing(username: str, files: int, seed: int) -> dict:
+    """A browse response with ``files`` files in album folders."""
+    rng = random.Random(seed)
+    directories = []
+    for album in range(files // 10):
+        artist = "Burial" if album % 500 == 0 else f"Artist {rng.randint(1, 3000)}"
+        directories.append({
+            "name": f"@@{username}\\Music\\{artist}\\Album {album}",
+            "files": [
+                {
+                    "filename": f"{n + 1:02d} - {artist} - Track {album}-{n}.mp3",
+                    "size": rng.randint(5_000_000, 20_000_000),
+                    "bitRate": 320,
+                    "length": rng.randint(150, 500),
+                    "sampleRate": 44100,
+                }
+                for n in range(10)
+            ],
+        })
+    return {"directories": directories, "lockedDirectories": []}
+
+
+def make_client(ttl: int = 3600) -> SoulseekClient:
+    config = SoulseekConfig()
+    config.shares = ShareCacheConfig(cache_dir=CACHE_DIR, ttl=ttl)
+    client = SoulseekClient(config)
+    client._connected = True
+
+    async def browse_shares(username: str, timeout: int = 10) -> dict:
+        browses["count"] += 1
+        await asyncio.sleep(0.5)  # Listing transfer
+        return make_listing(username, 100_000, seed=hash(username) % 1000)
+
+    async def search(query: str, **kwargs):
+        return [
+            FileInfo(
+                file=File(filename=f"@@{peer}\\Music\\Burial\\Album 0\\01 - Burial - Track 0-0.mp3", size=9_000_000),
+                username=peer,
+                free_upload_slots=True,
+            )
+            for peer in ("peer_a", "peer_b", "peer_c")
+        ]
+
+    # The test replaces the network calls only
+    client.user_api.browse_shares = browse_shares
+    client.search = search
+    return client
+
+
+async def test_share_cache():
+    print("=" * 60)
+    print("Testing Soulseek peer share cache")
+    print("=" * 60)
+
+    client = make_client()
+
+    print("\n1. First discovery browses each of the 3 peers once...")
+    start = time.perf_counter()
+    first = await client.discover_similar("Burial - Archangel", limit=20)
+    elapsed = time.perf_counter() - start
+    print(f"   {'✅' if browses['count'] == 3 else '❌'} Browses: {browses['count']} (expected 3), {elapsed:.2f}s")
+    print(f"   {'✅' if first and all('Burial' in f.file.filename for f in first) else '❌'} "
+          f"{len(first)} files by the artist, e.g. {first[0].file.filename if first else '-'}")
+
+    print("\n2. Second discovery is answered locally...")
+    start = time.perf_counter()
+    second = await client.discover_similar("Burial - Archangel", limit=20)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"   {'✅' if browses['count'] == 3 else '❌'} Browses: {browses['count']} (expected 3), {elapsed:.1f} ms")
+    print(f"   {'✅' if [f.file.filename for f in first] == [f.file.filename for f in second] else '❌'} Same results")
+
+    print("\n3. A new client reads the disk cache...")
+    client = make_client()
+    start = time.perf_counter()
+    third = await client.discover_similar("Burial - Archangel", limit=20)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"   {'✅' if browses['count'] == 3 and len(third) == len(first) else '❌'} "
+          f"Browses: {browses['count']} (expected 3), {elapsed:.1f} ms (index loaded from disk)")
+
+    print("\n4. Cross-peer query over cached listings...")
+    start = time.perf_counter()
+    matches = await client.search_shares("burial track 500", limit=50)
+    elapsed = (time.perf_counter() - start) * 1000
+    peers = sorted({m.username for m in matches})
+    print(f"   {'✅' if len(peers) == 3 else '❌'} {len(matches)} files from {peers} in {elapsed:.1f} ms")
+
+    size_kb = sum(f.stat().st_size for f in Path(CACHE_DIR).glob("*.json.gz")) / 1024
+    print(f"   Disk: {size_kb:.0f} KB for 3 x 100,000 files")
+
+    print("\n5. Expired listings are browsed again...")
+    client = make_client(ttl=1)
+    await asyncio.sleep(1.1)
+    await client.get_peer_shares("peer_a")
+    print(f"   {'✅' if browses['count'] == 4 else '❌'} Browses: {browses['count']} (expected 4)")
+    print(f"   Stats: {client.share_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_share_cache())
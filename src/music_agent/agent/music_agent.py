@@ -7,11 +7,12 @@ Supports multiple AI models, intelligent tool management, and extensive platform
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from ..database.schema import init_database
 from ..utils.config import config as app_config
+from ..utils.jobs import Job, JobCancelled, JobManager, get_job_manager
 
 from .models import ModelConfig, ModelProvider, ModelManager
 from .tools_manager import ToolsManager, ToolsProfile
@@ -19,6 +20,20 @@ from .config import AgentConfig, SystemPromptManager, PromptTemplate
 
 logger = logging.getLogger(__name__)
 
+RESEARCH_PROMPT = """Research this track: {query}
+
+Candidates already found by searching {platform}:
+{candidates}
+
+Identify the best match and fill in what the candidates are missing (label,
+release date, BPM, key, genre) using your tools. Finish with a short summary:
+the matched track, its metadata, and where it can be streamed or downloaded."""
+
+DOWNLOAD_PROMPT = "Search for and download the track: {query}"
+
+# Remote platforms search_music queries for "all" (the local catalog has no limit)
+SEARCH_PLATFORMS = ("deezer", "spotify", "youtube")
+
 
 class MusicAgent:
     """
@@ -136,7 +151,9 @@ class MusicAgent:
         # Get system prompt
         system_prompt = self._get_system_prompt()
         
-        # Create agent
+        # Create agent (worker agents for background jobs reuse the tools and prompt)
+        self._tools = tools
+        self._system_prompt = system_prompt
         self.agent = self.model_manager.create_agent(tools, system_prompt)
         
         if not self.agent:
@@ -188,13 +205,19 @@ class MusicAgent:
             tools_profile=self.config.tools_profile
         )
     
-    def chat(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+    def chat(
+        self,
+        message: str,
+        context: Optional[Dict[str, Any]] = None,
+        job: Optional[Job] = None
+    ) -> str:
         """
         Process a chat message and return the response.
         
         Args:
             message: User message
             context: Optional conversation context
+            job: Background job to report tool calls to (see ``submit_chat``)
         
         Returns:
             Agent response
@@ -216,7 +239,11 @@ class MusicAgent:
             
             # Process message
             start_time = datetime.now()
-            result = self.agent(enhanced_message)
+            history = len(self.agent.messages)
+            if job:
+                result = self.agent(enhanced_message, callback_handler=self._job_callback(job))
+            else:
+                result = self.agent(enhanced_message)
             processing_time = (datetime.now() - start_time).total_seconds()
             
             # Extract response
@@ -233,10 +260,188 @@ class MusicAgent:
             
             return response
             
+        except JobCancelled:
+            # Drop the interrupted turn (its user message, and a tool use
+            # without a result), which would break the next turn
+            del self.agent.messages[history:]
+            raise
+            
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             return f"I encountered an error while processing your request: {str(e)}. Please try again or rephrase your question."
     
+    @property
+    def jobs(self) -> JobManager:
+        """The shared background job pool."""
+        return get_job_manager()
+    
+    def _job_callback(self, job: Job) -> Callable[..., None]:
+        """
+        Create a Strands callback handler for a background job.
+        
+        Reports each tool call as a job update, and stops the agent at its
+        next event once the job is cancelled.
+        """
+        seen = set()
+        
+        def handler(**event):
+            job.raise_if_cancelled()
+            tool = event.get("current_tool_use")
+            if tool and tool.get("name") and tool.get("toolUseId") not in seen:
+                seen.add(tool.get("toolUseId"))
+                job.report(f"Calling {tool['name']}", tool=tool["name"])
+        
+        return handler
+    
+    def _run_worker(self, prompt: str, job: Optional[Job] = None) -> str:
+        """
+        Run a prompt on a fresh agent.
+        
+        The conversational agent keeps one message history and can't take
+        concurrent calls, so each background job gets its own agent with the
+        same tools and system prompt.
+        
+        Args:
+            prompt: Prompt to run
+            job: Job to report progress to
+        
+        Returns:
+            Agent response
+        """
+        if not self.initialized:
+            raise RuntimeError("Agent not properly initialized")
+        
+        agent = self.model_manager.create_agent(self._tools, self._system_prompt)
+        if not agent:
+            raise RuntimeError("Failed to create Strands agent")
+        
+        handler = self._job_callback(job) if job else (lambda **event: None)
+        return self._extract_response(agent(prompt, callback_handler=handler))
+    
+    async def research_track(
+        self,
+        query: str,
+        platform: str = "all",
+        limit: int = 10,
+        job: Optional[Job] = None
+    ) -> Dict[str, Any]:
+        """
+        Research a track without blocking the caller's event loop.
+        
+        Searches for candidates first (local catalog, then platforms), then
+        has a worker agent pick the match and complete its metadata.
+        
+        Args:
+            query: Track to research (e.g. "Artist - Title")
+            platform: Platform to search ("all" for multi-platform)
+            limit: Maximum candidates
+            job: Job to report progress and partial results to
+        
+        Returns:
+            Research result with candidates and the agent's summary
+        """
+        start_time = datetime.now()
+        
+        if job:
+            job.report(f"Searching {platform} for '{query}'")
+        candidates = await self.jobs.run_in_executor(self.search, query, platform, limit)
+        if job:
+            job.report(f"Found {len(candidates)} candidates", results=candidates)
+        
+        prompt = RESEARCH_PROMPT.format(
+            query=query,
+            platform=platform,
+            candidates=json.dumps(candidates, indent=2, default=str) if candidates else "None"
+        )
+        summary = await self.jobs.run_in_executor(self._run_worker, prompt, job)
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        if job:
+            job.report("Research complete")
+        
+        return {
+            "query": query,
+            "platform": platform,
+            "candidates": candidates,
+            "summary": summary,
+            "processing_time": processing_time
+        }
+    
+    def download_track(self, query: str, platform: str = "deezer", job: Optional[Job] = None) -> str:
+        """
+        Search for and download a track with a worker agent.
+        
+        Args:
+            query: Track to download
+            platform: Preferred platform
+            job: Job to report progress to
+        
+        Returns:
+            Agent response describing the download
+        """
+        if job:
+            job.report(f"Looking for '{query}' on {platform}")
+        prompt = DOWNLOAD_PROMPT.format(query=query)
+        if platform != "deezer":
+            prompt += f" (prefer {platform})"
+        return self._run_worker(prompt, job)
+    
+    def submit_chat(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Queue a chat message as a background job.
+        
+        Chat jobs run on the conversational agent, one at a time and in
+        submission order.
+        
+        Args:
+            message: User message
+            context: Optional conversation context
+        
+        Returns:
+            Job ID
+        """
+        return self.jobs.submit(
+            "chat", self.chat, message, context,
+            platform="conversation", description=message
+        )
+    
+    def submit_research(self, query: str, platform: str = "all", limit: int = 10) -> str:
+        """
+        Queue a track research job.
+        
+        The job counts against the limit of every platform it searches.
+        
+        Args:
+            query: Track to research
+            platform: Platform to search ("all" for multi-platform)
+            limit: Maximum candidates
+        
+        Returns:
+            Job ID (the result is the ``research_track`` dict)
+        """
+        return self.jobs.submit(
+            "research", self.research_track, query, platform, limit,
+            platform=platform,
+            platforms=SEARCH_PLATFORMS if platform == "all" else [platform],
+            description=query
+        )
+    
+    def submit_download(self, query: str, platform: str = "deezer") -> str:
+        """
+        Queue a download job.
+        
+        Args:
+            query: Track to download
+            platform: Preferred platform (counted against its concurrency limit)
+        
+        Returns:
+            Job ID (the result is the agent's response)
+        """
+        return self.jobs.submit(
+            "download", self.download_track, query, platform,
+            platform=platform, description=query
+        )
+    
     def _extract_response(self, result) -> str:
         """Extract text response from agent result."""
         if hasattr(result, 'output'):
@@ -0,0 +1,29 @@
+"""
+Shared async cache package.
+
+Provides the ``get``/``set`` cache interface used by the integrations, with
+interchangeable tiers:
+- In-memory LRU with TTL and size limits
+- Optional on-disk SQLite tier
+- Optional Redis tier (the docker-compose Redis service)
+- Multi-tier manager with stampede protection and hit-rate stats
+- Compressed on-disk page cache with HTTP revalidation for the scrapers
+"""
+
+from .base import CacheBackend, CacheStats
+from .memory import InMemoryCache
+from .sqlite import SQLiteCache
+from .manager import CacheManager, build_cache
+from .pages import CachedPage, PageCache, get_page_cache
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "InMemoryCache",
+    "SQLiteCache",
+    "CacheManager",
+    "build_cache",
+    "CachedPage",
+    "PageCache",
+    "get_page_cache",
+]
@@ -0,0 +1,75 @@
+"""
+Cache backend interface and statistics.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache tier or manager."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "errors": self.errors,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Async key/value cache tier.
+
+    ``get`` returns None on a miss, so None itself cannot be cached.
+    """
+
+    name: str = "cache"
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value with an optional TTL in seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every value."""
+
+    async def close(self) -> None:
+        """Release resources held by the backend."""
+
+    @staticmethod
+    def expiry(ttl: Optional[int]) -> Optional[float]:
+        """Absolute wall-clock expiry time for a TTL (None = never)."""
+        return time.time() + ttl if ttl else None
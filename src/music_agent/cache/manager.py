@@ -0,0 +1,256 @@
+"""
+Multi-tier cache manager.
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from .base import CacheBackend, CacheStats
+from .memory import InMemoryCache
+from .sqlite import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManager:
+    """
+    Read-through cache over ordered tiers (e.g. memory -> SQLite -> Redis).
+
+    Lookups try each tier in order and promote hits into the faster tiers;
+    writes go to every tier. ``get_or_set`` adds stampede protection: while
+    a value is being computed for a key, concurrent callers for the same key
+    wait for that single computation instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: int = 3600,
+        tiers: Optional[List[CacheBackend]] = None,
+        namespace: str = ""
+    ):
+        """
+        Initialize cache manager.
+
+        Args:
+            backend: Single cache tier (ignored when ``tiers`` is given)
+            default_ttl: Default TTL in seconds
+            tiers: Ordered cache tiers, fastest first
+            namespace: Prefix applied to every key
+        """
+        self.tiers: List[CacheBackend] = list(tiers) if tiers else ([backend] if backend else [])
+        self.default_ttl = default_ttl
+        self.namespace = namespace
+        self.stats = CacheStats()
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        """The fastest tier (None when caching is disabled)."""
+        return self.tiers[0] if self.tiers else None
+
+    @backend.setter
+    def backend(self, backend: Optional[CacheBackend]):
+        """Replace every tier with a single backend."""
+        self.tiers = [backend] if backend else []
+
+    @backend.deleter
+    def backend(self):
+        """Drop every tier (disables caching)."""
+        self.tiers = []
+
+    def __bool__(self) -> bool:
+        return bool(self.tiers)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}" if self.namespace else key
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the first tier that has it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        full_key = self._key(key)
+
+        for index, tier in enumerate(self.tiers):
+            value = await tier.get(full_key)
+            if value is not None:
+                self.stats.hits += 1
+                # Promote into the faster tiers that missed
+                for faster in self.tiers[:index]:
+                    await faster.set(full_key, value, self.default_ttl)
+                return value
+
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store a value in every tier.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is not cacheable)
+            ttl: TTL in seconds (defaults to ``default_ttl``)
+
+        Returns:
+            True if the value was handed to at least one tier
+        """
+        if value is None or not self.tiers:
+            return False
+
+        full_key = self._key(key)
+        ttl = ttl or self.default_ttl
+        for tier in self.tiers:
+            await tier.set(full_key, value, ttl)
+        self.stats.sets += 1
+        return True
+
+    async def delete(self, key: str) -> None:
+        """Remove a value from every tier."""
+        full_key = self._key(key)
+        for tier in self.tiers:
+            await tier.delete(full_key)
+
+    async def clear(self) -> None:
+        """Clear every tier."""
+        for tier in self.tiers:
+            await tier.clear()
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Get a value, computing and caching it on a miss.
+
+        Concurrent misses for the same key share one ``factory`` call.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+            ttl: TTL in seconds
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def cached(self, ttl: Optional[int] = None, key_prefix: Optional[str] = None):
+        """
+        Decorator caching an async function's result by its arguments.
+
+        Args:
+            ttl: TTL in seconds
+            key_prefix: Key prefix (defaults to the function's qualified name)
+
+        Returns:
+            Decorator
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]):
+            prefix = key_prefix or f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                signature = repr((args, sorted(kwargs.items())))
+                key = f"{prefix}:{hashlib.md5(signature.encode()).hexdigest()}"
+                return await self.get_or_set(key, lambda: func(*args, **kwargs), ttl)
+
+            return wrapper
+
+        return decorator
+
+    async def close(self) -> None:
+        """Release resources held by every tier."""
+        for tier in self.tiers:
+            await tier.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate statistics.
+
+        Returns:
+            Overall stats plus per-tier stats
+        """
+        stats = self.stats.to_dict()
+        stats["tiers"] = {tier.name: tier.stats.to_dict() for tier in self.tiers}
+        return stats
+
+
+def build_cache(
+    namespace: str,
+    default_ttl: int = 3600,
+    max_entries: int = 1000,
+    max_memory_bytes: Optional[int] = None,
+    disk_path: Optional[Union[str, Path]] = None,
+    max_disk_bytes: int = 100 * 1024 * 1024,
+    redis_url: Optional[str] = None
+) -> CacheManager:
+    """
+    Build a tiered cache from simple settings.
+
+    The memory tier is always present; the SQLite tier is added when
+    ``disk_path`` is set and the Redis tier when ``redis_url`` is set and the
+    ``redis`` package is installed.
+
+    Args:
+        namespace: Key prefix (typically the integration name)
+        default_ttl: Default TTL in seconds
+        max_entries: Memory tier entry bound
+        max_memory_bytes: Optional memory tier size bound
+        disk_path: SQLite file path
+        max_disk_bytes: SQLite tier size bound
+        redis_url: Redis connection URL
+
+    Returns:
+        Configured CacheManager
+    """
+    tiers: List[CacheBackend] = [InMemoryCache(max_entries, max_memory_bytes)]
+
+    if disk_path:
+        tiers.append(SQLiteCache(disk_path, max_disk_bytes))
+
+    if redis_url:
+        try:
+            from .redis_cache import RedisCache
+            tiers.append(RedisCache(redis_url, namespace=namespace))
+        except ImportError as e:
+            logger.warning(f"Redis cache tier disabled: {e}")
+
+    return CacheManager(default_ttl=default_ttl, tiers=tiers, namespace=namespace)
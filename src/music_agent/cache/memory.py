@@ -0,0 +1,122 @@
+"""
+In-memory LRU cache tier.
+"""
+
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .base import CacheBackend
+
+
+class InMemoryCache(CacheBackend):
+    """
+    LRU cache with per-entry TTL, bounded by entry count and (optionally)
+    by the approximate pickled size of its values.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_size_bytes: Optional[int] = None,
+        default_ttl: Optional[int] = None
+    ):
+        """
+        Initialize in-memory cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_size_bytes: Optional bound on total value size
+            default_ttl: TTL used when ``set`` is called without one
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+
+        # key -> (value, expires_at, size)
+        self._data: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate size of cached values (0 when size is not tracked)."""
+        return self._size
+
+    def _measure(self, value: Any) -> int:
+        """Approximate a value's size; only paid for when a byte bound is set."""
+        if not self.max_size_bytes:
+            return 0
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._data.pop(key)
+        self._size -= size
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.time():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        size = self._measure(value)
+        if self.max_size_bytes and size > self.max_size_bytes:
+            return  # Never cache a single value larger than the whole tier
+
+        if key in self._data:
+            self._remove(key)
+
+        self._data[key] = (value, self.expiry(ttl or self.default_ttl), size)
+        self._size += size
+        self.stats.sets += 1
+
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_size_bytes and self._size > self.max_size_bytes)
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        if key in self._data:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self._size = 0
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        expired = [k for k, (_, exp, _) in self._data.items() if exp is not None and exp <= now]
+        for key in expired:
+            self._remove(key)
+        self.stats.expirations += len(expired)
+        return len(expired)
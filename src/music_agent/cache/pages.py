@@ -0,0 +1,442 @@
+"""
+On-disk page cache for the HTML scrapers.
+
+Stores fetched pages compressed in SQLite, keyed by URL, together with their
+``ETag``/``Last-Modified`` validators so stale entries can be revalidated
+with a conditional request (a 304 costs no body transfer and no re-parse).
+Parsed results are cached separately, tagged with the parser name/version
+and the hash of the page they came from, so a parser upgrade or a changed
+page invalidates them automatically. Total size is bounded with LRU
+eviction.
+"""
+
+import os
+import time
+import zlib
+import pickle
+import hashlib
+import asyncio
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .base import CacheStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_CACHE_PATH = "~/.music_agent_cache/pages.db"
+
+
+@dataclass
+class CachedPage:
+    """A cached page body and its HTTP validators."""
+
+    url: str
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float  # Last time the body was fetched or revalidated
+    content_hash: str
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the page can be used without revalidation."""
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers for revalidating this page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    Size-bounded, compressed page cache with conditional revalidation.
+
+    Safe to share between threads; the ``a*`` methods run the blocking
+    SQLite work in a worker thread for use from asyncio code.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_size_bytes: int = 200 * 1024 * 1024,
+        compress_level: int = 6
+    ):
+        """
+        Initialize page cache.
+
+        Args:
+            path: Database file path (defaults to ``PAGE_CACHE_PATH``)
+            max_size_bytes: Bound on total stored (compressed) size
+            compress_level: zlib compression level
+        """
+        self.path = Path(os.path.expanduser(
+            str(path or os.getenv("PAGE_CACHE_PATH", DEFAULT_PAGE_CACHE_PATH))
+        ))
+        self.max_size_bytes = max_size_bytes
+        self.compress_level = compress_level
+        self.stats = CacheStats()
+        self.revalidations = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at);
+                CREATE TABLE IF NOT EXISTS parsed (
+                    url TEXT NOT NULL,
+                    parser TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (url, parser)
+                );
+                """
+            )
+            self._purge_orphans(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def hash_content(html: str) -> str:
+        """Stable hash of a page body."""
+        return hashlib.sha1(html.encode("utf-8", "replace")).hexdigest()
+
+    # Pages
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Get a cached page regardless of age.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            CachedPage or None
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, fetched_at, content_hash FROM pages WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+
+        body, etag, last_modified, fetched_at, content_hash = row
+        self.stats.hits += 1
+        return CachedPage(
+            url=url,
+            html=zlib.decompress(body).decode("utf-8"),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+            content_hash=content_hash,
+        )
+
+    def get_fresh(self, url: str, ttl: float) -> Optional[str]:
+        """
+        Get a cached page body only if it is younger than ``ttl``.
+
+        Args:
+            url: Page URL
+            ttl: Freshness lifetime in seconds
+
+        Returns:
+            HTML or None
+        """
+        page = self.get(url)
+        return page.html if page and page.is_fresh(ttl) else None
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> CachedPage:
+        """
+        Store a freshly fetched page.
+
+        Args:
+            url: Page URL
+            html: Page body
+            etag: ``ETag`` response header
+            last_modified: ``Last-Modified`` response header
+
+        Returns:
+            The stored CachedPage
+        """
+        now = time.time()
+        content_hash = self.hash_content(html)
+        body = zlib.compress(html.encode("utf-8"), self.compress_level)
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, body, etag, last_modified, content_hash, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, content_hash, len(body), now, now)
+            )
+            self._evict(conn)
+        self.stats.sets += 1
+
+        return CachedPage(url, html, etag, last_modified, now, content_hash)
+
+    def put_response(self, url: str, html: str, headers) -> CachedPage:
+        """
+        Store a page along with the validators from its response headers.
+
+        Args:
+            url: Page URL
+            html: Page body
+            headers: Response headers mapping (requests, httpx, aiohttp or
+                Playwright's lower-cased ``all_headers()``)
+
+        Returns:
+            The stored CachedPage
+        """
+        headers = {str(name).lower(): value for name, value in headers.items()}
+        return self.put(url, html, headers.get("etag"), headers.get("last-modified"))
+
+    def touch(self, url: str) -> Optional[CachedPage]:
+        """
+        Mark a page as revalidated (after a 304 Not Modified).
+
+        Args:
+            url: Page URL
+
+        Returns:
+            The cached page or None if it was evicted meanwhile
+        """
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute("UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+        self.revalidations += 1
+        return self.get(url)
+
+    def delete(self, url: str) -> None:
+        """Remove a page and its parsed results."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            conn.execute("DELETE FROM parsed WHERE url = ?", (url,))
+
+    # Parsed results
+
+    def get_parsed(self, url: str, parser: str, version: str, content_hash: Optional[str] = None) -> Optional[Any]:
+        """
+        Get a parsed result for a URL.
+
+        The result is only returned if it was produced by the same parser
+        version from the page content currently cached (or ``content_hash``).
+
+        Args:
+            url: Page URL
+            parser: Parser name
+            version: Parser version
+            content_hash: Hash of the page the caller is about to parse
+
+        Returns:
+            Parsed value or None
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT p.value, p.version, p.content_hash, pg.content_hash "
+                "FROM parsed p LEFT JOIN pages pg ON pg.url = p.url "
+                "WHERE p.url = ? AND p.parser = ?",
+                (url, parser)
+            ).fetchone()
+
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        value, stored_version, parsed_hash, page_hash = row
+        expected_hash = content_hash or page_hash
+        if stored_version != version or parsed_hash != expected_hash:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return pickle.loads(zlib.decompress(value))
+
+    def put_parsed(
+        self,
+        url: str,
+        parser: str,
+        version: str,
+        value: Any,
+        content_hash: Optional[str] = None
+    ) -> None:
+        """
+        Store a parsed result for a URL.
+
+        Results are tied to a cached page and dropped with it, so nothing is
+        stored if the page isn't cached (e.g. it was evicted meanwhile).
+
+        Args:
+            url: Page URL
+            parser: Parser name
+            version: Parser version
+            value: Parsed value (must be picklable)
+            content_hash: Hash of the page it was parsed from (defaults to the
+                cached page's hash)
+        """
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), self.compress_level)
+
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT content_hash FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return  # Nothing to tie the result to
+            if content_hash is None:
+                content_hash = row[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO parsed (url, parser, version, content_hash, value, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, parser, version, content_hash, blob, len(blob))
+            )
+            self._evict(conn)
+
+    # Maintenance
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            "SELECT (SELECT COALESCE(SUM(size), 0) FROM pages) + (SELECT COALESCE(SUM(size), 0) FROM parsed)"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _purge_orphans(conn: sqlite3.Connection) -> int:
+        """Delete parsed results whose page is no longer cached."""
+        return conn.execute(
+            "DELETE FROM parsed WHERE NOT EXISTS (SELECT 1 FROM pages pg WHERE pg.url = parsed.url)"
+        ).rowcount
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Evict least-recently-used pages until under the size bound."""
+        total = self._total_size(conn)
+        if total <= self.max_size_bytes:
+            return
+
+        # Results left behind by older versions count towards the bound too
+        if self._purge_orphans(conn):
+            total = self._total_size(conn)
+            if total <= self.max_size_bytes:
+                return
+
+        excess = total - self.max_size_bytes
+        freed = 0
+        victims = []
+        rows = conn.execute(
+            "SELECT pg.url, pg.size + COALESCE((SELECT SUM(size) FROM parsed p WHERE p.url = pg.url), 0) "
+            "FROM pages pg ORDER BY pg.accessed_at"
+        )
+        for url, size in rows:
+            victims.append((url,))
+            freed += size
+            if freed >= excess:
+                break
+
+        conn.executemany("DELETE FROM pages WHERE url = ?", victims)
+        conn.executemany("DELETE FROM parsed WHERE url = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def clear(self) -> None:
+        """Remove every page and parsed result."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM pages")
+            conn.execute("DELETE FROM parsed")
+
+    def size_bytes(self) -> int:
+        """Total stored (compressed) size."""
+        with self._lock:
+            return self._total_size(self._connection())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters plus revalidation count and stored size
+        """
+        stats = self.stats.to_dict()
+        stats["revalidations"] = self.revalidations
+        stats["size_bytes"] = self.size_bytes()
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # Async wrappers
+
+    async def aget(self, url: str) -> Optional[CachedPage]:
+        """Async ``get``."""
+        return await asyncio.to_thread(self.get, url)
+
+    async def aput_response(self, url: str, html: str, headers) -> CachedPage:
+        """Async ``put_response``."""
+        return await asyncio.to_thread(self.put_response, url, html, headers)
+
+    async def atouch(self, url: str) -> Optional[CachedPage]:
+        """Async ``touch``."""
+        return await asyncio.to_thread(self.touch, url)
+
+    async def aget_parsed(self, url: str, parser: str, version: str, content_hash: Optional[str] = None) -> Optional[Any]:
+        """Async ``get_parsed``."""
+        return await asyncio.to_thread(self.get_parsed, url, parser, version, content_hash)
+
+    async def aput_parsed(self, url: str, parser: str, version: str, value: Any, content_hash: Optional[str] = None) -> None:
+        """Async ``put_parsed``."""
+        await asyncio.to_thread(self.put_parsed, url, parser, version, value, content_hash)
+
+
+# Global page cache instance
+_page_cache: Optional[PageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """Get the process-wide page cache."""
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            max_mb = int(os.getenv("PAGE_CACHE_MAX_MB", "200"))
+            _page_cache = PageCache(max_size_bytes=max_mb * 1024 * 1024)
+        return _page_cache
@@ -0,0 +1,101 @@
+"""
+Redis cache tier (optional; requires the ``redis`` package).
+"""
+
+import pickle
+import logging
+from typing import Any, Optional
+
+from .base import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache tier backed by the Redis service from docker-compose.
+
+    Values are pickled and stored under ``{namespace}:{key}`` with SETEX so
+    Redis handles expiry (and, with ``allkeys-lru``, eviction). Connection
+    failures are logged and treated as misses so a down Redis never breaks
+    the integrations.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        namespace: str = "music_agent",
+        default_ttl: Optional[int] = None
+    ):
+        """
+        Initialize Redis cache.
+
+        Args:
+            url: Redis connection URL
+            namespace: Key prefix
+            default_ttl: TTL used when ``set`` is called without one
+        """
+        if aioredis is None:
+            raise ImportError("redis not installed. Install with: pip install redis")
+
+        super().__init__()
+        self.url = url
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self._client = aioredis.from_url(url)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            blob = await self._client.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            self.stats.errors += 1
+            blob = None
+
+        if blob is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return pickle.loads(blob)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            ttl = ttl or self.default_ttl
+            if ttl:
+                await self._client.setex(self._key(key), ttl, blob)
+            else:
+                await self._client.set(self._key(key), blob)
+            self.stats.sets += 1
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+            self.stats.errors += 1
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    async def clear(self) -> None:
+        """Remove every key in this namespace."""
+        try:
+            keys = [k async for k in self._client.scan_iter(match=self._key("*"))]
+            if keys:
+                await self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
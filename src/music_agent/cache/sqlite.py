@@ -0,0 +1,166 @@
+"""
+On-disk SQLite cache tier.
+"""
+
+import asyncio
+import pickle
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .base import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache stored in a single SQLite file.
+
+    Values are pickled; least-recently-accessed rows are evicted once the
+    total stored size exceeds ``max_size_bytes``. Blocking SQLite calls run
+    in a worker thread so they never stall the event loop.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size_bytes: int = 100 * 1024 * 1024,
+        default_ttl: Optional[int] = None
+    ):
+        """
+        Initialize SQLite cache.
+
+        Args:
+            path: Database file path
+            max_size_bytes: Bound on total stored value size
+            default_ttl: TTL used when ``set`` is called without one
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def _get_sync(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            now = time.time()
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.stats.expirations += 1
+                return None
+
+            conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def _set_sync(self, key: str, blob: bytes, expires_at: Optional[float]) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires_at, time.time())
+            )
+            self._evict_sync(conn)
+
+    def _evict_sync(self, conn: sqlite3.Connection) -> None:
+        """Drop expired rows, then LRU rows until under the size bound."""
+        now = time.time()
+        cursor = conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        self.stats.expirations += max(cursor.rowcount, 0)
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        excess = total - self.max_size_bytes
+        freed = 0
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            blob = await asyncio.to_thread(self._get_sync, key)
+        except Exception as e:
+            logger.warning(f"SQLite cache read failed: {e}")
+            self.stats.errors += 1
+            blob = None
+
+        if blob is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return pickle.loads(blob)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            await asyncio.to_thread(self._set_sync, key, blob, self.expiry(ttl or self.default_ttl))
+            self.stats.sets += 1
+        except Exception as e:
+            logger.warning(f"SQLite cache write failed: {e}")
+            self.stats.errors += 1
+
+    async def delete(self, key: str) -> None:
+        def _delete():
+            with self._lock:
+                self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        await asyncio.to_thread(_delete)
+
+    async def clear(self) -> None:
+        def _clear():
+            with self._lock:
+                self._connection().execute("DELETE FROM cache")
+        await asyncio.to_thread(_clear)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
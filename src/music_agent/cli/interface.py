@@ -7,16 +7,24 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.live import Live
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
 
 from ..agent import MusicAgent, ToolsProfile, AgentConfig, create_agent
 from ..utils.config import config
+from ..utils.jobs import Job, JobStatus
+from ..utils.runtime import run_sync
+from ..services.llm_service import quick_stream
 from ..auth.deezer_auth import DeezerAuthHelper
 from ..auth.spotify_auth import SpotifyAuthHelper
 from ..auth.youtube_auth import YouTubeAuthHelper
 
 
+ASK_SYSTEM_PROMPT = """You are a knowledgeable music assistant. Answer briefly and
+concretely from what you know; say so when you are unsure."""
+
+
 class MusicAgentCLI:
     """Rich CLI interface for the music agent."""
     
@@ -28,6 +36,9 @@ class MusicAgentCLI:
         self.spotify_auth = SpotifyAuthHelper(self.console)
         self.youtube_auth = YouTubeAuthHelper(self.console)
         
+        # Background jobs whose outcome has already been shown
+        self.reported_jobs = set()
+        
     def initialize_agent(self):
         """Initialize the music agent with progress display."""
         with Progress(
@@ -187,7 +198,18 @@ class MusicAgentCLI:
 - `search deezer <query>` - Search only on Deezer  
 - `search spotify <query>` - Search only on Spotify
 - `search youtube <query>` - Search only on YouTube
-- `download <query>` - Search and download a track from Deezer
+- `research <query>` - Research a track in the background
+- `research <platform> <query>` - Research using one platform's search
+- `download <query>` - Search and download a track from Deezer (in the background)
+
+**💬 Quick Questions**
+- `ask <question>` - Stream a direct answer from the model (no tools or searches)
+
+**🧵 Background Jobs**
+- `jobs` - List jobs and their latest status
+- `jobs watch` - Follow running jobs live (Ctrl-C to stop watching)
+- `job <id>` - Show a job's result (or follow it until it finishes)
+- `cancel <id>` - Cancel a job (`cancel all` for every active job)
 
 **📝 Playlist Management**
 - `create playlist <name>` - Create a new playlist
@@ -222,6 +244,9 @@ You can also use natural language:
 - "Create a road trip playlist with rock music"
 - "What are the top songs by The Beatles?"
 - "Show me my listening history for last week"
+
+Queries run as jobs: press Ctrl-C while one is running to send it to the
+background, and its answer is shown once it finishes.
         """
         
         help_panel = Panel(
@@ -244,28 +269,31 @@ You can also use natural language:
             
         query = parts[1]
         
-        with self.console.status("[bold green]Searching and preparing download...") as status:
-            try:
-                # Use the core search and download functionality via the agent
-                download_prompt = f"Search for and download the track: {query}"
-                result = self.agent.chat(download_prompt)
-                
-                # Display result in a nice panel
-                if "✅" in result or "✓" in result:
-                    panel = Panel(
-                        result,
-                        title="💿 Download Complete",
-                        border_style="green",
-                        padding=(1, 2)
-                    )
-                    self.console.print(panel)
-                elif "❌" in result or "Error" in result or "Failed" in result:
-                    self.console.print(result, style="red")
-                else:
-                    self.console.print(result)
-                    
-            except Exception as e:
-                self.console.print(f"❌ Download failed: {e}", style="red")
+        job_id = self.agent.submit_download(query)
+        self.console.print(
+            f"💿 Download queued as job [bold cyan]{job_id}[/bold cyan] "
+            f"(`job {job_id}` for progress, `cancel {job_id}` to stop)"
+        )
+    
+    def process_research_command(self, command: str):
+        """Process research commands."""
+        parts = command.strip().split(maxsplit=2)
+        
+        if len(parts) < 2:
+            self.console.print("❌ Usage: research <query> or research <platform> <query>", style="red")
+            return
+        
+        platform = "all"
+        query = " ".join(parts[1:])
+        if len(parts) == 3 and parts[1].lower() in ["deezer", "spotify", "youtube", "local", "all"]:
+            platform = parts[1].lower()
+            query = parts[2]
+        
+        job_id = self.agent.submit_research(query, platform)
+        self.console.print(
+            f"🔬 Research queued as job [bold cyan]{job_id}[/bold cyan] "
+            f"(`job {job_id}` for progress, `cancel {job_id}` to stop)"
+        )
     
     def process_search_command(self, command: str):
         """Process search commands."""
@@ -454,34 +482,203 @@ You can also use natural language:
         self.console.print(status_table)
         self.console.print()
     
+    def process_ask_command(self, command: str):
+        """Stream a direct model answer, rendering tokens as they arrive."""
+        parts = command.strip().split(maxsplit=1)
+        
+        if len(parts) < 2:
+            self.console.print("❌ Usage: ask <question>", style="red")
+            return
+        
+        stream = quick_stream(parts[1], system_prompt=ASK_SYSTEM_PROMPT)
+        
+        async def next_fragment():
+            return await anext(stream, None)
+        
+        def panel(text: str) -> Panel:
+            return Panel(Markdown(text or "…"), title="💬 Answer", border_style="magenta", padding=(1, 2))
+        
+        text = ""
+        try:
+            with Live(panel(text), console=self.console, refresh_per_second=12) as live:
+                while (fragment := run_sync(next_fragment())) is not None:
+                    text += fragment
+                    live.update(panel(text))
+        except KeyboardInterrupt:
+            self.console.print("⏹️ Stopped", style="yellow")
+        except Exception as e:
+            self.console.print(f"❌ Request failed: {e}", style="red")
+        finally:
+            try:
+                run_sync(stream.aclose())
+            except Exception:
+                pass  # Already closed by the interrupted read
+        self.console.print()
+    
     def process_agent_query(self, query: str):
         """Process natural language query through the agent."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Processing your request...", total=None)
+        job_id = self.agent.submit_chat(query)
+        self.follow_job(job_id)
+    
+    def follow_job(self, job_id: str):
+        """Show a job's progress until it finishes; Ctrl-C leaves it running."""
+        job = self.agent.jobs.get(job_id)
+        if job is None:
+            self.console.print(f"❌ Unknown job: {job_id}", style="red")
+            return
+        
+        try:
+            with self.console.status(f"[bold green]{job.description[:60]}...") as status:
+                seen = 0
+                while not job.done:
+                    updates = job.updates_since(seen)
+                    if updates:
+                        seen = updates[-1].seq
+                        status.update(f"[bold green]{updates[-1].message}...")
+                    time.sleep(0.2)
+        except KeyboardInterrupt:
+            self.console.print(
+                f"⏩ Job [bold cyan]{job.id}[/bold cyan] continues in the background "
+                f"(`job {job.id}` to check, `cancel {job.id}` to stop)"
+            )
+            return
+        
+        self.show_job_result(job)
+    
+    def show_job_result(self, job: Job):
+        """Display a finished job's result."""
+        self.reported_jobs.add(job.id)
+        
+        if job.status == JobStatus.CANCELLED:
+            self.console.print(f"🛑 Job {job.id} was cancelled: {job.description}", style="yellow")
+            return
+        if job.status == JobStatus.FAILED:
+            self.console.print(f"❌ Job {job.id} failed: {job.error}", style="red")
+            return
+        
+        if job.kind == "research":
+            result = job.result
+            self.display_search_results(result["candidates"], result["query"])
+            self.console.print(Panel(
+                Markdown(result["summary"]),
+                title=f"🔬 Research: {result['query']}",
+                border_style="magenta",
+                padding=(1, 2)
+            ))
+        elif job.kind == "download":
+            result = job.result
+            if "✅" in result or "✓" in result:
+                self.console.print(Panel(
+                    result,
+                    title="💿 Download Complete",
+                    border_style="green",
+                    padding=(1, 2)
+                ))
+            elif "❌" in result or "Error" in result or "Failed" in result:
+                self.console.print(result, style="red")
+            else:
+                self.console.print(result)
+        else:
+            self.console.print(Panel(
+                job.result,
+                title="🤖 Agent Response",
+                border_style="magenta",
+                padding=(1, 2)
+            ))
+        self.console.print()
+    
+    def show_job_notifications(self):
+        """Announce background jobs that finished since the last prompt."""
+        for job in reversed(self.agent.jobs.list_jobs()):
+            if not job.done or job.id in self.reported_jobs:
+                continue
+            self.reported_jobs.add(job.id)
             
-            try:
-                response = self.agent.chat(query)
-                progress.update(task, description="✅ Request processed")
-                time.sleep(0.5)
-                
-            except Exception as e:
-                progress.update(task, description=f"❌ Request failed: {str(e)}")
-                time.sleep(2)
+            icon = {JobStatus.COMPLETED: "✅", JobStatus.FAILED: "❌"}.get(job.status, "🛑")
+            self.console.print(
+                f"{icon} Job [bold cyan]{job.id}[/bold cyan] ({job.kind}) {job.status.value} "
+                f"after {job.elapsed:.1f}s: {job.description[:50]} — `job {job.id}` to view"
+            )
+    
+    def build_jobs_table(self) -> Table:
+        """Build a table of background jobs."""
+        table = Table(title="🧵 Background Jobs", show_header=True)
+        table.add_column("ID", style="cyan", width=8)
+        table.add_column("Kind", style="white", width=8)
+        table.add_column("Status", style="yellow", width=10)
+        table.add_column("Platform", style="blue", width=12)
+        table.add_column("Time", style="green", width=7)
+        table.add_column("Latest", style="white", width=28)
+        table.add_column("Description", style="dim", width=30)
+        
+        styles = {
+            JobStatus.RUNNING: "bold yellow",
+            JobStatus.COMPLETED: "green",
+            JobStatus.FAILED: "red",
+            JobStatus.CANCELLED: "dim"
+        }
+        for job in self.agent.jobs.list_jobs()[:30]:
+            updates = job.updates_since(max(0, len(job.updates) - 1))
+            latest = job.error if job.error else (updates[-1].message if updates else "")
+            table.add_row(
+                job.id,
+                job.kind,
+                f"[{styles.get(job.status, 'white')}]{job.status.value}[/]",
+                job.platform or "-",
+                f"{job.elapsed:.1f}s",
+                latest[:28],
+                job.description[:30]
+            )
+        return table
+    
+    def process_jobs_command(self, command: str):
+        """Process job commands (jobs, jobs watch, job <id>, cancel <id>)."""
+        parts = command.strip().split()
+        action = parts[0].lower()
+        jobs = self.agent.jobs
+        
+        if action == "jobs":
+            if len(parts) > 1 and parts[1].lower() == "watch":
+                self.watch_jobs()
+                return
+            if not jobs.list_jobs():
+                self.console.print("💡 No jobs yet. Try `research <query>` or `download <query>`")
                 return
+            self.console.print(self.build_jobs_table())
+            self.console.print()
+            return
         
-        # Display response in a panel
-        response_panel = Panel(
-            response,
-            title="🤖 Agent Response",
-            border_style="magenta",
-            padding=(1, 2)
-        )
+        if len(parts) < 2:
+            self.console.print(f"❌ Usage: {action} <job id>", style="red")
+            return
+        
+        if action == "cancel":
+            if parts[1].lower() == "all":
+                cancelled = [job.id for job in jobs.list_jobs() if not job.done and jobs.cancel(job.id)]
+                self.console.print(f"🛑 Cancelled {len(cancelled)} jobs", style="yellow")
+            elif jobs.cancel(parts[1]):
+                self.console.print(f"🛑 Cancelling job {parts[1]}", style="yellow")
+            else:
+                self.console.print(f"❌ No active job {parts[1]}", style="red")
+            return
         
-        self.console.print(response_panel)
+        job = jobs.get(parts[1])
+        if job is None:
+            self.console.print(f"❌ Unknown job: {parts[1]}", style="red")
+        elif job.done:
+            self.show_job_result(job)
+        else:
+            self.follow_job(job.id)
+    
+    def watch_jobs(self):
+        """Follow all jobs live until they finish or Ctrl-C."""
+        try:
+            with Live(self.build_jobs_table(), console=self.console, refresh_per_second=4) as live:
+                while any(not job.done for job in self.agent.jobs.list_jobs()):
+                    time.sleep(0.25)
+                    live.update(self.build_jobs_table())
+        except KeyboardInterrupt:
+            pass
         self.console.print()
     
     def run_interactive_mode(self):
@@ -500,6 +697,8 @@ You can also use natural language:
         
         while True:
             try:
+                self.show_job_notifications()
+                
                 # Get user input with rich prompt
                 user_input = Prompt.ask(
                     "[bold cyan]🎵[/bold cyan]",
@@ -511,7 +710,11 @@ You can also use natural language:
                     
                 # Handle exit commands
                 if user_input.lower() in ["quit", "exit", "q"]:
-                    if Confirm.ask("Are you sure you want to exit?", console=self.console):
+                    active = [job for job in self.agent.jobs.list_jobs() if not job.done]
+                    question = "Are you sure you want to exit?"
+                    if active:
+                        question = f"{len(active)} jobs are still running and will be cancelled. Exit anyway?"
+                    if Confirm.ask(question, console=self.console):
                         break
                     continue
                 
@@ -541,6 +744,18 @@ You can also use natural language:
                     self.process_download_command(user_input)
                     continue
                     
+                elif user_input.lower().split()[0] == "ask":
+                    self.process_ask_command(user_input)
+                    continue
+                    
+                elif user_input.lower().startswith("research"):
+                    self.process_research_command(user_input)
+                    continue
+                    
+                elif user_input.lower().split()[0] in ["jobs", "job", "cancel"]:
+                    self.process_jobs_command(user_input)
+                    continue
+                    
                 elif user_input.lower().startswith("auth"):
                     self.process_auth_command(user_input)
                     continue
@@ -5,9 +5,9 @@ Main Bandcamp client.
 import asyncio
 import logging
 from typing import Optional, List, Union
-import aiohttp
 from aiohttp import ClientSession
 
+from ...utils.http import DOWNLOAD_TIMEOUT, shared_session
 from .config import BandcampConfig
 from .scraper import AlbumScraper, SearchScraper
 from .download import DownloadManager
@@ -56,8 +56,9 @@ class BandcampClient:
         """Initialize the client."""
         # Create session if needed
         if not self._session:
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-            self._session = aiohttp.ClientSession(connector=connector)
+            # Per-host limits now come from the process-wide pool; scraper
+            # requests set their own timeout, downloads use the session's
+            self._session = await shared_session(timeout=DOWNLOAD_TIMEOUT)
         
         # Initialize scrapers
         self._album_scraper = AlbumScraper(self._session, self.config.scraper)
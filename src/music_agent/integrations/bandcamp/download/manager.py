@@ -10,6 +10,7 @@ from typing import Optional, List, Callable, Union
 import aiohttp
 from aiohttp import ClientSession
 
+from ....services.artwork_service import ArtworkService, get_artwork_service
 from ..config import DownloadConfig
 from ..models import Track, Album
 from ..types import DownloadOptions
@@ -22,16 +23,23 @@ logger = logging.getLogger(__name__)
 class DownloadManager:
     """Manages Bandcamp downloads."""
     
-    def __init__(self, session: ClientSession, config: DownloadConfig):
+    def __init__(
+        self,
+        session: ClientSession,
+        config: DownloadConfig,
+        artwork_service: Optional[ArtworkService] = None
+    ):
         """
         Initialize download manager.
         
         Args:
             session: aiohttp session
             config: Download configuration
+            artwork_service: Artwork fetcher (defaults to the shared one)
         """
         self.session = session
         self.config = config
+        self.artwork = artwork_service or get_artwork_service()
         self.metadata_writer = MetadataWriter(config)
     
     async def download_track(
@@ -39,7 +47,8 @@ class DownloadManager:
         track: Track,
         output_dir: Optional[str] = None,
         options: Optional[DownloadOptions] = None,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        artwork_path: Optional[str] = None
     ) -> str:
         """
         Download a track.
@@ -49,6 +58,7 @@ class DownloadManager:
             output_dir: Output directory
             options: Download options
             progress_callback: Progress callback
+            artwork_path: Artwork to embed (defaults to cover.jpg next to the file)
             
         Returns:
             Path to downloaded file
@@ -75,7 +85,7 @@ class DownloadManager:
         
         # Write metadata
         if self.config.write_metadata:
-            await self._write_metadata(output_path, track)
+            await self._write_metadata(output_path, track, artwork_path)
         
         logger.info(f"Downloaded: {track.title} -> {output_path}")
         return output_path
@@ -112,6 +122,13 @@ class DownloadManager:
             album_dir = self._get_album_dir(album, output_dir)
             output_dir = album_dir
         
+        # Fetch artwork first so every track can embed it
+        artwork_path = None
+        if album.artwork_url and self.config.embed_artwork:
+            artwork_path = await self._download_artwork(album.artwork_url, output_dir)
+            if artwork_path:
+                logger.debug(f"Downloaded artwork to {artwork_path}")
+        
         # Download tracks
         semaphore = asyncio.Semaphore(self.config.parallel_downloads)
         
@@ -125,7 +142,7 @@ class DownloadManager:
                     track.album = album.title
                     track.artist = track.artist or album.artist
                     
-                    path = await self.download_track(track, output_dir, options)
+                    path = await self.download_track(track, output_dir, options, artwork_path=artwork_path)
                     return path
                 except Exception as e:
                     logger.error(f"Failed to download '{track.title}': {e}")
@@ -139,12 +156,6 @@ class DownloadManager:
         results = await asyncio.gather(*tasks, return_exceptions=False)
         downloaded = [path for path in results if path]
         
-        # Download artwork if available
-        if album.artwork_url and self.config.embed_artwork:
-            artwork_path = await self._download_artwork(album.artwork_url, output_dir)
-            if artwork_path:
-                logger.debug(f"Downloaded artwork to {artwork_path}")
-        
         logger.info(f"Downloaded {len(downloaded)}/{total} tracks from '{album.title}'")
         return downloaded
     
@@ -181,29 +192,27 @@ class DownloadManager:
                 os.remove(output_path)
             raise DownloadError(f"Download failed: {e}")
     
-    async def _download_artwork(self, url: str, output_dir: str) -> Optional[str]:
-        """Download album artwork."""
+    async def _download_artwork(self, url: str, output_dir: Optional[str]) -> Optional[str]:
+        """Save album artwork as cover.jpg in the album directory."""
+        artwork = await self.artwork.fetch(url, self.session)
+        if not artwork:
+            return None
+        
         try:
-            output_path = os.path.join(output_dir, "cover.jpg")
-            
-            async with self.session.get(url) as response:
-                response.raise_for_status()
-                
-                with open(output_path, "wb") as f:
-                    f.write(await response.read())
-            
+            output_path = os.path.join(output_dir or self.config.download_dir, "cover.jpg")
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(Path(output_path).write_bytes, artwork.data)
             return output_path
             
         except Exception as e:
-            logger.warning(f"Failed to download artwork: {e}")
+            logger.warning(f"Failed to save artwork: {e}")
             return None
     
-    async def _write_metadata(self, file_path: str, track: Track):
+    async def _write_metadata(self, file_path: str, track: Track, artwork_path: Optional[str] = None):
         """Write metadata to file."""
         try:
             # Get artwork path if it exists
-            artwork_path = None
-            if self.config.embed_artwork:
+            if artwork_path is None and self.config.embed_artwork:
                 # Look for cover.jpg in same directory
                 dir_path = os.path.dirname(file_path)
                 cover_path = os.path.join(dir_path, "cover.jpg")
@@ -13,6 +13,7 @@ import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 from bs4 import BeautifulSoup
 
+from ...cache.pages import get_page_cache
 from ..config import ScraperConfig
 from ..exceptions import ScrapingError, ParseError, NetworkError
 from ..types import PageData, StreamData
@@ -34,6 +35,9 @@ class BaseScraper:
         self.session = session
         self.config = config
         self._last_request_time = 0
+        
+        # Shared on-disk page cache (stale pages are revalidated)
+        self.page_cache = get_page_cache() if config.use_cache else None
     
     async def scrape_page(self, url: str) -> PageData:
         """
@@ -84,6 +88,10 @@ class BaseScraper:
         Returns:
             HTML content
         """
+        cached = await self.page_cache.aget(url) if self.page_cache else None
+        if cached and cached.is_fresh(self.config.cache_ttl):
+            return cached.html
+        
         # Apply rate limiting
         await self._apply_rate_limit()
         
@@ -94,13 +102,23 @@ class BaseScraper:
             "Accept-Encoding": "gzip, deflate",
             "Connection": "keep-alive",
         }
+        if cached:
+            headers.update(cached.conditional_headers())
         
         for attempt in range(self.config.max_retries):
             try:
                 timeout = ClientTimeout(total=self.config.timeout)
                 async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                    if cached and response.status == 304:
+                        await self.page_cache.atouch(url)
+                        return cached.html
+                    
                     response.raise_for_status()
-                    return await response.text()
+                    html = await response.text()
+                    
+                    if self.page_cache:
+                        await self.page_cache.aput_response(url, html, response.headers)
+                    return html
                     
             except aiohttp.ClientError as e:
                 logger.warning(f"Request failed (attempt {attempt + 1}/{self.config.max_retries}): {e}")
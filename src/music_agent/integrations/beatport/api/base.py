@@ -3,7 +3,13 @@ Base API client for Beatport.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+import math
+import asyncio
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterator, AsyncIterator
 import requests
 from urllib.parse import urljoin
 
@@ -30,6 +36,10 @@ class BaseAPI:
         self.config = config
         self.session = requests.Session()
         self._last_request_time = 0
+        
+        # Next free request slot, shared by concurrent page fetches
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
     
     def _get_url(self, endpoint: str) -> str:
         """
@@ -52,11 +62,23 @@ class BaseAPI:
         return base + endpoint
     
     def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self.config.rate_limit_delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.config.rate_limit_delay:
-                time.sleep(self.config.rate_limit_delay - elapsed)
+        """
+        Apply rate limiting between requests.
+        
+        Each caller reserves the next free slot under a lock and sleeps
+        outside it, so concurrent page fetches are spaced by
+        ``rate_limit_delay`` while their network latency overlaps.
+        """
+        if self.config.rate_limit_delay <= 0:
+            return
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self.config.rate_limit_delay
+        
+        if slot > now:
+            time.sleep(slot - now)
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -244,44 +266,74 @@ class BaseAPI:
         """
         return self._request('DELETE', endpoint, params=params)
     
-    def paginate(
+    @staticmethod
+    def _extract_results(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract result items (handle different response formats)."""
+        if 'results' in response:
+            return response['results']
+        elif 'data' in response:
+            return response['data']
+        return [response]
+    
+    def _page_params(self, params: Optional[Dict[str, Any]], page: int) -> Dict[str, Any]:
+        """Build query parameters for one page without mutating the caller's dict."""
+        page_params = dict(params or {})
+        page_params['page'] = page
+        page_params.setdefault('per_page', self.config.default_per_page)
+        return page_params
+    
+    def _page_count(
+        self,
+        response: Dict[str, Any],
+        params: Dict[str, Any],
+        max_pages: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Work out the number of pages from the first response.
+        
+        Args:
+            response: First page response
+            params: Parameters used for the first page
+            max_pages: Optional cap
+            
+        Returns:
+            Total pages, or None if the response has no ``count``
+        """
+        count = response.get('count')
+        if count is None:
+            return None
+        
+        per_page = response.get('per_page') or params['per_page']
+        pages = max(1, math.ceil(count / per_page))
+        return min(pages, max_pages) if max_pages else pages
+    
+    def iter_pages(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        max_pages: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        max_pages: Optional[int] = None,
+        start_page: int = 1
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Paginate through API results.
+        Lazily iterate over result pages, one request per page.
+        
+        Nothing is fetched until the next page is requested, so callers
+        can stop early without paying for the rest.
         
         Args:
             endpoint: API endpoint
             params: Initial parameters
             max_pages: Maximum pages to fetch
+            start_page: First page to request
             
-        Returns:
-            List of all results
+        Yields:
+            List of results for each page
         """
-        if params is None:
-            params = {}
-        
-        all_results = []
-        page = 1
+        page = start_page
         
         while True:
-            params['page'] = page
-            params['per_page'] = params.get('per_page', self.config.default_per_page)
-            
-            response = self.get(endpoint, params)
-            
-            # Extract results (handle different response formats)
-            if 'results' in response:
-                results = response['results']
-            elif 'data' in response:
-                results = response['data']
-            else:
-                results = [response]
-            
-            all_results.extend(results)
+            response = self.get(endpoint, self._page_params(params, page))
+            yield self._extract_results(response)
             
             # Check for more pages
             if 'next' not in response or not response['next']:
@@ -291,5 +343,124 @@ class BaseAPI:
                 break
             
             page += 1
+    
+    def iter_results(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over individual results across pages.
+        
+        Args:
+            endpoint: API endpoint
+            params: Initial parameters
+            max_pages: Maximum pages to fetch
+            
+        Yields:
+            Result items
+        """
+        for results in self.iter_pages(endpoint, params, max_pages):
+            yield from results
+    
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Paginate through API results.
+        
+        The first response's ``count``/``per_page`` determine the page count;
+        the remaining pages are then fetched concurrently (up to
+        ``config.max_concurrency``) under the shared rate budget. Falls back
+        to following ``next`` links when the response carries no count.
+        
+        Args:
+            endpoint: API endpoint
+            params: Initial parameters
+            max_pages: Maximum pages to fetch
+            
+        Returns:
+            List of all results in page order
+        """
+        first_params = self._page_params(params, 1)
+        first = self.get(endpoint, first_params)
+        all_results = list(self._extract_results(first))
+        
+        if 'next' not in first or not first['next'] or max_pages == 1:
+            return all_results
+        
+        pages = self._page_count(first, first_params, max_pages)
+        if pages is None:
+            for results in self.iter_pages(endpoint, params, max_pages, start_page=2):
+                all_results.extend(results)
+            return all_results
+        
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            return self._extract_results(self.get(endpoint, self._page_params(params, page)))
+        
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            for results in executor.map(fetch, range(2, pages + 1)):
+                all_results.extend(results)
+        
+        return all_results
+    
+    async def aiter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async iterator over result pages with bounded read-ahead.
+        
+        Up to ``config.max_concurrency`` pages are fetched ahead of the
+        consumer in worker threads; pages are yielded in order, and breaking
+        out of the loop stops any further requests from being started.
+        
+        Args:
+            endpoint: API endpoint
+            params: Initial parameters
+            max_pages: Maximum pages to fetch
+            
+        Yields:
+            List of results for each page
+        """
+        first_params = self._page_params(params, 1)
+        first = await asyncio.to_thread(self.get, endpoint, first_params)
+        yield self._extract_results(first)
+        
+        if 'next' not in first or not first['next'] or max_pages == 1:
+            return
+        
+        pages = self._page_count(first, first_params, max_pages)
+        if pages is None:
+            # No count to plan with: follow next links one page at a time
+            pages_iter = self.iter_pages(endpoint, params, max_pages, start_page=2)
+            while True:
+                results = await asyncio.to_thread(next, pages_iter, None)
+                if results is None:
+                    return
+                yield results
+        
+        async def fetch(page: int) -> List[Dict[str, Any]]:
+            response = await asyncio.to_thread(self.get, endpoint, self._page_params(params, page))
+            return self._extract_results(response)
         
-        return all_results
\ No newline at end of file
+        # Window of in-flight pages, refilled as each page is yielded
+        window = max(1, self.config.max_concurrency)
+        upcoming = iter(range(2, pages + 1))
+        tasks = deque(asyncio.create_task(fetch(page)) for page in islice(upcoming, window))
+        try:
+            while tasks:
+                results = await tasks.popleft()
+                page = next(upcoming, None)
+                if page is not None:
+                    tasks.append(asyncio.create_task(fetch(page)))
+                yield results
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -2,7 +2,8 @@
 Charts API for Beatport.
 """
 
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from datetime import datetime
 
 from .base import BaseAPI
@@ -108,27 +109,64 @@ class ChartsAPI(BaseAPI):
         chart = self.get_chart(ChartType.BEATPORT_PICKS, genre_id)
         return chart.tracks
     
-    def get_genre_charts(self, genre_id: int) -> Dict[str, Chart]:
+    def get_genres(self) -> List[Genre]:
         """
-        Get all charts for a specific genre.
+        Get all genres.
+        
+        Returns:
+            List of genres
+        """
+        results = self.paginate("catalog/genres", {'per_page': self.config.max_per_page})
+        return [self.parser.parse_genre(g) for g in results]
+    
+    def prefetch_charts(
+        self,
+        genre_ids: Optional[Iterable[Optional[int]]] = None,
+        chart_types: Iterable[ChartType] = (ChartType.TOP_100,)
+    ) -> Dict[Tuple[str, Optional[int]], Chart]:
+        """
+        Fetch many charts concurrently under the shared rate budget.
         
         Args:
-            genre_id: Genre ID
+            genre_ids: Genre IDs (None fetches every genre plus the overall chart)
+            chart_types: Chart types to fetch for each genre
             
         Returns:
-            Dictionary of charts by type
+            Dictionary of charts keyed by (chart type, genre ID); charts
+            that fail to load are omitted
         """
-        charts = {}
+        if genre_ids is None:
+            genre_ids = [None] + [genre.id for genre in self.get_genres()]
         
-        for chart_type in ChartType:
+        jobs = [(chart_type, genre_id) for genre_id in genre_ids for chart_type in chart_types]
+        
+        def fetch(job: Tuple[ChartType, Optional[int]]) -> Optional[Chart]:
             try:
-                chart = self.get_chart(chart_type, genre_id)
-                charts[chart_type.value] = chart
-            except:
-                continue
+                return self.get_chart(*job)
+            except Exception:
+                return None
+        
+        charts = {}
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            for (chart_type, genre_id), chart in zip(jobs, executor.map(fetch, jobs)):
+                if chart is not None:
+                    charts[(chart_type.value, genre_id)] = chart
         
         return charts
     
+    def get_genre_charts(self, genre_id: int) -> Dict[str, Chart]:
+        """
+        Get all charts for a specific genre.
+        
+        Args:
+            genre_id: Genre ID
+            
+        Returns:
+            Dictionary of charts by type
+        """
+        charts = self.prefetch_charts([genre_id], list(ChartType))
+        return {chart_type: chart for (chart_type, _), chart in charts.items()}
+    
     def get_chart_history(
         self,
         chart_type: ChartType,
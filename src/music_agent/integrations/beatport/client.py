@@ -2,7 +2,7 @@
 Main Beatport API client.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
 from .config import BeatportConfig
 from .auth import BeatportAuth
@@ -334,6 +334,23 @@ class BeatportClient:
         chart_tracks = self.charts_api.get_essential_chart(genre_id)
         return [ct.track for ct in chart_tracks]
     
+    def prefetch_charts(
+        self,
+        genre_ids: Optional[Iterable[Optional[int]]] = None,
+        chart_types: Iterable[ChartType] = (ChartType.TOP_100,)
+    ) -> Dict[Tuple[str, Optional[int]], Chart]:
+        """
+        Fetch charts for many genres concurrently.
+        
+        Args:
+            genre_ids: Genre IDs (None for every genre plus the overall chart)
+            chart_types: Chart types to fetch
+            
+        Returns:
+            Dictionary of charts keyed by (chart type, genre ID)
+        """
+        return self.charts_api.prefetch_charts(genre_ids, chart_types)
+    
     # Utility methods
     
     def close(self) -> None:
@@ -34,6 +34,7 @@ class BeatportConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     rate_limit_delay: float = 0.5  # Delay between requests
+    max_concurrency: int = 4  # Concurrent page/chart fetches
     
     # Search defaults
     default_per_page: int = 25
@@ -59,6 +60,7 @@ class BeatportConfig:
             token_file=token_file,
             timeout=int(os.getenv("BEATPORT_TIMEOUT", "30")),
             rate_limit_delay=float(os.getenv("BEATPORT_RATE_LIMIT", "0.5")),
+            max_concurrency=int(os.getenv("BEATPORT_MAX_CONCURRENCY", "4")),
         )
     
     def validate(self) -> None:
@@ -0,0 +1,278 @@
+"""
+Local Catalog Search
+Ranked search of the PostgreSQL music catalog
+
+Queries the ``music.track_search`` materialized view through a pooled
+asyncpg engine:
+
+- full-text matches (``search_vector``, ranked with ``ts_rank_cd``)
+- fuzzy matches for typos and partial names (pg_trgm word similarity on
+  ``search_text``)
+- BPM range and key filters, backed by btree indexes
+
+Sync jobs call ``refresh_track_search`` when they finish; the database
+function only rebuilds the view (concurrently, so searches keep working)
+when the catalog changed since the last refresh.
+
+Every multi-platform search tries the catalog first, so connecting is
+bounded by a short timeout, and after a failed connect the catalog is
+skipped for ``retry_after`` seconds instead of stalling each search.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Combined text + trigram match; a row matches either way and is ranked by both
+SEARCH_QUERY = """
+WITH q AS (
+    SELECT websearch_to_tsquery('english', $1) AS tsq, lower($1) AS text
+)
+SELECT s.id, s.title, s.artist_name, s.album_title, s.genre, s.bpm, s.key,
+       s.energy, s.duration_ms, s.file_path,
+       ts_rank_cd(s.search_vector, q.tsq) AS text_rank,
+       word_similarity(q.text, s.search_text) AS similarity
+FROM music.track_search s, q
+WHERE (s.search_vector @@ q.tsq OR q.text <% s.search_text)
+AND ($2::numeric IS NULL OR s.bpm >= $2)
+AND ($3::numeric IS NULL OR s.bpm <= $3)
+AND ($4::text[] IS NULL OR s.key = ANY($4))
+ORDER BY ts_rank_cd(s.search_vector, q.tsq) + word_similarity(q.text, s.search_text) DESC
+LIMIT $5
+"""
+
+# Filters only (e.g. "everything at 124-128 BPM in 8A")
+BROWSE_QUERY = """
+SELECT s.id, s.title, s.artist_name, s.album_title, s.genre, s.bpm, s.key,
+       s.energy, s.duration_ms, s.file_path,
+       0.0::real AS text_rank, 0.0::real AS similarity
+FROM music.track_search s
+WHERE ($1::numeric IS NULL OR s.bpm >= $1)
+AND ($2::numeric IS NULL OR s.bpm <= $2)
+AND ($3::text[] IS NULL OR s.key = ANY($3))
+ORDER BY s.bpm, s.title
+LIMIT $4
+"""
+
+
+@dataclass
+class CatalogConfig:
+    """Catalog connection and search configuration."""
+
+    host: str = "localhost"
+    port: int = 5432
+    user: str = "music_agent"
+    password: str = "music123"
+    database: str = "music_catalog"
+    min_pool_size: int = 1
+    max_pool_size: int = 10
+    command_timeout: float = 10.0
+    connect_timeout: float = 3.0
+    retry_after: float = 60.0      # Seconds to skip the catalog after a failed connect
+    min_similarity: float = 0.4    # pg_trgm word similarity needed for a fuzzy match
+
+    @classmethod
+    def from_env(cls) -> "CatalogConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            host=os.getenv("POSTGRES_HOST", "localhost"),
+            port=int(os.getenv("POSTGRES_PORT", "5432")),
+            user=os.getenv("POSTGRES_USER", "music_agent"),
+            password=os.getenv("POSTGRES_PASSWORD", "music123"),
+            database=os.getenv("POSTGRES_DB", "music_catalog"),
+            min_pool_size=int(os.getenv("CATALOG_POOL_MIN", "1")),
+            max_pool_size=int(os.getenv("CATALOG_POOL_MAX", "10")),
+            connect_timeout=float(os.getenv("CATALOG_CONNECT_TIMEOUT", "3")),
+            retry_after=float(os.getenv("CATALOG_RETRY_AFTER", "60")),
+            min_similarity=float(os.getenv("CATALOG_MIN_SIMILARITY", "0.4")),
+        )
+
+
+async def refresh_track_search(conn, force: bool = False) -> bool:
+    """
+    Refresh the search view if the catalog changed.
+
+    Args:
+        conn: asyncpg connection or pool
+        force: Refresh even if nothing changed
+
+    Returns:
+        True if the view was rebuilt
+    """
+    return await conn.fetchval("SELECT refresh_track_search($1)", force)
+
+
+def _bpm(value: Optional[float]) -> Optional[Decimal]:
+    # Compared as numeric so the bpm index applies
+    return Decimal(str(value)) if value is not None else None
+
+
+def _track(row) -> Dict[str, Any]:
+    return {
+        "id": str(row["id"]),
+        "title": row["title"],
+        "artist": row["artist_name"] or "Unknown",
+        "album": row["album_title"] or "",
+        "genre": row["genre"],
+        "bpm": float(row["bpm"]) if row["bpm"] is not None else None,
+        "key": row["key"],
+        "energy": float(row["energy"]) if row["energy"] is not None else None,
+        "duration": row["duration_ms"] // 1000 if row["duration_ms"] else 0,
+        "file_path": row["file_path"],
+        "platform": "local",
+        "score": round(row["text_rank"] + row["similarity"], 4),
+    }
+
+
+class CatalogSearch:
+    """Search the local music catalog."""
+
+    def __init__(self, config: Optional[CatalogConfig] = None):
+        """
+        Initialize catalog search (the pool is created on first use).
+
+        Args:
+            config: Catalog configuration (defaults to environment)
+        """
+        self.config = config or CatalogConfig.from_env()
+        self.pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        self._unavailable_until = 0.0  # Loop time before which connect fails fast
+
+    async def connect(self) -> asyncpg.Pool:
+        """
+        Create the connection pool if needed.
+
+        Returns:
+            The pool
+
+        Raises:
+            ConnectionError: If the database was unreachable less than
+                ``retry_after`` seconds ago
+        """
+        if self.pool is not None:
+            return self.pool
+
+        async with self._pool_lock:
+            if self.pool is not None:
+                return self.pool
+
+            loop = asyncio.get_running_loop()
+            if loop.time() < self._unavailable_until:
+                raise ConnectionError(
+                    f"Catalog database unavailable; retrying in "
+                    f"{self._unavailable_until - loop.time():.0f}s"
+                )
+
+            try:
+                self.pool = await asyncpg.create_pool(
+                    host=self.config.host,
+                    port=self.config.port,
+                    user=self.config.user,
+                    password=self.config.password,
+                    database=self.config.database,
+                    min_size=self.config.min_pool_size,
+                    max_size=self.config.max_pool_size,
+                    command_timeout=self.config.command_timeout,
+                    timeout=self.config.connect_timeout,
+                    # A session default, not a SET: asyncpg runs RESET ALL
+                    # when a connection goes back to the pool
+                    server_settings={
+                        "pg_trgm.word_similarity_threshold": str(float(self.config.min_similarity))
+                    },
+                )
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+                self._unavailable_until = loop.time() + self.config.retry_after
+                logger.warning(
+                    f"Catalog database unreachable ({e!r}); skipping it for {self.config.retry_after:.0f}s"
+                )
+                raise ConnectionError(f"Catalog database unreachable: {e!r}") from e
+
+            logger.info(f"Catalog search pool connected to {self.config.host}/{self.config.database}")
+        return self.pool
+
+    async def search(
+        self,
+        query: str = "",
+        limit: int = 20,
+        bpm_min: Optional[float] = None,
+        bpm_max: Optional[float] = None,
+        keys: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search tracks by text, BPM range and key.
+
+        Args:
+            query: Free text (title, artist, album); web-search syntax such as
+                quoted phrases and ``-exclude`` is supported. Empty browses by
+                the filters alone
+            limit: Maximum results
+            bpm_min: Lowest BPM (inclusive)
+            bpm_max: Highest BPM (inclusive)
+            keys: Accepted keys (e.g. ``["8A", "9A"]``)
+
+        Returns:
+            Track dicts ranked best first, with ``platform`` set to "local"
+        """
+        pool = await self.connect()
+        keys = list(keys) if keys else None
+        bpm_min, bpm_max = _bpm(bpm_min), _bpm(bpm_max)
+
+        if query and query.strip():
+            rows = await pool.fetch(SEARCH_QUERY, query.strip(), bpm_min, bpm_max, keys, limit)
+        else:
+            rows = await pool.fetch(BROWSE_QUERY, bpm_min, bpm_max, keys, limit)
+
+        return [_track(row) for row in rows]
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Refresh the search view if the catalog changed.
+
+        Args:
+            force: Refresh even if nothing changed
+
+        Returns:
+            True if the view was rebuilt
+        """
+        pool = await self.connect()
+        return await refresh_track_search(pool, force)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Get catalog search statistics.
+
+        Returns:
+            Indexed track count and last refresh time
+        """
+        pool = await self.connect()
+        row = await pool.fetchrow("""
+        SELECT (SELECT count(*) FROM music.track_search) AS tracks,
+               (SELECT refreshed_at FROM music.search_refresh_state
+                WHERE view_name = 'track_search') AS refreshed_at
+        """)
+        return {
+            "tracks": row["tracks"],
+            "refreshed_at": row["refreshed_at"].isoformat() if row["refreshed_at"] else None,
+            "pool_size": self.pool.get_size(),
+        }
+
+    async def close(self):
+        """Close the connection pool."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+
+__all__ = [
+    'CatalogConfig',
+    'CatalogSearch',
+    'refresh_track_search',
+]
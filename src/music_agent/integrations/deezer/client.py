@@ -12,6 +12,7 @@ from pathlib import Path
 import aiohttp
 from aiohttp import ClientSession
 
+from ...utils.http import DOWNLOAD_TIMEOUT, shared_session
 from .config import DeezerConfig
 from .auth import AuthenticationManager
 from .api import SearchAPI
@@ -64,7 +65,10 @@ class DeezerClient:
     async def connect(self):
         """Connect to Deezer and authenticate if credentials available."""
         if self._session is None:
-            self._session = ClientSession()
+            # Borrow from the process-wide pool so connections and DNS
+            # lookups are reused across client instances. API calls set
+            # their own timeout; the session default has to fit downloads
+            self._session = await shared_session(timeout=DOWNLOAD_TIMEOUT)
         
         # Initialize API clients
         self._search_api = SearchAPI(self._session, self.config.api, self.auth_manager)
@@ -21,6 +21,8 @@ except ImportError:
 import aiohttp
 from aiohttp import ClientSession
 
+from ....services.artwork_service import Artwork, ArtworkService, get_artwork_service
+from ....utils.tagging import TagWriter, ensure_tags, get_tag_writer
 from ..config import DownloadConfig
 from ..models import Track, TrackFormat
 from ..exceptions import DownloadError, DecryptionError, QualityNotAvailableError
@@ -38,7 +40,9 @@ class DownloadManager:
         self,
         session: ClientSession,
         config: DownloadConfig,
-        auth_manager: Optional[Any] = None
+        auth_manager: Optional[Any] = None,
+        artwork_service: Optional[ArtworkService] = None,
+        tag_writer: Optional[TagWriter] = None
     ):
         """
         Initialize download manager.
@@ -47,10 +51,14 @@ class DownloadManager:
             session: aiohttp session
             config: Download configuration
             auth_manager: Authentication manager for quality access
+            artwork_service: Cover art fetcher (defaults to the shared one)
+            tag_writer: Tag writing pool (defaults to the shared one)
         """
         self.session = session
         self.config = config
         self.auth_manager = auth_manager
+        self.artwork = artwork_service or get_artwork_service()
+        self.tag_writer = tag_writer or get_tag_writer()
         self._download_semaphore = asyncio.Semaphore(config.parallel_downloads)
     
     def _get_blowfish_key(self, track_id: str) -> bytes:
@@ -397,87 +405,85 @@ class DownloadManager:
         """
         Write metadata to downloaded file.
         
+        Tags are saved by the shared tag writer's thread pool, so the save
+        never blocks other downloads on the event loop.
+        
         Args:
             file_path: Path to file
             track: Track object
         """
+        suffix = file_path.suffix.lower()
+        if suffix == '.mp3':
+            apply_tags = self._apply_mp3_tags
+        elif suffix == '.flac':
+            apply_tags = self._apply_flac_tags
+        else:
+            return
+        
         try:
-            from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TRCK, APIC
-            from mutagen.flac import FLAC
+            # Add cover art if configured (fetched once per album)
+            artwork = None
+            if self.config.embed_artwork and track.cover_xl:
+                artwork = await self.artwork.fetch(track.cover_xl, self.session)
             
-            if file_path.suffix.lower() == '.mp3':
-                # MP3 metadata
-                audio = ID3(file_path)
-                audio.add(TIT2(encoding=3, text=track.title))
-                if track.artist_name:
-                    audio.add(TPE1(encoding=3, text=track.artist_name))
-                if track.album_title:
-                    audio.add(TALB(encoding=3, text=track.album_title))
-                if track.release_date:
-                    audio.add(TDRC(encoding=3, text=str(track.release_date.year)))
-                if track.track_position:
-                    audio.add(TRCK(encoding=3, text=str(track.track_position)))
-                
-                # Add cover art if configured
-                if self.config.embed_artwork and track.cover_xl:
-                    await self._add_cover_art(audio, track.cover_xl)
-                
-                audio.save(file_path)
-                
-            elif file_path.suffix.lower() == '.flac':
-                # FLAC metadata
-                audio = FLAC(file_path)
-                audio["title"] = track.title
-                if track.artist_name:
-                    audio["artist"] = track.artist_name
-                if track.album_title:
-                    audio["album"] = track.album_title
-                if track.release_date:
-                    audio["date"] = str(track.release_date.year)
-                if track.track_position:
-                    audio["tracknumber"] = str(track.track_position)
-                
-                # Add cover art if configured
-                if self.config.embed_artwork and track.cover_xl:
-                    await self._add_cover_art_flac(audio, track.cover_xl)
-                
-                audio.save()
+            await self.tag_writer.update(file_path, lambda audio: apply_tags(audio, track, artwork))
                 
         except Exception as e:
             logger.warning(f"Failed to write metadata: {e}")
     
-    async def _add_cover_art(self, audio: Any, cover_url: str):
+    def _apply_mp3_tags(self, audio: Any, track: Track, artwork: Optional[Artwork]):
+        """Set MP3 (ID3) tags on a loaded file."""
+        from mutagen.id3 import TIT2, TPE1, TALB, TDRC, TRCK
+        
+        tags = ensure_tags(audio)
+        tags.add(TIT2(encoding=3, text=track.title))
+        if track.artist_name:
+            tags.add(TPE1(encoding=3, text=track.artist_name))
+        if track.album_title:
+            tags.add(TALB(encoding=3, text=track.album_title))
+        if track.release_date:
+            tags.add(TDRC(encoding=3, text=str(track.release_date.year)))
+        if track.track_position:
+            tags.add(TRCK(encoding=3, text=str(track.track_position)))
+        
+        if artwork:
+            self._add_cover_art(tags, artwork)
+    
+    def _apply_flac_tags(self, audio: Any, track: Track, artwork: Optional[Artwork]):
+        """Set FLAC (Vorbis comment) tags on a loaded file."""
+        audio["title"] = track.title
+        if track.artist_name:
+            audio["artist"] = track.artist_name
+        if track.album_title:
+            audio["album"] = track.album_title
+        if track.release_date:
+            audio["date"] = str(track.release_date.year)
+        if track.track_position:
+            audio["tracknumber"] = str(track.track_position)
+        
+        if artwork:
+            self._add_cover_art_flac(audio, artwork)
+    
+    def _add_cover_art(self, tags: Any, artwork: Artwork):
         """Add cover art to MP3."""
-        try:
-            from mutagen.id3 import APIC
-            async with self.session.get(cover_url) as response:
-                if response.status == 200:
-                    image_data = await response.read()
-                    audio.add(APIC(
-                        encoding=3,
-                        mime='image/jpeg',
-                        type=3,
-                        desc='Cover',
-                        data=image_data
-                    ))
-        except Exception as e:
-            logger.warning(f"Failed to add cover art: {e}")
+        from mutagen.id3 import APIC
+        tags.add(APIC(
+            encoding=3,
+            mime=artwork.mime,
+            type=3,
+            desc='Cover',
+            data=artwork.data
+        ))
     
-    async def _add_cover_art_flac(self, audio: Any, cover_url: str):
+    def _add_cover_art_flac(self, audio: Any, artwork: Artwork):
         """Add cover art to FLAC."""
-        try:
-            from mutagen.flac import Picture
-            
-            async with self.session.get(cover_url) as response:
-                if response.status == 200:
-                    image_data = await response.read()
-                    
-                    picture = Picture()
-                    picture.type = 3  # Cover (front)
-                    picture.mime = 'image/jpeg'
-                    picture.desc = 'Cover'
-                    picture.data = image_data
-                    
-                    audio.add_picture(picture)
-        except Exception as e:
-            logger.warning(f"Failed to add cover art: {e}")
\ No newline at end of file
+        from mutagen.flac import Picture
+        
+        picture = Picture()
+        picture.type = 3  # Cover (front)
+        picture.mime = artwork.mime
+        picture.desc = 'Cover'
+        picture.data = artwork.data
+        
+        audio.clear_pictures()
+        audio.add_picture(picture)
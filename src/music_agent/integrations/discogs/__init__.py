@@ -4,12 +4,13 @@ Discogs integration for music agent.
 Provides comprehensive access to Discogs database including:
 - Artist, release, master, and label information
 - Advanced search capabilities
-- Collection management
+- Collection management (with concurrent asyncio sync)
 - Marketplace data
 - Community statistics
 """
 
 from .client import DiscogsClient
+from .async_client import AsyncDiscogsClient
 from .config import DiscogsConfig
 from .models.core import Artist, Label, Track
 from .models.release import Release, Master
@@ -28,6 +29,7 @@ __version__ = "1.0.0"
 
 __all__ = [
     "DiscogsClient",
+    "AsyncDiscogsClient",
     "DiscogsConfig",
     "Artist",
     "Release",
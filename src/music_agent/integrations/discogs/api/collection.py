@@ -7,6 +7,7 @@ from typing import Optional, List, Dict, Any
 
 from ..models import CollectionItem
 from ..exceptions import APIError, AuthenticationError
+from .parsers import DataParser
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ class CollectionAPI:
             client: Parent DiscogsClient instance
         """
         self.client = client
+        self.parser = DataParser()
     
     def get_collection(
         self,
@@ -198,13 +200,7 @@ class CollectionAPI:
             
             items = []
             for item in wantlist:
-                items.append({
-                    'id': item.id,
-                    'rating': item.rating,
-                    'notes': item.notes,
-                    'basic_information': item.data.get('basic_information', {}),
-                    'resource_url': item.data.get('resource_url')
-                })
+                items.append(self.parser.parse_wantlist_item(item.data))
             
             return items
             
@@ -298,13 +294,10 @@ class CollectionAPI:
             raise APIError(f"Failed to get collection value: {e}")
     
     def _parse_collection_item(self, item: Any) -> CollectionItem:
-        """Parse raw collection item into model."""
-        return CollectionItem(
-            id=item.id if hasattr(item, 'id') else 0,
-            instance_id=item.instance_id if hasattr(item, 'instance_id') else 0,
-            folder_id=item.folder_id if hasattr(item, 'folder_id') else 1,
-            rating=item.rating if hasattr(item, 'rating') else 0,
-            basic_information=item.data.get('basic_information', {}) if hasattr(item, 'data') else {},
-            notes=item.notes if hasattr(item, 'notes') else None,
-            date_added=item.date_added if hasattr(item, 'date_added') else None
-        )
\ No newline at end of file
+        """
+        Parse raw collection item into model.
+        
+        Reads the already-fetched JSON payload instead of the lazy
+        discogs_client attributes, which may trigger extra requests.
+        """
+        return self.parser.parse_collection_item(getattr(item, 'data', None) or {})
@@ -5,7 +5,7 @@ Data parsing utilities for Discogs API responses.
 from typing import Any, Dict, List
 
 from ..models import (
-    Artist, Release, Master, Label, Track, Image
+    Artist, Release, Master, Label, Track, Image, CollectionItem
 )
 
 
@@ -257,4 +257,31 @@ class DataParser:
         elif hasattr(data, 'get'):
             result['resource_url'] = data.get('resource_url')
             
-        return result
\ No newline at end of file
+        return result
+    
+    def parse_collection_item(self, data: Dict[str, Any]) -> CollectionItem:
+        """Parse a raw collection release JSON object."""
+        notes = data.get('notes')
+        if isinstance(notes, list):
+            # API returns notes as [{"field_id": 3, "value": "..."}]
+            notes = '\n'.join(str(n.get('value', '')) for n in notes if n.get('value')) or None
+        
+        return CollectionItem(
+            id=data.get('id', 0),
+            instance_id=data.get('instance_id', 0),
+            folder_id=data.get('folder_id', 1),
+            rating=data.get('rating', 0),
+            basic_information=data.get('basic_information', {}),
+            notes=notes,
+            date_added=data.get('date_added')
+        )
+    
+    def parse_wantlist_item(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a raw wantlist JSON object."""
+        return {
+            'id': data.get('id'),
+            'rating': data.get('rating', 0),
+            'notes': data.get('notes'),
+            'basic_information': data.get('basic_information', {}),
+            'resource_url': data.get('resource_url')
+        }
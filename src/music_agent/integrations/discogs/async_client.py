@@ -0,0 +1,374 @@
+"""
+Asyncio Discogs client.
+
+Works on the raw JSON responses of the Discogs REST API instead of the lazy
+``discogs_client`` objects, and fetches collection/wantlist pages
+concurrently within the account's per-minute budget. The budget is kept in
+sync with the ``X-Discogs-Ratelimit-Remaining`` response header.
+"""
+
+import asyncio
+import logging
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
+
+import aiohttp
+
+from ...utils.http import shared_session
+from ...utils.rate_limit import AsyncRateLimiter
+from .config import DiscogsConfig
+from .models import CollectionItem
+from .exceptions import (
+    AuthenticationError,
+    APIError,
+    RateLimitError,
+    NotFoundError,
+    NetworkError,
+)
+from .api.parsers import DataParser
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDiscogsClient:
+    """Asyncio Discogs client for bulk collection and wantlist sync."""
+
+    def __init__(
+        self,
+        config: Optional[DiscogsConfig] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize async Discogs client.
+
+        Args:
+            config: Optional configuration. If not provided, will load from environment.
+            session: Optional aiohttp session to borrow instead of creating one
+        """
+        self.config = config or DiscogsConfig.from_env()
+        self.config.validate()
+        self.parser = DataParser()
+
+        self._session = session
+        self._owns_session = session is None
+        self._username: Optional[str] = None
+
+        # Discogs uses a moving 60s window; allow a small burst so pages can
+        # start concurrently, then settle to the steady per-minute rate
+        self._limiter = AsyncRateLimiter(
+            self.config.requests_per_minute,
+            period=60.0,
+            burst=self.config.max_concurrency,
+            max_concurrency=self.config.max_concurrency,
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def connect(self):
+        """Borrow a pooled HTTP session if one was not supplied."""
+        if self._session is None or self._session.closed:
+            self._session = await shared_session(
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+            )
+            self._owns_session = True
+
+    async def close(self):
+        """Close the HTTP session if this client owns it."""
+        if self._session and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Build request headers including authentication."""
+        headers = {
+            "User-Agent": self.config.user_agent,
+            "Accept": "application/vnd.discogs.v2.discogs+json",
+        }
+        if self.config.user_token:
+            headers["Authorization"] = f"Discogs token={self.config.user_token}"
+        elif self.config.consumer_key and self.config.consumer_secret:
+            headers["Authorization"] = (
+                f"Discogs key={self.config.consumer_key}, secret={self.config.consumer_secret}"
+            )
+        return headers
+
+    def _update_budget(self, response: aiohttp.ClientResponse) -> None:
+        """Clamp the local budget to what Discogs reports as remaining."""
+        remaining = response.headers.get("X-Discogs-Ratelimit-Remaining")
+        if remaining is not None:
+            try:
+                self._limiter.set_available(int(remaining))
+            except ValueError:
+                pass
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an API request with rate limiting and retries.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. ``/users/{name}/collection/folders/0/releases``)
+            params: Query parameters
+
+        Returns:
+            Decoded JSON body
+        """
+        await self.connect()
+        url = f"{self.config.base_url}{path}"
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.config.max_retries):
+            async with self._limiter:
+                try:
+                    async with self._session.request(
+                        method, url, params=params, headers=self._headers()
+                    ) as response:
+                        self._update_budget(response)
+
+                        if response.status == 401:
+                            raise AuthenticationError("Authentication failed")
+                        if response.status == 404:
+                            raise NotFoundError(f"Resource not found: {path}")
+                        if response.status == 429:
+                            retry_after = int(response.headers.get("Retry-After", 60))
+                            self._limiter.pause(retry_after)
+                            last_error = RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                            logger.warning(f"Rate limited, retrying after {retry_after} seconds")
+                            continue
+                        if response.status >= 500:
+                            last_error = APIError(f"Server error: {response.status}", status_code=response.status)
+                        elif response.status >= 400:
+                            text = await response.text()
+                            raise APIError(f"API error: {text[:200]}", status_code=response.status)
+                        else:
+                            return await response.json(content_type=None)
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = NetworkError(f"Network error: {e}")
+
+            await asyncio.sleep(self.config.retry_delay * (2 ** attempt))
+
+        raise last_error or APIError("Max retries exceeded")
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make GET request."""
+        return await self._request("GET", path, params)
+
+    async def get_username(self, username: Optional[str] = None) -> str:
+        """
+        Resolve the username to operate on.
+
+        Args:
+            username: Explicit username (defaults to authenticated user)
+
+        Returns:
+            Username
+        """
+        if username:
+            return username
+        if not self._username:
+            identity = await self._get("/oauth/identity")
+            self._username = identity["username"]
+        return self._username
+
+    async def _fetch_pages(
+        self,
+        path: str,
+        items_key: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Fetch every page of a paginated listing.
+
+        The first page reveals the page count; the remaining pages are then
+        requested concurrently and yielded as they complete.
+
+        Args:
+            path: API path
+            items_key: Key holding the page items (``releases``, ``wants``)
+            params: Extra query parameters
+
+        Yields:
+            (page number, raw items) tuples
+        """
+        params = dict(params or {})
+        params["per_page"] = min(self.config.sync_per_page, self.config.max_per_page)
+
+        first = await self._get(path, {**params, "page": 1})
+        yield 1, first.get(items_key, [])
+
+        pages = first.get("pagination", {}).get("pages", 1)
+        if pages <= 1:
+            return
+
+        async def fetch(page: int) -> Tuple[int, List[Dict[str, Any]]]:
+            data = await self._get(path, {**params, "page": page})
+            return page, data.get(items_key, [])
+
+        tasks = [asyncio.create_task(fetch(page)) for page in range(2, pages + 1)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # Collection
+
+    async def iter_collection(
+        self,
+        username: Optional[str] = None,
+        folder_id: int = 0,
+        sort: str = "added",
+        sort_order: str = "asc"
+    ) -> AsyncIterator[CollectionItem]:
+        """
+        Stream a user's collection as pages arrive (not in page order).
+
+        Args:
+            username: Username (defaults to authenticated user)
+            folder_id: Folder ID (0 for all folders)
+            sort: Sort field (artist, title, catno, year, added)
+            sort_order: Sort order (asc, desc)
+
+        Yields:
+            CollectionItem objects
+        """
+        user = await self.get_username(username)
+        path = f"/users/{user}/collection/folders/{folder_id}/releases"
+
+        async for _, rows in self._fetch_pages(path, "releases", {"sort": sort, "sort_order": sort_order}):
+            for row in rows:
+                yield self.parser.parse_collection_item(row)
+
+    async def get_collection(
+        self,
+        username: Optional[str] = None,
+        folder_id: int = 0,
+        sort: str = "added",
+        sort_order: str = "asc"
+    ) -> List[CollectionItem]:
+        """
+        Get a user's entire collection, fetching pages concurrently.
+
+        Args:
+            username: Username (defaults to authenticated user)
+            folder_id: Folder ID (0 for all folders)
+            sort: Sort field (artist, title, catno, year, added)
+            sort_order: Sort order (asc, desc)
+
+        Returns:
+            List of CollectionItem objects in API order
+        """
+        user = await self.get_username(username)
+        path = f"/users/{user}/collection/folders/{folder_id}/releases"
+
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        async for page, rows in self._fetch_pages(path, "releases", {"sort": sort, "sort_order": sort_order}):
+            pages[page] = rows
+
+        return [
+            self.parser.parse_collection_item(row)
+            for page in sorted(pages)
+            for row in pages[page]
+        ]
+
+    async def get_collection_folders(self, username: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get a user's collection folders.
+
+        Args:
+            username: Username (defaults to authenticated user)
+
+        Returns:
+            List of folder dictionaries
+        """
+        user = await self.get_username(username)
+        data = await self._get(f"/users/{user}/collection/folders")
+        return [
+            {
+                'id': folder.get('id'),
+                'name': folder.get('name'),
+                'count': folder.get('count'),
+                'resource_url': folder.get('resource_url')
+            }
+            for folder in data.get('folders', [])
+        ]
+
+    async def get_collection_value(self, username: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get estimated collection value.
+
+        Args:
+            username: Username (defaults to authenticated user)
+
+        Returns:
+            Dictionary with value statistics
+        """
+        user = await self.get_username(username)
+        return await self._get(f"/users/{user}/collection/value")
+
+    # Wantlist
+
+    async def get_wantlist(self, username: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get a user's entire wantlist, fetching pages concurrently.
+
+        Args:
+            username: Username (defaults to authenticated user)
+
+        Returns:
+            List of wantlist items in API order
+        """
+        user = await self.get_username(username)
+
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        async for page, rows in self._fetch_pages(f"/users/{user}/wants", "wants"):
+            pages[page] = rows
+
+        return [
+            self.parser.parse_wantlist_item(row)
+            for page in sorted(pages)
+            for row in pages[page]
+        ]
+
+    # Database
+
+    async def search(
+        self,
+        query: str,
+        search_type: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+        **filters: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the Discogs database.
+
+        Args:
+            query: Search query
+            search_type: Restrict to release, master, artist or label
+            per_page: Results per page
+            page: Page number
+            **filters: Extra search fields (artist, track, label, ...)
+
+        Returns:
+            Raw result rows
+        """
+        params: Dict[str, Any] = {"q": query, "per_page": per_page, "page": page, **filters}
+        if search_type:
+            params["type"] = search_type
+
+        data = await self._get("/database/search", params)
+        return data.get("results", [])
@@ -24,6 +24,11 @@ class DiscogsConfig:
     requests_per_minute: int = 60
     max_retries: int = 3
     retry_delay: float = 1.0
+    request_timeout: float = 30.0
+    max_concurrency: int = 4  # Concurrent requests for the async client
+    
+    # Paginated sync (collection/wantlist); the API caps per_page at 100
+    sync_per_page: int = 100
     
     # Search defaults
     default_per_page: int = 50
@@ -0,0 +1,385 @@
+"""
+Structured Graph Writer
+Direct Cypher ingestion of structured music facts
+
+Rekordbox, Deezer and other catalogs hand us fully structured data (IDs,
+ISRC, BPM, key). Sending that through Graphiti's LLM extraction is slow and
+lossy, so this writer MERGEs Track, Artist, Album, Label and Playlist nodes
+and their relationships (following ``models/ontologies.py``) with batched
+``UNWIND`` queries instead. Graphiti episodes stay the path for free text.
+
+Tracks are keyed by their first platform ID (``rekordbox_id``,
+``deezer_id``, ...), which is stable for a source, and the ISRC is a
+property. A track new to a source adopts an existing node with its ISRC
+that has no ID from that source yet, so the same recording from Rekordbox
+and Deezer lands on one node, while two Rekordbox tracks sharing an ISRC
+stay apart. Only tracks without any platform ID are keyed by ISRC.
+"""
+
+import time
+import logging
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models.ontologies import Playlist, Track
+
+logger = logging.getLogger(__name__)
+
+# Platform identifiers tracks can be keyed and matched by, in key order
+TRACK_ID_FIELDS: Tuple[str, ...] = tuple(
+    name for name in Track.model_fields if name.endswith("_id")
+)
+TRACK_KEY_FIELDS: Tuple[str, ...] = TRACK_ID_FIELDS + ("isrc",)
+
+TRACK_PROPERTIES = frozenset(Track.model_fields)
+PLAYLIST_PROPERTIES = frozenset(Playlist.model_fields)
+
+STRUCTURED_INDEXES = [
+    "CREATE INDEX track_id IF NOT EXISTS FOR (n:Track) ON (n.id)",
+    "CREATE INDEX track_rekordbox IF NOT EXISTS FOR (n:Track) ON (n.rekordbox_id)",
+    "CREATE INDEX track_beatport IF NOT EXISTS FOR (n:Track) ON (n.beatport_id)",
+    "CREATE INDEX track_discogs IF NOT EXISTS FOR (n:Track) ON (n.discogs_id)",
+    "CREATE INDEX track_youtube IF NOT EXISTS FOR (n:Track) ON (n.youtube_id)",
+    "CREATE INDEX track_1001 IF NOT EXISTS FOR (n:Track) ON (n.track_1001_id)",
+    "CREATE INDEX artist_name_key IF NOT EXISTS FOR (n:Artist) ON (n.name_key)",
+    "CREATE INDEX album_key IF NOT EXISTS FOR (n:Album) ON (n.key)",
+    "CREATE INDEX label_name_key IF NOT EXISTS FOR (n:Label) ON (n.name_key)",
+    "CREATE INDEX playlist_id IF NOT EXISTS FOR (n:Playlist) ON (n.id)",
+    "CREATE INDEX preference_group IF NOT EXISTS FOR (n:Preference) ON (n.group_id)",
+    "CREATE INDEX preference_type IF NOT EXISTS FOR (n:Preference) ON (n.preference_type)",
+    "CREATE INDEX discovery_time IF NOT EXISTS FOR (n:Discovery) ON (n.created_at)",
+]
+
+# Typed event records backing MusicMemory's read paths
+EVENT_LABELS = frozenset({"Preference", "Discovery"})
+
+# A track not yet known by this source's ID takes over a node with its ISRC
+# that has no ID from this source (the same recording seen elsewhere)
+ADOPT_BY_ISRC = """
+CALL {
+    WITH row
+    OPTIONAL MATCH (known:Track {%(key)s: row.key})
+    OPTIONAL MATCH (same:Track {isrc: row.props.isrc})
+    WHERE known IS NULL AND same.%(key)s IS NULL
+    WITH row, head(collect(same)) AS adopted
+    FOREACH (t IN CASE WHEN adopted IS NULL THEN [] ELSE [adopted] END |
+        SET t.%(key)s = row.key)
+}
+"""
+
+MERGE_TRACKS = """
+UNWIND $rows AS row
+%(adopt)s
+MERGE (t:Track {%(key)s: row.key})
+ON CREATE SET t.id = row.id, t.created_at = datetime()
+SET t += row.props, t.group_id = $group_id, t.updated_at = datetime()
+FOREACH (artist IN row.artists |
+    MERGE (a:Artist {name_key: artist.key})
+    ON CREATE SET a.name = artist.name
+    MERGE (t)-[:PERFORMED_BY]->(a))
+FOREACH (album IN CASE WHEN row.album IS NULL THEN [] ELSE [row.album] END |
+    MERGE (al:Album {key: album.key})
+    ON CREATE SET al.title = album.title, al.artist = album.artist
+    MERGE (t)-[:BELONGS_TO_ALBUM]->(al))
+FOREACH (label IN CASE WHEN row.label IS NULL THEN [] ELSE [row.label] END |
+    MERGE (l:Label {name_key: label.key})
+    ON CREATE SET l.name = label.name
+    MERGE (t)-[:RELEASED_ON]->(l))
+RETURN count(*) AS written
+"""
+
+# Replaces each playlist's entries; tracks are matched by a platform ID
+MERGE_PLAYLISTS = """
+UNWIND $rows AS row
+MERGE (p:Playlist {id: row.id})
+SET p += row.props, p.group_id = $group_id, p.updated_at = datetime()
+WITH p, row
+CALL {
+    WITH p
+    MATCH (p)-[old:CONTAINS_TRACK]->()
+    DELETE old
+}
+WITH p, row
+UNWIND row.tracks AS entry
+MATCH (t:Track {%(key)s: entry.key})
+CREATE (p)-[:CONTAINS_TRACK {position: entry.position}]->(t)
+RETURN count(*) AS written
+"""
+
+CREATE_EVENTS = """
+UNWIND $rows AS row
+CREATE (e:%(label)s)
+SET e = row, e.group_id = $group_id
+RETURN count(*) AS written
+"""
+
+
+def name_key(name: str) -> str:
+    """Case- and whitespace-insensitive key for artist and label names."""
+    return " ".join(name.lower().split())
+
+
+def _clean(value: Any) -> Any:
+    """Empty strings are missing values."""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def track_row(track: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Cypher parameters for one track.
+
+    Args:
+        track: Track fields named as in ``ontologies.Track``, plus optional
+            ``artists`` (list of names) and ``label``
+
+    Returns:
+        Row with the merge key (the first platform ID, else the ISRC) and
+        properties, or None if the track has neither
+    """
+    props = {
+        name: _clean(value) for name, value in track.items()
+        if name in TRACK_PROPERTIES and _clean(value) is not None
+    }
+    for name in TRACK_ID_FIELDS:
+        if name in props:
+            props[name] = str(props[name])
+    if "isrc" in props:
+        props["isrc"] = str(props["isrc"]).upper()
+
+    key_field = next((name for name in TRACK_KEY_FIELDS if name in props), None)
+    if key_field is None:
+        return None
+
+    artists = [_clean(name) for name in (track.get("artists") or [track.get("artist")])]
+    artists = [{"key": name_key(name), "name": name} for name in artists if name]
+
+    album = None
+    if props.get("album"):
+        primary = artists[0]["key"] if artists else ""
+        album = {
+            "key": f"{primary}|{name_key(props['album'])}",
+            "title": props["album"],
+            "artist": artists[0]["name"] if artists else None,
+        }
+
+    label = _clean(track.get("label"))
+
+    return {
+        "key_field": key_field,
+        "key": props[key_field],
+        "id": props[key_field] if key_field == "isrc" else f"{key_field[:-3]}:{props[key_field]}",
+        "props": props,
+        "artists": artists,
+        "album": album,
+        "label": {"key": name_key(label), "name": label} if label else None,
+    }
+
+
+def playlist_row(playlist: Dict[str, Any], track_ids: List[Any]) -> Dict[str, Any]:
+    """
+    Cypher parameters for one playlist.
+
+    Args:
+        playlist: Fields named as in ``ontologies.Playlist``; ``platform``
+            and ``platform_id`` are required
+        track_ids: Platform IDs of the tracks, in order
+
+    Returns:
+        Row with the playlist ID, properties and entries
+    """
+    props = {
+        name: _clean(value) for name, value in playlist.items()
+        if name in PLAYLIST_PROPERTIES and _clean(value) is not None
+    }
+    props["platform_id"] = str(props["platform_id"])
+    return {
+        "id": f"{props['platform']}:{props['platform_id']}",
+        "props": props,
+        "tracks": [
+            {"key": str(track_id), "position": position}
+            for position, track_id in enumerate(track_ids, 1)
+        ],
+    }
+
+
+@dataclass
+class GraphWriteStats:
+    """Structured write counters."""
+
+    tracks: int = 0
+    skipped_tracks: int = 0  # No ISRC or platform ID
+    playlists: int = 0
+    playlist_entries: int = 0
+    events: int = 0
+    transactions: int = 0
+    seconds: float = 0.0
+
+
+class StructuredGraphWriter:
+    """
+    Batched, parameterized Cypher writes of structured music data.
+
+    Each batch is one auto-commit transaction on the Graphiti driver, so a
+    failure loses at most one batch and retrying is safe (every write is a
+    MERGE).
+    """
+
+    def __init__(self, driver: Any, group_id: Optional[str] = None, batch_size: int = 500):
+        """
+        Initialize writer.
+
+        Args:
+            driver: Graphiti graph driver (anything with ``execute_query``)
+            group_id: Stored on written nodes, like Graphiti's group
+            batch_size: Rows per transaction
+        """
+        self.driver = driver
+        self.group_id = group_id
+        self.batch_size = batch_size
+        self.stats = GraphWriteStats()
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the MERGE keys need."""
+        for statement in STRUCTURED_INDEXES:
+            try:
+                await self.driver.execute_query(statement)
+            except Exception as e:
+                logger.debug(f"Index creation skipped: {e}")
+
+    async def _run(self, query: str, rows: List[Dict[str, Any]]) -> None:
+        """Execute one batch."""
+        started = time.perf_counter()
+        await self.driver.execute_query(query, rows=rows, group_id=self.group_id)
+        self.stats.transactions += 1
+        self.stats.seconds += time.perf_counter() - started
+
+    @staticmethod
+    def _merge_tracks_query(key_field: str) -> str:
+        """MERGE_TRACKS for one key; platform keys adopt ISRC matches first."""
+        adopt = "" if key_field == "isrc" else ADOPT_BY_ISRC % {"key": key_field}
+        return MERGE_TRACKS % {"key": key_field, "adopt": adopt}
+
+    async def write_tracks(self, tracks: Iterable[Dict[str, Any]]) -> int:
+        """
+        MERGE tracks with their artists, album and label.
+
+        Args:
+            tracks: Track dictionaries (see ``track_row``); may be a generator
+
+        Returns:
+            Number of tracks written
+        """
+        written = 0
+        # The merge property can't be a parameter: one query, and buffer, per key
+        buffers: Dict[str, List[Dict[str, Any]]] = {}
+        for track in tracks:
+            row = track_row(track)
+            if row is None:
+                self.stats.skipped_tracks += 1
+                continue
+            key_field = row.pop("key_field")
+            buffer = buffers.setdefault(key_field, [])
+            buffer.append(row)
+            if len(buffer) >= self.batch_size:
+                await self._run(self._merge_tracks_query(key_field), buffer)
+                written += len(buffer)
+                buffers[key_field] = []
+
+        for key_field, rows in buffers.items():
+            if rows:
+                await self._run(self._merge_tracks_query(key_field), rows)
+                written += len(rows)
+
+        self.stats.tracks += written
+        return written
+
+    async def write_playlists(
+        self,
+        playlists: Iterable[Tuple[Dict[str, Any], List[Any]]],
+        track_key: str = "rekordbox_id"
+    ) -> int:
+        """
+        MERGE playlists and replace their CONTAINS_TRACK relationships.
+
+        Tracks must already be in the graph; entries whose track isn't
+        are skipped.
+
+        Args:
+            playlists: (playlist fields, track IDs) pairs; may be a generator
+            track_key: Track property the IDs refer to
+
+        Returns:
+            Number of playlists written
+        """
+        if track_key not in TRACK_KEY_FIELDS:
+            raise ValueError(f"Unknown track key: {track_key}")
+
+        query = MERGE_PLAYLISTS % {"key": track_key}
+        written = 0
+        batch: List[Dict[str, Any]] = []
+        entries = 0
+        for playlist, track_ids in playlists:
+            row = playlist_row(playlist, track_ids)
+            batch.append(row)
+            entries += len(row["tracks"])
+            # Bound transactions by entries, not playlists
+            if entries >= self.batch_size * 10 or len(batch) >= self.batch_size:
+                await self._run(query, batch)
+                written += len(batch)
+                self.stats.playlist_entries += entries
+                batch, entries = [], 0
+
+        if batch:
+            await self._run(query, batch)
+            written += len(batch)
+            self.stats.playlist_entries += entries
+
+        self.stats.playlists += written
+        return written
+
+    async def write_events(self, label: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Record typed events (preferences, discoveries) as indexed nodes.
+
+        Args:
+            label: Node label, one of ``EVENT_LABELS``
+            rows: Event properties (primitive values and datetimes)
+
+        Returns:
+            Number of events written
+        """
+        if label not in EVENT_LABELS:
+            raise ValueError(f"Unknown event label: {label}")
+        if not rows:
+            return 0
+
+        await self._run(CREATE_EVENTS % {"label": label}, rows)
+        self.stats.events += len(rows)
+        return len(rows)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get write statistics.
+
+        Returns:
+            Counters and rows written per second
+        """
+        stats = asdict(self.stats)
+        rows = self.stats.tracks + self.stats.playlist_entries
+        stats["rows_per_second"] = round(rows / self.stats.seconds, 1) if self.stats.seconds else 0.0
+        return stats
+
+
+__all__ = [
+    'EVENT_LABELS',
+    'GraphWriteStats',
+    'STRUCTURED_INDEXES',
+    'StructuredGraphWriter',
+    'TRACK_KEY_FIELDS',
+    'name_key',
+    'playlist_row',
+    'track_row',
+]
@@ -0,0 +1,545 @@
+"""
+Graphiti Ingestion Queue
+Batched, durable episode ingestion for MusicMemory
+
+Every Graphiti episode runs its own LLM extraction, so writing them one at
+a time from a library sync means thousands of serial calls. The queue
+accepts episodes without waiting for Graphiti:
+
+- track discoveries are coalesced into ``add_episode_bulk`` calls
+- other episodes (conversations, preferences, playlists) are sent alone
+- a bounded number of calls run concurrently
+- every episode is written to a SQLite spool first and removed once
+  Graphiti has it, so pending work survives restarts
+- submitters wait when too much work is pending (backpressure)
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+import sqlite3
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from graphiti_core.nodes import EpisodeType
+from graphiti_core.utils.bulk_utils import RawEpisode
+
+logger = logging.getLogger(__name__)
+
+TRACK = "track"
+EPISODE = "episode"
+
+
+@dataclass
+class IngestConfig:
+    """Ingestion queue configuration."""
+
+    spool_path: str = "~/.music_agent_cache/graphiti_ingest.db"
+    max_concurrency: int = 4       # Graphiti calls in flight
+    batch_size: int = 25           # Track episodes per bulk call
+    flush_interval: float = 2.0    # Seconds a partial batch waits for more tracks
+    max_pending: int = 2000        # Submitters wait above this many pending episodes
+    max_attempts: int = 3
+    retry_delay: float = 5.0       # Multiplied by the attempt number
+    episode_timeout: float = 30.0
+    bulk_timeout: float = 180.0
+
+    @classmethod
+    def from_env(cls) -> "IngestConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            spool_path=os.getenv("GRAPHITI_INGEST_SPOOL", "~/.music_agent_cache/graphiti_ingest.db"),
+            max_concurrency=int(os.getenv("GRAPHITI_INGEST_CONCURRENCY", "4")),
+            batch_size=int(os.getenv("GRAPHITI_INGEST_BATCH_SIZE", "25")),
+            flush_interval=float(os.getenv("GRAPHITI_INGEST_FLUSH_SECONDS", "2.0")),
+            max_pending=int(os.getenv("GRAPHITI_INGEST_MAX_PENDING", "2000")),
+        )
+
+
+@dataclass
+class EpisodeJob:
+    """An episode waiting to be written to Graphiti."""
+
+    id: str
+    kind: str  # TRACK or EPISODE
+    name: str
+    body: str
+    source_description: str
+    reference_time: datetime
+    group_id: Optional[str] = None
+    attempts: int = 0
+    created: float = 0.0  # Unix time it was submitted
+
+    def to_raw_episode(self) -> RawEpisode:
+        """Episode for ``add_episode_bulk``."""
+        return RawEpisode(
+            name=self.name,
+            content=self.body,
+            source=EpisodeType.text,
+            source_description=self.source_description,
+            reference_time=self.reference_time,
+        )
+
+
+@dataclass
+class IngestStats:
+    """Ingestion counters."""
+
+    submitted: int = 0
+    recovered: int = 0          # Pending episodes loaded from the spool at start
+    completed: int = 0
+    failed: int = 0             # Gave up after max_attempts (kept in the spool)
+    retried: int = 0
+    bulk_calls: int = 0
+    coalesced: int = 0          # Track episodes sent through bulk calls
+    episode_calls: int = 0
+    backpressure_waits: int = 0
+    backpressure_seconds: float = 0.0
+    max_pending: int = 0
+
+
+class EpisodeSpool:
+    """
+    SQLite spool of pending episodes.
+
+    Rows are inserted on submit and deleted once Graphiti accepted them.
+    Episodes that exhausted their attempts stay behind with status
+    ``failed`` for inspection or ``requeue_failed``.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the spool.
+
+        Args:
+            path: Database file, or ":memory:"
+        """
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, isolation_level=None)
+        # WAL with NORMAL sync survives process crashes without an fsync per episode
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+        CREATE TABLE IF NOT EXISTS episodes (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            body TEXT NOT NULL,
+            source_description TEXT NOT NULL,
+            reference_time TEXT NOT NULL,
+            group_id TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            error TEXT
+        )
+        """)
+
+    def add(self, job: EpisodeJob) -> None:
+        """Persist a new episode."""
+        self._db.execute(
+            "INSERT INTO episodes (id, kind, name, body, source_description, reference_time, "
+            "group_id, attempts, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job.id, job.kind, job.name, job.body, job.source_description,
+                job.reference_time.isoformat(), job.group_id, job.attempts, job.created
+            )
+        )
+
+    def remove(self, jobs: List[EpisodeJob]) -> None:
+        """Drop episodes Graphiti accepted."""
+        self._db.executemany("DELETE FROM episodes WHERE id = ?", [(job.id,) for job in jobs])
+
+    def record_attempt(self, job: EpisodeJob, error: str, failed: bool) -> None:
+        """Store a failed attempt, marking the episode failed if it gave up."""
+        self._db.execute(
+            "UPDATE episodes SET attempts = ?, error = ?, status = ? WHERE id = ?",
+            (job.attempts, error[:500], "failed" if failed else "pending", job.id)
+        )
+
+    def pending(self) -> List[EpisodeJob]:
+        """Pending episodes, oldest first."""
+        rows = self._db.execute(
+            "SELECT id, kind, name, body, source_description, reference_time, group_id, attempts, created "
+            "FROM episodes WHERE status = 'pending' ORDER BY created"
+        ).fetchall()
+        return [
+            EpisodeJob(
+                id=row[0], kind=row[1], name=row[2], body=row[3], source_description=row[4],
+                reference_time=datetime.fromisoformat(row[5]), group_id=row[6],
+                attempts=row[7], created=row[8]
+            )
+            for row in rows
+        ]
+
+    def requeue_failed(self) -> int:
+        """Mark failed episodes pending again; returns how many."""
+        cursor = self._db.execute(
+            "UPDATE episodes SET status = 'pending', attempts = 0 WHERE status = 'failed'"
+        )
+        return cursor.rowcount
+
+    def count(self, status: str = "pending") -> int:
+        """Number of episodes with a status."""
+        return self._db.execute("SELECT COUNT(*) FROM episodes WHERE status = ?", (status,)).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+class GraphitiIngestQueue:
+    """
+    Bounded, batching, spooled writer of Graphiti episodes.
+
+    Works with anything that has Graphiti's ``add_episode`` and
+    ``add_episode_bulk`` coroutines, so it can be driven by a fake in tests.
+    """
+
+    def __init__(
+        self,
+        graphiti: Any,
+        group_id: Optional[str] = None,
+        config: Optional[IngestConfig] = None
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            graphiti: Graphiti instance
+            group_id: Default group (session) for submitted episodes
+            config: Queue configuration (defaults from environment)
+        """
+        self.graphiti = graphiti
+        self.group_id = group_id
+        self.config = config or IngestConfig.from_env()
+        self.stats = IngestStats()
+
+        self._spool: Optional[EpisodeSpool] = None
+        self._queue: "asyncio.Queue[List[EpisodeJob]]" = asyncio.Queue()
+        self._buffers: Dict[Optional[str], List[EpisodeJob]] = {}
+        self._buffer_started: Dict[Optional[str], float] = {}
+        self._pending = 0
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+        self._tasks: List[asyncio.Task] = []
+        self._retries: set = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are running."""
+        return bool(self._tasks)
+
+    async def start(self) -> int:
+        """
+        Open the spool, queue what a previous run left and start the workers.
+
+        Returns:
+            Number of episodes recovered from the spool
+        """
+        if self.running:
+            return 0
+
+        self._spool = EpisodeSpool(self.config.spool_path)
+        recovered = self._spool.pending()
+        for job in recovered:
+            self._pending += 1
+            self._enqueue(job)
+        self.stats.recovered += len(recovered)
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} pending Graphiti episodes from the spool")
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"graphiti-ingest-{n}")
+            for n in range(max(1, self.config.max_concurrency))
+        ]
+        self._tasks.append(asyncio.create_task(self._flusher(), name="graphiti-ingest-flush"))
+        return len(recovered)
+
+    async def submit_track(
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: Optional[datetime] = None,
+        group_id: Optional[str] = None
+    ) -> str:
+        """
+        Queue a track discovery, to be written in a bulk call with others.
+
+        Args:
+            name: Episode name
+            episode_body: Episode text
+            source_description: Where the episode came from
+            reference_time: When it happened (now if None)
+            group_id: Group (defaults to the queue's)
+
+        Returns:
+            Episode job ID
+        """
+        return await self._submit(TRACK, name, episode_body, source_description, reference_time, group_id)
+
+    async def submit_episode(
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: Optional[datetime] = None,
+        group_id: Optional[str] = None
+    ) -> str:
+        """
+        Queue an episode to be written on its own.
+
+        Args:
+            name: Episode name
+            episode_body: Episode text
+            source_description: Where the episode came from
+            reference_time: When it happened (now if None)
+            group_id: Group (defaults to the queue's)
+
+        Returns:
+            Episode job ID
+        """
+        return await self._submit(EPISODE, name, episode_body, source_description, reference_time, group_id)
+
+    async def _submit(
+        self,
+        kind: str,
+        name: str,
+        body: str,
+        source_description: str,
+        reference_time: Optional[datetime],
+        group_id: Optional[str]
+    ) -> str:
+        """Spool an episode and hand it to the workers."""
+        if not self.running:
+            raise RuntimeError("Ingestion queue is not running; call start() first")
+
+        # Backpressure: wait for the workers to catch up
+        if self._pending >= self.config.max_pending:
+            self.stats.backpressure_waits += 1
+            started = time.monotonic()
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._pending < self.config.max_pending)
+            self.stats.backpressure_seconds += time.monotonic() - started
+
+        job = EpisodeJob(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            name=name,
+            body=body,
+            source_description=source_description,
+            reference_time=reference_time or datetime.now(),
+            group_id=group_id if group_id is not None else self.group_id,
+            created=time.time()
+        )
+        self._spool.add(job)
+        self._pending += 1
+        self.stats.submitted += 1
+        self.stats.max_pending = max(self.stats.max_pending, self._pending)
+        self._enqueue(job)
+        return job.id
+
+    def _enqueue(self, job: EpisodeJob) -> None:
+        """Buffer a track for coalescing, or queue an episode directly."""
+        if job.kind != TRACK or job.attempts > 0:
+            # Retries go alone, so one bad episode can't sink a batch again
+            self._queue.put_nowait([job])
+            return
+
+        buffer = self._buffers.setdefault(job.group_id, [])
+        if not buffer:
+            self._buffer_started[job.group_id] = time.monotonic()
+        buffer.append(job)
+        if len(buffer) >= self.config.batch_size:
+            self._flush(job.group_id)
+
+    def _flush(self, group_id: Optional[str]) -> None:
+        """Queue a group's buffered tracks as one batch."""
+        batch = self._buffers.pop(group_id, None)
+        self._buffer_started.pop(group_id, None)
+        if batch:
+            self._queue.put_nowait(batch)
+
+    def _flush_all(self) -> None:
+        """Queue every partial batch."""
+        for group_id in list(self._buffers):
+            self._flush(group_id)
+
+    async def _flusher(self) -> None:
+        """Queue partial batches that waited ``flush_interval``."""
+        interval = self.config.flush_interval
+        while True:
+            await asyncio.sleep(max(0.05, interval / 4))
+            now = time.monotonic()
+            for group_id, started in list(self._buffer_started.items()):
+                if now - started >= interval:
+                    self._flush(group_id)
+
+    async def _worker(self) -> None:
+        """Send queued batches to Graphiti."""
+        while True:
+            batch = await self._queue.get()
+            self._in_flight += len(batch)
+            try:
+                await self._send(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await self._handle_failure(batch, e)
+            else:
+                self._spool.remove(batch)
+                self.stats.completed += len(batch)
+                await self._settle(len(batch))
+            finally:
+                self._in_flight -= len(batch)
+                self._queue.task_done()
+
+    async def _send(self, batch: List[EpisodeJob]) -> None:
+        """Write a batch with one Graphiti call."""
+        if len(batch) > 1:
+            self.stats.bulk_calls += 1
+            self.stats.coalesced += len(batch)
+            await asyncio.wait_for(
+                self.graphiti.add_episode_bulk(
+                    [job.to_raw_episode() for job in batch],
+                    group_id=batch[0].group_id
+                ),
+                timeout=self.config.bulk_timeout
+            )
+            return
+
+        job = batch[0]
+        self.stats.episode_calls += 1
+        await asyncio.wait_for(
+            self.graphiti.add_episode(
+                name=job.name,
+                episode_body=job.body,
+                source_description=job.source_description,
+                reference_time=job.reference_time,
+                group_id=job.group_id
+            ),
+            timeout=self.config.episode_timeout
+        )
+
+    async def _handle_failure(self, batch: List[EpisodeJob], error: Exception) -> None:
+        """Schedule retries, or give up on episodes out of attempts."""
+        message = str(error) or type(error).__name__
+        logger.warning(f"Graphiti ingestion of {len(batch)} episode(s) failed: {message}")
+
+        gave_up = 0
+        for job in batch:
+            job.attempts += 1
+            failed = job.attempts >= self.config.max_attempts
+            self._spool.record_attempt(job, message, failed)
+            if failed:
+                gave_up += 1
+                self.stats.failed += 1
+                logger.error(f"Giving up on episode {job.name} after {job.attempts} attempts")
+            else:
+                self.stats.retried += 1
+                task = asyncio.create_task(self._retry(job, self.config.retry_delay * job.attempts))
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+
+        if gave_up:
+            await self._settle(gave_up)
+
+    async def _retry(self, job: EpisodeJob, delay: float) -> None:
+        """Queue an episode again after a delay."""
+        await asyncio.sleep(delay)
+        self._enqueue(job)
+
+    async def _settle(self, count: int) -> None:
+        """Mark episodes as no longer pending and wake waiters."""
+        async with self._changed:
+            self._pending -= count
+            self._changed.notify_all()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send partial batches now and wait until nothing is pending.
+
+        Args:
+            timeout: Seconds to wait (no limit if None)
+
+        Returns:
+            True if everything was written or gave up, False on timeout
+        """
+        self._flush_all()
+
+        async def settled():
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._pending <= 0)
+
+        try:
+            await asyncio.wait_for(settled(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: Optional[float] = 60.0) -> None:
+        """
+        Drain, then stop the workers.
+
+        Episodes still pending after ``timeout`` stay in the spool and are
+        sent by the next ``start``.
+
+        Args:
+            timeout: Seconds to wait for pending episodes
+        """
+        if not self.running:
+            return
+
+        if not await self.drain(timeout):
+            logger.warning(f"{self._pending} Graphiti episodes left in the spool for the next run")
+
+        for task in self._tasks + list(self._retries):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+        self._retries.clear()
+        self._buffers.clear()
+        self._buffer_started.clear()
+        self._queue = asyncio.Queue()
+        self._pending = 0
+
+        self._spool.close()
+        self._spool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Counters plus current depth (pending, buffered, queued, in
+            flight) and the age of the oldest buffered batch
+        """
+        now = time.monotonic()
+        oldest = min(self._buffer_started.values(), default=None)
+        stats = asdict(self.stats)
+        stats.update({
+            "pending": self._pending,
+            "buffered": sum(len(buffer) for buffer in self._buffers.values()),
+            "queued_batches": self._queue.qsize(),
+            "in_flight": self._in_flight,
+            "oldest_buffered_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+            "spool_failed": self._spool.count("failed") if self._spool else None,
+        })
+        return stats
+
+
+__all__ = [
+    'EpisodeJob',
+    'EpisodeSpool',
+    'GraphitiIngestQueue',
+    'IngestConfig',
+    'IngestStats',
+]
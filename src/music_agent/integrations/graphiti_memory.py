@@ -6,8 +6,8 @@ Manages temporal knowledge graph for music discovery and preferences
 import os
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from graphiti_core import Graphiti
@@ -23,12 +23,68 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.music_agent.utils.request_handler import RequestHandler
+from .graphiti_ingest import GraphitiIngestQueue, IngestConfig
+from .graph_writer import STRUCTURED_INDEXES, StructuredGraphWriter
+from ..cache import build_cache
 
 # from ..database.schema import Track, Playlist  # TODO: Add when schema is ready
 # from ..utils.config import config  # Not needed with env vars
 
 logger = logging.getLogger(__name__)
 
+# Listening-pattern windows: days covered and the bucket they are grouped by
+PATTERN_WINDOWS = {
+    "week": (7, "day"),
+    "month": (30, "day"),
+    "year": (365, "week"),
+}
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "", "N/A") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _native(value: Any) -> Any:
+    """Convert neo4j temporal values to Python ones."""
+    return value.to_native() if hasattr(value, "to_native") else value
+
+
+def parse_preference_episode(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Typed fields of a preference episode body written by add_preference.
+    
+    Args:
+        content: Episode body ("Type: likes artist", "Entity: ...", ...)
+    
+    Returns:
+        entity_type, entity_name, preference_type, score and reason, or
+        None if the body isn't a preference episode
+    """
+    fields: Dict[str, str] = {}
+    for line in (content or "").splitlines():
+        key, separator, value = line.partition(": ")
+        if separator:
+            fields.setdefault(key.strip(), value.strip())
+    
+    entity_type = fields.get("Entity Type")
+    if not entity_type or "Entity" not in fields:
+        return None
+    # "Type: {preference_type} {entity_type}"
+    preference_type = fields.get("Type", "")
+    if preference_type.endswith(f" {entity_type}"):
+        preference_type = preference_type[:-len(entity_type) - 1]
+    
+    return {
+        "entity_type": entity_type,
+        "entity_name": fields["Entity"],
+        "preference_type": preference_type or None,
+        "score": _to_float(fields.get("Score")),
+        "reason": fields.get("Reason"),
+    }
+
 
 class MusicMemory:
     """Graphiti-based memory system for music agent"""
@@ -42,6 +98,18 @@ class MusicMemory:
         self.graphiti: Optional[Graphiti] = None
         self.initialized = False
         self.session_id = None  # Will be set during initialize
+        self.ingest: Optional[GraphitiIngestQueue] = None  # Set by start_ingest
+        self.graph: Optional[StructuredGraphWriter] = None  # Direct Cypher writes
+        
+        # Read-path results, keyed by session and a per-kind generation that
+        # writes bump, so a write makes earlier entries unreachable
+        self._reads = build_cache(
+            "memory_reads",
+            default_ttl=int(os.getenv("MEMORY_READ_CACHE_TTL", "300")),
+            max_entries=256
+        )
+        self._generations: Dict[str, int] = {}
+        self._preferences_migrated = False  # Set by the first preference read
         
     async def initialize(self, session_id: Optional[str] = None):
         """Initialize Graphiti connection and indices"""
@@ -96,6 +164,9 @@ class MusicMemory:
             except Exception as e:
                 logger.warning(f"Skipping build_indices_and_constraints: {e}")
             
+            # Structured facts bypass LLM extraction
+            self.graph = StructuredGraphWriter(self.graphiti.driver, group_id=self.session_id)
+            
             # Build music-specific indices
             await self._build_indices()
             
@@ -119,7 +190,7 @@ class MusicMemory:
             "CREATE INDEX track_bpm IF NOT EXISTS FOR (n:Track) ON (n.bpm)",
             "CREATE INDEX track_key IF NOT EXISTS FOR (n:Track) ON (n.key)",
             "CREATE FULLTEXT INDEX track_search IF NOT EXISTS FOR (n:Track) ON EACH [n.title, n.artist, n.album]"
-        ]
+        ] + STRUCTURED_INDEXES
         
         for index in music_indices:
             try:
@@ -127,6 +198,28 @@ class MusicMemory:
             except Exception:
                 pass  # Index might already exist
     
+    async def start_ingest(self, config: Optional[IngestConfig] = None) -> GraphitiIngestQueue:
+        """
+        Route episode writes through a batched, spooled ingestion queue.
+        
+        Afterwards the add_* methods return as soon as the episode is
+        spooled; track discoveries are written in bulk. ``close`` drains
+        the queue.
+        
+        Args:
+            config: Queue configuration (defaults from environment)
+        
+        Returns:
+            The running GraphitiIngestQueue
+        """
+        if not self.initialized:
+            raise RuntimeError("Graphiti memory is not initialized")
+        
+        if self.ingest is None:
+            self.ingest = GraphitiIngestQueue(self.graphiti, group_id=self.session_id, config=config)
+            await self.ingest.start()
+        return self.ingest
+    
     async def _add_episode_safe(
         self,
         name: str,
@@ -187,6 +280,91 @@ class MusicMemory:
             logger.error(f"Failed to add episode {name}: {e}")
             return None
     
+    def _invalidate(self, *kinds: str):
+        """Invalidate cached reads of the given kinds."""
+        for kind in kinds:
+            self._generations[kind] = self._generations.get(kind, 0) + 1
+    
+    async def _cached_read(self, kind: str, key: str, factory):
+        """
+        Serve a read from the session cache.
+        
+        Args:
+            kind: Read kind (``preferences``, ``patterns``, ``context``)
+            key: Arguments identifying the read
+            factory: Coroutine function computing the result on a miss
+        
+        Returns:
+            Cached or freshly computed result
+        """
+        generation = self._generations.get(kind, 0)
+        return await self._reads.get_or_set(f"{self.session_id}:{kind}:{generation}:{key}", factory)
+    
+    async def _record_event(self, label: str, row: Dict[str, Any]):
+        """Write a typed Preference/Discovery node for the indexed read paths."""
+        if not self.graph:
+            return
+        try:
+            await self.graph.write_events(label, [row])
+        except Exception as e:
+            logger.warning(f"Failed to record {label.lower()}: {e}")
+    
+    async def migrate_preference_episodes(self) -> int:
+        """
+        Backfill Preference nodes from this session's preference episodes.
+        
+        Preferences recorded before typed nodes existed are only episodes,
+        which get_user_preferences no longer searches. Episodes older than
+        the first typed preference are parsed and written as Preference
+        nodes tagged with their episode's uuid, so running this again adds
+        nothing. get_user_preferences runs it once per session.
+        
+        Returns:
+            Number of preferences backfilled
+        """
+        
+        state = await self.graphiti.driver.execute_query(
+            """
+            MATCH (p:Preference)
+            WHERE p.group_id = $group_id
+            RETURN collect(p.episode_uuid) AS migrated,
+                   min(CASE WHEN p.episode_uuid IS NULL THEN p.created_at END) AS recorded_since
+            """,
+            group_id=self.session_id
+        )
+        migrated = set(state.records[0]["migrated"]) if state.records else set()
+        recorded_since = state.records[0]["recorded_since"] if state.records else None
+        
+        episodes = await self.graphiti.driver.execute_query(
+            """
+            MATCH (e:Episodic)
+            WHERE e.group_id = $group_id AND e.name STARTS WITH 'preference_'
+            AND ($before IS NULL OR e.created_at < $before)
+            RETURN e.uuid AS uuid, e.content AS content, e.created_at AS created_at
+            """,
+            group_id=self.session_id,
+            before=recorded_since
+        )
+        
+        rows = []
+        for record in episodes.records:
+            if record["uuid"] in migrated:
+                continue
+            fields = parse_preference_episode(record["content"])
+            if fields is None:
+                continue
+            rows.append({
+                **fields,
+                "created_at": _native(record["created_at"]),
+                "episode_uuid": record["uuid"],
+            })
+        
+        if rows:
+            await self.graph.write_events("Preference", rows)
+            self._invalidate("preferences")
+            logger.info(f"Backfilled {len(rows)} preferences from episodes")
+        return len(rows)
+    
     async def add_conversation(
         self,
         user_message: str,
@@ -204,8 +382,18 @@ Assistant: {agent_response}{context_str}
 Type: conversation
 Timestamp: {datetime.now().isoformat()}"""
         
+        name = f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self._invalidate("context")
+        
+        if self.ingest:
+            return await self.ingest.submit_episode(
+                name=name,
+                episode_body=episode_body.strip(),
+                source_description="User conversation with music agent"
+            )
+        
         result = await self.graphiti.add_episode(
-            name=f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            name=name,
             episode_body=episode_body.strip(),
             source_description="User conversation with music agent",
             reference_time=datetime.now(),
@@ -237,9 +425,31 @@ Timestamp: {datetime.now().isoformat()}"""
         if action:
             episode_body += f"\nAction: {action}"
         
+        name = f"track_{clean_title}_{datetime.now().strftime('%H%M%S')}"
+        
+        await self._record_event("Discovery", {
+            "source": source,
+            "action": action,
+            "track_id": str(track['id']) if track.get('id') is not None else None,
+            "title": track.get('title'),
+            "artist": track.get('artist'),
+            "bpm": _to_float(track.get('bpm')),
+            "key": track.get('key'),
+            "created_at": datetime.now(timezone.utc),
+        })
+        self._invalidate("patterns", "context")
+        
+        # Coalesced with other discoveries when the ingestion queue runs
+        if self.ingest:
+            return await self.ingest.submit_track(
+                name=name,
+                episode_body=episode_body.strip(),
+                source_description=f"Track discovered from {source}"
+            )
+        
         # Use safe add method
         result = await self._add_episode_safe(
-            name=f"track_{clean_title}_{datetime.now().strftime('%H%M%S')}",
+            name=name,
             episode_body=episode_body.strip(),
             source_description=f"Track discovered from {source}",
             reference_time=datetime.now(),
@@ -269,8 +479,27 @@ Timestamp: {datetime.now().isoformat()}"""
         if reason:
             episode_body += f"\nReason: {reason}"
         
+        name = f"preference_{entity_type}_{preference_type}_{datetime.now().strftime('%H%M%S')}"
+        
+        await self._record_event("Preference", {
+            "entity_type": entity_type,
+            "entity_name": entity_name,
+            "preference_type": preference_type,
+            "score": float(score),
+            "reason": reason,
+            "created_at": datetime.now(timezone.utc),
+        })
+        self._invalidate("preferences", "context")
+        
+        if self.ingest:
+            return await self.ingest.submit_episode(
+                name=name,
+                episode_body=episode_body.strip(),
+                source_description="User preference captured by agent"
+            )
+        
         result = await self.graphiti.add_episode(
-            name=f"preference_{entity_type}_{preference_type}_{datetime.now().strftime('%H%M%S')}",
+            name=name,
             episode_body=episode_body.strip(),
             source_description="User preference captured by agent",
             reference_time=datetime.now(),
@@ -278,6 +507,87 @@ Timestamp: {datetime.now().isoformat()}"""
         )
         return result
     
+    async def add_playlists(
+        self,
+        playlists: List[Dict[str, Any]],
+        source: str,
+        chunk_size: int = 25
+    ) -> int:
+        """
+        Record a library's playlists, many per episode.
+        
+        Args:
+            playlists: Dicts with ``name`` and ``track_count``
+            source: Where the playlists come from (e.g. "rekordbox")
+            chunk_size: Playlists per episode
+        
+        Returns:
+            Number of episodes added (or queued)
+        """
+        self._invalidate("context")
+        added = 0
+        for start in range(0, len(playlists), chunk_size):
+            chunk = playlists[start:start + chunk_size]
+            lines = "\n".join(f"- {p['name']} ({p['track_count']} tracks)" for p in chunk)
+            episode_body = f"""User-created {source} playlists:
+{lines}
+Type: preference
+Entity Type: playlist
+Timestamp: {datetime.now().isoformat()}"""
+            
+            name = f"playlists_{source}_{start // chunk_size + 1}_{datetime.now().strftime('%H%M%S')}"
+            
+            if self.ingest:
+                await self.ingest.submit_episode(
+                    name=name,
+                    episode_body=episode_body,
+                    source_description=f"Playlists synced from {source}"
+                )
+                added += 1
+                continue
+            
+            result = await self._add_episode_safe(
+                name=name,
+                episode_body=episode_body,
+                source_description=f"Playlists synced from {source}",
+                reference_time=datetime.now()
+            )
+            if result is not None:
+                added += 1
+        return added
+    
+    async def add_tracks(self, tracks: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write structured track facts straight to the graph.
+        
+        For catalog data (IDs, ISRC, BPM, key); no LLM extraction runs.
+        Use add_track_discovery for events worth remembering as episodes.
+        
+        Args:
+            tracks: Track dicts with ontology field names (see graph_writer.track_row)
+        
+        Returns:
+            Number of tracks written
+        """
+        return await self.graph.write_tracks(tracks)
+    
+    async def add_playlist_tracks(
+        self,
+        playlists: Iterable[Tuple[Dict[str, Any], List[Any]]],
+        track_key: str = "rekordbox_id"
+    ) -> int:
+        """
+        Write playlists and their track order straight to the graph.
+        
+        Args:
+            playlists: (playlist fields, track IDs) pairs
+            track_key: Track property the IDs refer to
+        
+        Returns:
+            Number of playlists written
+        """
+        return await self.graph.write_playlists(playlists, track_key=track_key)
+    
     async def search_memory(
         self,
         query: str,
@@ -341,37 +651,68 @@ Timestamp: {datetime.now().isoformat()}"""
     async def get_user_preferences(
         self,
         user_id: Optional[str] = None,
-        preference_type: Optional[str] = None
+        preference_type: Optional[str] = None,
+        limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Retrieve user preferences from memory"""
+        """
+        Retrieve user preferences recorded in this session, newest first.
         
-        # Use Graphiti search to find preference episodes
-        search_query = "preference"
-        if preference_type:
-            search_query = f"{preference_type} preference"
+        Reads the typed Preference nodes through the group_id index instead
+        of a semantic search; results are cached until the next preference
+        is recorded. Preferences stored only as episodes (before typed
+        nodes) are backfilled on the first read.
         
-        try:
-            # Search for preference episodes
-            results = await self.graphiti.search(
-                query=search_query,
-                num_results=100,
-                group_ids=[self.session_id] if self.session_id else None
+        Args:
+            user_id: Unused (preferences are scoped to the session)
+            preference_type: Filter on preference type ("likes") or entity type ("artist")
+            limit: Maximum preferences to return
+        
+        Returns:
+            Preference dicts with content, score, timestamp and typed fields
+        """
+        
+        query = """
+        MATCH (p:Preference)
+        WHERE p.group_id = $group_id
+        AND ($preference_type IS NULL
+             OR p.preference_type = $preference_type
+             OR p.entity_type = $preference_type)
+        RETURN p.entity_type AS entity_type, p.entity_name AS entity_name,
+               p.preference_type AS preference_type, p.score AS score,
+               p.reason AS reason, p.created_at AS created_at
+        ORDER BY p.created_at DESC
+        LIMIT $limit
+        """
+        
+        async def fetch():
+            results = await self.graphiti.driver.execute_query(
+                query,
+                group_id=self.session_id,
+                preference_type=preference_type,
+                limit=limit
             )
-            
-            preferences = []
-            for result in results:
-                # Parse preference data from the content
-                content = getattr(result, 'content', str(result))
-                if 'preference' in content.lower():
-                    # Extract basic info from content
-                    preferences.append({
-                        "content": content,
-                        "score": getattr(result, 'score', 0.0),
-                        "timestamp": getattr(result, 'created_at', None)
-                    })
-            
-            return preferences
-            
+            return [
+                {
+                    "content": f"{r['preference_type']} {r['entity_type']}: {r['entity_name']}",
+                    "score": r["score"],
+                    "timestamp": _native(r["created_at"]),
+                    "entity_type": r["entity_type"],
+                    "entity_name": r["entity_name"],
+                    "preference_type": r["preference_type"],
+                    "reason": r["reason"],
+                }
+                for r in results.records
+            ]
+        
+        if not self._preferences_migrated and self.graph:
+            self._preferences_migrated = True
+            try:
+                await self.migrate_preference_episodes()
+            except Exception as e:
+                logger.warning(f"Failed to backfill preference episodes: {e}")
+        
+        try:
+            return await self._cached_read("preferences", f"{preference_type}:{limit}", fetch)
         except Exception as e:
             logger.error(f"Failed to get user preferences: {e}")
             return []
@@ -380,76 +721,121 @@ Timestamp: {datetime.now().isoformat()}"""
         self,
         time_range: str = "week"
     ) -> Dict[str, Any]:
-        """Analyze listening patterns over time"""
+        """
+        Analyze track discoveries over time.
         
-        # Calculate time range
-        if time_range == "week":
-            days = 7
-        elif time_range == "month":
-            days = 30
-        else:
-            days = 365
+        One range scan over the Discovery created_at index, aggregated per
+        time bucket (days for week/month, weeks for year) and source.
+        Results are cached until the next discovery in this session;
+        discoveries from other sessions show up once the TTL expires.
         
-        query = """
-        MATCH (e:Episode)
-        WHERE e.metadata.type = 'track_discovery'
-        AND e.created_at > datetime() - duration({days: $days})
-        RETURN 
-            count(e) as total_discoveries,
-            collect(DISTINCT e.metadata.source) as sources,
-            avg(toFloat(e.metadata.bpm)) as avg_bpm
+        Args:
+            time_range: "week", "month" or "year"
+        
+        Returns:
+            Totals, sources, average BPM and per-bucket/per-source breakdowns
         """
         
-        results = await self.graphiti.driver.execute_query(
-            query,
-            days=days
-        )
+        days, unit = PATTERN_WINDOWS.get(time_range, PATTERN_WINDOWS["year"])
+        
+        query = """
+        MATCH (d:Discovery)
+        WHERE d.created_at >= $since
+        RETURN date.truncate($unit, d.created_at) AS bucket,
+               d.source AS source,
+               count(d) AS discoveries,
+               sum(d.bpm) AS bpm_total,
+               count(d.bpm) AS bpm_count
+        ORDER BY bucket
+        """
         
-        if results:
-            result = results[0]
+        async def fetch():
+            results = await self.graphiti.driver.execute_query(
+                query,
+                since=datetime.now(timezone.utc) - timedelta(days=days),
+                unit=unit
+            )
+            
+            buckets: Dict[str, Dict[str, Any]] = {}
+            by_source: Dict[str, int] = {}
+            bpm_total = 0.0
+            bpm_count = 0
+            for r in results.records:
+                day = _native(r["bucket"]).isoformat()
+                bucket = buckets.setdefault(day, {
+                    "start": day, "discoveries": 0, "sources": [], "bpm_total": 0.0, "bpm_count": 0
+                })
+                bucket["discoveries"] += r["discoveries"]
+                bucket["bpm_total"] += r["bpm_total"] or 0.0
+                bucket["bpm_count"] += r["bpm_count"]
+                if r["source"]:
+                    bucket["sources"].append(r["source"])
+                    by_source[r["source"]] = by_source.get(r["source"], 0) + r["discoveries"]
+                bpm_total += r["bpm_total"] or 0.0
+                bpm_count += r["bpm_count"]
+            
+            for bucket in buckets.values():
+                bucket["average_bpm"] = (
+                    bucket["bpm_total"] / bucket["bpm_count"] if bucket["bpm_count"] else None
+                )
+                del bucket["bpm_total"], bucket["bpm_count"]
+            
             return {
                 "time_range": time_range,
-                "total_discoveries": result["total_discoveries"],
-                "sources_used": result["sources"],
-                "average_bpm": result["avg_bpm"],
+                "bucket": unit,
+                "total_discoveries": sum(b["discoveries"] for b in buckets.values()),
+                "sources_used": list(by_source),
+                "average_bpm": bpm_total / bpm_count if bpm_count else None,
+                "by_source": by_source,
+                "buckets": list(buckets.values()),
                 "analysis_date": datetime.now().isoformat()
             }
         
-        return {}
+        try:
+            return await self._cached_read("patterns", time_range, fetch)
+        except Exception as e:
+            logger.error(f"Failed to analyze listening patterns: {e}")
+            return {}
     
     async def get_recent_context(
         self,
         limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """Get recent conversation context"""
+        """Get recent conversation context (cached until the next write)"""
         
-        # Use search to get recent episodes
-        try:
+        async def fetch():
             episodes = await self.graphiti.search(
                 query="*",
                 num_results=limit,
                 group_ids=[self.session_id] if self.session_id else None
             )
+            return [
+                {
+                    "content": getattr(episode, 'content', str(episode)),
+                    "type": getattr(episode, 'type', 'unknown'),
+                    "timestamp": getattr(episode, 'created_at', None),
+                    "source": getattr(episode, 'source', 'unknown')
+                }
+                for episode in episodes
+            ]
+        
+        try:
+            return await self._cached_read("context", str(limit), fetch)
         except Exception as e:
             logger.error(f"Failed to get recent context: {e}")
-            episodes = []
-        
-        context = []
-        for episode in episodes:
-            context.append({
-                "content": getattr(episode, 'content', str(episode)),
-                "type": getattr(episode, 'type', 'unknown'),
-                "timestamp": getattr(episode, 'created_at', None),
-                "source": getattr(episode, 'source', 'unknown')
-            })
-        
-        return context
+            return []
     
     async def close(self):
         """Close Graphiti connection"""
         
+        if self.ingest:
+            # Whatever doesn't make it stays in the spool for the next run
+            await self.ingest.close()
+            self.ingest = None
+        
         if self.graphiti:
             # Graphiti doesn't have explicit close, but we can clean up
             self.graphiti = None
+            self.graph = None
             self.initialized = False
             logger.info("Graphiti memory system closed")
\ No newline at end of file
@@ -9,9 +9,9 @@ import logging
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 
-import aiohttp
 from aiohttp import ClientSession
 
+from ...utils.http import DOWNLOAD_TIMEOUT, shared_session
 from .config import MixcloudConfig
 from .auth import AuthenticationManager
 from .api import CloudcastsAPI, UsersAPI, SearchAPI, DiscoverAPI
@@ -66,7 +66,8 @@ class MixcloudClient:
         """Initialize the client."""
         # Create session if needed
         if not self._session:
-            self._session = aiohttp.ClientSession()
+            # API calls set their own timeout; downloads use the session's
+            self._session = await shared_session(timeout=DOWNLOAD_TIMEOUT)
         
         # Initialize auth
         await self.auth_manager.initialize()
@@ -14,6 +14,7 @@ from datetime import datetime
 import aiohttp
 from aiohttp import ClientSession
 
+from ....services.artwork_service import ArtworkService, get_artwork_service
 from ..config import DownloadConfig
 from ..models import Cloudcast
 from ..types import DownloadOptions, StreamInfo
@@ -36,7 +37,8 @@ class DownloadManager:
         self,
         session: ClientSession,
         config: DownloadConfig,
-        stream_extractor: Optional[StreamExtractor] = None
+        stream_extractor: Optional[StreamExtractor] = None,
+        artwork_service: Optional[ArtworkService] = None
     ):
         """
         Initialize download manager.
@@ -45,9 +47,11 @@ class DownloadManager:
             session: aiohttp client session
             config: Download configuration
             stream_extractor: Optional stream extractor
+            artwork_service: Artwork fetcher (defaults to the shared one)
         """
         self.session = session
         self.config = config
+        self.artwork = artwork_service or get_artwork_service()
         self.stream_extractor = stream_extractor or StreamExtractor(session, config)
         self.metadata_writer = MetadataWriter(config)
         self.m3u8_downloader = M3U8Downloader(session, config)
@@ -261,35 +265,22 @@ class DownloadManager:
                 artwork_path
             )
             
-            # Clean up artwork file
-            if artwork_path and os.path.exists(artwork_path):
-                os.remove(artwork_path)
-            
         except Exception as e:
             logger.warning(f"Failed to write metadata: {e}")
     
     async def _download_artwork(self, cloudcast: Cloudcast) -> Optional[str]:
-        """Download cloudcast artwork."""
+        """
+        Get cloudcast artwork.
+        
+        Returns:
+            Path of the cached image (shared, do not delete)
+        """
         if not cloudcast.artwork_url:
             return None
         
-        try:
-            # Create temp file
-            import tempfile
-            fd, temp_path = tempfile.mkstemp(suffix=".jpg")
-            os.close(fd)
-            
-            # Download artwork
-            async with self.session.get(cloudcast.artwork_url) as response:
-                response.raise_for_status()
-                with open(temp_path, "wb") as f:
-                    f.write(await response.read())
-            
-            return temp_path
-            
-        except Exception as e:
-            logger.warning(f"Failed to download artwork: {e}")
-            return None
+        # A show's cloudcasts usually share the user's artwork
+        artwork = await self.artwork.fetch(cloudcast.artwork_url, self.session)
+        return str(artwork.path) if artwork and artwork.path else None
     
     def _get_output_path(
         self,
@@ -9,20 +9,26 @@ import os
 from typing import Dict, Any, Optional
 import asyncio
 
+from ....utils.tagging import TagWriter, get_tag_writer
+
 logger = logging.getLogger(__name__)
 
 
 class MetadataWriter:
     """Writes metadata to audio files."""
     
-    def __init__(self, config):
+    SUPPORTED_FORMATS = (".mp3", ".m4a", ".mp4")
+    
+    def __init__(self, config, tag_writer: Optional[TagWriter] = None):
         """
         Initialize metadata writer.
         
         Args:
             config: Download configuration
+            tag_writer: Tag writing pool (defaults to the shared one)
         """
         self.config = config
+        self.tag_writer = tag_writer or get_tag_writer()
         self._mutagen_available = False
         
         try:
@@ -52,130 +58,116 @@ class MetadataWriter:
         if not self._mutagen_available:
             return False
         
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self._write_sync,
-            file_path,
-            metadata,
-            artwork_path
-        )
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in self.SUPPORTED_FORMATS:
+            logger.warning(f"Unsupported file format for metadata: {ext}")
+            return False
+        
+        # Saved by the shared tag writer pool, off the event loop
+        try:
+            await self.tag_writer.update(
+                file_path,
+                lambda audio: self._apply_tags(audio, file_path, metadata, artwork_path)
+            )
+        except Exception as e:
+            logger.error(f"Failed to write metadata: {e}")
+            return False
+        
+        logger.debug(f"Metadata written to {file_path}")
+        return True
     
-    def _write_sync(
+    def _apply_tags(
         self,
+        audio,
         file_path: str,
         metadata: Dict[str, Any],
         artwork_path: Optional[str] = None
-    ) -> bool:
+    ) -> None:
         """
-        Synchronously write metadata.
+        Apply metadata to a loaded file (runs in a tag writer thread).
         
         Args:
+            audio: Loaded mutagen file
             file_path: Path to audio file
             metadata: Metadata dictionary
             artwork_path: Optional path to artwork image
-            
-        Returns:
-            True if successful
         """
-        try:
-            from mutagen.mp3 import MP3
-            from mutagen.mp4 import MP4
-            from mutagen.id3 import (
-                ID3, TIT2, TPE1, TALB, TDRC, TCON, COMM, APIC, TXXX
-            )
+        from mutagen.mp4 import MP4
+        from mutagen.id3 import (
+            ID3, TIT2, TPE1, TALB, TDRC, TCON, COMM, APIC, TXXX
+        )
+        
+        # Determine file type
+        ext = os.path.splitext(file_path)[1].lower()
+        
+        if ext == ".mp3":
+            # Handle MP3 files
+            # Create ID3 tags if needed
+            if audio.tags is None:
+                audio.add_tags()
+            
+            # Write basic tags
+            if metadata.get("title"):
+                audio.tags.add(TIT2(encoding=3, text=metadata["title"]))
+            
+            if metadata.get("artist"):
+                audio.tags.add(TPE1(encoding=3, text=metadata["artist"]))
+            
+            if metadata.get("album"):
+                audio.tags.add(TALB(encoding=3, text=metadata["album"]))
+            
+            if metadata.get("date"):
+                audio.tags.add(TDRC(encoding=3, text=metadata["date"]))
+            
+            if metadata.get("genre"):
+                audio.tags.add(TCON(encoding=3, text=metadata["genre"]))
+            
+            if metadata.get("comment"):
+                audio.tags.add(COMM(encoding=3, lang="eng", text=metadata["comment"]))
+            
+            if metadata.get("url"):
+                audio.tags.add(TXXX(encoding=3, desc="URL", text=metadata["url"]))
+            
+            # Add artwork if available
+            if artwork_path and os.path.exists(artwork_path):
+                with open(artwork_path, "rb") as f:
+                    audio.tags.add(
+                        APIC(
+                            encoding=3,
+                            mime="image/jpeg",
+                            type=3,  # Cover (front)
+                            desc="Cover",
+                            data=f.read()
+                        )
+                    )
             
-            # Determine file type
-            ext = os.path.splitext(file_path)[1].lower()
+        elif ext in [".m4a", ".mp4"]:
+            # Handle M4A/MP4 files
+            # Write tags using MP4 atoms
+            if metadata.get("title"):
+                audio["\xa9nam"] = metadata["title"]
             
-            if ext == ".mp3":
-                # Handle MP3 files
-                audio = MP3(file_path)
-                
-                # Create ID3 tags if needed
-                if audio.tags is None:
-                    audio.add_tags()
-                
-                # Write basic tags
-                if metadata.get("title"):
-                    audio.tags.add(TIT2(encoding=3, text=metadata["title"]))
-                
-                if metadata.get("artist"):
-                    audio.tags.add(TPE1(encoding=3, text=metadata["artist"]))
-                
-                if metadata.get("album"):
-                    audio.tags.add(TALB(encoding=3, text=metadata["album"]))
-                
-                if metadata.get("date"):
-                    audio.tags.add(TDRC(encoding=3, text=metadata["date"]))
-                
-                if metadata.get("genre"):
-                    audio.tags.add(TCON(encoding=3, text=metadata["genre"]))
-                
-                if metadata.get("comment"):
-                    audio.tags.add(COMM(encoding=3, lang="eng", text=metadata["comment"]))
-                
-                if metadata.get("url"):
-                    audio.tags.add(TXXX(encoding=3, desc="URL", text=metadata["url"]))
-                
-                # Add artwork if available
-                if artwork_path and os.path.exists(artwork_path):
-                    with open(artwork_path, "rb") as f:
-                        audio.tags.add(
-                            APIC(
-                                encoding=3,
-                                mime="image/jpeg",
-                                type=3,  # Cover (front)
-                                desc="Cover",
-                                data=f.read()
-                            )
-                        )
-                
-                audio.save()
-                
-            elif ext in [".m4a", ".mp4"]:
-                # Handle M4A/MP4 files
-                audio = MP4(file_path)
-                
-                # Write tags using MP4 atoms
-                if metadata.get("title"):
-                    audio["\xa9nam"] = metadata["title"]
-                
-                if metadata.get("artist"):
-                    audio["\xa9ART"] = metadata["artist"]
-                
-                if metadata.get("album"):
-                    audio["\xa9alb"] = metadata["album"]
-                
-                if metadata.get("date"):
-                    audio["\xa9day"] = metadata["date"]
-                
-                if metadata.get("genre"):
-                    audio["\xa9gen"] = metadata["genre"]
-                
-                if metadata.get("comment"):
-                    audio["\xa9cmt"] = metadata["comment"]
-                
-                # Add artwork if available
-                if artwork_path and os.path.exists(artwork_path):
-                    with open(artwork_path, "rb") as f:
-                        audio["covr"] = [
-                            MP4.Cover(f.read(), imageformat=MP4.Cover.FORMAT_JPEG)
-                        ]
-                
-                audio.save()
+            if metadata.get("artist"):
+                audio["\xa9ART"] = metadata["artist"]
             
-            else:
-                logger.warning(f"Unsupported file format for metadata: {ext}")
-                return False
+            if metadata.get("album"):
+                audio["\xa9alb"] = metadata["album"]
             
-            logger.debug(f"Metadata written to {file_path}")
-            return True
+            if metadata.get("date"):
+                audio["\xa9day"] = metadata["date"]
             
-        except Exception as e:
-            logger.error(f"Failed to write metadata: {e}")
-            return False
+            if metadata.get("genre"):
+                audio["\xa9gen"] = metadata["genre"]
+            
+            if metadata.get("comment"):
+                audio["\xa9cmt"] = metadata["comment"]
+            
+            # Add artwork if available
+            if artwork_path and os.path.exists(artwork_path):
+                with open(artwork_path, "rb") as f:
+                    audio["covr"] = [
+                        MP4.Cover(f.read(), imageformat=MP4.Cover.FORMAT_JPEG)
+                    ]
     
     async def read(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -6,10 +6,12 @@ Provides comprehensive access to MusicBrainz database including:
 - Advanced search capabilities
 - ISRC and barcode lookups
 - Cover art retrieval
+- Asyncio client with batched ISRC and release lookups
 - Extensive metadata and relationships
 """
 
 from .client import MusicBrainzClient
+from .async_client import AsyncMusicBrainzClient
 from .config import MusicBrainzConfig
 from .models import (
     Artist,
@@ -37,6 +39,7 @@ __version__ = "1.0.0"
 
 __all__ = [
     "MusicBrainzClient",
+    "AsyncMusicBrainzClient",
     "MusicBrainzConfig",
     "Artist",
     "Recording",
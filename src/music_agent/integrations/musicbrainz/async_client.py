@@ -0,0 +1,394 @@
+"""
+Asyncio MusicBrainz client.
+
+Talks to the MusicBrainz JSON web service directly instead of going through
+the blocking ``musicbrainzngs`` wrapper. Many ISRCs or release MBIDs are
+resolved per request with Lucene ``field:(a OR b OR ...)`` search queries,
+and Cover Art Archive fetches run concurrently against their own budget.
+"""
+
+import asyncio
+import re
+import logging
+from typing import Optional, List, Dict, Any, Iterable, Sequence
+from urllib.parse import urljoin
+
+import aiohttp
+
+from ...utils.http import shared_session
+from ...utils.rate_limit import AsyncRateLimiter
+from .config import MusicBrainzConfig
+from .models import (
+    Recording,
+    Release,
+    EntityType,
+    SearchResults,
+)
+from .exceptions import (
+    APIError,
+    RateLimitError,
+    NotFoundError,
+    NetworkError,
+)
+from .api.parsers import DataParser
+
+logger = logging.getLogger(__name__)
+
+ISRC_PATTERN = re.compile(r"^[A-Z]{2}[A-Z0-9]{3}\d{7}$")
+
+# The search endpoint never returns more than 100 rows per page
+SEARCH_PAGE_LIMIT = 100
+
+
+def normalize_isrc(isrc: str) -> Optional[str]:
+    """
+    Normalize an ISRC to its canonical 12-character form.
+
+    Args:
+        isrc: ISRC, optionally with hyphens/whitespace
+
+    Returns:
+        Normalized ISRC or None if it is not valid
+    """
+    if not isrc:
+        return None
+    value = re.sub(r"[\s-]", "", isrc).upper()
+    return value if ISRC_PATTERN.match(value) else None
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    """Yield successive chunks of ``size`` items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class AsyncMusicBrainzClient:
+    """Asyncio MusicBrainz client with batched lookups."""
+
+    def __init__(
+        self,
+        config: Optional[MusicBrainzConfig] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize async MusicBrainz client.
+
+        Args:
+            config: Optional configuration. If not provided, will load from environment.
+            session: Optional aiohttp session to borrow instead of creating one
+        """
+        self.config = config or MusicBrainzConfig.from_env()
+        self.config.validate()
+        self.parser = DataParser()
+
+        self._session = session
+        self._owns_session = session is None
+
+        # MusicBrainz allows ~1 req/s per client; CAA is a separate service
+        self._api_limiter = AsyncRateLimiter(self.config.requests_per_second)
+        self._cover_art_limiter = AsyncRateLimiter(
+            self.config.cover_art_requests_per_second,
+            burst=self.config.cover_art_concurrency,
+            max_concurrency=self.config.cover_art_concurrency,
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def connect(self):
+        """Borrow a pooled HTTP session if one was not supplied."""
+        if self._session is None or self._session.closed:
+            self._session = await shared_session(
+                headers=self._headers(),
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+            )
+            self._owns_session = True
+
+    async def close(self):
+        """Close the HTTP session if this client owns it."""
+        if self._session and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Build request headers (MusicBrainz requires a meaningful User-Agent)."""
+        contact = self.config.contact_email or "https://github.com/user/project"
+        return {
+            "User-Agent": f"{self.config.app_name}/{self.config.app_version} ( {contact} )",
+            "Accept": "application/json",
+        }
+
+    async def _get_json(
+        self,
+        url: str,
+        limiter: AsyncRateLimiter,
+        params: Optional[Dict[str, Any]] = None,
+        allow_not_found: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        GET a JSON document with rate limiting and retries.
+
+        Args:
+            url: Absolute URL
+            limiter: Rate budget to draw from
+            params: Query parameters
+            allow_not_found: Return None on 404 instead of raising
+
+        Returns:
+            Decoded JSON body
+        """
+        await self.connect()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.config.max_retries):
+            async with limiter:
+                try:
+                    async with self._session.get(url, params=params, headers=self._headers()) as response:
+                        if response.status == 404:
+                            if allow_not_found:
+                                return None
+                            raise NotFoundError(f"Resource not found: {url}")
+
+                        # MusicBrainz answers 503 when a client exceeds its rate
+                        if response.status in (429, 503):
+                            try:
+                                retry_after = float(response.headers.get("Retry-After", self.config.retry_delay))
+                            except ValueError:
+                                retry_after = self.config.retry_delay
+                            limiter.pause(retry_after)
+                            last_error = RateLimitError(
+                                f"Rate limited by {response.url.host}",
+                                retry_after=int(retry_after)
+                            )
+                            continue
+
+                        if response.status >= 500:
+                            last_error = APIError(f"Server error: {response.status}", response.status)
+                        elif response.status >= 400:
+                            text = await response.text()
+                            raise APIError(f"API error {response.status}: {text[:200]}", response.status)
+                        else:
+                            return await response.json(content_type=None)
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = NetworkError(f"Network error: {e}")
+
+            logger.warning(f"Request failed (attempt {attempt + 1}/{self.config.max_retries}): {last_error}")
+            await asyncio.sleep(self.config.retry_delay * (2 ** attempt))
+
+        raise last_error or APIError("Request failed after all retries")
+
+    async def _ws(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """Call a MusicBrainz web service endpoint."""
+        params = dict(params or {})
+        params["fmt"] = "json"
+        return await self._get_json(
+            urljoin(self.config.base_url, path), self._api_limiter, params, **kwargs
+        )
+
+    async def _search_all(self, entity: str, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run a search query and follow its pages.
+
+        Args:
+            entity: Entity endpoint (recording, release, ...)
+            query: Lucene query
+            max_results: Optional cap on returned rows
+
+        Returns:
+            Raw result rows
+        """
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        while True:
+            data = await self._ws(entity, {"query": query, "limit": SEARCH_PAGE_LIMIT, "offset": offset})
+            page = data.get(f"{entity}s", [])
+            rows.extend(page)
+
+            offset += len(page)
+            total = data.get("count", 0)
+            if not page or offset >= total or (max_results and len(rows) >= max_results):
+                break
+
+        return rows[:max_results] if max_results else rows
+
+    # Search
+
+    async def search(
+        self,
+        query: str,
+        entity_type: EntityType,
+        limit: int = 25,
+        offset: int = 0
+    ) -> SearchResults:
+        """
+        Perform a raw Lucene search.
+
+        Args:
+            query: Lucene query string
+            entity_type: Type of entity to search for
+            limit: Number of results to return
+            offset: Offset for pagination
+
+        Returns:
+            SearchResults object
+        """
+        data = await self._ws(
+            entity_type.value,
+            {"query": query, "limit": min(limit, self.config.max_limit), "offset": offset}
+        )
+
+        results = [
+            self.parser.parse_search_result(item, entity_type)
+            for item in data.get(f"{entity_type.value}s", [])
+        ]
+        return SearchResults(
+            results=results,
+            total_count=data.get("count", 0),
+            offset=data.get("offset", offset),
+            limit=len(results)
+        )
+
+    # Lookups
+
+    async def get_recording(self, recording_id: str) -> Recording:
+        """
+        Get recording information.
+
+        Args:
+            recording_id: MusicBrainz ID
+
+        Returns:
+            Recording object
+        """
+        data = await self._ws(f"recording/{recording_id}", {"inc": "artists+releases+isrcs"})
+        return self.parser.parse_recording(data)
+
+    async def get_release(self, release_id: str) -> Release:
+        """
+        Get release information.
+
+        Args:
+            release_id: MusicBrainz ID
+
+        Returns:
+            Release object
+        """
+        data = await self._ws(
+            f"release/{release_id}",
+            {"inc": "artists+labels+recordings+release-groups"}
+        )
+        return self.parser.parse_release(data)
+
+    # Batched lookups
+
+    async def get_recordings_by_isrcs(self, isrcs: Iterable[str]) -> Dict[str, List[Recording]]:
+        """
+        Resolve many ISRCs with as few requests as possible.
+
+        ISRCs are grouped into ``isrc:(a OR b OR ...)`` search queries of
+        ``config.isrc_batch_size`` codes each, and matches are mapped back to
+        the requested codes through each recording's ``isrcs`` list.
+
+        Args:
+            isrcs: ISRCs to resolve
+
+        Returns:
+            Mapping of each requested ISRC (as given) to its recordings
+        """
+        isrcs = list(isrcs)
+        codes = list(dict.fromkeys(filter(None, map(normalize_isrc, isrcs))))
+        found: Dict[str, List[Recording]] = {code: [] for code in codes}
+
+        for batch in _chunks(codes, self.config.isrc_batch_size):
+            query = "isrc:(" + " OR ".join(batch) + ")"
+            wanted = set(batch)
+            for row in await self._search_all("recording", query):
+                recording = self.parser.parse_recording(row)
+                for code in {c.upper() for c in recording.isrcs} & wanted:
+                    found[code].append(recording)
+
+        return {isrc: found.get(normalize_isrc(isrc), []) for isrc in isrcs}
+
+    async def get_recording_by_isrc(self, isrc: str) -> List[Recording]:
+        """
+        Get recordings by ISRC.
+
+        Args:
+            isrc: International Standard Recording Code
+
+        Returns:
+            List of Recording objects
+        """
+        return (await self.get_recordings_by_isrcs([isrc])).get(isrc, [])
+
+    async def get_releases(self, release_ids: Iterable[str]) -> Dict[str, Release]:
+        """
+        Fetch summary data for many releases with ``reid:(...)`` queries.
+
+        Search rows carry title, status, date, country, artist credit, labels,
+        media formats and release group, but not full tracklists; use
+        ``get_release`` when tracks are needed.
+
+        Args:
+            release_ids: Release MBIDs
+
+        Returns:
+            Mapping of release MBID to Release (missing IDs are omitted)
+        """
+        ids = list(dict.fromkeys(rid.lower() for rid in release_ids if rid))
+        releases: Dict[str, Release] = {}
+
+        for batch in _chunks(ids, self.config.release_batch_size):
+            query = "reid:(" + " OR ".join(f'"{rid}"' for rid in batch) + ")"
+            for row in await self._search_all("release", query, max_results=len(batch)):
+                release = self.parser.parse_release(row)
+                releases[release.id] = release
+
+        return releases
+
+    # Cover Art Archive
+
+    async def get_cover_art(self, release_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cover art URLs for a release.
+
+        Queries the Cover Art Archive directly; a 404 means the release has
+        no artwork, so no MusicBrainz lookup is needed beforehand.
+
+        Args:
+            release_id: MusicBrainz release ID
+
+        Returns:
+            Dictionary with cover art URLs or None
+        """
+        try:
+            return await self._get_json(
+                urljoin(self.config.cover_art_url, f"release/{release_id}"),
+                self._cover_art_limiter,
+                allow_not_found=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get cover art: {e}")
+            return None
+
+    async def get_cover_art_many(self, release_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch cover art listings for many releases concurrently.
+
+        Args:
+            release_ids: Release MBIDs
+
+        Returns:
+            Mapping of release MBID to cover art listing (or None)
+        """
+        ids = list(dict.fromkeys(release_ids))
+        listings = await asyncio.gather(*(self.get_cover_art(rid) for rid in ids))
+        return dict(zip(ids, listings))
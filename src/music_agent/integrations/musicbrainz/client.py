@@ -258,15 +258,11 @@ class MusicBrainzClient:
             Dictionary with cover art URLs or None
         """
         try:
-            # Check if release has cover art
-            release = self.get_release(release_id)
-            if not release.has_cover_art:
-                return None
-            
-            # Get cover art from Cover Art Archive
+            # Cover Art Archive answers 404 for releases without artwork,
+            # so there is no need to fetch the full release first
             import requests
             response = requests.get(
-                f"https://coverartarchive.org/release/{release_id}",
+                f"{self.config.cover_art_url}release/{release_id}",
                 timeout=10
             )
             
@@ -22,6 +22,16 @@ class MusicBrainzConfig:
     requests_per_second: float = 1.0  # MusicBrainz requires 1 req/sec
     max_retries: int = 3
     retry_delay: float = 1.0
+    request_timeout: float = 30.0
+    
+    # Batched lookups (async client)
+    isrc_batch_size: int = 50  # ISRCs per Lucene query
+    release_batch_size: int = 50  # Release MBIDs per Lucene query
+    
+    # Cover Art Archive (separate host, separate budget)
+    cover_art_url: str = "https://coverartarchive.org/"
+    cover_art_requests_per_second: float = 10.0
+    cover_art_concurrency: int = 8
     
     # Search defaults
     default_limit: int = 25
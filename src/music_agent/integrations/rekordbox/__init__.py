@@ -8,11 +8,14 @@ from .client import RekordboxClient
 from .models import RekordboxTrack, RekordboxPlaylist
 from .sync import RekordboxSync
 from .converter import RekordboxConverter
+from .harmonic import HarmonicIndex, HarmonicMatch
 
 __all__ = [
     'RekordboxClient',
     'RekordboxTrack',
     'RekordboxPlaylist',
     'RekordboxSync',
-    'RekordboxConverter'
+    'RekordboxConverter',
+    'HarmonicIndex',
+    'HarmonicMatch'
 ]
\ No newline at end of file
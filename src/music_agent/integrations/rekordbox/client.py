@@ -5,7 +5,7 @@ Provides high-level interface to Rekordbox database using pyrekordbox.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +21,11 @@ except ImportError:
     RekordboxXml = None
 
 from ...utils.config import config
+from .extract import (
+    DEFAULT_BATCH_SIZE, iter_playlists, iter_track_cues, iter_beat_grids, library_stats, read_beat_grid
+)
+from .harmonic import HarmonicIndex
+from .models import RekordboxBeatGrid, RekordboxPlaylist, TrackCues
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +62,9 @@ class RekordboxClient:
         self.db: Optional[MasterDatabase] = None
         self.xml: Optional[RekordboxXml] = None
         self.connected = False
+        # Database stats with the update sequence number they were computed at
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._harmonic_cache: Optional[Tuple[int, HarmonicIndex]] = None
         
         # Configure pyrekordbox if needed
         self._configure_pyrekordbox()
@@ -159,11 +167,7 @@ class RekordboxClient:
             raise RuntimeError("Not connected to Rekordbox database")
         
         try:
-            # Get all content and filter
-            for content in self.db.get_content():
-                if str(content.ID) == str(track_id):
-                    return content
-            return None
+            return self.db.get_content(ID=str(track_id))
         except Exception as e:
             logger.error(f"Failed to get track {track_id}: {e}")
             return None
@@ -434,6 +438,24 @@ class RekordboxClient:
             logger.error(f"Failed to import XML: {e}")
             return False
     
+    def _cue_rows(self, track_id: Union[str, int]) -> TrackCues:
+        """Cue points of one track, straight from djmdCue."""
+        if not self.connected or not self.db:
+            raise RuntimeError("Not connected to Rekordbox database")
+        
+        rows = [
+            {
+                'kind': cue.Kind or 0,
+                'position_ms': cue.InMsec,
+                'out_position_ms': cue.OutMsec,
+                'color': cue.Color,
+                'active_loop': cue.ActiveLoop,
+                'comment': cue.Comment,
+            }
+            for cue in self.db.get_cue(ContentID=str(track_id)).filter_by(rb_local_deleted=0)
+        ]
+        return TrackCues.from_rows(track_id, rows)
+    
     def get_hot_cues(self, track_id: Union[str, int]) -> List[Dict[str, Any]]:
         """
         Get hot cues for a track.
@@ -442,28 +464,18 @@ class RekordboxClient:
             track_id: Track ID
         
         Returns:
-            List of hot cue data
+            List of hot cue data (positions in milliseconds)
         """
-        track = self.get_track_by_id(track_id)
-        if not track:
-            return []
-        
-        hot_cues = []
-        
         try:
-            # Access hot cues through track object
-            # Implementation depends on pyrekordbox structure
-            if hasattr(track, 'HotCues'):
-                for cue in track.HotCues:
-                    hot_cues.append({
-                        'number': cue.Number,
-                        'position': cue.Position,
-                        'color': cue.Color,
-                        'name': cue.Name
-                    })
-            
-            return hot_cues
-            
+            return [
+                {
+                    'number': cue.number,
+                    'position': cue.position,
+                    'color': cue.color,
+                    'name': cue.name
+                }
+                for cue in self._cue_rows(track_id).hot_cues
+            ]
         except Exception as e:
             logger.error(f"Failed to get hot cues: {e}")
             return []
@@ -476,25 +488,16 @@ class RekordboxClient:
             track_id: Track ID
         
         Returns:
-            List of memory cue data
+            List of memory cue data (positions in milliseconds)
         """
-        track = self.get_track_by_id(track_id)
-        if not track:
-            return []
-        
-        memory_cues = []
-        
         try:
-            # Access memory cues through track object
-            if hasattr(track, 'MemoryCues'):
-                for cue in track.MemoryCues:
-                    memory_cues.append({
-                        'position': cue.Position,
-                        'name': cue.Name
-                    })
-            
-            return memory_cues
-            
+            return [
+                {
+                    'position': cue.position,
+                    'name': cue.name
+                }
+                for cue in self._cue_rows(track_id).memory_cues
+            ]
         except Exception as e:
             logger.error(f"Failed to get memory cues: {e}")
             return []
@@ -510,24 +513,108 @@ class RekordboxClient:
             Beat grid data or None
         """
         track = self.get_track_by_id(track_id)
-        if not track:
+        if not track or not track.AnalysisDataPath:
             return None
         
         try:
-            # Access beat grid through track object
-            if hasattr(track, 'BeatGrid'):
-                return {
-                    'bpm': track.Tempo,
-                    'first_beat': track.BeatGrid.FirstBeat,
-                    'locked': track.BeatGrid.Locked
-                }
+            grid = self._read_beat_grid(track.AnalysisDataPath)
+            if grid is None:
+                return None
             
-            return None
+            return {
+                'bpm': (track.BPM or 0) / 100 or grid.bpm,
+                'first_beat': grid.first_beat,
+                'locked': grid.locked
+            }
             
         except Exception as e:
             logger.error(f"Failed to get beat grid: {e}")
             return None
     
+    def _read_beat_grid(self, analysis_path: str) -> Optional[RekordboxBeatGrid]:
+        relative = analysis_path.replace('\\', '/').strip('/')
+        return read_beat_grid(Path(self.db.share_directory) / relative)
+    
+    # Bulk extraction (one streamed query each, see extract.py)
+    
+    def _raw_connection(self):
+        """DB-API connection from pyrekordbox's engine."""
+        if not self.connected or not self.db:
+            raise RuntimeError("Not connected to Rekordbox database")
+        return self.db.engine.raw_connection()
+    
+    def iter_playlists(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RekordboxPlaylist]:
+        """
+        Stream all playlists and folders with their track IDs.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            RekordboxPlaylist per playlist
+        """
+        connection = self._raw_connection()
+        try:
+            yield from iter_playlists(connection, batch_size)
+        finally:
+            connection.close()
+    
+    def iter_track_cues(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TrackCues]:
+        """
+        Stream hot cues, memory cues and loops for the whole library.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            TrackCues per track with cue points
+        """
+        connection = self._raw_connection()
+        try:
+            yield from iter_track_cues(connection, batch_size)
+        finally:
+            connection.close()
+    
+    def iter_beat_grids(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+        """
+        Stream beat grids for every analyzed track.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            (track ID, RekordboxBeatGrid) pairs
+        """
+        connection = self._raw_connection()
+        try:
+            yield from iter_beat_grids(connection, Path(self.db.share_directory), batch_size)
+        finally:
+            connection.close()
+    
+    def get_harmonic_index(self) -> HarmonicIndex:
+        """
+        Get the harmonic mixing index for the library.
+        
+        Built with one streamed track query and reused until the
+        database changes.
+        
+        Returns:
+            HarmonicIndex over all tracks
+        """
+        usn = self.db.get_local_usn() if self.connected and self.db else None
+        if self._harmonic_cache and self._harmonic_cache[0] == usn:
+            return self._harmonic_cache[1]
+        
+        connection = self._raw_connection()
+        try:
+            index = HarmonicIndex.from_rekordbox(connection)
+        finally:
+            connection.close()
+        
+        logger.info(f"Built harmonic index: {index.indexed} of {len(index)} tracks have BPM and key")
+        self._harmonic_cache = (usn, index)
+        return index
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the Rekordbox database.
@@ -542,44 +629,30 @@ class RekordboxClient:
             }
         
         try:
-            tracks = list(self.db.get_content())
-            playlists = list(self.db.get_playlist())
+            # Every write to master.db bumps the local USN
+            usn = self.db.get_local_usn()
+            if self._stats_cache and self._stats_cache[0] == usn:
+                return dict(self._stats_cache[1])
             
-            # Calculate various stats
-            total_duration = sum(
-                track.Length or 0 for track in tracks
-            ) / 1000  # Convert to seconds
+            connection = self._raw_connection()
+            try:
+                totals = library_stats(connection)
+            finally:
+                connection.close()
             
             stats = {
                 'connected': True,
-                'total_tracks': len(tracks),
-                'total_playlists': len(playlists),
-                'total_duration_hours': round(total_duration / 3600, 1),
+                'total_tracks': totals['total_tracks'],
+                'total_playlists': totals['total_playlists'],
+                'total_duration_hours': round(totals['total_seconds'] / 3600, 1),  # Length is in seconds
                 'database_path': str(self.database_path) if self.database_path else 'auto-detected',
-                'analyzed_tracks': sum(
-                    1 for track in tracks
-                    if track.AnalyzePath
-                ),
-                'tracks_with_artwork': sum(
-                    1 for track in tracks
-                    if track.ImagePath
-                )
+                'analyzed_tracks': totals['analyzed_tracks'],
+                'tracks_with_artwork': totals['tracks_with_artwork'],
+                'top_genres': totals['top_genres']
             }
             
-            # Get genre distribution
-            genres = {}
-            for track in tracks:
-                if track.Genre:
-                    genre = track.Genre.Name
-                    genres[genre] = genres.get(genre, 0) + 1
-            
-            stats['top_genres'] = sorted(
-                genres.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            return stats
+            self._stats_cache = (usn, stats)
+            return dict(stats)
             
         except Exception as e:
             logger.error(f"Failed to get database stats: {e}")
@@ -0,0 +1,339 @@
+"""
+Rekordbox Bulk Extraction - Streamed DJ data from master.db
+
+Reads playlist entries and cue points with one ordered query each instead
+of one query per playlist or track, and library statistics with SQL
+aggregates. Rows are streamed with ``fetchmany`` and grouped per playlist
+or per track, so memory is bounded by the batch size, the playlist headers
+and the largest single group, not the library size.
+
+Deleted tracks are filtered in Python against the (small) set of deleted
+content IDs rather than joined per row: the entry and cue queries then read
+only their own table in index order.
+
+Works on any DB-API connection to master.db: a decrypted sqlite3 copy or
+pyrekordbox's engine. Beat grids live in the ANLZ analysis files next to
+the database, not in master.db; ``read_beat_grid`` reads their PQTZ tag.
+"""
+
+import struct
+import logging
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Set, Tuple
+
+from .models import RekordboxBeatGrid, RekordboxPlaylist, TrackCues
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+
+TRACKS_QUERY = """
+SELECT
+    c.ID as id,
+    c.Title as title,
+    a.Name as artist,
+    al.Name as album,
+    g.Name as genre,
+    c.BPM as bpm,
+    k.ScaleName as key,
+    c.Rating as rating,
+    c.ColorID as color,
+    c.Commnt as comment,
+    c.AnalysisDataPath as analysis_path,
+    c.FolderPath as file_path,
+    c.DateCreated as date_added,
+    c.updated_at as last_modified,
+    c.DJPlayCount as play_count,
+    c.ISRC as isrc
+FROM djmdContent c
+LEFT JOIN djmdArtist a ON c.ArtistID = a.ID
+LEFT JOIN djmdAlbum al ON c.AlbumID = al.ID
+LEFT JOIN djmdGenre g ON c.GenreID = g.ID
+LEFT JOIN djmdKey k ON c.KeyID = k.ID
+WHERE c.rb_local_deleted = 0
+ORDER BY c.ID
+"""
+
+# Playlist and folder headers (entries are read separately, so the header
+# columns aren't repeated on every entry row)
+PLAYLISTS_QUERY = """
+SELECT
+    p.ID as playlist_id,
+    p.Name as name,
+    p.ParentID as parent_id,
+    p.Seq as seq,
+    p.Attribute as attribute,
+    p.created_at as created_at,
+    p.updated_at as updated_at
+FROM djmdPlaylist p
+WHERE p.rb_local_deleted = 0
+ORDER BY p.ID
+"""
+
+PLAYLIST_ENTRIES_QUERY = """
+SELECT s.PlaylistID as playlist_id, s.ContentID as track_id
+FROM djmdSongPlaylist s
+WHERE s.rb_local_deleted = 0
+ORDER BY s.PlaylistID, s.TrackNo
+"""
+
+CUES_QUERY = """
+SELECT
+    q.ContentID as track_id,
+    q.Kind as kind,
+    q.InMsec as position_ms,
+    q.OutMsec as out_position_ms,
+    q.Color as color,
+    q.ActiveLoop as active_loop,
+    q.Comment as comment
+FROM djmdCue q
+WHERE q.rb_local_deleted = 0
+ORDER BY q.ContentID, q.InMsec
+"""
+
+DELETED_TRACKS_QUERY = "SELECT c.ID FROM djmdContent c WHERE c.rb_local_deleted != 0"
+
+ANALYSIS_QUERY = """
+SELECT c.ID as track_id, c.BPM as bpm, c.AnalysisDataPath as analysis_path
+FROM djmdContent c
+WHERE c.rb_local_deleted = 0 AND c.AnalysisDataPath IS NOT NULL AND c.AnalysisDataPath != ''
+ORDER BY c.ID
+"""
+
+# Library totals in one pass over djmdContent
+STATS_QUERY = """
+SELECT
+    COUNT(*) as total_tracks,
+    COALESCE(SUM(c.Length), 0) as total_seconds,
+    COUNT(NULLIF(c.AnalysisDataPath, '')) as analyzed_tracks,
+    COUNT(NULLIF(c.ImagePath, '')) as tracks_with_artwork,
+    (SELECT COUNT(*) FROM djmdPlaylist p WHERE p.rb_local_deleted = 0) as total_playlists
+FROM djmdContent c
+WHERE c.rb_local_deleted = 0
+"""
+
+GENRE_COUNTS_QUERY = """
+SELECT g.Name as genre, COUNT(*) as tracks
+FROM djmdContent c
+JOIN djmdGenre g ON g.ID = c.GenreID
+WHERE c.rb_local_deleted = 0
+GROUP BY c.GenreID
+ORDER BY tracks DESC, genre
+LIMIT ?
+"""
+
+
+def stream_rows(
+    connection: Any,
+    query: str,
+    params: Sequence[Any] = (),
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run a query and yield rows as dictionaries, a batch at a time.
+
+    Args:
+        connection: DB-API connection to master.db
+        query: SQL query
+        params: Query parameters
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Row dictionaries keyed by column name
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        cursor.close()
+
+
+def deleted_track_ids(connection: Any) -> Set[Any]:
+    """
+    IDs of tracks deleted in Rekordbox (still present in master.db).
+
+    Args:
+        connection: DB-API connection to master.db
+
+    Returns:
+        Set of content IDs
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(DELETED_TRACKS_QUERY)
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def iter_tracks(connection: Any, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every live track with its artist, album, genre and key names.
+
+    Args:
+        connection: DB-API connection to master.db
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Track row dictionaries (BPM as stored, times 100)
+    """
+    return stream_rows(connection, TRACKS_QUERY, batch_size=batch_size)
+
+
+def iter_playlists(connection: Any, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RekordboxPlaylist]:
+    """
+    Stream every playlist and folder with its track IDs, in order.
+
+    Args:
+        connection: DB-API connection to master.db
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        RekordboxPlaylist per playlist (playlists with entries in entry
+        order, then empty playlists and folders)
+    """
+    headers = {
+        row['playlist_id']: row
+        for row in stream_rows(connection, PLAYLISTS_QUERY, batch_size=batch_size)
+    }
+    deleted = deleted_track_ids(connection)
+
+    rows = stream_rows(connection, PLAYLIST_ENTRIES_QUERY, batch_size=batch_size)
+    for playlist_id, entries in groupby(rows, key=itemgetter('playlist_id')):
+        header = headers.pop(playlist_id, None)
+        if header is None:
+            continue  # Entries of a deleted playlist
+        track_ids = [entry['track_id'] for entry in entries if entry['track_id'] not in deleted]
+        yield RekordboxPlaylist.from_row(header, track_ids)
+
+    for header in headers.values():
+        yield RekordboxPlaylist.from_row(header, [])
+
+
+def iter_track_cues(connection: Any, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TrackCues]:
+    """
+    Stream hot cues, memory cues and loops grouped per track.
+
+    Args:
+        connection: DB-API connection to master.db
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        TrackCues for every track that has cue points
+    """
+    deleted = deleted_track_ids(connection)
+    rows = stream_rows(connection, CUES_QUERY, batch_size=batch_size)
+    for track_id, cues in groupby(rows, key=itemgetter('track_id')):
+        if track_id is None or track_id in deleted:
+            continue
+        yield TrackCues.from_rows(track_id, list(cues))
+
+
+def library_stats(connection: Any, top_genres: int = 10) -> Dict[str, Any]:
+    """
+    Library totals and genre distribution, computed by the database.
+
+    Args:
+        connection: DB-API connection to master.db
+        top_genres: Number of genres to return
+
+    Returns:
+        Dictionary with track, playlist, duration, analysis and artwork
+        counts, and ``top_genres`` as (name, track count) pairs
+    """
+    stats = next(stream_rows(connection, STATS_QUERY))
+    stats['top_genres'] = [
+        (row['genre'], row['tracks'])
+        for row in stream_rows(connection, GENRE_COUNTS_QUERY, (top_genres,))
+    ]
+    return stats
+
+
+def read_beat_grid(path: Path) -> Optional[RekordboxBeatGrid]:
+    """
+    Read the beat grid from a Rekordbox ANLZ analysis file.
+
+    Parses only the PQTZ tag (big-endian: beat number, BPM x 100 and time
+    in milliseconds per beat) instead of the whole file.
+
+    Args:
+        path: ANLZ .DAT file
+
+    Returns:
+        RekordboxBeatGrid (first beat in milliseconds), or None if the file
+        is missing or has no beat grid
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+
+    if data[:4] != b'PMAI' or len(data) < 12:
+        return None
+
+    offset = struct.unpack_from('>I', data, 4)[0]
+    while offset + 12 <= len(data):
+        tag, header_length, tag_length = struct.unpack_from('>4sII', data, offset)
+        if tag_length <= 0:
+            break
+        if tag == b'PQTZ':
+            count = struct.unpack_from('>I', data, offset + 20)[0]
+            entries = offset + header_length
+            if count == 0 or entries + 8 > len(data):
+                return None
+            _, tempo, first_beat = struct.unpack_from('>HHI', data, entries)
+            return RekordboxBeatGrid(bpm=tempo / 100, first_beat=float(first_beat))
+        offset += tag_length
+    return None
+
+
+def iter_beat_grids(
+    connection: Any,
+    share_dir: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Tuple[Any, RekordboxBeatGrid]]:
+    """
+    Stream beat grids for every analyzed track.
+
+    Args:
+        connection: DB-API connection to master.db
+        share_dir: Rekordbox ``share`` directory the analysis paths are relative to
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        (track ID, RekordboxBeatGrid) for tracks whose analysis file has a grid
+    """
+    share_dir = Path(share_dir)
+    missing = 0
+    for row in stream_rows(connection, ANALYSIS_QUERY, batch_size=batch_size):
+        analysis_path = row['analysis_path'].replace('\\', '/').strip('/')
+        grid = read_beat_grid(share_dir / analysis_path)
+        if grid is None:
+            missing += 1
+            continue
+        yield row['track_id'], grid
+
+    if missing:
+        logger.info(f"{missing} analyzed tracks had no readable beat grid")
+
+
+__all__ = [
+    'DEFAULT_BATCH_SIZE',
+    'deleted_track_ids',
+    'iter_beat_grids',
+    'iter_playlists',
+    'iter_track_cues',
+    'iter_tracks',
+    'library_stats',
+    'read_beat_grid',
+    'stream_rows',
+]
@@ -0,0 +1,486 @@
+"""
+Rekordbox Harmonic Index - Compatible-track lookups for mixing
+
+Holds the library in NumPy arrays sorted by BPM within each Camelot key
+(24 buckets), so "what mixes into this track" is a handful of binary
+searches instead of a scan:
+
+- compatible keys: same key, one step around the wheel, relative
+  major/minor
+- tempo: within a pitch tolerance, optionally at half or double time
+- paths: a chain of compatible tracks from one track to another, moving
+  at most one Camelot step and the pitch tolerance per transition
+
+Built from the Rekordbox import (``iter_tracks`` rows) and rebuilt when
+the database changes; tracks without a BPM or key are kept but not
+indexed.
+"""
+
+import re
+import math
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .converter import RekordboxConverter
+from .extract import iter_tracks
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 0.06  # ±6%, the CDJ default pitch range
+TEMPO_FACTORS = (1.0, 0.5, 2.0)
+
+CAMELOT_RE = re.compile(r"^(1[0-2]|[1-9])\s*([AB])$", re.IGNORECASE)
+OPEN_KEY_RE = re.compile(r"^(1[0-2]|[1-9])\s*([DM])$", re.IGNORECASE)
+
+# Musical notation to Camelot, including the sharp majors the converter lacks
+MUSICAL_TO_CAMELOT = {**RekordboxConverter.KEY_TO_CAMELOT, "G#": "4B", "D#": "5B", "A#": "6B"}
+
+# Relation of a compatible key to the reference key, best first
+RELATIONS = ("same", "up", "down", "relative")
+
+
+def camelot_slot(key: Optional[str]) -> int:
+    """
+    Map a key to its Camelot wheel slot.
+
+    Accepts Camelot ("8A"), Open Key ("1m") and musical notation ("Am",
+    "F# minor", "Dbmaj").
+
+    Args:
+        key: Key in any supported notation
+
+    Returns:
+        Slot 0-11 for minor (1A-12A), 12-23 for major (1B-12B); -1 if unknown
+    """
+    if not key:
+        return -1
+    key = str(key).strip().replace('♯', '#').replace('♭', 'b')
+
+    match = CAMELOT_RE.match(key)
+    if match:
+        number, letter = int(match.group(1)), match.group(2).upper()
+        return number - 1 + (12 if letter == "B" else 0)
+
+    match = OPEN_KEY_RE.match(key)
+    if match:
+        # Open Key 1m/1d is Camelot 8A/8B
+        number, major = int(match.group(1)), match.group(2).lower() == "d"
+        return (number + 6) % 12 + (12 if major else 0)
+
+    key = re.sub(r"\s*(minor|min)$", "m", key, flags=re.IGNORECASE)
+    key = re.sub(r"\s*(major|maj)$", "", key, flags=re.IGNORECASE)
+    camelot = MUSICAL_TO_CAMELOT.get(key[:1].upper() + key[1:])
+    return camelot_slot(camelot) if camelot else -1
+
+
+def camelot_name(slot: int) -> str:
+    """Camelot notation for a wheel slot ("8A")."""
+    return f"{slot % 12 + 1}{'B' if slot >= 12 else 'A'}"
+
+
+def compatible_slots(slot: int) -> Tuple[int, int, int, int]:
+    """
+    Slots that mix harmonically with a slot, in ``RELATIONS`` order.
+
+    Args:
+        slot: Camelot wheel slot
+
+    Returns:
+        (same, one up, one down, relative major/minor)
+    """
+    base, number = slot - slot % 12, slot % 12
+    return slot, base + (number + 1) % 12, base + (number - 1) % 12, (slot + 12) % 24
+
+
+def _key_distances() -> np.ndarray:
+    """Camelot steps between every pair of slots (BFS on the wheel)."""
+    distances = np.full((24, 24), -1, dtype=np.int8)
+    for start in range(24):
+        distances[start, start] = 0
+        frontier = [start]
+        while frontier:
+            following = []
+            for slot in frontier:
+                for neighbour in compatible_slots(slot)[1:]:
+                    if distances[start, neighbour] < 0:
+                        distances[start, neighbour] = distances[start, slot] + 1
+                        following.append(neighbour)
+            frontier = following
+    return distances
+
+
+KEY_DISTANCES = _key_distances()
+
+
+def key_paths(start: int, end: int) -> List[List[int]]:
+    """
+    All shortest key sequences from one slot to another.
+
+    Args:
+        start: First slot
+        end: Last slot
+
+    Returns:
+        Slot sequences including both ends
+    """
+    if start == end:
+        return [[start]]
+    paths = []
+    for neighbour in compatible_slots(start)[1:]:
+        if KEY_DISTANCES[neighbour, end] == KEY_DISTANCES[start, end] - 1:
+            paths.extend([start] + rest for rest in key_paths(neighbour, end))
+    return paths
+
+
+@dataclass
+class HarmonicMatch:
+    """A track that mixes with a reference track (or the previous path step)."""
+
+    track_id: Any
+    title: Optional[str]
+    artist: Optional[str]
+    bpm: float
+    key: str
+    relation: str    # same, up, down or relative
+    tempo: float     # 1.0, or 0.5/2.0 for half/double time
+    pitch: float     # Pitch change (percent) that matches the tempos
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'track_id': self.track_id,
+            'title': self.title,
+            'artist': self.artist,
+            'bpm': self.bpm,
+            'key': self.key,
+            'relation': self.relation,
+            'tempo': self.tempo,
+            'pitch': round(self.pitch, 2)
+        }
+
+
+class HarmonicIndex:
+    """In-memory BPM/Camelot index over a track library."""
+
+    def __init__(
+        self,
+        track_ids: Sequence[Hashable],
+        bpms: Sequence[Optional[float]],
+        keys: Sequence[Optional[str]],
+        titles: Optional[Sequence[Optional[str]]] = None,
+        artists: Optional[Sequence[Optional[str]]] = None
+    ):
+        """
+        Build the index.
+
+        Args:
+            track_ids: Track IDs
+            bpms: BPM per track (None or 0 if unknown)
+            keys: Key per track, in any notation ``camelot_slot`` accepts
+            titles: Optional titles for results
+            artists: Optional artists for results
+        """
+        self.track_ids = list(track_ids)
+        self.titles = list(titles) if titles is not None else [None] * len(self.track_ids)
+        self.artists = list(artists) if artists is not None else [None] * len(self.track_ids)
+        self._rows = {track_id: row for row, track_id in enumerate(self.track_ids)}
+
+        self.bpm = np.array([b or 0.0 for b in bpms], dtype=np.float64)
+        self.slot = np.array([camelot_slot(k) for k in keys], dtype=np.int8)
+
+        # Indexed rows sorted by (slot, bpm); bucket s is order[bounds[s]:bounds[s + 1]]
+        indexed = np.flatnonzero((self.bpm > 0) & (self.slot >= 0))
+        self.order = indexed[np.lexsort((self.bpm[indexed], self.slot[indexed]))]
+        self.sorted_bpm = self.bpm[self.order]
+        self.bounds = np.searchsorted(self.slot[self.order], np.arange(25))
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[Dict[str, Any]], bpm_scale: float = 1.0) -> "HarmonicIndex":
+        """
+        Build from track dictionaries with ``id``, ``bpm``, ``key``, ``title``, ``artist``.
+
+        Args:
+            tracks: Track rows
+            bpm_scale: Multiplier for stored BPMs (0.01 for raw Rekordbox rows)
+
+        Returns:
+            HarmonicIndex
+        """
+        ids, bpms, keys, titles, artists = [], [], [], [], []
+        for track in tracks:
+            ids.append(track["id"])
+            bpms.append(track["bpm"] * bpm_scale if track.get("bpm") else None)
+            keys.append(track.get("key"))
+            titles.append(track.get("title"))
+            artists.append(track.get("artist"))
+        return cls(ids, bpms, keys, titles, artists)
+
+    @classmethod
+    def from_rekordbox(cls, connection: Any) -> "HarmonicIndex":
+        """
+        Build from a Rekordbox master.db connection.
+
+        Args:
+            connection: DB-API connection to master.db
+
+        Returns:
+            HarmonicIndex
+        """
+        return cls.from_tracks(iter_tracks(connection), bpm_scale=0.01)  # RB stores BPM * 100
+
+    def __len__(self) -> int:
+        return len(self.track_ids)
+
+    @property
+    def indexed(self) -> int:
+        """Tracks with both BPM and key."""
+        return len(self.order)
+
+    def _row(self, track_id: Hashable) -> int:
+        row = self._rows.get(track_id)
+        if row is None:
+            raise KeyError(f"Track not in index: {track_id}")
+        return row
+
+    def _window(self, slot: int, target: float, tolerance: float) -> np.ndarray:
+        """Positions (into ``order``) of tracks in a slot that reach ``target`` BPM within the pitch tolerance."""
+        low, high = target / (1 + tolerance), target / (1 - tolerance)
+        start, end = self.bounds[slot], self.bounds[slot + 1]
+        bucket = self.sorted_bpm[start:end]
+        return np.arange(
+            start + np.searchsorted(bucket, low, "left"),
+            start + np.searchsorted(bucket, high, "right")
+        )
+
+    def _match(self, row: int, relation: str, tempo: float, pitch: float) -> HarmonicMatch:
+        return HarmonicMatch(
+            track_id=self.track_ids[row],
+            title=self.titles[row],
+            artist=self.artists[row],
+            bpm=round(float(self.bpm[row]), 2),
+            key=camelot_name(int(self.slot[row])),
+            relation=relation,
+            tempo=tempo,
+            pitch=pitch
+        )
+
+    def compatible_with(
+        self,
+        bpm: float,
+        key: str,
+        tolerance: float = DEFAULT_TOLERANCE,
+        half_double: bool = True,
+        limit: Optional[int] = 50,
+        exclude: Optional[Hashable] = None
+    ) -> List[HarmonicMatch]:
+        """
+        Find tracks that mix with a BPM and key.
+
+        Args:
+            bpm: Reference BPM
+            key: Reference key (any notation)
+            tolerance: Largest pitch change, as a fraction (0.06 = ±6%)
+            half_double: Also match tracks at half or double the tempo
+            limit: Maximum results (None for all)
+            exclude: Track ID to leave out (the reference track)
+
+        Returns:
+            Matches ordered by pitch change needed, then key relation
+        """
+        slot = camelot_slot(key)
+        if slot < 0 or not bpm:
+            return []
+
+        factors = TEMPO_FACTORS if half_double else TEMPO_FACTORS[:1]
+        positions, relations, tempos = [], [], []
+        for relation, candidate_slot in enumerate(compatible_slots(slot)):
+            for tempo in factors:
+                found = self._window(candidate_slot, bpm * tempo, tolerance)
+                positions.append(found)
+                relations.append(np.full(len(found), relation, dtype=np.int8))
+                tempos.append(np.full(len(found), tempo))
+
+        positions = np.concatenate(positions)
+        relation_codes = np.concatenate(relations)
+        tempo_values = np.concatenate(tempos)
+        rows = self.order[positions]
+        pitch = (bpm * tempo_values / self.bpm[rows] - 1) * 100
+
+        keep = np.ones(len(rows), dtype=bool)
+        if exclude is not None and exclude in self._rows:
+            keep &= rows != self._rows[exclude]
+
+        selected = np.flatnonzero(keep)
+        if limit is not None and len(selected) > limit:
+            # Only the best ``limit`` need a full sort
+            selected = selected[np.argpartition(np.abs(pitch[selected]), limit - 1)[:limit]]
+        ranked = selected[np.lexsort((relation_codes[selected], np.abs(pitch[selected])))]
+
+        return [
+            self._match(int(rows[i]), RELATIONS[relation_codes[i]], float(tempo_values[i]), float(pitch[i]))
+            for i in ranked
+        ]
+
+    def compatible(
+        self,
+        track_id: Hashable,
+        tolerance: float = DEFAULT_TOLERANCE,
+        half_double: bool = True,
+        limit: Optional[int] = 50
+    ) -> List[HarmonicMatch]:
+        """
+        Find tracks that mix with a library track.
+
+        Args:
+            track_id: Reference track ID
+            tolerance: Largest pitch change, as a fraction (0.06 = ±6%)
+            half_double: Also match tracks at half or double the tempo
+            limit: Maximum results (None for all)
+
+        Returns:
+            Matches ordered by pitch change needed, then key relation
+        """
+        row = self._row(track_id)
+        if self.bpm[row] <= 0 or self.slot[row] < 0:
+            return []
+        return self.compatible_with(
+            float(self.bpm[row]), camelot_name(int(self.slot[row])),
+            tolerance=tolerance, half_double=half_double, limit=limit, exclude=track_id
+        )
+
+    def _closest(
+        self, slot: int, previous: float, target: float, tolerance: float, used: set
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Unused track in a slot that mixes with a track at ``previous`` BPM.
+
+        Candidates at half/double time count at their effective tempo;
+        the one closest to ``target`` (in the previous track's tempo) wins.
+
+        Returns:
+            (row, tempo factor relative to the previous track), or None
+        """
+        best, best_distance = None, None
+        for tempo in TEMPO_FACTORS:
+            positions = self._window(slot, previous * tempo, tolerance)
+            if not len(positions):
+                continue
+            distances = np.abs(self.sorted_bpm[positions] / tempo - target)
+            for position in np.argsort(distances):
+                row = int(self.order[positions[position]])
+                if row in used:
+                    continue
+                if best_distance is None or distances[position] < best_distance:
+                    best, best_distance = (row, tempo), distances[position]
+                break
+        return best
+
+    def path(
+        self,
+        from_id: Hashable,
+        to_id: Hashable,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_steps: int = 16
+    ) -> Optional[List[HarmonicMatch]]:
+        """
+        Find a chain of compatible tracks from one track to another.
+
+        Every transition moves at most one Camelot step and needs at most
+        ``tolerance`` of pitch change (at equal, half or double time). The
+        key route is a shortest one on the wheel and the tempo moves
+        geometrically towards the last track; each step takes the unused
+        track closest to the planned tempo.
+
+        Args:
+            from_id: First track ID
+            to_id: Last track ID
+            tolerance: Largest pitch change per transition, as a fraction
+            max_steps: Longest chain (transitions) to try
+
+        Returns:
+            Tracks from first to last, each relative to the one before it;
+            None if no chain exists within ``max_steps``
+        """
+        start, end = self._row(from_id), self._row(to_id)
+        if min(self.bpm[start], self.bpm[end]) <= 0 or min(self.slot[start], self.slot[end]) < 0:
+            return None
+
+        first_bpm = float(self.bpm[start])
+        step = math.log(1 + tolerance)
+        routes = key_paths(int(self.slot[start]), int(self.slot[end]))
+
+        # The last track can be reached at its tempo or at half/double time; nearest first
+        for tempo in sorted(TEMPO_FACTORS, key=lambda f: abs(math.log(self.bpm[end] / f / first_bpm))):
+            last_bpm = float(self.bpm[end]) / tempo  # In the first track's tempo
+            tempo_steps = math.ceil(abs(math.log(last_bpm / first_bpm)) / step - 1e-9)
+            for route in routes:
+                shortest = max(len(route) - 1, tempo_steps, 1)
+                for steps in range(shortest, min(shortest + 3, max_steps + 1)):
+                    plan = self._plan(start, end, route, steps, first_bpm, last_bpm, tolerance)
+                    if plan:
+                        return self._chain(plan)
+        return None
+
+    def _plan(
+        self, start: int, end: int, route: List[int], steps: int,
+        first_bpm: float, last_bpm: float, tolerance: float
+    ) -> Optional[List[Tuple[int, float]]]:
+        # Spread the key route over the steps (holding keys where tempo needs more steps)
+        hops = len(route) - 1
+        slots = [route[round(i * hops / steps)] for i in range(steps + 1)]
+
+        plan, used = [(start, 1.0)], {start, end}
+        frame = 1.0  # Actual BPM of the current track over its tempo in the first track's frame
+        for i in range(1, steps):
+            target = first_bpm * (last_bpm / first_bpm) ** (i / steps)
+            previous = self.bpm[plan[-1][0]]
+            found = self._closest(slots[i], previous, target * frame, tolerance, used)
+            if found is None:
+                return None
+            plan.append(found)
+            used.add(found[0])
+            frame *= found[1]
+
+        # Last transition, at whatever tempo factor fits
+        previous = self.bpm[plan[-1][0]]
+        for tempo in TEMPO_FACTORS:
+            if abs(previous * tempo / self.bpm[end] - 1) <= tolerance:
+                return plan + [(end, tempo)]
+        return None
+
+    def _chain(self, plan: List[Tuple[int, float]]) -> List[HarmonicMatch]:
+        chain = [self._match(plan[0][0], "same", 1.0, 0.0)]
+        for (previous, _), (row, tempo) in zip(plan, plan[1:]):
+            relation = RELATIONS[compatible_slots(int(self.slot[previous])).index(int(self.slot[row]))]
+            pitch = (self.bpm[previous] * tempo / self.bpm[row] - 1) * 100
+            chain.append(self._match(row, relation, tempo, float(pitch)))
+        return chain
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Track counts and tracks per key
+        """
+        counts = np.diff(self.bounds)
+        return {
+            'tracks': len(self),
+            'indexed': self.indexed,
+            'per_key': {camelot_name(slot): int(counts[slot]) for slot in range(24) if counts[slot]},
+            'memory_bytes': int(self.bpm.nbytes + self.slot.nbytes + self.order.nbytes + self.sorted_bpm.nbytes)
+        }
+
+
+__all__ = [
+    'DEFAULT_TOLERANCE',
+    'HarmonicIndex',
+    'HarmonicMatch',
+    'camelot_name',
+    'camelot_slot',
+    'compatible_slots',
+    'key_paths',
+]
@@ -129,6 +129,11 @@ class RekordboxTrack:
         return data
 
 
+# djmdPlaylist.Attribute values
+PLAYLIST_FOLDER = 1
+PLAYLIST_SMART = 4
+
+
 @dataclass
 class RekordboxPlaylist:
     """Simplified Rekordbox playlist model."""
@@ -170,6 +175,21 @@ class RekordboxPlaylist:
         
         return playlist
     
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], track_ids: List[Any]) -> 'RekordboxPlaylist':
+        """Create from a djmdPlaylist row and its tracks, in order."""
+        parent_id = row.get('parent_id')
+        return cls(
+            id=row['playlist_id'],
+            name=row.get('name') or '',
+            parent_id=None if parent_id in (None, '', 'root') else parent_id,
+            is_folder=row.get('attribute') == PLAYLIST_FOLDER,
+            track_ids=track_ids,
+            track_count=len(track_ids),
+            created_at=row.get('created_at'),
+            updated_at=row.get('updated_at')
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -182,6 +202,12 @@ class RekordboxPlaylist:
         }
 
 
+def _cue_color(row: Dict[str, Any]) -> Optional[str]:
+    """Cue color from a djmdCue row (-1 means none)."""
+    color = row.get('color')
+    return None if color is None or color < 0 else str(color)
+
+
 @dataclass
 class RekordboxHotCue:
     """Hot cue point model."""
@@ -200,6 +226,16 @@ class RekordboxHotCue:
             color=rb_cue.Color if hasattr(rb_cue, 'Color') else None,
             name=rb_cue.Name if hasattr(rb_cue, 'Name') else None
         )
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'RekordboxHotCue':
+        """Create from a djmdCue row (Kind is the hot cue slot)."""
+        return cls(
+            number=row['kind'],
+            position=row['position_ms'],
+            color=_cue_color(row),
+            name=row.get('comment') or None
+        )
 
 
 @dataclass
@@ -216,6 +252,14 @@ class RekordboxMemoryCue:
             position=rb_cue.Position,
             name=rb_cue.Name if hasattr(rb_cue, 'Name') else None
         )
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'RekordboxMemoryCue':
+        """Create from a djmdCue row."""
+        return cls(
+            position=row['position_ms'],
+            name=row.get('comment') or None
+        )
 
 
 @dataclass
@@ -236,6 +280,16 @@ class RekordboxLoop:
             name=rb_loop.Name if hasattr(rb_loop, 'Name') else None,
             active=rb_loop.Active if hasattr(rb_loop, 'Active') else False
         )
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'RekordboxLoop':
+        """Create from a djmdCue row with an out point."""
+        return cls(
+            start=row['position_ms'],
+            end=row['out_position_ms'],
+            name=row.get('comment') or None,
+            active=bool(row.get('active_loop'))
+        )
 
 
 @dataclass
@@ -255,4 +309,34 @@ class RekordboxBeatGrid:
             first_beat=rb_grid.FirstBeat,
             locked=rb_grid.Locked if hasattr(rb_grid, 'Locked') else False,
             beats=list(rb_grid.Beats) if hasattr(rb_grid, 'Beats') else []
-        )
\ No newline at end of file
+        )
+
+
+@dataclass
+class TrackCues:
+    """All cue points of one track."""
+    
+    track_id: Any
+    hot_cues: List[RekordboxHotCue] = field(default_factory=list)
+    memory_cues: List[RekordboxMemoryCue] = field(default_factory=list)
+    loops: List[RekordboxLoop] = field(default_factory=list)
+    
+    @classmethod
+    def from_rows(cls, track_id: Any, rows: List[Dict[str, Any]]) -> 'TrackCues':
+        """
+        Create from a track's djmdCue rows.
+        
+        Kind 0 is a memory cue and any other Kind a hot cue slot; rows with
+        an out point are loops (hot loops are kept as hot cues too).
+        """
+        cues = cls(track_id=track_id)
+        for row in rows:
+            out_ms = row.get('out_position_ms')
+            if out_ms is not None and out_ms > 0:
+                cues.loops.append(RekordboxLoop.from_row(row))
+            if row['kind']:
+                cues.hot_cues.append(RekordboxHotCue.from_row(row))
+            elif out_ms is None or out_ms <= 0:
+                cues.memory_cues.append(RekordboxMemoryCue.from_row(row))
+        cues.hot_cues.sort(key=lambda cue: cue.number)
+        return cues
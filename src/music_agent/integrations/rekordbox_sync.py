@@ -14,12 +14,25 @@ import asyncpg
 # Note: Decryption is handled by sqlcipher3 directly
 # No need for manual AES decryption
 import hashlib
+from decimal import Decimal
 
+from .catalog_search import refresh_track_search
 from .graphiti_memory import MusicMemory
+from .rekordbox.extract import iter_beat_grids, iter_playlists, iter_track_cues, iter_tracks
 
 logger = logging.getLogger(__name__)
 
 
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a Rekordbox date ("2024-01-31" or "2024-01-31 12:00:00.000 +00:00")"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)[:19])
+    except ValueError:
+        return None
+
+
 class RekordboxSync:
     """Sync Rekordbox database with music agent memory"""
     
@@ -30,6 +43,10 @@ class RekordboxSync:
         self.rekordbox_db_path = os.path.expanduser(
             os.getenv("REKORDBOX_DB_PATH", "~/Library/Pioneer/rekordbox/master.db")
         )
+        # ANLZ analysis files (beat grids) live under the share directory
+        self.rekordbox_share_dir = os.path.expanduser(
+            os.getenv("REKORDBOX_SHARE_DIR", os.path.join(os.path.dirname(self.rekordbox_db_path), "share"))
+        )
         self.postgres_conn = None
         self.memory = MusicMemory()
         
@@ -39,6 +56,8 @@ class RekordboxSync:
         if not skip_graphiti:
             try:
                 await self.memory.initialize(session_id="rekordbox_sync")
+                # Playlist summary episodes are batched instead of sent one by one
+                await self.memory.start_ingest()
                 logger.info("Graphiti memory initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize Graphiti: {e}")
@@ -149,14 +168,18 @@ class RekordboxSync:
             for track in tracks:
                 await self.process_track(dict(track))
             
-            # Sync playlists
-            await self.sync_playlists(cursor)
-            
-            # Sync cue points
-            await self.sync_cue_points(cursor)
+            # Playlists, cue points and beat grids for the whole library
+            await self.sync_dj_data(conn)
             
             conn.close()
             
+            # Make the new tracks searchable in the local catalog
+            try:
+                if await refresh_track_search(self.postgres_conn):
+                    logger.info("Refreshed catalog search view")
+            except Exception as e:
+                logger.warning(f"Failed to refresh catalog search view: {e}")
+            
         finally:
             # Clean up temp file
             if os.path.exists(temp_db):
@@ -166,14 +189,7 @@ class RekordboxSync:
         """Process a single track"""
         
         # Convert Rekordbox data to our format
-        # Rekordbox rating is 0-255, convert to 1-5 scale
-        rating = None
-        if track["rating"] is not None:
-            # Map 0-255 to 1-5
-            if track["rating"] == 0:
-                rating = None  # No rating
-            else:
-                rating = min(5, max(1, int(track["rating"] * 5 / 255) + 1))
+        rating = self.convert_rating(track["rating"])
         
         track_data = {
             "id": f"rekordbox_{track['id']}",
@@ -193,21 +209,16 @@ class RekordboxSync:
             "play_count": track["play_count"] or 0
         }
         
-        # Store in PostgreSQL
+        # Store in PostgreSQL (the graph is written in bulk by sync_graph)
         await self.store_track_postgres(track_data)
+    
+    def convert_rating(self, rating: Optional[int]) -> Optional[int]:
+        """Convert Rekordbox rating (0-255) to a 1-5 scale"""
         
-        # Add to Graphiti memory with error handling
-        if self.memory.initialized:
-            try:
-                await self.memory.add_track_discovery(
-                    track=track_data,
-                    source="rekordbox",
-                    action="synced"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to add track to Graphiti: {e}")
-                # Continue anyway - PostgreSQL storage succeeded
-        
+        if not rating:
+            return None  # No rating
+        return min(5, max(1, int(rating * 5 / 255) + 1))
+    
     async def store_track_postgres(self, track: Dict[str, Any]):
         """Store track in PostgreSQL"""
         
@@ -243,87 +254,216 @@ class RekordboxSync:
             json.dumps({"rekordbox_id": track["id"], "color": track["color"], "comment": track["comment"]})
         )
     
-    async def sync_playlists(self, cursor):
-        """Sync playlists from Rekordbox"""
-        
-        query = """
-        SELECT 
-            p.ID as id,
-            p.Name as name,
-            p.ParentID as parent_id,
-            p.Seq as position
-        FROM djmdPlaylist p
+    async def sync_dj_data(self, conn):
         """
+        Bulk-load DJ data into the rekordbox schema.
         
-        cursor.execute(query)
-        playlists = cursor.fetchall()
+        Each table is filled from one streamed query with COPY, inside a
+        single transaction, so readers never see a half-synced library.
         
-        logger.info(f"Found {len(playlists)} playlists")
+        Args:
+            conn: Connection to the decrypted Rekordbox database
+        """
+        async with self.postgres_conn.transaction():
+            tracks = await self.sync_track_mirror(conn)
+            playlists = await self.sync_playlists(conn)
+            cues = await self.sync_cue_points(conn)
+            grids = await self.sync_beat_grids(conn)
+        
+        logger.info(
+            f"Synced DJ data: {tracks} tracks, {len(playlists)} playlists, "
+            f"{cues} cue points, {grids} beat grids"
+        )
         
-        for playlist in playlists:
-            # Get tracks in playlist
-            tracks_query = """
-            SELECT 
-                s.ContentID as track_id,
-                s.TrackNo as position
-            FROM djmdSongPlaylist s
-            WHERE s.PlaylistID = ?
-            ORDER BY s.TrackNo
-            """
-            
-            cursor.execute(tracks_query, (playlist["id"],))
-            playlist_tracks = cursor.fetchall()
+        # Add to the knowledge graph (if initialized)
+        if self.memory.initialized:
+            try:
+                await self.sync_graph(conn)
+            except Exception as e:
+                logger.warning(f"Failed to write library to the graph: {e}")
             
-            # Store playlist info in memory
-            playlist_data = {
-                "id": f"rekordbox_playlist_{playlist['id']}",
-                "name": playlist["name"],
-                "track_count": len(playlist_tracks)
+            # Structured nodes carry the library; the summaries tell the
+            # agent which playlists the user built (spooled by the queue)
+            named = [p for p in playlists if p["track_count"]]
+            try:
+                await self.memory.add_playlists(named, source="rekordbox")
+            except Exception as e:
+                logger.warning(f"Failed to add playlists to Graphiti: {e}")
+    
+    async def sync_graph(self, conn):
+        """
+        Write tracks and playlists to the graph with direct Cypher.
+        
+        Library data is fully structured, so it skips Graphiti's LLM
+        extraction; tracks are MERGEd before the playlists that match them.
+        
+        Args:
+            conn: Connection to the decrypted Rekordbox database
+        """
+        tracks = (
+            {
+                "rekordbox_id": t["id"],
+                "isrc": t["isrc"],
+                "title": t["title"],
+                "artist": t["artist"],
+                "album": t["album"],
+                "bpm": t["bpm"] / 100 if t["bpm"] else None,  # RB stores BPM * 100
+                "key": t["key"],
+                "rating": self.convert_rating(t["rating"]),
+                "color": self.convert_color(t["color"]),
+                "comment": t["comment"],
+                "analyzed": bool(t["analysis_path"]),
+                "file_path": t["file_path"],
+                "play_count": t["play_count"] or 0,
             }
-            
-            # Add to Graphiti (if initialized)
-            if self.memory.initialized:
-                try:
-                    await self.memory.add_preference(
-                        entity_type="playlist",
-                        entity_name=playlist["name"],
-                        preference_type="created",
-                        score=0.8,
-                        reason=f"Rekordbox playlist with {len(playlist_tracks)} tracks"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to add playlist to Graphiti: {e}")
+            for t in iter_tracks(conn)
+        )
+        written = await self.memory.add_tracks(tracks)
+        
+        playlists = (
+            ({"name": p.name, "platform": "rekordbox", "platform_id": p.id}, p.track_ids)
+            for p in iter_playlists(conn) if not p.is_folder
+        )
+        playlist_count = await self.memory.add_playlist_tracks(playlists, track_key="rekordbox_id")
+        
+        logger.info(f"Wrote {written} tracks and {playlist_count} playlists to the graph")
+    
+    async def _copy(self, table: str, columns: List[str], records, schema: Optional[str] = None) -> int:
+        """COPY records into a table; returns the row count."""
+        status = await self.postgres_conn.copy_records_to_table(
+            table, columns=columns, records=records, schema_name=schema
+        )
+        return int(status.split()[-1])
     
-    async def sync_cue_points(self, cursor):
-        """Sync cue points and hot cues"""
+    async def sync_track_mirror(self, conn) -> int:
+        """Upsert every Rekordbox track into rekordbox.tracks"""
+        
+        columns = [
+            "id", "title", "artist", "album", "genre", "bpm", "key", "rating", "color",
+            "comment", "analyzed", "file_path", "date_added", "last_modified", "play_count"
+        ]
+        records = (
+            (
+                str(t["id"]), t["title"], t["artist"], t["album"], t["genre"],
+                Decimal(t["bpm"]).scaleb(-2) if t["bpm"] else None,  # RB stores BPM * 100
+                t["key"], t["rating"], t["color"], t["comment"], bool(t["analysis_path"]),
+                t["file_path"], parse_timestamp(t["date_added"]), parse_timestamp(t["last_modified"]),
+                t["play_count"] or 0
+            )
+            for t in iter_tracks(conn)
+        )
         
-        query = """
-        SELECT 
-            c.ContentID as track_id,
-            c.Kind as cue_type,
-            c.InMsec as position_ms,
-            c.OutMsec as out_position_ms,
-            c.Color as color,
-            c.Comment as comment
-        FROM djmdCue c
-        WHERE c.ContentID IS NOT NULL
+        await self.postgres_conn.execute(
+            "CREATE TEMP TABLE rb_tracks_stage (LIKE rekordbox.tracks INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        count = await self._copy("rb_tracks_stage", columns, records)
+        
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns[1:])
+        await self.postgres_conn.execute(f"""
+        INSERT INTO rekordbox.tracks ({", ".join(columns)})
+        SELECT {", ".join(columns)} FROM rb_tracks_stage
+        ON CONFLICT (id) DO UPDATE SET {updates}
+        """)
+        return count
+    
+    async def sync_playlists(self, conn) -> List[Dict[str, Any]]:
+        """
+        Sync playlists and their tracks from Rekordbox
+        
+        Returns:
+            Name and track count per playlist (folders excluded)
         """
         
-        cursor.execute(query)
-        cues = cursor.fetchall()
+        headers = []
+        summaries = []
+        
+        def entries():
+            # One pass: entries are copied while playlist headers are collected
+            for playlist in iter_playlists(conn):
+                if not playlist.is_folder:
+                    summaries.append({"name": playlist.name, "track_count": len(playlist.track_ids)})
+                headers.append((
+                    str(playlist.id), playlist.name,
+                    str(playlist.parent_id) if playlist.parent_id is not None else None,
+                    playlist.is_folder,
+                    parse_timestamp(playlist.created_at), parse_timestamp(playlist.updated_at)
+                ))
+                for position, track_id in enumerate(playlist.track_ids, 1):
+                    yield str(playlist.id), str(track_id), position
+        
+        await self.postgres_conn.execute("""
+        CREATE TEMP TABLE rb_playlist_tracks_stage (LIKE rekordbox.playlist_tracks) ON COMMIT DROP;
+        CREATE TEMP TABLE rb_playlists_stage (LIKE rekordbox.playlists) ON COMMIT DROP;
+        """)
+        await self._copy("rb_playlist_tracks_stage", ["playlist_id", "track_id", "position"], entries())
+        await self._copy(
+            "rb_playlists_stage",
+            ["id", "name", "parent_id", "is_folder", "created_at", "updated_at"],
+            headers
+        )
+        
+        # Parents that were deleted in Rekordbox become top level, and the
+        # deleted playlists themselves are dropped (live playlists no longer
+        # point at them, and their entries go with them)
+        await self.postgres_conn.execute("""
+        INSERT INTO rekordbox.playlists (id, name, parent_id, is_folder, created_at, updated_at)
+        SELECT s.id, s.name, p.id, s.is_folder, s.created_at, s.updated_at
+        FROM rb_playlists_stage s
+        LEFT JOIN rb_playlists_stage p ON p.id = s.parent_id
+        ON CONFLICT (id) DO UPDATE SET
+            name = EXCLUDED.name,
+            parent_id = EXCLUDED.parent_id,
+            is_folder = EXCLUDED.is_folder,
+            updated_at = EXCLUDED.updated_at;
+        
+        DELETE FROM rekordbox.playlists p
+        WHERE NOT EXISTS (SELECT 1 FROM rb_playlists_stage s WHERE s.id = p.id);
+        
+        DELETE FROM rekordbox.playlist_tracks;
+        INSERT INTO rekordbox.playlist_tracks SELECT * FROM rb_playlist_tracks_stage;
+        """)
         
-        logger.info(f"Found {len(cues)} cue points")
+        logger.info(f"Found {len(headers)} playlists")
         
-        # Store cue points in PostgreSQL
-        for cue in cues:
-            await self.store_cue_point(dict(cue))
+        return summaries
+    
+    async def sync_cue_points(self, conn) -> int:
+        """Replace rekordbox.cue_points with hot cues, memory cues and loops"""
+        
+        def records():
+            for cues in iter_track_cues(conn):
+                track_id = str(cues.track_id)
+                # Colors are Rekordbox palette indexes
+                for cue in cues.hot_cues:
+                    yield track_id, int(cue.position), "hot_cue", cue.number, cue.name, cue.color
+                for cue in cues.memory_cues:
+                    yield track_id, int(cue.position), "memory_cue", None, cue.name, None
+                for loop in cues.loops:
+                    yield track_id, int(loop.start), "loop", None, loop.name, None
+        
+        await self.postgres_conn.execute("DELETE FROM rekordbox.cue_points")
+        return await self._copy(
+            "cue_points",
+            ["track_id", "position_ms", "type", "index", "name", "color"],
+            records(),
+            schema="rekordbox"
+        )
     
-    async def store_cue_point(self, cue: Dict[str, Any]):
-        """Store cue point in PostgreSQL"""
+    async def sync_beat_grids(self, conn) -> int:
+        """Replace rekordbox.beat_grids from the ANLZ analysis files"""
         
-        # Store as JSON in track metadata for now
-        # TODO: Create dedicated cue_points table if needed
-        pass
+        records = (
+            (str(track_id), int(grid.first_beat), Decimal(str(grid.bpm)), False)
+            for track_id, grid in iter_beat_grids(conn, Path(self.rekordbox_share_dir))
+        )
+        
+        await self.postgres_conn.execute("DELETE FROM rekordbox.beat_grids")
+        return await self._copy(
+            "beat_grids",
+            ["track_id", "first_beat_ms", "bpm", "manually_adjusted"],
+            records,
+            schema="rekordbox"
+        )
     
     def convert_key_id(self, rb_key: Optional[int]) -> Optional[str]:
         """Convert Rekordbox key ID to Camelot notation"""
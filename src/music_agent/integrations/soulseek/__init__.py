@@ -6,7 +6,7 @@ through the Soulseek network using the slskd server as a backend.
 """
 
 from .client import SoulseekClient
-from .config import SoulseekConfig, SlskdConfig, SearchConfig, DownloadConfig
+from .config import SoulseekConfig, SlskdConfig, SearchConfig, DownloadConfig, ShareCacheConfig
 from .models import (
     # File models
     File,
@@ -15,6 +15,7 @@ from .models import (
     SearchResult,
     SearchResponse,
     SearchState,
+    SearchResultTable,
     # Transfer models
     Transfer,
     TransferState,
@@ -28,6 +29,7 @@ from .models import (
     Room,
     RoomMessage,
 )
+from .shares import PeerShareCache, PeerShares
 from .exceptions import (
     SoulseekError,
     SlskdConnectionError,
@@ -49,6 +51,10 @@ __all__ = [
     "SlskdConfig",
     "SearchConfig",
     "DownloadConfig",
+    "ShareCacheConfig",
+    # Peer share cache
+    "PeerShareCache",
+    "PeerShares",
     # File models
     "File",
     "FileInfo",
@@ -56,6 +62,7 @@ __all__ = [
     "SearchResult",
     "SearchResponse",
     "SearchState",
+    "SearchResultTable",
     # Transfer models
     "Transfer",
     "TransferState",
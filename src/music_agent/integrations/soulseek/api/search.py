@@ -87,10 +87,7 @@ class SearchAPI(BaseAPI):
             
             # Apply bitrate filter
             if min_bitrate > 0:
-                filtered_files = result.filter_by_bitrate(min_bitrate)
-                # Reconstruct responses with filtered files
-                # For simplicity, we'll just update the file count
-                result.file_count = len(filtered_files)
+                result.apply_bitrate_filter(min_bitrate)
             
             # Stop the search
             try:
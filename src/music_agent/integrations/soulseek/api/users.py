@@ -37,49 +37,49 @@ class UserAPI(BaseAPI):
             logger.error(f"Failed to get user info for {username}: {e}")
             raise UserNotFoundError(f"User {username} not found or error: {e}")
     
-    async def browse_user(self, username: str, timeout: int = 10) -> BrowseResult:
+    async def browse_shares(self, username: str, timeout: int = 10) -> dict:
         """
-        Browse a user's shared files.
+        Fetch a user's raw share listing.
+        
+        slskd answers the browse request once the whole listing has
+        arrived, so the request runs in a worker thread instead of the
+        event loop polling for status.
         
         Args:
             username: Username to browse
             timeout: Timeout in seconds
             
         Returns:
-            BrowseResult object
+            slskd browse response (directories with their files)
         """
         self.ensure_connected()
         
         try:
-            # Request browse
-            self.client.users.browse(username)
-            logger.info(f"Initiated browse for user {username}")
-            
-            # Wait for browse to complete
-            start_time = asyncio.get_event_loop().time()
-            
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                # Get browse status - the correct method is 'browsing_status'
-                status = self.client.users.browsing_status(username)
-                
-                if status and status.get("status") == "completed":
-                    # Browse completed, return result
-                    return BrowseResult.from_api(username, status)
-                
-                await asyncio.sleep(1)
-            
-            # Timeout - return partial results if available
-            status = self.client.users.browsing_status(username)
-            if status:
-                logger.warning(f"Browse timed out for {username}, returning partial results")
-                return BrowseResult.from_api(username, status)
-            else:
-                raise UserNotFoundError(f"Browse failed for user {username}")
-                
+            data = await asyncio.wait_for(
+                asyncio.to_thread(self.client.users.browse, username),
+                timeout=timeout
+            )
+            logger.info(f"Browsed user {username}")
+            return data or {}
+        except asyncio.TimeoutError:
+            raise UserNotFoundError(f"Browse timed out for user {username}")
         except Exception as e:
             logger.error(f"Failed to browse user {username}: {e}")
             raise UserNotFoundError(f"Failed to browse user {username}: {e}")
     
+    async def browse_user(self, username: str, timeout: int = 10) -> BrowseResult:
+        """
+        Browse a user's shared files.
+        
+        Args:
+            username: Username to browse
+            timeout: Timeout in seconds
+            
+        Returns:
+            BrowseResult object
+        """
+        return BrowseResult.from_api(username, await self.browse_shares(username, timeout))
+    
     async def get_user(self, username: str) -> User:
         """
         Get complete user information including browse.
@@ -4,6 +4,7 @@ Main Soulseek client.
 Provides high-level interface for interacting with Soulseek via slskd.
 """
 
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -16,6 +17,7 @@ from .models import (
     SearchResult, FileInfo, Transfer, User, 
     UserInfo, BrowseResult
 )
+from .shares import PeerShareCache, PeerShares
 from .exceptions import SoulseekError
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,9 @@ class SoulseekClient:
             self.config.download
         )
         
+        # Browse listings, reused across discovery calls and runs
+        self.share_cache = PeerShareCache(self.config.shares)
+        
         self._connected = False
     
     async def __aenter__(self):
@@ -158,6 +163,8 @@ class SoulseekClient:
         """
         Browse a user's shared files.
         
+        The listing is also stored in the share cache.
+        
         Args:
             username: Username to browse
             
@@ -167,7 +174,42 @@ class SoulseekClient:
         if not self._connected:
             await self.connect()
         
-        return await self.user_api.browse_user(username)
+        data = await self._browse_shares(username)
+        await self.share_cache.put(username, data)
+        return BrowseResult.from_api(username, data)
+    
+    async def _browse_shares(self, username: str) -> dict:
+        return await self.user_api.browse_shares(username, timeout=self.config.shares.browse_timeout)
+    
+    async def get_peer_shares(self, username: str, refresh: bool = False) -> PeerShares:
+        """
+        Get a user's indexed share listing, browsing only if not cached.
+        
+        Args:
+            username: Username
+            refresh: Browse again even if cached
+            
+        Returns:
+            PeerShares for local queries
+        """
+        if not self._connected:
+            await self.connect()
+        
+        return await self.share_cache.get_or_browse(username, self._browse_shares, refresh=refresh)
+    
+    async def search_shares(self, query: str, limit: int = 50) -> List[FileInfo]:
+        """
+        Search the listings of every cached peer, without network requests.
+        
+        Args:
+            query: Search text (all words must match the file path)
+            limit: Maximum results
+            
+        Returns:
+            List of FileInfo objects (no upload slot or queue information)
+        """
+        matches = await self.share_cache.search(query, limit=limit)
+        return [FileInfo(file=file, username=username) for username, file in matches]
     
     async def get_user(self, username: str) -> User:
         """
@@ -347,27 +389,54 @@ class SoulseekClient:
         if not results:
             return []
         
-        similar = []
-        
-        # Browse users who have the reference track
+        # "Artist - Title" references look for more by the artist
+        artist = reference_track.split(" - ")[0].strip()
+        peers: Dict[str, FileInfo] = {}
         for result in results[:3]:  # Check top 3 users
-            try:
-                browse_result = await self.browse_user(result.username)
-                
-                # Add some of their files as similar
-                for file in browse_result.get_all_files()[:5]:
-                    file_info = FileInfo(
-                        file=file,
-                        username=result.username,
-                        free_upload_slots=result.free_upload_slots,
-                        upload_speed=result.upload_speed,
-                        queue_length=result.queue_length
-                    )
-                    
-                    if file_info not in similar:
-                        similar.append(file_info)
-                        
-            except Exception as e:
-                logger.debug(f"Failed to browse {result.username}: {e}")
-        
-        return similar[:limit]
\ No newline at end of file
+            peers.setdefault(result.username, result)
+        
+        seen = {(result.username, result.file.filename) for result in results}
+        similar: List[FileInfo] = []
+        
+        def add(file_info: FileInfo):
+            key = (file_info.username, file_info.file.filename)
+            if key not in seen:
+                seen.add(key)
+                similar.append(file_info)
+        
+        # Listings come from the share cache; only unseen peers are browsed
+        listings = await asyncio.gather(
+            *(self.get_peer_shares(username) for username in peers),
+            return_exceptions=True
+        )
+        per_peer = max(5, limit // len(peers))
+        
+        for (username, result), shares in zip(peers.items(), listings):
+            if isinstance(shares, Exception):
+                logger.debug(f"Failed to browse {username}: {shares}")
+                continue
+            
+            rows = shares.search(artist)
+            if len(rows) == 0:
+                # Fall back to the rest of the reference's folder
+                rows = shares.directory_rows(result.file.filename.rsplit("\\", 1)[0])
+            
+            # One extra in case the reference itself is among them
+            for file in shares.files(rows[:per_peer + 1]):
+                add(FileInfo(
+                    file=file,
+                    username=username,
+                    free_upload_slots=result.free_upload_slots,
+                    upload_speed=result.upload_speed,
+                    queue_length=result.queue_length
+                ))
+        
+        # Top up from other peers browsed before
+        if len(similar) < limit:
+            others = [username for username in self.share_cache.cached_peers() if username not in peers]
+            for username, file in await self.share_cache.search(
+                artist, usernames=others, limit=limit - len(similar), exclude=seen
+            ):
+                add(FileInfo(file=file, username=username))
+        
+        return similar[:limit]
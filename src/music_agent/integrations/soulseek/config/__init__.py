@@ -67,6 +67,26 @@ class DownloadConfig:
         )
 
 
+@dataclass
+class ShareCacheConfig:
+    """Configuration for the peer share listing cache."""
+    
+    cache_dir: str = "~/.music_agent_cache/soulseek_shares"
+    ttl: int = 24 * 3600  # Seconds before a peer is browsed again (0 = never expire)
+    max_memory_peers: int = 32  # Indexed listings kept in memory
+    browse_timeout: int = 60  # Large listings take a while to transfer
+    
+    @classmethod
+    def from_env(cls) -> "ShareCacheConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            cache_dir=os.getenv("SOULSEEK_SHARE_CACHE_DIR", "~/.music_agent_cache/soulseek_shares"),
+            ttl=int(os.getenv("SOULSEEK_SHARE_CACHE_TTL", str(24 * 3600))),
+            max_memory_peers=int(os.getenv("SOULSEEK_SHARE_CACHE_PEERS", "32")),
+            browse_timeout=int(os.getenv("SOULSEEK_BROWSE_TIMEOUT", "60"))
+        )
+
+
 @dataclass
 class SoulseekConfig:
     """Main Soulseek configuration."""
@@ -74,6 +94,7 @@ class SoulseekConfig:
     slskd: SlskdConfig = field(default_factory=SlskdConfig)
     search: SearchConfig = field(default_factory=SearchConfig)
     download: DownloadConfig = field(default_factory=DownloadConfig)
+    shares: ShareCacheConfig = field(default_factory=ShareCacheConfig)
     enable_memory: bool = False
     
     @classmethod
@@ -83,5 +104,6 @@ class SoulseekConfig:
             slskd=SlskdConfig.from_env(),
             search=SearchConfig(),
             download=DownloadConfig.from_env(),
+            shares=ShareCacheConfig.from_env(),
             enable_memory=os.getenv("SOULSEEK_ENABLE_MEMORY", "false").lower() == "true"
         )
\ No newline at end of file
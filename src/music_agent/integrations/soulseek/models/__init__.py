@@ -4,6 +4,7 @@ Soulseek data models.
 
 from .file import File, FileInfo
 from .search import SearchResult, SearchResponse, SearchState
+from .table import SearchResultTable
 from .transfer import Transfer, TransferState, TransferDirection
 from .user import User, UserInfo, BrowseResult, Directory
 from .room import Room, RoomMessage
@@ -14,6 +15,7 @@ __all__ = [
     "SearchResult",
     "SearchResponse",
     "SearchState",
+    "SearchResultTable",
     "Transfer",
     "TransferState",
     "TransferDirection",
@@ -7,7 +7,10 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+import numpy as np
+
 from .file import FileInfo
+from .table import SearchResultTable
 
 
 class SearchState(Enum):
@@ -31,14 +34,11 @@ class SearchResponse:
     response_time: Optional[float] = None
     
     @classmethod
-    def from_api(cls, data: dict) -> "SearchResponse":
+    def from_api(cls, data: dict, files: Optional[List[FileInfo]] = None) -> "SearchResponse":
         """Create SearchResponse from slskd API response."""
         username = data.get("username", "")
-        files = []
-        
-        for file_data in data.get("files", []):
-            file_info = FileInfo.from_search_result(file_data, data)
-            files.append(file_info)
+        if files is None:
+            files = [FileInfo.from_search_result(file_data, data) for file_data in data.get("files", [])]
         
         return cls(
             username=username,
@@ -52,12 +52,18 @@ class SearchResponse:
 
 @dataclass
 class SearchResult:
-    """Complete search result with all responses."""
+    """
+    Complete search result with all responses.
+
+    Files are kept in a columnar ``SearchResultTable``; ranking and
+    filtering run on it and only build ``FileInfo`` objects for the files
+    they return. ``responses`` is built from the table when accessed.
+    """
     
     search_id: str
     query: str
     state: SearchState
-    responses: List[SearchResponse] = field(default_factory=list)
+    table: SearchResultTable = field(default_factory=lambda: SearchResultTable.from_api([]), repr=False)
     file_count: int = 0
     response_count: int = 0
     created_at: Optional[datetime] = None
@@ -66,44 +72,49 @@ class SearchResult:
     @classmethod
     def from_api(cls, search_data: dict, responses: List[dict]) -> "SearchResult":
         """Create SearchResult from slskd API data."""
-        search_responses = [SearchResponse.from_api(r) for r in responses]
-        
-        # Count total files
-        file_count = sum(len(r.files) for r in search_responses)
+        table = SearchResultTable.from_api(responses)
         
         return cls(
             search_id=search_data.get("id", ""),
             query=search_data.get("searchText", ""),
             state=SearchState(search_data.get("state", "pending").lower()),
-            responses=search_responses,
-            file_count=file_count,
-            response_count=len(search_responses)
+            table=table,
+            file_count=len(table),
+            response_count=table.response_count
         )
     
+    @property
+    def responses(self) -> List[SearchResponse]:
+        """Responses per user with their files (built on each access)."""
+        return [
+            SearchResponse.from_api(self.table.response_data(index), files=self.table.materialize(rows))
+            for index, rows in self.table.response_rows().items()
+        ]
+    
     def get_all_files(self) -> List[FileInfo]:
         """Get all files from all responses."""
-        all_files = []
-        for response in self.responses:
-            all_files.extend(response.files)
-        return all_files
+        return self.table.materialize()
     
     def get_best_files(self, limit: int = 50) -> List[FileInfo]:
         """Get best files sorted by quality score."""
-        all_files = self.get_all_files()
-        
-        # Sort by quality score
-        all_files.sort(key=lambda f: f.quality_score, reverse=True)
-        
-        return all_files[:limit]
+        return self.table.materialize(self.table.top_k(limit))
+    
+    def get_best_per_user(self, limit: int = 50) -> List[FileInfo]:
+        """Get the best file of each user, best users first."""
+        return self.table.materialize(self.table.best_per_user(limit))
     
     def filter_by_bitrate(self, min_bitrate: int) -> List[FileInfo]:
         """Filter files by minimum bitrate."""
-        filtered = []
-        for file_info in self.get_all_files():
-            if file_info.file.bitrate:
-                if file_info.file.bitrate >= min_bitrate:
-                    filtered.append(file_info)
-            elif file_info.file.is_lossless:
-                # Include lossless files regardless of bitrate
-                filtered.append(file_info)
-        return filtered
\ No newline at end of file
+        return self.table.materialize(np.flatnonzero(self.table.bitrate_mask(min_bitrate)))
+    
+    def apply_bitrate_filter(self, min_bitrate: int) -> None:
+        """
+        Drop files below a minimum bitrate from this result.
+        
+        Lossless files without a reported bitrate are kept.
+        
+        Args:
+            min_bitrate: Minimum bitrate in kbps
+        """
+        self.table = self.table.select(self.table.bitrate_mask(min_bitrate))
+        self.file_count = len(self.table)
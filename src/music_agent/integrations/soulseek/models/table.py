@@ -0,0 +1,313 @@
+"""
+Columnar storage for Soulseek search results.
+
+Popular queries return tens of thousands of files. Instead of building a
+``FileInfo`` per file, ``SearchResultTable`` keeps the columns ranking needs
+in NumPy arrays (one row per file) and the raw slskd dicts alongside them.
+Scoring, filtering, top-k and per-user grouping run on the arrays, and
+``FileInfo`` objects are only built for the rows a caller asks for.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .file import FileInfo
+
+LOSSLESS_EXTENSIONS = frozenset({".flac", ".wav", ".aiff", ".alac", ".ape"})
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+class SearchResultTable:
+    """
+    Search result files as columns.
+
+    Per-file columns are indexed by row; per-response columns (one entry per
+    responding peer) are reached through ``response_index``. Scores follow
+    ``FileInfo.quality_score`` exactly, and rows with equal scores keep
+    their response order, like the stable sort they replace.
+    """
+
+    def __init__(
+        self,
+        responses: Sequence[dict],
+        files: Sequence[dict],
+        response_index: np.ndarray,
+        bitrate: np.ndarray,
+        size: np.ndarray,
+        lossless: np.ndarray,
+        rows: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize table.
+
+        Use ``from_api`` to build one from slskd responses.
+
+        Args:
+            responses: Raw response dicts, one per peer
+            files: Raw file dicts, one per row
+            response_index: Response each row belongs to
+            bitrate: Bitrate per row (0 if unknown)
+            size: Size in bytes per row
+            lossless: Whether each row has a lossless extension
+            rows: Rows of ``files`` this table covers (all when None)
+        """
+        self._responses = responses
+        self._files = files
+        self.response_index = response_index
+        self.bitrate = bitrate
+        self.size = size
+        self.lossless = lossless
+        # Positions in the raw file list, so filtered tables share it
+        self.rows = np.arange(len(files), dtype=np.int64) if rows is None else rows
+
+        self.free_slot = np.fromiter(
+            (bool(r.get("hasFreeUploadSlot")) for r in responses), dtype=bool, count=len(responses)
+        )
+        self.upload_speed = np.fromiter(
+            (r.get("uploadSpeed") or 0 for r in responses), dtype=np.int64, count=len(responses)
+        )
+        self.queue_length = np.fromiter(
+            (r.get("queueLength") or 0 for r in responses), dtype=np.int64, count=len(responses)
+        )
+        # Peers can answer more than once; group rows by username
+        codes: Dict[str, int] = {}
+        self._user_of_response = np.array(
+            [codes.setdefault(r.get("username", ""), len(codes)) for r in responses], dtype=np.int32
+        )
+        self.usernames: List[str] = list(codes)
+        self._scores: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_api(cls, responses: List[dict]) -> "SearchResultTable":
+        """
+        Build a table from slskd search responses in one pass.
+
+        Args:
+            responses: Raw responses from the search endpoint
+
+        Returns:
+            SearchResultTable
+        """
+        files: List[dict] = []
+        response_index: List[int] = []
+        bitrate: List[int] = []
+        size: List[int] = []
+        lossless: List[bool] = []
+
+        for index, response in enumerate(responses):
+            for file_data in response.get("files", []):
+                files.append(file_data)
+                response_index.append(index)
+                bitrate.append(file_data.get("bitRate") or 0)
+                size.append(file_data.get("size") or 0)
+                extension = file_data.get("extension") or os.path.splitext(file_data.get("filename", ""))[1]
+                lossless.append(extension.lower() in LOSSLESS_EXTENSIONS)
+
+        return cls(
+            responses=responses,
+            files=files,
+            response_index=np.array(response_index, dtype=np.int32),
+            bitrate=np.array(bitrate, dtype=np.int32),
+            size=np.array(size, dtype=np.int64),
+            lossless=np.array(lossless, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def response_count(self) -> int:
+        """Number of peers that responded."""
+        return len(self._responses)
+
+    @property
+    def user_index(self) -> np.ndarray:
+        """Index into ``usernames`` per row."""
+        return self._user_of_response[self.response_index]
+
+    def quality_scores(self) -> np.ndarray:
+        """
+        Score every row like ``FileInfo.quality_score``.
+
+        Returns:
+            Score per row (computed once, then cached)
+        """
+        if self._scores is None:
+            free = self.free_slot[self.response_index]
+            queue = self.queue_length[self.response_index]
+            speed = self.upload_speed[self.response_index]
+
+            # Bitrate (max 40), lossless files without a bitrate get full marks
+            score = np.where(
+                self.bitrate > 0,
+                np.minimum(40.0, self.bitrate / 8),
+                np.where(self.lossless, 40.0, 0.0)
+            )
+            # Availability (max 30)
+            score += np.select([free, queue < 5, queue < 10], [30.0, 20.0, 10.0], 0.0)
+            # Upload speed (max 20)
+            score += np.minimum(20.0, speed / 50000)
+            # File size (max 10, prefer larger files)
+            score += np.minimum(10.0, self.size / _BYTES_PER_MB / 10)
+            self._scores = score
+        return self._scores
+
+    def bitrate_mask(self, min_bitrate: int) -> np.ndarray:
+        """
+        Rows meeting a minimum bitrate.
+
+        Lossless files without a reported bitrate are always included.
+
+        Args:
+            min_bitrate: Minimum bitrate in kbps
+
+        Returns:
+            Boolean mask per row
+        """
+        known = self.bitrate > 0
+        return (known & (self.bitrate >= min_bitrate)) | (~known & self.lossless)
+
+    def select(self, mask: np.ndarray) -> "SearchResultTable":
+        """
+        Narrow the table to some rows.
+
+        Args:
+            mask: Boolean mask or row indices
+
+        Returns:
+            New table sharing the raw responses and files
+        """
+        table = SearchResultTable.__new__(SearchResultTable)
+        table.__dict__.update(self.__dict__)
+        table.response_index = self.response_index[mask]
+        table.bitrate = self.bitrate[mask]
+        table.size = self.size[mask]
+        table.lossless = self.lossless[mask]
+        table.rows = self.rows[mask]
+        table._scores = None if self._scores is None else self._scores[mask]
+        return table
+
+    def top_k(self, k: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Best rows by quality score.
+
+        Args:
+            k: Number of rows
+            mask: Only consider rows where this is True
+
+        Returns:
+            Row indices, best first
+        """
+        scores = self.quality_scores()
+        candidates = np.arange(len(scores)) if mask is None else np.flatnonzero(mask)
+        if k <= 0 or len(candidates) == 0:
+            return candidates[:0]
+
+        if k < len(candidates):
+            # Every row scoring at least the k-th best, in row order, so ties
+            # resolve the same way as a full stable sort
+            threshold = np.partition(scores[candidates], len(candidates) - k)[len(candidates) - k]
+            candidates = candidates[scores[candidates] >= threshold]
+
+        order = np.argsort(-scores[candidates], kind="stable")
+        return candidates[order[:k]]
+
+    def group_by_user(self, mask: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Rows per peer, best first.
+
+        Args:
+            mask: Only consider rows where this is True
+
+        Returns:
+            Username to row indices
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        users = self.user_index[rows]
+        order = np.lexsort((-self.quality_scores()[rows], users))
+        rows, users = rows[order], users[order]
+        starts = np.flatnonzero(np.r_[True, users[1:] != users[:-1]]) if len(rows) else rows
+        return {
+            self.usernames[users[start]]: group
+            for start, group in zip(starts, np.split(rows, starts[1:]))
+        }
+
+    def best_per_user(self, limit: int = 50, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        The best row of each peer, best peers first.
+
+        Spreads downloads across peers instead of queueing everything on
+        whoever shares the most matching files.
+
+        Args:
+            limit: Maximum number of rows
+            mask: Only consider rows where this is True
+
+        Returns:
+            Row indices, best first
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if len(rows) == 0 or limit <= 0:
+            return rows[:0]
+
+        scores = self.quality_scores()[rows]
+        users = self.user_index[rows]
+        order = np.lexsort((-scores, users))
+        _, first = np.unique(users[order], return_index=True)
+        best = rows[order[first]]
+        return best[np.argsort(-self.quality_scores()[best], kind="stable")][:limit]
+
+    def materialize(self, indices: Optional[np.ndarray] = None) -> List[FileInfo]:
+        """
+        Build ``FileInfo`` objects for some rows.
+
+        Args:
+            indices: Row indices (all rows when None)
+
+        Returns:
+            FileInfo per row, in the given order
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        return [
+            FileInfo.from_search_result(
+                self._files[self.rows[i]],
+                self._responses[self.response_index[i]]
+            )
+            for i in indices.tolist()
+        ]
+
+    def response_rows(self) -> Dict[int, np.ndarray]:
+        """
+        Rows per response, in response order.
+
+        Returns:
+            Response index to row indices
+        """
+        order = np.argsort(self.response_index, kind="stable")
+        indices = self.response_index[order]
+        starts = np.flatnonzero(np.r_[True, indices[1:] != indices[:-1]]) if len(order) else order
+        return {
+            int(indices[start]): group
+            for start, group in zip(starts, np.split(order, starts[1:]))
+        }
+
+    def response_data(self, index: int) -> dict:
+        """Raw slskd dict for a response."""
+        return self._responses[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the column arrays."""
+        arrays = (
+            self.response_index, self.bitrate, self.size, self.lossless, self.rows,
+            self.free_slot, self.upload_speed, self.queue_length, self._user_of_response,
+        )
+        total = sum(array.nbytes for array in arrays)
+        return total + (self._scores.nbytes if self._scores is not None else 0)
+
+
+__all__ = ["LOSSLESS_EXTENSIONS", "SearchResultTable"]
@@ -0,0 +1,574 @@
+"""
+Cached, indexed peer share listings.
+
+Browsing a peer transfers their whole share listing, which can hold 100k+
+files. ``PeerShareCache`` keeps each listing once: columnar in memory with
+a token index, and gzip-compressed on disk with a TTL, so looking up
+"other files by this artist" on a peer we have already browsed, or across
+every cached peer, needs no new browse.
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import ShareCacheConfig
+from ..models import File
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+
+    Args:
+        text: Path, filename or query
+
+    Returns:
+        Unique tokens of two or more characters, in order
+    """
+    return list(dict.fromkeys(t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1))
+
+
+def _pack_postings(postings: Dict[str, np.ndarray]) -> Dict[str, list]:
+    """Flatten token postings into three lists for storage."""
+    tokens = list(postings)
+    counts = [len(postings[token]) for token in tokens]
+    rows = np.concatenate([postings[token] for token in tokens]) if tokens else np.array([], dtype=np.int32)
+    return {"tokens": tokens, "counts": counts, "rows": rows.tolist()}
+
+
+def _unpack_postings(packed: Dict[str, list]) -> Dict[str, np.ndarray]:
+    """Restore ``_pack_postings`` output."""
+    rows = np.array(packed["rows"], dtype=np.int32)
+    groups = np.split(rows, np.cumsum(packed["counts"])[:-1]) if packed["tokens"] else []
+    return dict(zip(packed["tokens"], groups))
+
+
+class PeerShares:
+    """
+    One peer's share listing as columns, with a token index.
+
+    Rows are files. Directory paths are stored once and referenced by
+    index. Tokens from directory paths are indexed per directory, and
+    tokens from filenames per file.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        browsed_at: float,
+        directories: List[str],
+        dir_index: np.ndarray,
+        names: List[str],
+        size: np.ndarray,
+        bitrate: np.ndarray,
+        length: np.ndarray,
+        sample_rate: np.ndarray,
+        locked_directories: Optional[List[str]] = None,
+        index: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize peer shares.
+
+        Use ``from_api`` or ``from_dict`` to build one.
+
+        Args:
+            username: Peer username
+            browsed_at: When the listing was fetched (epoch seconds)
+            directories: Directory paths
+            dir_index: Directory of each file
+            names: Filename of each file, without the directory
+            size: Size in bytes per file
+            bitrate: Bitrate per file (0 if unknown)
+            length: Duration in seconds per file (0 if unknown)
+            sample_rate: Sample rate per file (0 if unknown)
+            locked_directories: Directories the peer does not share with us
+            index: Stored token index (built from the listing when None)
+        """
+        self.username = username
+        self.browsed_at = browsed_at
+        self.directories = directories
+        self.dir_index = dir_index
+        self.names = names
+        self.size = size
+        self.bitrate = bitrate
+        self.length = length
+        self.sample_rate = sample_rate
+        self.locked_directories = locked_directories or []
+
+        if index is not None:
+            self._dir_tokens = _unpack_postings(index["directories"])
+            self._file_tokens = _unpack_postings(index["files"])
+        else:
+            self._build_index()
+
+    @classmethod
+    def from_api(cls, username: str, data: dict, browsed_at: Optional[float] = None) -> "PeerShares":
+        """
+        Build from a slskd browse response.
+
+        Args:
+            username: Peer username
+            data: Browse response (directories with their files)
+            browsed_at: When the listing was fetched (defaults to now)
+
+        Returns:
+            PeerShares
+        """
+        directories: List[str] = []
+        dir_index: List[int] = []
+        names: List[str] = []
+        size: List[int] = []
+        bitrate: List[int] = []
+        length: List[int] = []
+        sample_rate: List[int] = []
+
+        for directory in data.get("directories", []):
+            index = len(directories)
+            directories.append(directory.get("name", ""))
+            for file_data in directory.get("files", []):
+                dir_index.append(index)
+                # Browse listings give bare filenames; search results give full paths
+                names.append(file_data.get("filename", "").rsplit("\\", 1)[-1])
+                size.append(file_data.get("size") or 0)
+                bitrate.append(file_data.get("bitRate") or 0)
+                length.append(file_data.get("length") or 0)
+                sample_rate.append(file_data.get("sampleRate") or 0)
+
+        return cls(
+            username=username,
+            browsed_at=time.time() if browsed_at is None else browsed_at,
+            directories=directories,
+            dir_index=np.array(dir_index, dtype=np.int32),
+            names=names,
+            size=np.array(size, dtype=np.int64),
+            bitrate=np.array(bitrate, dtype=np.int32),
+            length=np.array(length, dtype=np.int32),
+            sample_rate=np.array(sample_rate, dtype=np.int32),
+            locked_directories=[d.get("name", "") for d in data.get("lockedDirectories", [])
+                                if isinstance(d, dict)],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Columnar dictionary for storage."""
+        return {
+            "version": _FORMAT_VERSION,
+            "username": self.username,
+            "browsed_at": self.browsed_at,
+            "directories": self.directories,
+            "locked_directories": self.locked_directories,
+            "dir_index": self.dir_index.tolist(),
+            "names": self.names,
+            "size": self.size.tolist(),
+            "bitrate": self.bitrate.tolist(),
+            "length": self.length.tolist(),
+            "sample_rate": self.sample_rate.tolist(),
+            "index": {
+                "directories": _pack_postings(self._dir_tokens),
+                "files": _pack_postings(self._file_tokens),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PeerShares":
+        """Restore from ``to_dict`` output."""
+        return cls(
+            username=data["username"],
+            browsed_at=data["browsed_at"],
+            directories=data["directories"],
+            dir_index=np.array(data["dir_index"], dtype=np.int32),
+            names=data["names"],
+            size=np.array(data["size"], dtype=np.int64),
+            bitrate=np.array(data["bitrate"], dtype=np.int32),
+            length=np.array(data["length"], dtype=np.int32),
+            sample_rate=np.array(data["sample_rate"], dtype=np.int32),
+            locked_directories=data.get("locked_directories", []),
+            index=data.get("index"),
+        )
+
+    def _build_index(self) -> None:
+        """Map tokens to directories and files."""
+        dir_postings: Dict[str, List[int]] = {}
+        for index, directory in enumerate(self.directories):
+            for token in tokenize(directory):
+                dir_postings.setdefault(token, []).append(index)
+
+        file_postings: Dict[str, List[int]] = {}
+        for row, name in enumerate(self.names):
+            for token in tokenize(name):
+                file_postings.setdefault(token, []).append(row)
+
+        self._dir_tokens = {t: np.array(d, dtype=np.int32) for t, d in dir_postings.items()}
+        self._file_tokens = {t: np.array(r, dtype=np.int32) for t, r in file_postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def age(self) -> float:
+        """Seconds since the listing was fetched."""
+        return time.time() - self.browsed_at
+
+    def token_rows(self, token: str) -> np.ndarray:
+        """
+        Files matching a token in their directory path or filename.
+
+        Args:
+            token: Lowercase token
+
+        Returns:
+            Sorted row indices
+        """
+        rows = self._file_tokens.get(token)
+        directories = self._dir_tokens.get(token)
+        if directories is not None:
+            in_directory = np.flatnonzero(np.isin(self.dir_index, directories))
+            rows = in_directory if rows is None else np.union1d(rows, in_directory)
+        return np.array([], dtype=np.int32) if rows is None else rows
+
+    def search(self, query: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Files matching every token of a query.
+
+        Args:
+            query: Search text
+            limit: Maximum rows
+
+        Returns:
+            Row indices in listing order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return np.array([], dtype=np.int32)
+
+        # Start from the rarest token to keep intersections small
+        postings = sorted((self.token_rows(token) for token in tokens), key=len)
+        rows = postings[0]
+        for other in postings[1:]:
+            if len(rows) == 0:
+                break
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows if limit is None else rows[:limit]
+
+    def directory_rows(self, directory: str) -> np.ndarray:
+        """
+        Files in a directory.
+
+        Args:
+            directory: Directory path as shared by the peer
+
+        Returns:
+            Row indices
+        """
+        try:
+            index = self.directories.index(directory)
+        except ValueError:
+            return np.array([], dtype=np.int32)
+        return np.flatnonzero(self.dir_index == index)
+
+    def path(self, row: int) -> str:
+        """Full path of a file, as used for downloads."""
+        return f"{self.directories[self.dir_index[row]]}\\{self.names[row]}"
+
+    def files(self, rows: Iterable[int]) -> List[File]:
+        """
+        Build ``File`` objects for some rows.
+
+        Args:
+            rows: Row indices
+
+        Returns:
+            Files with full paths
+        """
+        return [
+            File(
+                filename=self.path(row),
+                size=int(self.size[row]),
+                extension=os.path.splitext(self.names[row])[1],
+                bitrate=int(self.bitrate[row]) or None,
+                sample_rate=int(self.sample_rate[row]) or None,
+                length=int(self.length[row]) or None,
+            )
+            for row in (rows.tolist() if isinstance(rows, np.ndarray) else rows)
+        ]
+
+
+@dataclass
+class ShareCacheStats:
+    """Peer share cache counters."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    expired: int = 0
+    browses: int = 0
+    browse_failures: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return dict(self.__dict__)
+
+
+class PeerShareCache:
+    """
+    Browse results per peer, in memory (LRU) and on disk (TTL).
+
+    Concurrent requests for the same peer share one browse. A manifest of
+    cached peers lets queries span every peer browsed within the TTL.
+    """
+
+    def __init__(self, config: Optional[ShareCacheConfig] = None):
+        """
+        Initialize peer share cache.
+
+        Args:
+            config: Cache configuration (defaults to environment)
+        """
+        self.config = config or ShareCacheConfig.from_env()
+        self.root = Path(os.path.expanduser(self.config.cache_dir))
+        self.stats = ShareCacheStats()
+
+        self._memory: "OrderedDict[str, PeerShares]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._manifest: Optional[Dict[str, float]] = None
+        self._lock = threading.Lock()
+
+    # Storage
+
+    def _path(self, username: str) -> Path:
+        digest = hashlib.sha256(username.encode()).hexdigest()[:32]
+        return self.root / f"{digest}.json.gz"
+
+    def _is_fresh(self, browsed_at: float) -> bool:
+        return self.config.ttl <= 0 or time.time() - browsed_at < self.config.ttl
+
+    def _load_manifest(self) -> Dict[str, float]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads((self.root / "manifest.json").read_text())
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / "manifest.json"
+        tmp_path = path.with_name(f"manifest.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._manifest))
+        os.replace(tmp_path, path)
+
+    def _read(self, username: str) -> Optional[PeerShares]:
+        """Load a peer from disk if present and fresh (blocking)."""
+        try:
+            data = json.loads(gzip.decompress(self._path(username).read_bytes()))
+        except (OSError, ValueError, EOFError):
+            return None
+        if data.get("version") != _FORMAT_VERSION or data.get("username") != username:
+            return None
+        if not self._is_fresh(data["browsed_at"]):
+            self.stats.expired += 1
+            return None
+        return PeerShares.from_dict(data)
+
+    def _write(self, shares: PeerShares) -> None:
+        """Store a peer on disk and record it in the manifest (blocking)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(shares.username)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        # One compress call; streaming json.dump through gzip is much slower
+        data = json.dumps(shares.to_dict(), separators=(",", ":")).encode()
+        tmp_path.write_bytes(gzip.compress(data, compresslevel=3))
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._load_manifest()[shares.username] = shares.browsed_at
+            self._save_manifest()
+
+    def _remember(self, shares: PeerShares) -> None:
+        self._memory[shares.username] = shares
+        self._memory.move_to_end(shares.username)
+        while len(self._memory) > max(1, self.config.max_memory_peers):
+            self._memory.popitem(last=False)
+
+    # Lookups
+
+    async def get(self, username: str) -> Optional[PeerShares]:
+        """
+        Get a peer's cached listing.
+
+        Args:
+            username: Peer username
+
+        Returns:
+            PeerShares, or None if not cached or expired
+        """
+        shares = self._memory.get(username)
+        if shares is not None:
+            if self._is_fresh(shares.browsed_at):
+                self._memory.move_to_end(username)
+                self.stats.memory_hits += 1
+                return shares
+            self.stats.expired += 1
+            del self._memory[username]
+
+        shares = await asyncio.to_thread(self._read, username)
+        if shares is not None:
+            self.stats.disk_hits += 1
+            self._remember(shares)
+        return shares
+
+    async def put(self, username: str, data: dict) -> PeerShares:
+        """
+        Cache a browse response.
+
+        Args:
+            username: Peer username
+            data: slskd browse response
+
+        Returns:
+            Indexed PeerShares
+        """
+        shares = await asyncio.to_thread(PeerShares.from_api, username, data)
+        self._remember(shares)
+        try:
+            await asyncio.to_thread(self._write, shares)
+        except OSError as e:
+            logger.warning(f"Failed to store shares for {username}: {e}")
+        return shares
+
+    async def get_or_browse(
+        self,
+        username: str,
+        browse: Callable[[str], Awaitable[dict]],
+        refresh: bool = False
+    ) -> PeerShares:
+        """
+        Get a peer's listing, browsing only on a miss.
+
+        Args:
+            username: Peer username
+            browse: Fetches the raw browse response for a username
+            refresh: Browse even if cached
+
+        Returns:
+            PeerShares
+
+        Raises:
+            Exception: Whatever ``browse`` raised
+        """
+        if not refresh:
+            shares = await self.get(username)
+            if shares is not None:
+                return shares
+
+        inflight = self._inflight.get(username)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[username] = future
+        try:
+            self.stats.browses += 1
+            shares = await self.put(username, await browse(username))
+            future.set_result(shares)
+            return shares
+        except BaseException as e:
+            self.stats.browse_failures += 1
+            future.set_exception(e)
+            # Retrieve it so a failure nobody waited for isn't logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._inflight[username]
+
+    def cached_peers(self) -> List[str]:
+        """
+        Peers with a listing browsed within the TTL.
+
+        Returns:
+            Usernames, most recently browsed first
+        """
+        with self._lock:
+            entries = dict(self._load_manifest())
+        for username, shares in self._memory.items():
+            entries[username] = shares.browsed_at
+        fresh = [(at, username) for username, at in entries.items() if self._is_fresh(at)]
+        return [username for _, username in sorted(fresh, reverse=True)]
+
+    async def search(
+        self,
+        query: str,
+        usernames: Optional[List[str]] = None,
+        limit: int = 50,
+        exclude: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> List[Tuple[str, File]]:
+        """
+        Search cached listings without browsing.
+
+        Args:
+            query: Search text (every token must match the path)
+            usernames: Peers to search (defaults to every cached peer)
+            limit: Maximum results
+            exclude: (username, full path) pairs to leave out
+
+        Returns:
+            (username, File) pairs, peer by peer
+        """
+        skip = set(exclude or ())
+        results: List[Tuple[str, File]] = []
+        for username in usernames if usernames is not None else self.cached_peers():
+            if len(results) >= limit:
+                break
+            shares = await self.get(username)
+            if shares is None:
+                continue
+            for row in shares.search(query).tolist():
+                if (username, shares.path(row)) in skip:
+                    continue
+                results.extend((username, f) for f in shares.files([row]))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def invalidate(self, username: str) -> None:
+        """Drop a peer from memory and disk."""
+        self._memory.pop(username, None)
+        try:
+            self._path(username).unlink()
+        except OSError:
+            pass
+        with self._lock:
+            if self._load_manifest().pop(username, None) is not None:
+                self._save_manifest()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit, browse and expiry counters and peers in memory
+        """
+        return {**self.stats.to_dict(), "peers_in_memory": len(self._memory)}
+
+
+__all__ = [
+    "PeerShareCache",
+    "PeerShares",
+    "ShareCacheStats",
+    "tokenize",
+]
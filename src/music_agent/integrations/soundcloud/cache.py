@@ -0,0 +1,74 @@
+"""
+Cache setup for the SoundCloud integration.
+
+Backed by the shared ``music_agent.cache`` package; this module wires the
+tiers from ``CacheConfig``.
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from ...cache import CacheManager, InMemoryCache, SQLiteCache, build_cache
+from .config import CacheConfig
+
+
+class FileCache(SQLiteCache):
+    """On-disk cache stored as ``cache.db`` inside a cache directory."""
+    
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size_bytes: int = 100 * 1024 * 1024,
+        default_ttl: Optional[int] = None
+    ):
+        """
+        Initialize file cache.
+        
+        Args:
+            cache_dir: Directory holding the cache database
+            max_size_bytes: Bound on total stored value size
+            default_ttl: TTL used when ``set`` is called without one
+        """
+        super().__init__(Path(cache_dir) / "cache.db", max_size_bytes, default_ttl)
+
+
+def create_cache(config: Optional[CacheConfig] = None) -> CacheManager:
+    """
+    Create the SoundCloud cache from configuration.
+    
+    Args:
+        config: Cache configuration
+        
+    Returns:
+        CacheManager (with no tiers when caching is disabled)
+    """
+    config = config or CacheConfig()
+    
+    if not config.enable_cache:
+        return CacheManager(namespace="soundcloud")
+    
+    cache = build_cache(
+        namespace="soundcloud",
+        default_ttl=config.default_ttl,
+        max_entries=config.max_entries,
+        redis_url=config.redis_url,
+    )
+    
+    if config.enable_disk_cache:
+        # Disk tier sits between memory and Redis
+        cache.tiers.insert(1, FileCache(
+            config.cache_dir,
+            max_size_bytes=config.max_cache_size_mb * 1024 * 1024,
+            default_ttl=config.default_ttl,
+        ))
+    
+    return cache
+
+
+__all__ = [
+    "CacheManager",
+    "FileCache",
+    "InMemoryCache",
+    "SQLiteCache",
+    "create_cache",
+]
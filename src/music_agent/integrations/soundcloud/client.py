@@ -11,10 +11,11 @@ from pathlib import Path
 
 import aiohttp
 
+from ...utils.http import shared_session
 from .config import SoundCloudConfig
 from .auth import AuthenticationManager
 from .types import AuthCredentials
-from .cache import CacheManager, InMemoryCache
+from .cache import create_cache
 from .search import SearchManager
 from .download import DownloadManager
 from .utils import RateLimiter
@@ -55,10 +56,7 @@ class SoundCloudClient:
         
         # Components
         self.auth = AuthenticationManager(config.auth)
-        self.cache = CacheManager(
-            backend=InMemoryCache() if config.cache.enabled else None,
-            default_ttl=config.cache.default_ttl
-        )
+        self.cache = create_cache(self.config.cache)
         self.search = SearchManager(self, self.cache)
         self.download = DownloadManager(self, config.download)
         self.rate_limiter = RateLimiter(
@@ -94,7 +92,7 @@ class SoundCloudClient:
         """Initialize client and authenticate."""
         # Create session if needed
         if not self._session:
-            self._session = aiohttp.ClientSession(
+            self._session = await shared_session(
                 timeout=aiohttp.ClientTimeout(total=self.config.api.timeout),
                 headers={
                     "User-Agent": self.config.api.user_agent,
@@ -114,9 +112,8 @@ class SoundCloudClient:
         if self._owns_session and self._session:
             await self._session.close()
         
-        # Clean up cache
-        if isinstance(self.cache.backend, InMemoryCache):
-            del self.cache.backend
+        # Release cache tiers (SQLite/Redis connections)
+        await self.cache.close()
     
     async def authenticate(
         self,
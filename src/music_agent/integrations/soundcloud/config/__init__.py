@@ -102,7 +102,16 @@ class CacheConfig:
         )
     )
     
+    # Optional tiers behind the in-memory LRU
+    enable_disk_cache: bool = field(
+        default_factory=lambda: os.getenv("SOUNDCLOUD_DISK_CACHE", "false").lower() == "true"
+    )
+    redis_url: Optional[str] = field(
+        default_factory=lambda: os.getenv("SOUNDCLOUD_CACHE_REDIS_URL")
+    )
+    
     # TTL values (in seconds)
+    default_ttl: int = 3600  # 1 hour
     client_id_ttl: int = 86400  # 24 hours
     track_ttl: int = 3600  # 1 hour
     user_ttl: int = 3600  # 1 hour
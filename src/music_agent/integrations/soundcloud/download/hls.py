@@ -9,11 +9,12 @@ import asyncio
 import re
 from pathlib import Path
 from typing import Optional, Callable, List, Dict, Any
-from urllib.parse import urljoin, urlparse
-import aiohttp
+from urllib.parse import urljoin
 import aiofiles
 from io import BytesIO
 
+from ....utils.http import shared_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,7 +133,7 @@ class HLSDownloader:
         """
         segments = []
         
-        async with aiohttp.ClientSession() as session:
+        async with await shared_session() as session:
             async with session.get(manifest_url) as response:
                 response.raise_for_status()
                 content = await response.text()
@@ -190,7 +191,7 @@ class HLSDownloader:
         Returns:
             Segment data
         """
-        async with aiohttp.ClientSession() as session:
+        async with await shared_session() as session:
             async with session.get(url) as response:
                 response.raise_for_status()
                 return await response.read()
@@ -12,6 +12,8 @@ from concurrent.futures import ThreadPoolExecutor
 import aiohttp
 import aiofiles
 
+from ....utils.http import shared_session
+from ....services.artwork_service import ArtworkService, get_artwork_service
 from ..config import DownloadConfig
 from ..types import DownloadOptions
 from ..models import Track, Playlist
@@ -30,16 +32,23 @@ logger = logging.getLogger(__name__)
 class DownloadManager:
     """Manages track downloads from SoundCloud."""
     
-    def __init__(self, client, config: Optional[DownloadConfig] = None):
+    def __init__(
+        self,
+        client,
+        config: Optional[DownloadConfig] = None,
+        artwork_service: Optional[ArtworkService] = None
+    ):
         """
         Initialize download manager.
         
         Args:
             client: SoundCloud client instance
             config: Download configuration
+            artwork_service: Artwork fetcher (defaults to the shared one)
         """
         self.client = client
         self.config = config or DownloadConfig()
+        self.artwork = artwork_service or get_artwork_service()
         self.stream_handler = StreamHandler(client)
         self.metadata_writer = MetadataWriter()
         self.hls_downloader = HLSDownloader(config)
@@ -214,7 +223,9 @@ class DownloadManager:
         chunk_size = options.get("chunk_size", self.config.chunk_size)
         progress_callback = options.get("progress_callback")
         
-        async with aiohttp.ClientSession() as session:
+        # Streams can run for minutes; only bound the gap between reads
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        async with await shared_session(timeout=timeout) as session:
             async with session.get(url) as response:
                 response.raise_for_status()
                 
@@ -248,15 +259,9 @@ class DownloadManager:
         else:
             artwork_url = track.artwork_url_high
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(artwork_url) as response:
-                    if response.status == 200:
-                        return await response.read()
-        except Exception as e:
-            logger.warning(f"Failed to download artwork: {e}")
-        
-        return None
+        # Playlist tracks often share artwork; fetched once and reused
+        artwork = await self.artwork.fetch(artwork_url)
+        return artwork.data if artwork else None
     
     def _get_output_path(self, track: Track, options: Dict[str, Any]) -> Path:
         """Determine output path for track."""
@@ -21,15 +21,23 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("mutagen not available - metadata writing disabled")
 
+from ....utils.tagging import TagWriter, ensure_tags, get_tag_writer
+
 logger = logging.getLogger(__name__)
 
 
 class MetadataWriter:
     """Writes metadata tags to downloaded audio files."""
     
-    def __init__(self):
-        """Initialize metadata writer."""
+    def __init__(self, tag_writer: Optional[TagWriter] = None):
+        """
+        Initialize metadata writer.
+        
+        Args:
+            tag_writer: Tag writing pool (defaults to the shared one)
+        """
         self.enabled = MUTAGEN_AVAILABLE
+        self.tag_writer = tag_writer or get_tag_writer()
     
     async def write_metadata(
         self,
@@ -53,94 +61,11 @@ class MetadataWriter:
             return False
         
         try:
-            # Load or create ID3 tags
-            audio = MP3(file_path)
-            
-            if audio.tags is None:
-                audio.add_tags()
-            
-            tags = audio.tags
-            
-            # Clear existing tags
-            tags.delete()
-            
-            # Title
-            if track.title:
-                tags.add(TIT2(encoding=3, text=track.title))
-            
-            # Artist
-            if track.artist:
-                tags.add(TPE1(encoding=3, text=track.artist))
-            
-            # Album
-            if track.album:
-                tags.add(TALB(encoding=3, text=track.album))
-            
-            # Album artist
-            if hasattr(track, "album_artist") and track.album_artist:
-                tags.add(TPE2(encoding=3, text=track.album_artist))
-            
-            # Year
-            if track.created_at:
-                year = track.created_at.year
-                tags.add(TDRC(encoding=3, text=str(year)))
-            elif hasattr(track, "release_date") and track.release_date:
-                year = track.release_date.year
-                tags.add(TDRC(encoding=3, text=str(year)))
-            
-            # Genre
-            if track.genre:
-                tags.add(TCON(encoding=3, text=track.genre))
-            
-            # Track number
-            if track.track_number:
-                track_str = str(track.track_number)
-                if hasattr(track, "total_tracks") and track.total_tracks:
-                    track_str = f"{track.track_number}/{track.total_tracks}"
-                tags.add(TRCK(encoding=3, text=track_str))
-            
-            # Disc number
-            if hasattr(track, "disc_number") and track.disc_number:
-                disc_str = str(track.disc_number)
-                if hasattr(track, "total_discs") and track.total_discs:
-                    disc_str = f"{track.disc_number}/{track.total_discs}"
-                tags.add(TPOS(encoding=3, text=disc_str))
-            
-            # Description/Comment
-            if track.description:
-                # Add as comment
-                tags.add(COMM(
-                    encoding=3,
-                    lang="eng",
-                    desc="Description",
-                    text=track.description
-                ))
-                
-                # Also add as lyrics (for some players)
-                tags.add(USLT(
-                    encoding=3,
-                    lang="eng",
-                    desc="",
-                    text=track.description
-                ))
-            
-            # Label
-            if track.label_name:
-                tags.add(TPUB(encoding=3, text=track.label_name))
-            
-            # URL
-            if track.permalink_url:
-                tags.add(WOAR(url=track.permalink_url))
-            
-            # Custom tags
-            self._add_custom_tags(tags, track)
-            
-            # Artwork
-            if artwork_data:
-                self._embed_artwork(tags, artwork_data)
-            
-            # Save tags
-            audio.save()
+            # Saved off the event loop, in one write
+            await self.tag_writer.update(
+                file_path,
+                lambda audio: self._apply_tags(audio, track, artwork_data)
+            )
             
             logger.info(f"Wrote metadata to {file_path}")
             return True
@@ -149,6 +74,88 @@ class MetadataWriter:
             logger.error(f"Failed to write metadata: {e}")
             return False
     
+    def _apply_tags(self, audio, track, artwork_data: Optional[bytes]):
+        """Replace the ID3 tags of a loaded file with the track's."""
+        tags = ensure_tags(audio)
+        
+        # Clear existing tags (in memory; written with the new ones)
+        tags.clear()
+        
+        # Title
+        if track.title:
+            tags.add(TIT2(encoding=3, text=track.title))
+        
+        # Artist
+        if track.artist:
+            tags.add(TPE1(encoding=3, text=track.artist))
+        
+        # Album
+        if track.album:
+            tags.add(TALB(encoding=3, text=track.album))
+        
+        # Album artist
+        if hasattr(track, "album_artist") and track.album_artist:
+            tags.add(TPE2(encoding=3, text=track.album_artist))
+        
+        # Year
+        if track.created_at:
+            year = track.created_at.year
+            tags.add(TDRC(encoding=3, text=str(year)))
+        elif hasattr(track, "release_date") and track.release_date:
+            year = track.release_date.year
+            tags.add(TDRC(encoding=3, text=str(year)))
+        
+        # Genre
+        if track.genre:
+            tags.add(TCON(encoding=3, text=track.genre))
+        
+        # Track number
+        if track.track_number:
+            track_str = str(track.track_number)
+            if hasattr(track, "total_tracks") and track.total_tracks:
+                track_str = f"{track.track_number}/{track.total_tracks}"
+            tags.add(TRCK(encoding=3, text=track_str))
+        
+        # Disc number
+        if hasattr(track, "disc_number") and track.disc_number:
+            disc_str = str(track.disc_number)
+            if hasattr(track, "total_discs") and track.total_discs:
+                disc_str = f"{track.disc_number}/{track.total_discs}"
+            tags.add(TPOS(encoding=3, text=disc_str))
+        
+        # Description/Comment
+        if track.description:
+            # Add as comment
+            tags.add(COMM(
+                encoding=3,
+                lang="eng",
+                desc="Description",
+                text=track.description
+            ))
+            
+            # Also add as lyrics (for some players)
+            tags.add(USLT(
+                encoding=3,
+                lang="eng",
+                desc="",
+                text=track.description
+            ))
+        
+        # Label
+        if track.label_name:
+            tags.add(TPUB(encoding=3, text=track.label_name))
+        
+        # URL
+        if track.permalink_url:
+            tags.add(WOAR(url=track.permalink_url))
+        
+        # Custom tags
+        self._add_custom_tags(tags, track)
+        
+        # Artwork
+        if artwork_data:
+            self._embed_artwork(tags, artwork_data)
+    
     def _add_custom_tags(self, tags: ID3, track):
         """Add custom SoundCloud-specific tags."""
         # SoundCloud ID
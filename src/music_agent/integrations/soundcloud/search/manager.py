@@ -57,46 +57,43 @@ class SearchManager:
         Returns:
             Search results (list or dict for "all")
         """
-        # Check cache if available
-        cache_key = self._get_cache_key(query, type, limit, offset, filters, sort)
-        
-        if self.cache:
-            cached = await self.cache.get(cache_key)
-            if cached:
-                logger.debug(f"Cache hit for search: {query}")
-                return cached
-        
-        # Perform search based on type
-        if type == "tracks":
-            results = await search_api.search_tracks(
-                self.client, query, limit, offset, filters
-            )
-        elif type == "playlists":
-            results = await search_api.search_playlists(
-                self.client, query, limit, offset, filters
-            )
-        elif type == "users":
-            results = await search_api.search_users(
-                self.client, query, limit, offset
-            )
-        elif type == "albums":
-            results = await search_api.search_albums(
-                self.client, query, limit, offset, filters
-            )
-        elif type == "all":
-            results = await search_api.search_all(
-                self.client, query, limit, offset, filters
-            )
-        else:
+        if type not in ("tracks", "playlists", "users", "albums", "all"):
             raise ValueError(f"Invalid search type: {type}")
         
-        # Apply sorting if requested
-        if sort and isinstance(results, list):
-            results = self._sort_results(results, sort)
+        async def run_search() -> Union[List, Dict]:
+            # Perform search based on type
+            if type == "tracks":
+                results = await search_api.search_tracks(
+                    self.client, query, limit, offset, filters
+                )
+            elif type == "playlists":
+                results = await search_api.search_playlists(
+                    self.client, query, limit, offset, filters
+                )
+            elif type == "users":
+                results = await search_api.search_users(
+                    self.client, query, limit, offset
+                )
+            elif type == "albums":
+                results = await search_api.search_albums(
+                    self.client, query, limit, offset, filters
+                )
+            else:
+                results = await search_api.search_all(
+                    self.client, query, limit, offset, filters
+                )
+            
+            # Apply sorting if requested
+            if sort and isinstance(results, list):
+                results = self._sort_results(results, sort)
+            return results
+        
+        if not self.cache:
+            return await run_search()
         
-        # Cache results
-        if self.cache:
-            await self.cache.set(cache_key, results, ttl=300)  # 5 minutes
+        # Concurrent identical searches share one API call (5 minute TTL)
+        cache_key = self._get_cache_key(query, type, limit, offset, filters, sort)
+        results = await self.cache.get_or_set(cache_key, run_search, ttl=300)
         
         return results
     
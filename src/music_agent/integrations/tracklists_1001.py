@@ -6,26 +6,31 @@ from 1001tracklists.com with:
 - Efficient HTML parsing with BeautifulSoup
 - Structured data extraction
 - Caching and rate limiting
+- Concurrent, resumable festival and DJ history crawls
 - Raw data output for agent processing
 """
 
+import os
 import re
-import json
-import asyncio
 import logging
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime, timedelta
+from contextlib import aclosing
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
+from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
 
 import httpx
 from bs4 import BeautifulSoup
-import openai
 from pydantic import BaseModel, Field
 
 from ..utils.config import get_config
-from ..integrations.discogs import DiscogsIntegration
+from ..services.llm_service import LLMService, LLMModel, ResponseFormat, get_llm_service
+from ..cache.pages import get_page_cache
+from ..utils.crawl import Crawler, CrawlTask, default_state_dir
+from ..utils.rate_limit import AsyncRateLimiter
+from .tracklists_parser import parse_festival_page, parse_profile_page, parse_next_pages
+from .tracklists_enrichment import TrackEnricher, EnrichmentStats
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +57,7 @@ class TrackMetadata:
     spotify_uri: Optional[str] = None
     beatport_url: Optional[str] = None
     discogs_id: Optional[int] = None
+    musicbrainz_id: Optional[str] = None
     soundcloud_url: Optional[str] = None
 
 
@@ -157,8 +163,13 @@ class DJSetInfo:
 class TracklistsLLMExtractor:
     """LLM-based extraction for 1001 Tracklists data."""
     
-    def __init__(self, openai_client):
-        self.client = openai_client
+    # gpt-4o-mini's output limit
+    MAX_OUTPUT_TOKENS = 16384
+    
+    def __init__(self, llm_service: LLMService):
+        # Responses are cached by request content, so re-extracting an
+        # unchanged page costs no tokens
+        self.llm = llm_service
         
     async def extract_tracklist(self, html: str) -> Dict[str, Any]:
         """Extract tracklist data from HTML using LLM."""
@@ -201,17 +212,18 @@ class TracklistsLLMExtractor:
             content = content[:15000]
         
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a music data extraction expert."},
-                    {"role": "user", "content": f"{prompt}\n\nHTML Content:\n{content}"}
-                ],
+            response = await self.llm.complete(
+                prompt=f"{prompt}\n\nHTML Content:\n{content}",
+                system_prompt="You are a music data extraction expert.",
+                model=LLMModel.GPT4O_MINI,
                 temperature=0.1,
-                response_format={"type": "json_object"}
+                max_tokens=self.MAX_OUTPUT_TOKENS,
+                response_format=ResponseFormat.JSON
             )
             
-            return json.loads(response.choices[0].message.content)
+            if not response.is_json:
+                raise ValueError("LLM response is not valid JSON")
+            return response.content
             
         except Exception as e:
             logger.error(f"LLM extraction failed: {e}")
@@ -257,6 +269,11 @@ class OneThousandOneTracklistsIntegration:
     - Caching and rate limiting
     """
     
+    BASE_URL = "https://www.1001tracklists.com"
+    
+    # Bump when extraction output changes so cached parses are invalidated
+    PARSER_VERSION = "1"
+    
     def __init__(self):
         """Initialize the integration."""
         config = get_config()
@@ -274,30 +291,25 @@ class OneThousandOneTracklistsIntegration:
         # Initialize LLM extractor if OpenAI is configured
         self.llm_extractor = None
         if config.openai.api_key:
-            openai.api_key = config.openai.api_key
-            self.llm_extractor = TracklistsLLMExtractor(openai)
+            self.llm_extractor = TracklistsLLMExtractor(get_llm_service())
         
-        # Cache for processed tracklists
-        self._cache = {}
+        # Shared on-disk cache for raw pages and processed tracklists; pages
+        # older than the TTL are revalidated with a conditional request
+        self.page_cache = get_page_cache()
         self._cache_ttl = 3600  # 1 hour
         
-        # Rate limiting
-        self._last_request = datetime.min
-        self._min_request_interval = timedelta(seconds=2)  # 30 requests/minute
+        # Rate limiting (30 requests/minute, shared by concurrent crawl tasks)
+        self._limiter = AsyncRateLimiter(30, period=60)
         
-        # Initialize other integrations for enrichment
-        self.discogs = DiscogsIntegration()
+        # Pages handled at once while crawling festivals and DJ histories
+        self.crawl_concurrency = int(os.getenv("TRACKLISTS_CRAWL_CONCURRENCY", "4"))
+        
+        # Track enrichment from external catalogs (created on first use)
+        self._enricher: Optional[TrackEnricher] = None
     
     async def _rate_limit(self):
         """Enforce rate limiting."""
-        now = datetime.now()
-        time_since_last = now - self._last_request
-        
-        if time_since_last < self._min_request_interval:
-            wait_time = (self._min_request_interval - time_since_last).total_seconds()
-            await asyncio.sleep(wait_time)
-        
-        self._last_request = datetime.now()
+        await self._limiter.acquire()
     
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key for URL."""
@@ -314,22 +326,15 @@ class OneThousandOneTracklistsIntegration:
         Returns:
             Complete DJ set information
         """
-        # Check cache
-        cache_key = self._get_cache_key(url)
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.now() - cached_time < timedelta(seconds=self._cache_ttl):
-                logger.info(f"Returning cached tracklist for {url}")
-                return cached_data
-        
-        # Rate limit
-        await self._rate_limit()
-        
         try:
-            # Fetch HTML
-            response = await self.client.get(url)
-            response.raise_for_status()
-            html = response.text
+            html, content_hash = await self._fetch_html(url)
+            
+            # Processed results are keyed by page content and extraction mode
+            parser = f"djset:{'llm' if self.llm_extractor else 'basic'}:{'enhanced' if enhance else 'raw'}"
+            cached = await self.page_cache.aget_parsed(url, parser, self.PARSER_VERSION, content_hash)
+            if cached is not None:
+                logger.info(f"Returning cached tracklist for {url}")
+                return cached
             
             # Extract with LLM or fallback
             if self.llm_extractor:
@@ -347,7 +352,7 @@ class OneThousandOneTracklistsIntegration:
                 dj_set = await self._enhance_tracklist(dj_set)
             
             # Cache the result
-            self._cache[cache_key] = (datetime.now(), dj_set)
+            await self.page_cache.aput_parsed(url, parser, self.PARSER_VERSION, dj_set, content_hash)
             
             return dj_set
             
@@ -355,6 +360,34 @@ class OneThousandOneTracklistsIntegration:
             logger.error(f"Error fetching tracklist from {url}: {e}")
             raise
     
+    async def _fetch_html(self, url: str) -> Tuple[str, str]:
+        """
+        Fetch page HTML through the page cache.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Tuple of (HTML, content hash)
+        """
+        page = await self.page_cache.aget(url)
+        if page and page.is_fresh(self._cache_ttl):
+            return page.html, page.content_hash
+        
+        # Rate limit
+        await self._rate_limit()
+        
+        headers = page.conditional_headers() if page else {}
+        response = await self.client.get(url, headers=headers)
+        
+        if page and response.status_code == 304:
+            await self.page_cache.atouch(url)
+            return page.html, page.content_hash
+        
+        response.raise_for_status()
+        page = await self.page_cache.aput_response(url, response.text, response.headers)
+        return page.html, page.content_hash
+    
     def _basic_extraction(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Basic HTML extraction without LLM."""
         data = {
@@ -459,43 +492,45 @@ class OneThousandOneTracklistsIntegration:
             tracks=tracks
         )
     
+    @property
+    def enricher(self) -> TrackEnricher:
+        """Track enricher shared by every set this integration enhances."""
+        if self._enricher is None:
+            self._enricher = TrackEnricher()
+        return self._enricher
+    
     async def _enhance_tracklist(self, dj_set: DJSetInfo) -> DJSetInfo:
         """
         Enhance tracklist with external data sources.
         
-        Adds BPM, key, genre, and streaming links from:
-        - Spotify (if configured)
+        Adds BPM, key, genre, and catalog links from:
+        - Discogs (if configured)
         - Beatport (if configured)
-        - Discogs
+        - MusicBrainz
         """
-        for track in dj_set.tracks:
-            if track.is_id or not track.artist:
-                continue
-            
-            # Try Discogs for additional metadata
-            try:
-                search_query = f"{track.artist} {track.title}"
-                if track.remix:
-                    search_query += f" {track.remix}"
-                
-                discogs_results = self.discogs.search(
-                    query=search_query,
-                    page=1,
-                    per_page=1
-                )
-                
-                if discogs_results.get('results'):
-                    result = discogs_results['results'][0]
-                    track.metadata.genre = result.get('genre', [None])[0] if result.get('genre') else None
-                    track.metadata.discogs_id = result.get('id')
-            except Exception as e:
-                logger.debug(f"Discogs enhancement failed for {track.full_title}: {e}")
-            
-            # Add a small delay between lookups
-            await asyncio.sleep(0.1)
-        
+        await self.enhance_sets([dj_set])
         return dj_set
     
+    async def enhance_sets(self, dj_sets: List[DJSetInfo]) -> EnrichmentStats:
+        """
+        Enhance several sets in one batch.
+        
+        Tracks are deduplicated across the sets and served from the track
+        identity cache where possible; only unknown tracks are looked up.
+        
+        Args:
+            dj_sets: Sets to enhance in place
+        
+        Returns:
+            Enrichment statistics
+        """
+        stats = await self.enricher.enrich_sets(dj_sets)
+        logger.debug(
+            f"Enriched {stats.tracks} tracks ({stats.unique} unique, "
+            f"{stats.cache_hits} cached, {stats.looked_up} looked up)"
+        )
+        return stats
+    
     async def analyze_dj_style(self, dj_name: str, num_sets: int = 10) -> Dict[str, Any]:
         """
         Analyze a DJ's mixing style and track preferences.
@@ -542,20 +577,142 @@ class OneThousandOneTracklistsIntegration:
         # For now, return empty list
         return []
     
-    async def get_festival_lineup(self, festival_url: str) -> List[DJSetInfo]:
+    async def get_festival_lineup(self, festival_url: str, enhance: bool = False) -> List[DJSetInfo]:
         """
         Get all DJ sets from a festival.
         
         Args:
             festival_url: 1001 Tracklists festival page URL
+            enhance: Whether to enhance tracks with external data
         
         Returns:
             List of all DJ sets from the festival
         """
-        # This would require parsing festival pages
-        # For now, return empty list
-        return []
+        return [dj_set async for dj_set in self.crawl_festival(festival_url, enhance=enhance, resume=False)]
+    
+    async def crawl_festival(
+        self,
+        festival_url: str,
+        enhance: bool = False,
+        resume: bool = True
+    ) -> AsyncIterator[DJSetInfo]:
+        """
+        Stream every DJ set linked from a festival page.
+        
+        Follows the festival's pagination and fetches set pages concurrently.
+        An interrupted crawl is checkpointed and, with ``resume``, continues
+        with the sets it had not finished.
+        
+        Args:
+            festival_url: 1001 Tracklists festival page URL
+            enhance: Whether to enhance tracks with external data
+            resume: Continue an interrupted crawl of this festival
+        
+        Yields:
+            DJ sets in completion order
+        """
+        seeds = [CrawlTask(festival_url, 'festival')]
+        async with aclosing(self._crawl(f"festival-{self._get_cache_key(festival_url)}", seeds, enhance, resume)) as sets:
+            async for dj_set in sets:
+                yield dj_set
+    
+    async def crawl_dj_sets(
+        self,
+        dj_name: str,
+        limit: Optional[int] = None,
+        enhance: bool = False,
+        resume: bool = True
+    ) -> AsyncIterator[DJSetInfo]:
+        """
+        Stream a DJ's sets from their profile pages.
+        
+        A crawl with a ``limit`` stops with pages still queued, so it neither
+        resumes nor writes a checkpoint; a later full crawl starts from the
+        profile pages instead of skipping what the limited one had queued.
+        
+        Args:
+            dj_name: DJ name
+            limit: Stop after this many sets
+            enhance: Whether to enhance tracks with external data
+            resume: Continue an interrupted crawl of this DJ (unlimited crawls only)
+        
+        Yields:
+            DJ sets in completion order
+        """
+        dj_slug = re.sub(r'[^a-z0-9-]', '', dj_name.lower().replace(' ', '-').replace('_', '-'))
+        seeds = [
+            CrawlTask(f"{self.BASE_URL}/{section}/{dj_slug}", 'profile', data={'dj': dj_name})
+            for section in ('dj', 'artist', 'djs')
+        ]
+        
+        count = 0
+        crawl = self._crawl(f"dj-{dj_slug}", seeds, enhance, resume, checkpoint=not limit)
+        async with aclosing(crawl) as sets:
+            async for dj_set in sets:
+                yield dj_set
+                count += 1
+                if limit and count >= limit:
+                    break
+    
+    async def _crawl(
+        self,
+        crawl_id: str,
+        seeds: List[CrawlTask],
+        enhance: bool,
+        resume: bool,
+        checkpoint: bool = True
+    ) -> AsyncIterator[DJSetInfo]:
+        """Run a crawl, checkpointed under ``crawl_id`` unless ``checkpoint`` is off."""
+        async def handle(task: CrawlTask) -> Tuple[Optional[DJSetInfo], List[CrawlTask]]:
+            if task.kind == 'tracklist':
+                dj_set = await self.get_tracklist(task.url, enhance=enhance)
+                return self._apply_listing_context(dj_set, task.data), []
+            return None, await self._expand_listing(task)
+        
+        crawler = Crawler(
+            handle,
+            concurrency=self.crawl_concurrency,
+            state_path=default_state_dir() / f"1001tracklists-{crawl_id}.json" if checkpoint else None,
+            resume=resume and checkpoint,
+        )
+        async with aclosing(crawler.crawl(seeds)) as results:
+            async for dj_set in results:
+                yield dj_set
+        
+        stats = crawler.get_stats()
+        if stats['failed']:
+            logger.info(f"Crawl {crawl_id}: {stats['done']} pages done, {stats['failed']} failed")
+    
+    async def _expand_listing(self, task: CrawlTask) -> List[CrawlTask]:
+        """Discover set pages and further listing pages from a festival or profile page."""
+        html, _ = await self._fetch_html(task.url)
+        
+        if task.kind == 'festival':
+            sets = parse_festival_page(html, self.BASE_URL)
+        else:
+            sets = parse_profile_page(html, task.data.get('dj'), self.BASE_URL)
+        
+        tasks = [
+            CrawlTask(set_info['url'], 'tracklist', task.depth + 1, data=set_info)
+            for set_info in sets
+            if set_info['type'] == 'tracklist'
+        ]
+        tasks.extend(
+            CrawlTask(url, task.kind, task.depth, data=task.data)
+            for url in parse_next_pages(html, task.url)
+        )
+        return tasks
+    
+    def _apply_listing_context(self, dj_set: DJSetInfo, listing: Dict[str, Any]) -> DJSetInfo:
+        """Fill DJ and event names the set page lacked from the page that linked to it."""
+        if not dj_set.dj_name and listing.get('dj'):
+            dj_set.dj_name = listing['dj']
+        if not dj_set.event_name and (listing.get('festival') or listing.get('event')):
+            dj_set.event_name = listing.get('festival') or listing.get('event')
+        return dj_set
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Close the HTTP client and enrichment providers."""
+        await self.client.aclose()
+        if self._enricher is not None:
+            await self._enricher.close()
\ No newline at end of file
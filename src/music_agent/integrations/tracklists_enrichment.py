@@ -0,0 +1,420 @@
+"""
+Track metadata enrichment for DJ set tracklists.
+
+The same tracks recur across sets, so enrichment works on unique track
+identities rather than on set positions: tracks from every set passed in
+are grouped by a normalized artist/title/remix key, each key is looked up
+in a persistent identity cache, and only the misses are sent to the
+external catalogs. Each catalog lookup runs concurrently with the others
+under that platform's own rate budget (the clients' limiters), and
+concurrent enrichments of the same track share one lookup.
+"""
+
+import os
+import re
+import asyncio
+import logging
+import unicodedata
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..cache import CacheManager, build_cache
+
+logger = logging.getLogger(__name__)
+
+# Metadata fields a provider may fill, in TrackMetadata terms
+METADATA_FIELDS = ('bpm', 'key', 'genre', 'discogs_id', 'beatport_url', 'musicbrainz_id')
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_SPACE_RE = re.compile(r'\s+')
+_FEATURING_RE = re.compile(r'\s+(?:feat\.?|ft\.?|featuring)\s+.*$', re.I)
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _normalize(text: Optional[str]) -> str:
+    """Case-, accent- and punctuation-insensitive form of a name."""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = _PUNCTUATION_RE.sub(' ', text.lower())
+    return _SPACE_RE.sub(' ', text).strip()
+
+
+def track_identity(artist: str, title: str, remix: Optional[str] = None) -> str:
+    """
+    Build the cache identity of a track.
+
+    Args:
+        artist: Track artist
+        title: Track title
+        remix: Remix/version name
+
+    Returns:
+        Normalized ``artist|title|remix`` key
+    """
+    return '|'.join((
+        _normalize(_FEATURING_RE.sub('', artist or '')),
+        _normalize(title),
+        _normalize(remix),
+    ))
+
+
+def _lucene_escape(text: str) -> str:
+    return _LUCENE_SPECIAL_RE.sub(r'\\\1', text)
+
+
+@dataclass
+class EnrichmentConfig:
+    """Track enrichment configuration."""
+
+    providers: Tuple[str, ...] = ('discogs', 'beatport', 'musicbrainz')
+    cache_path: str = "~/.music_agent_cache/track_identity.db"
+    cache_ttl: int = 30 * 24 * 3600  # Found metadata (30 days)
+    miss_ttl: int = 24 * 3600  # Tracks no catalog knows yet (1 day)
+    max_cache_bytes: int = 50 * 1024 * 1024
+    max_concurrency: int = 16  # Unique tracks resolved at once
+    musicbrainz_min_score: int = 90
+
+    @classmethod
+    def from_env(cls) -> "EnrichmentConfig":
+        """Create configuration from environment variables."""
+        providers = os.getenv("TRACK_ENRICHMENT_PROVIDERS", "discogs,beatport,musicbrainz")
+        return cls(
+            providers=tuple(name.strip().lower() for name in providers.split(',') if name.strip()),
+            cache_path=os.getenv("TRACK_ENRICHMENT_CACHE_PATH", "~/.music_agent_cache/track_identity.db"),
+            cache_ttl=int(os.getenv("TRACK_ENRICHMENT_CACHE_TTL", str(30 * 24 * 3600))),
+            miss_ttl=int(os.getenv("TRACK_ENRICHMENT_MISS_TTL", str(24 * 3600))),
+            max_concurrency=int(os.getenv("TRACK_ENRICHMENT_CONCURRENCY", "16")),
+        )
+
+
+class EnrichmentProvider(ABC):
+    """A catalog that can identify a track."""
+
+    name = "base"
+
+    @abstractmethod
+    async def lookup(self, artist: str, title: str, remix: Optional[str]) -> Dict[str, Any]:
+        """
+        Look up a track.
+
+        Args:
+            artist: Track artist
+            title: Track title
+            remix: Remix/version name
+
+        Returns:
+            Metadata fields found (empty if the track is unknown)
+        """
+
+    async def close(self) -> None:
+        """Release provider resources."""
+
+
+class DiscogsProvider(EnrichmentProvider):
+    """Genre and release ID from the Discogs database search."""
+
+    name = "discogs"
+
+    def __init__(self, client=None):
+        from .discogs import AsyncDiscogsClient
+        self.client = client or AsyncDiscogsClient()
+
+    async def lookup(self, artist: str, title: str, remix: Optional[str]) -> Dict[str, Any]:
+        query = f"{artist} {title}"
+        if remix:
+            query += f" {remix}"
+
+        results = await self.client.search(query, per_page=1)
+        if not results:
+            return {}
+
+        result = results[0]
+        return {
+            'genre': result['genre'][0] if result.get('genre') else None,
+            'discogs_id': result.get('id'),
+        }
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class BeatportProvider(EnrichmentProvider):
+    """BPM, key and genre from Beatport's track search."""
+
+    name = "beatport"
+
+    def __init__(self, client=None):
+        from .beatport import BeatportClient
+        self.client = client or BeatportClient()
+        # The sync client paces requests itself; bound the threads using it
+        self._semaphore = asyncio.Semaphore(self.client.config.max_concurrency)
+
+    async def lookup(self, artist: str, title: str, remix: Optional[str]) -> Dict[str, Any]:
+        query = f"{artist} {title}"
+        if remix:
+            query += f" {remix}"
+
+        async with self._semaphore:
+            tracks = await asyncio.to_thread(self.client.search_tracks, query, per_page=1)
+        if not tracks:
+            return {}
+
+        track = tracks[0]
+        return {
+            'bpm': float(track.bpm) if track.bpm else None,
+            'key': (track.key.short_name or track.key.name) if track.key else None,
+            'genre': track.genre.name if track.genre else None,
+            'beatport_url': track.url,
+        }
+
+
+class MusicBrainzProvider(EnrichmentProvider):
+    """Recording ID from a MusicBrainz recording search."""
+
+    name = "musicbrainz"
+
+    def __init__(self, client=None, min_score: int = 90):
+        from .musicbrainz import AsyncMusicBrainzClient
+        self.client = client or AsyncMusicBrainzClient()
+        self.min_score = min_score
+
+    async def lookup(self, artist: str, title: str, remix: Optional[str]) -> Dict[str, Any]:
+        from .musicbrainz import EntityType
+
+        query = f'recording:"{_lucene_escape(title)}" AND artist:"{_lucene_escape(artist)}"'
+        results = await self.client.search(query, EntityType.RECORDING, limit=1)
+        if not results.results or results.results[0].score < self.min_score:
+            return {}
+        return {'musicbrainz_id': results.results[0].id}
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def _provider_configured(name: str) -> bool:
+    """Whether credentials for a provider are present."""
+    if name == 'discogs':
+        return bool(os.getenv("DISCOGS_USER_TOKEN") or (os.getenv("DISCOGS_CONSUMER_KEY") and os.getenv("DISCOGS_CONSUMER_SECRET")))
+    if name == 'beatport':
+        return bool(os.getenv("BEATPORT_ACCESS_TOKEN") or (os.getenv("BEATPORT_USERNAME") and os.getenv("BEATPORT_PASSWORD")))
+    return name == 'musicbrainz'
+
+
+def create_providers(config: EnrichmentConfig) -> List[EnrichmentProvider]:
+    """
+    Create the configured providers that have credentials.
+
+    Args:
+        config: Enrichment configuration
+
+    Returns:
+        Providers in precedence order
+    """
+    factories = {
+        'discogs': DiscogsProvider,
+        'beatport': BeatportProvider,
+        'musicbrainz': lambda: MusicBrainzProvider(min_score=config.musicbrainz_min_score),
+    }
+
+    providers = []
+    for name in config.providers:
+        if name not in factories or not _provider_configured(name):
+            continue
+        try:
+            providers.append(factories[name]())
+        except (ImportError, ValueError) as e:
+            logger.warning(f"Track enrichment provider '{name}' disabled: {e}")
+    return providers
+
+
+@dataclass
+class EnrichmentStats:
+    """Counters for one enrichment run."""
+
+    tracks: int = 0
+    unique: int = 0
+    cache_hits: int = 0
+    looked_up: int = 0
+    failed: int = 0
+    enriched: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary."""
+        return dict(self.__dict__)
+
+
+class TrackEnricher:
+    """Cache-first, deduplicated, concurrent track enrichment."""
+
+    def __init__(
+        self,
+        config: Optional[EnrichmentConfig] = None,
+        providers: Optional[List[EnrichmentProvider]] = None,
+        cache: Optional[CacheManager] = None
+    ):
+        """
+        Initialize enricher.
+
+        Args:
+            config: Configuration (loads from environment if not provided)
+            providers: Catalog providers in precedence order (created from
+                the configuration if not provided)
+            cache: Track identity cache (a memory + SQLite cache at
+                ``config.cache_path`` if not provided)
+        """
+        self.config = config or EnrichmentConfig.from_env()
+        self.providers = providers if providers is not None else create_providers(self.config)
+        self.cache = cache or build_cache(
+            namespace="track_identity",
+            default_ttl=self.config.cache_ttl,
+            max_entries=10000,
+            disk_path=os.path.expanduser(self.config.cache_path),
+            max_disk_bytes=self.config.max_cache_bytes,
+        )
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+    async def _lookup(self, artist: str, title: str, remix: Optional[str]) -> Dict[str, Any]:
+        """Query every provider concurrently and merge by precedence."""
+        async with self._semaphore:
+            results = await asyncio.gather(
+                *(provider.lookup(artist, title, remix) for provider in self.providers),
+                return_exceptions=True,
+            )
+
+        metadata: Dict[str, Any] = {}
+        errors = []
+        for provider, result in zip(self.providers, results):
+            if isinstance(result, BaseException):
+                logger.debug(f"{provider.name} lookup failed for {artist} - {title}: {result}")
+                errors.append(result)
+                continue
+            for name, value in result.items():
+                if value is not None and metadata.get(name) is None:
+                    metadata[name] = value
+
+        # Don't cache "unknown" when the catalogs could not be asked
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        return metadata
+
+    async def resolve(self, artist: str, title: str, remix: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get metadata for one track, from the cache or the providers.
+
+        Args:
+            artist: Track artist
+            title: Track title
+            remix: Remix/version name
+
+        Returns:
+            Metadata fields found (empty if no catalog knows the track)
+        """
+        key = track_identity(artist, title, remix)
+        looked_up = False
+
+        async def lookup() -> Dict[str, Any]:
+            nonlocal looked_up
+            looked_up = True
+            return await self._lookup(artist, title, remix)
+
+        metadata = await self.cache.get_or_set(key, lookup, ttl=self.config.cache_ttl)
+        if looked_up and not metadata:
+            # Unknown tracks are retried sooner than found ones expire
+            await self.cache.set(key, metadata, self.config.miss_ttl)
+        return metadata
+
+    async def enrich_tracks(self, tracks: Iterable[Any]) -> EnrichmentStats:
+        """
+        Enrich tracks in place.
+
+        Tracks sharing an identity are resolved once; ID and artist-less
+        tracks are skipped.
+
+        Args:
+            tracks: ``DJSetTrack`` objects (from any number of sets)
+
+        Returns:
+            Run statistics
+        """
+        stats = EnrichmentStats()
+        groups: Dict[str, List[Any]] = {}
+        for track in tracks:
+            if track.is_id or not track.artist:
+                continue
+            stats.tracks += 1
+            groups.setdefault(track_identity(track.artist, track.title, track.remix), []).append(track)
+        stats.unique = len(groups)
+
+        if not groups or not self.providers:
+            return stats
+
+        cached = await asyncio.gather(*(self.cache.get(key) for key in groups))
+        pending = []
+        for (key, group), metadata in zip(groups.items(), cached):
+            if metadata is not None:
+                stats.cache_hits += 1
+                stats.enriched += self._apply(group, metadata)
+            else:
+                pending.append(group)
+
+        stats.looked_up = len(pending)
+        results = await asyncio.gather(
+            *(self.resolve(group[0].artist, group[0].title, group[0].remix) for group in pending),
+            return_exceptions=True,
+        )
+        for group, metadata in zip(pending, results):
+            if isinstance(metadata, BaseException):
+                stats.failed += 1
+                continue
+            stats.enriched += self._apply(group, metadata)
+
+        return stats
+
+    async def enrich_sets(self, dj_sets: Iterable[Any]) -> EnrichmentStats:
+        """
+        Enrich every track of several sets in one batch.
+
+        Args:
+            dj_sets: ``DJSetInfo`` objects
+
+        Returns:
+            Run statistics
+        """
+        return await self.enrich_tracks(track for dj_set in dj_sets for track in dj_set.tracks)
+
+    @staticmethod
+    def _apply(group: List[Any], metadata: Dict[str, Any]) -> int:
+        """Copy metadata onto every track in a group."""
+        if not metadata:
+            return 0
+        for track in group:
+            for name in METADATA_FIELDS:
+                value = metadata.get(name)
+                if value is not None:
+                    setattr(track.metadata, name, value)
+        return len(group)
+
+    async def close(self) -> None:
+        """Close providers and the cache."""
+        for provider in self.providers:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.debug(f"Failed to close {provider.name} provider: {e}")
+        await self.cache.close()
+
+
+__all__ = [
+    "EnrichmentConfig",
+    "EnrichmentProvider",
+    "DiscogsProvider",
+    "BeatportProvider",
+    "MusicBrainzProvider",
+    "EnrichmentStats",
+    "TrackEnricher",
+    "create_providers",
+    "track_identity",
+]
@@ -0,0 +1,987 @@
+"""
+Page parsers for the 1001 Tracklists integrations.
+
+Tracklist pages have two interchangeable backends:
+- ``SoupTracklistParser``: BeautifulSoup on the pure-Python ``html.parser``
+  (the reference implementation)
+- ``LxmlTracklistParser``: libxml2 via lxml, extracting every field in a
+  single walk over the document with precompiled patterns
+
+Their output is identical on well-formed markup. On invalid nesting the two
+tree builders repair the document differently, and fields can differ:
+libxml2 closes an ``<h1>`` at a block element inside it (shortening
+``title``) and closes unclosed ``<tr>`` rows that ``html.parser`` nests
+into each other (changing ``tracks``). ``get_tracklist_parser`` picks lxml
+when it is installed unless ``TRACKLISTS_PARSER`` says otherwise; set it to
+``soup`` for the reference output.
+
+Festival and DJ profile pages are parsed into set links by
+``parse_festival_page`` and ``parse_profile_page``, shared by the simple
+scraper and the crawler.
+"""
+
+import os
+import re
+import bisect
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Precompiled patterns shared by both backends
+GENRE_CLASS_RE = re.compile('tag|genre')
+TRACK_DIV_CLASS_RE = re.compile('tlpItem|trackItem|track')
+TRACK_ROW_CLASS_RE = re.compile('tlpItem|track')
+TRACK_ITEM_CLASS_RE = re.compile('track')
+CUE_CLASS_RE = re.compile('cue|time|timestamp')
+LABEL_CLASS_RE = re.compile('label')
+DATE_CLASSES = ('date', 'eventDate', 'tlDate')
+
+WHITESPACE_RE = re.compile(r'\s+')
+LEADING_NUMBER_RE = re.compile(r'^\d+\.?\s*')
+LEADING_TIMESTAMP_RE = re.compile(r'^\[?[\d:]+\]?\s*')
+TRACK_TEXT_PATTERNS = (
+    # Artist - Title (Remix)
+    re.compile(r'^([^-]+?)\s*-\s*([^(]+?)(?:\s*\(([^)]+)\))?$'),
+    # Artist - Title [Label]
+    re.compile(r'^([^-]+?)\s*-\s*([^[]+?)(?:\s*\[[^\]]+\])?$'),
+    # Artist: Title
+    re.compile(r'^([^:]+?):\s*(.+)$'),
+)
+FALLBACK_TRACK_RE = re.compile(r'(?:^\d+\.?\s*)?(?:\[?[\d:]+\]?\s*)?([^-]+?)\s*-\s*(.+)')
+
+RECORDING_LINK_PATTERNS: Tuple[Tuple[str, Tuple[Any, ...]], ...] = tuple(
+    (platform, tuple(re.compile(pattern) for pattern in patterns))
+    for platform, patterns in (
+        ('soundcloud', ('soundcloud.com',)),
+        ('mixcloud', ('mixcloud.com',)),
+        ('youtube', ('youtube.com', 'youtu.be')),
+        ('spotify', ('spotify.com',)),
+    )
+)
+STAT_PATTERNS = tuple(
+    (stat_type, re.compile(stat_type, re.I))
+    for stat_type in ('views', 'plays', 'likes', 'favorites')
+)
+NUMBER_RE = re.compile(r'\d+')
+
+FALLBACK_TRACK_LIMIT = 200
+
+
+def parse_track_text(text: str) -> Dict[str, Optional[str]]:
+    """
+    Parse track text into artist/title/remix components.
+
+    Args:
+        text: Track text
+
+    Returns:
+        Dictionary with artist, title and remix (None when not found)
+    """
+    result = {
+        'artist': None,
+        'title': None,
+        'remix': None
+    }
+
+    # Clean up text
+    text = WHITESPACE_RE.sub(' ', text)
+    text = LEADING_NUMBER_RE.sub('', text)  # Remove leading number
+    text = LEADING_TIMESTAMP_RE.sub('', text)  # Remove timestamp
+
+    for pattern in TRACK_TEXT_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            groups = match.groups()
+            result['artist'] = groups[0].strip() if groups[0] else None
+            result['title'] = groups[1].strip() if len(groups) > 1 and groups[1] else None
+            if len(groups) > 2 and groups[2]:
+                result['remix'] = groups[2].strip()
+            break
+
+    # Fallback: assume entire text is title
+    if not result['artist'] and not result['title']:
+        result['title'] = text.strip()
+
+    return result
+
+
+def build_track(position: int, cue: Optional[str], track_text: str, label: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Build a track record from the text pieces of its container.
+
+    Args:
+        position: 1-based container position
+        cue: Cue time text (None if no cue element)
+        track_text: Container text joined with spaces
+        label: Label text (None if no label element)
+
+    Returns:
+        Track dictionary, or None if the container is not a track
+    """
+    track = {
+        'position': position,
+        'cue': cue,
+        'artist': None,
+        'title': None,
+        'remix': None,
+        'label': None,
+        'mix_type': None,
+        'is_id': False
+    }
+
+    # Check if it's an ID track
+    if 'ID - ID' in track_text or 'Unknown' in track_text:
+        track['is_id'] = True
+        track['artist'] = 'ID'
+        track['title'] = 'ID'
+    else:
+        # Parse artist - title pattern
+        track.update(parse_track_text(track_text))
+
+    # Extract mix type (w/, into, etc.)
+    if ' w/ ' in track_text:
+        track['mix_type'] = 'w/'
+    elif ' into ' in track_text.lower():
+        track['mix_type'] = 'into'
+
+    if label is not None:
+        track['label'] = label
+
+    return track if (track['artist'] or track['is_id']) else None
+
+
+def extract_tracks_from_text(text: str) -> List[Dict[str, Any]]:
+    """
+    Fallback track extraction from the page's plain text.
+
+    Args:
+        text: Whole-document text
+
+    Returns:
+        List of track dictionaries
+    """
+    tracks = []
+
+    position = 1
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line or len(line) < 5:
+            continue
+
+        match = FALLBACK_TRACK_RE.match(line)
+        if match:
+            tracks.append({
+                'position': position,
+                'cue': None,
+                'artist': match.group(1).strip(),
+                'title': match.group(2).strip(),
+                'remix': None,
+                'label': None,
+                'mix_type': None,
+                'is_id': 'ID' in line
+            })
+            position += 1
+
+        if position > FALLBACK_TRACK_LIMIT:  # Sanity limit
+            break
+
+    return tracks
+
+
+def event_from_description(content: Optional[str]) -> Optional[str]:
+    """Extract an event name from a meta description ("... at Event, ...")."""
+    if content and ' at ' in content:
+        parts = content.split(' at ')
+        if len(parts) > 1:
+            return parts[1].split(',')[0].strip()
+    return None
+
+
+def stats_from_texts(found: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build the stats dictionary from the text around each stat keyword.
+
+    Args:
+        found: Stat type -> text of the element containing the keyword
+
+    Returns:
+        Stats dictionary
+    """
+    stats = {
+        'views': None,
+        'favorites': None,
+        'comments': None
+    }
+
+    for stat_type, _ in STAT_PATTERNS:
+        text = found.get(stat_type)
+        if text is None:
+            continue
+        numbers = NUMBER_RE.findall(text)
+        if numbers:
+            if 'view' in stat_type or 'play' in stat_type:
+                stats['views'] = int(numbers[0])
+            elif 'fav' in stat_type or 'like' in stat_type:
+                stats['favorites'] = int(numbers[0])
+
+    return stats
+
+
+class TracklistParser(ABC):
+    """Extracts structured tracklist data from a tracklist page."""
+
+    name = "base"
+
+    def parse(self, url: str, html: str) -> Dict[str, Any]:
+        """
+        Parse a tracklist page.
+
+        Args:
+            url: Page URL
+            html: Page HTML
+
+        Returns:
+            Structured tracklist data
+        """
+        data = self._parse(html)
+        return {
+            'url': url,
+            **data,
+            'extracted_at': datetime.utcnow().isoformat()
+        }
+
+    @abstractmethod
+    def _parse(self, html: str) -> Dict[str, Any]:
+        """Extract title, dj, event, date, genres, tracks, recording_links and stats."""
+
+
+class SoupTracklistParser(TracklistParser):
+    """BeautifulSoup backend (reference implementation)."""
+
+    name = "soup"
+
+    def _parse(self, html: str) -> Dict[str, Any]:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        return {
+            'title': self._extract_title(soup),
+            'dj': self._extract_dj(soup),
+            'event': self._extract_event(soup),
+            'date': self._extract_date(soup),
+            'genres': self._extract_genres(soup),
+            'tracks': self._extract_tracks(soup),
+            'recording_links': self._extract_recording_links(soup),
+            'stats': self._extract_stats(soup),
+        }
+
+    def _extract_title(self, soup: BeautifulSoup) -> str:
+        """Extract tracklist title."""
+        # Try meta property first
+        meta = soup.find('meta', {'property': 'og:title'})
+        if meta and meta.get('content'):
+            return meta['content']
+
+        # Try h1 title
+        h1 = soup.find('h1')
+        if h1:
+            return h1.get_text(strip=True)
+
+        # Fallback to page title
+        title = soup.find('title')
+        if title:
+            return title.get_text(strip=True)
+
+        return "Unknown Tracklist"
+
+    def _extract_dj(self, soup: BeautifulSoup) -> str:
+        """Extract DJ/artist name."""
+        # Look for DJ name in various places
+        dj_elem = soup.find('span', {'class': 'djName'})
+        if dj_elem:
+            return dj_elem.get_text(strip=True)
+
+        # Try to extract from title
+        title = self._extract_title(soup)
+        if ' @ ' in title:
+            return title.split(' @ ')[0].strip()
+
+        return "Unknown DJ"
+
+    def _extract_event(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extract event/venue name."""
+        # Look for event info
+        event_elem = soup.find('span', {'class': 'eventName'})
+        if event_elem:
+            return event_elem.get_text(strip=True)
+
+        # Try meta description
+        meta = soup.find('meta', {'name': 'description'})
+        if meta and meta.get('content'):
+            return event_from_description(meta['content'])
+
+        return None
+
+    def _extract_date(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extract date of the set."""
+        # Look for date element
+        date_elem = soup.find('time')
+        if date_elem:
+            return date_elem.get('datetime', date_elem.get_text(strip=True))
+
+        # Look in various date classes
+        for class_name in DATE_CLASSES:
+            elem = soup.find(class_=class_name)
+            if elem:
+                return elem.get_text(strip=True)
+
+        return None
+
+    def _extract_genres(self, soup: BeautifulSoup) -> List[str]:
+        """Extract music genres."""
+        genres = []
+
+        # Look for genre tags
+        for elem in soup.find_all('a', {'class': GENRE_CLASS_RE}):
+            genre = elem.get_text(strip=True)
+            if genre and genre not in genres:
+                genres.append(genre)
+
+        return genres
+
+    def _extract_tracks(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Extract track information."""
+        tracks = []
+
+        # Find track container (varies by page type)
+        track_containers = (
+            soup.find_all('div', {'class': TRACK_DIV_CLASS_RE}) or
+            soup.find_all('tr', {'class': TRACK_ROW_CLASS_RE}) or
+            soup.find_all('li', {'class': TRACK_ITEM_CLASS_RE})
+        )
+
+        for idx, container in enumerate(track_containers, 1):
+            track = self._parse_track(container, idx)
+            if track:
+                tracks.append(track)
+
+        # If no tracks found with class, try alternative parsing
+        if not tracks:
+            tracks = extract_tracks_from_text(soup.get_text())
+
+        return tracks
+
+    def _parse_track(self, container, position: int) -> Optional[Dict[str, Any]]:
+        """Parse individual track from container."""
+        cue_elem = container.find(class_=CUE_CLASS_RE)
+        label_elem = container.find(class_=LABEL_CLASS_RE)
+
+        return build_track(
+            position,
+            cue_elem.get_text(strip=True) if cue_elem else None,
+            container.get_text(' ', strip=True),
+            label_elem.get_text(strip=True) if label_elem else None,
+        )
+
+    def _extract_recording_links(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Extract links to recordings (SoundCloud, Mixcloud, etc.)."""
+        links = {}
+
+        # Look for player embeds and links
+        for platform, patterns in RECORDING_LINK_PATTERNS:
+            for pattern in patterns:
+                link = soup.find('a', href=pattern)
+                if link:
+                    links[platform] = link['href']
+                # Also check iframes
+                iframe = soup.find('iframe', src=pattern)
+                if iframe:
+                    links[platform] = iframe['src']
+
+        return links
+
+    def _extract_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Extract view counts, favorites, etc."""
+        found = {}
+
+        # Look for stat elements
+        for stat_type, pattern in STAT_PATTERNS:
+            elem = soup.find(string=pattern)
+            if elem and elem.parent:
+                found[stat_type] = elem.parent.get_text()
+
+        return stats_from_texts(found)
+
+
+# Tags whose strings BeautifulSoup keeps out of get_text() of other tags
+_STRING_CONTAINERS = frozenset(('rt', 'rp', 'style', 'script', 'template'))
+_PRESERVE_WHITESPACE = frozenset(('pre', 'textarea'))
+_ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+_COMMENT = 'comment'
+_DOCTYPE = 'doctype'
+
+
+class LxmlTracklistParser(TracklistParser):
+    """
+    lxml backend.
+
+    Matches ``SoupTracklistParser`` on well-formed markup only; libxml2
+    repairs invalid nesting differently from ``html.parser`` (see the
+    module docstring).
+
+    Walks the document once, recording every text node with the string
+    type BeautifulSoup would give it and every element's span of text nodes
+    and descendants. Every field is then answered from those records: the
+    first element matching each selector, text of any element as a slice of
+    the text nodes, and the first cue/label inside a track container by
+    bisecting the sorted positions of the cue/label elements.
+    """
+
+    name = "lxml"
+
+    def __init__(self):
+        """Initialize parser."""
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required for the lxml tracklist parser. Install with: pip install lxml")
+        self._fallback = SoupTracklistParser()
+
+    def _parse(self, html: str) -> Dict[str, Any]:
+        try:
+            parser = etree.HTMLParser(encoding='utf-8')
+            root = etree.fromstring(html.encode('utf-8'), parser)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"lxml could not parse page, using BeautifulSoup: {e}")
+            root = None
+
+        if root is None:
+            return self._fallback._parse(html)
+
+        return _Document(root).extract()
+
+
+class _Document:
+    """Single-pass index over an lxml tree."""
+
+    def __init__(self, root):
+        # Text nodes in document order: (text, string type, parent element index)
+        self.strings: List[Tuple[str, Optional[str], int]] = []
+        # Elements in document order: [element, first string, end string, end element]
+        self.elements: List[list] = []
+
+        self.og_title = self.h1 = self.title = None
+        self.dj_name = self.event_name = self.description = self.time = None
+        self.date_classes: Dict[str, int] = {}
+        self.genres: List[int] = []
+        self.track_divs: List[int] = []
+        self.track_rows: List[int] = []
+        self.track_items: List[int] = []
+        self.cues: List[int] = []
+        self.labels: List[int] = []
+        self.link_hrefs: Dict[Any, str] = {}
+        self.iframe_srcs: Dict[Any, str] = {}
+
+        doctype = root.getroottree().docinfo.doctype
+        if doctype:
+            # BeautifulSoup keeps the declaration body as a string
+            body = doctype[len('<!DOCTYPE'):].rstrip('>').strip()
+            self.strings.append((body, _DOCTYPE, -1))
+
+        self._walk(root)
+
+    def _add_string(self, text: Optional[str], string_type: Optional[str], parent: int, preserve: bool) -> None:
+        if not text:
+            return
+        if not preserve and all(char in _ASCII_SPACES for char in text):
+            text = '\n' if '\n' in text else ' '
+        self.strings.append((text, string_type, parent))
+
+    def _walk(self, root) -> None:
+        """Record strings and elements, and match every selector."""
+        strings = self.strings
+        elements = self.elements
+        # Open elements: (element index, string type inside it, preserves whitespace)
+        stack: List[Tuple[int, Optional[str], bool]] = []
+
+        for event, el in etree.iterwalk(root, events=('start', 'end')):
+            tag = el.tag
+
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                if event == 'start':
+                    parent, string_type, preserve = stack[-1] if stack else (-1, None, False)
+                    if tag is etree.Comment:
+                        self._add_string(el.text, _COMMENT, parent, preserve)
+                else:
+                    parent, string_type, preserve = stack[-1] if stack else (-1, None, False)
+                    self._add_string(el.tail, string_type, parent, preserve)
+                continue
+
+            if event == 'start':
+                index = len(elements)
+                elements.append([el, len(strings), 0, 0])
+
+                _, outer_type, outer_preserve = stack[-1] if stack else (-1, None, False)
+                string_type = tag if tag in _STRING_CONTAINERS else outer_type
+                preserve = outer_preserve or tag in _PRESERVE_WHITESPACE
+                stack.append((index, string_type, preserve))
+
+                self._match(index, el, tag)
+                self._add_string(el.text, string_type, index, preserve)
+            else:
+                index, _, _ = stack.pop()
+                record = elements[index]
+                record[2] = len(strings)
+                record[3] = len(elements)
+
+                parent, string_type, preserve = stack[-1] if stack else (-1, None, False)
+                self._add_string(el.tail, string_type, parent, preserve)
+
+    def _match(self, index: int, el, tag: str) -> None:
+        """Record the element against every selector it satisfies."""
+        attrib = el.attrib
+        css_class = attrib.get('class')
+
+        if tag == 'meta':
+            if self.og_title is None and attrib.get('property') == 'og:title':
+                self.og_title = index
+            if self.description is None and attrib.get('name') == 'description':
+                self.description = index
+        elif tag == 'h1':
+            if self.h1 is None:
+                self.h1 = index
+        elif tag == 'title':
+            if self.title is None:
+                self.title = index
+        elif tag == 'time':
+            if self.time is None:
+                self.time = index
+        elif tag == 'a':
+            href = attrib.get('href')
+            if href is not None:
+                for _, patterns in RECORDING_LINK_PATTERNS:
+                    for pattern in patterns:
+                        if pattern not in self.link_hrefs and pattern.search(href):
+                            self.link_hrefs[pattern] = href
+        elif tag == 'iframe':
+            src = attrib.get('src')
+            if src is not None:
+                for _, patterns in RECORDING_LINK_PATTERNS:
+                    for pattern in patterns:
+                        if pattern not in self.iframe_srcs and pattern.search(src):
+                            self.iframe_srcs[pattern] = src
+
+        if css_class is None:
+            return
+
+        tokens = css_class.split()
+        if tag == 'span':
+            if self.dj_name is None and 'djName' in tokens:
+                self.dj_name = index
+            if self.event_name is None and 'eventName' in tokens:
+                self.event_name = index
+
+        for class_name in DATE_CLASSES:
+            if class_name not in self.date_classes and class_name in tokens:
+                self.date_classes[class_name] = index
+
+        if tag == 'a' and GENRE_CLASS_RE.search(css_class):
+            self.genres.append(index)
+        elif tag == 'div' and TRACK_DIV_CLASS_RE.search(css_class):
+            self.track_divs.append(index)
+        elif tag == 'tr' and TRACK_ROW_CLASS_RE.search(css_class):
+            self.track_rows.append(index)
+        elif tag == 'li' and TRACK_ITEM_CLASS_RE.search(css_class):
+            self.track_items.append(index)
+
+        if CUE_CLASS_RE.search(css_class):
+            self.cues.append(index)
+        if LABEL_CLASS_RE.search(css_class):
+            self.labels.append(index)
+
+    # Text
+
+    def text(self, index: int, separator: str = '', strip: bool = False) -> str:
+        """Equivalent of BeautifulSoup's ``get_text`` for an element."""
+        el, first, end, _ = self.elements[index]
+        wanted = el.tag if el.tag in _STRING_CONTAINERS else None
+        pieces = (text for text, string_type, _ in self.strings[first:end] if string_type == wanted)
+        if strip:
+            pieces = (piece for piece in (text.strip() for text in pieces) if piece)
+        return separator.join(pieces)
+
+    def document_text(self) -> str:
+        """Equivalent of BeautifulSoup's ``get_text`` for the whole page."""
+        return ''.join(text for text, string_type, _ in self.strings if string_type is None)
+
+    def first_within(self, candidates: List[int], index: int) -> Optional[int]:
+        """First candidate element that is a descendant of ``index``."""
+        end = self.elements[index][3]
+        position = bisect.bisect_right(candidates, index)
+        if position < len(candidates) and candidates[position] < end:
+            return candidates[position]
+        return None
+
+    # Fields
+
+    def extract(self) -> Dict[str, Any]:
+        title = self.extract_title()
+        return {
+            'title': title,
+            'dj': self.extract_dj(title),
+            'event': self.extract_event(),
+            'date': self.extract_date(),
+            'genres': self.extract_genres(),
+            'tracks': self.extract_tracks(),
+            'recording_links': self.extract_recording_links(),
+            'stats': self.extract_stats(),
+        }
+
+    def extract_title(self) -> str:
+        if self.og_title is not None:
+            content = self.elements[self.og_title][0].get('content')
+            if content:
+                return content
+        if self.h1 is not None:
+            return self.text(self.h1, strip=True)
+        if self.title is not None:
+            return self.text(self.title, strip=True)
+        return "Unknown Tracklist"
+
+    def extract_dj(self, title: str) -> str:
+        if self.dj_name is not None:
+            return self.text(self.dj_name, strip=True)
+        if ' @ ' in title:
+            return title.split(' @ ')[0].strip()
+        return "Unknown DJ"
+
+    def extract_event(self) -> Optional[str]:
+        if self.event_name is not None:
+            return self.text(self.event_name, strip=True)
+        if self.description is not None:
+            content = self.elements[self.description][0].get('content')
+            if content:
+                return event_from_description(content)
+        return None
+
+    def extract_date(self) -> Optional[str]:
+        if self.time is not None:
+            datetime_attr = self.elements[self.time][0].get('datetime')
+            return datetime_attr if datetime_attr is not None else self.text(self.time, strip=True)
+        for class_name in DATE_CLASSES:
+            index = self.date_classes.get(class_name)
+            if index is not None:
+                return self.text(index, strip=True)
+        return None
+
+    def extract_genres(self) -> List[str]:
+        genres = []
+        for index in self.genres:
+            genre = self.text(index, strip=True)
+            if genre and genre not in genres:
+                genres.append(genre)
+        return genres
+
+    def extract_tracks(self) -> List[Dict[str, Any]]:
+        containers = self.track_divs or self.track_rows or self.track_items
+
+        tracks = []
+        for position, index in enumerate(containers, 1):
+            cue = self.first_within(self.cues, index)
+            label = self.first_within(self.labels, index)
+            track = build_track(
+                position,
+                self.text(cue, strip=True) if cue is not None else None,
+                self.text(index, ' ', strip=True),
+                self.text(label, strip=True) if label is not None else None,
+            )
+            if track:
+                tracks.append(track)
+
+        if not tracks:
+            tracks = extract_tracks_from_text(self.document_text())
+
+        return tracks
+
+    def extract_recording_links(self) -> Dict[str, str]:
+        links = {}
+        for platform, patterns in RECORDING_LINK_PATTERNS:
+            for pattern in patterns:
+                if pattern in self.link_hrefs:
+                    links[platform] = self.link_hrefs[pattern]
+                if pattern in self.iframe_srcs:
+                    links[platform] = self.iframe_srcs[pattern]
+        return links
+
+    def extract_stats(self) -> Dict[str, Any]:
+        found = {}
+        for stat_type, pattern in STAT_PATTERNS:
+            for text, _, parent in self.strings:
+                if pattern.search(text):
+                    found[stat_type] = self.text(parent) if parent >= 0 else self.document_text()
+                    break
+        return stats_from_texts(found)
+
+
+# Listing pages (festival pages, DJ profiles)
+
+TRACKLIST_HREF_RE = re.compile(r'/tracklist/[a-z0-9]+/', re.I)
+LINEUP_CLASS_RE = re.compile(r'(lineup|artist|performer|dj|set)', re.I)
+PAGINATION_CLASS_RE = re.compile(r'pagination|pager', re.I)
+DJ_FROM_HREF_RE = re.compile(r'/([^/]+)-at-', re.I)
+STAGE_PATTERNS = (
+    re.compile(r'(?:stage|room|arena|floor)[:\s]+([^,\n]+)', re.I),
+    re.compile(r'@\s+([^,\n]+(?:stage|room|arena|tent))', re.I),
+)
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}')
+FESTIVAL_DATE_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
+    re.I
+)
+SET_TIME_RE = re.compile(r'\b(\d{1,2}:\d{2})\s*(?:AM|PM|am|pm)?\b')
+PROFILE_EVENT_RE = re.compile(r'@\s+([^,\n]+)|at\s+([^,\n]+)', re.I)
+
+
+def absolute_url(base_url: str, href: str) -> str:
+    """Resolve a site-relative link against the site root."""
+    return href if href.startswith('http') else base_url + href
+
+
+def parse_festival_page(html: str, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Extract the set links from a festival page.
+
+    Args:
+        html: Festival page HTML
+        base_url: Site root for relative links
+
+    Returns:
+        Sets with url, title, festival, dj, stage, date, time and type,
+        sorted by date and time
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    sets = []
+    seen = set()
+
+    # Extract festival name from page
+    festival_name = None
+    title_elem = soup.find(['h1', 'h2', 'title'])
+    if title_elem:
+        festival_name = title_elem.get_text(strip=True)
+
+    # Strategy 1: Look for tracklist links
+    for link in soup.find_all('a', href=TRACKLIST_HREF_RE):
+        link_text = link.get_text(strip=True)
+        set_info = {
+            'url': absolute_url(base_url, link.get('href', '')),
+            'title': link_text,
+            'festival': festival_name,
+            'dj': None,
+            'stage': None,
+            'date': None,
+            'time': None,
+            'type': 'tracklist'
+        }
+
+        # Common patterns: "DJ Name @ Stage" or "DJ Name - Time"
+        if ' @ ' in link_text:
+            parts = link_text.split(' @ ')
+            set_info['dj'] = parts[0].strip()
+            if len(parts) > 1:
+                set_info['stage'] = parts[1].strip()
+        elif ' - ' in link_text:
+            set_info['dj'] = link_text.split(' - ')[0].strip()
+        else:
+            # Try to extract DJ from the URL or title
+            url_match = DJ_FROM_HREF_RE.search(link.get('href', ''))
+            if url_match:
+                set_info['dj'] = url_match.group(1).replace('-', ' ').title()
+            else:
+                set_info['dj'] = link_text
+
+        # Look for additional metadata in parent container
+        parent = link.find_parent(['div', 'article', 'li', 'tr', 'section'])
+        if parent:
+            parent_text = parent.get_text(' ', strip=True)
+
+            for pattern in STAGE_PATTERNS:
+                stage_match = pattern.search(parent_text)
+                if stage_match:
+                    set_info['stage'] = stage_match.group(1).strip()
+                    break
+
+            date_match = FESTIVAL_DATE_RE.search(parent_text)
+            if date_match:
+                set_info['date'] = date_match.group(0)
+
+            time_match = SET_TIME_RE.search(parent_text)
+            if time_match:
+                set_info['time'] = time_match.group(0)
+
+        if set_info['url'] not in seen:
+            seen.add(set_info['url'])
+            sets.append(set_info)
+
+    # Strategy 2: If no tracklist links found, look for any festival lineup structure
+    if not sets:
+        for container in soup.find_all(['div', 'section', 'article'], class_=LINEUP_CLASS_RE):
+            container_date = None
+            for link in container.find_all('a', href=True):
+                href = link.get('href', '')
+                if '/tracklist/' in href or '/dj/' in href or '/artist/' in href:
+                    url = absolute_url(base_url, href)
+                    if url in seen:
+                        continue
+
+                    if container_date is None:
+                        date_match = DATE_RE.search(container.get_text())
+                        container_date = date_match.group(0) if date_match else ''
+
+                    seen.add(url)
+                    sets.append({
+                        'url': url,
+                        'title': link.get_text(strip=True),
+                        'festival': festival_name,
+                        'dj': link.get_text(strip=True),
+                        'stage': None,
+                        'date': container_date or None,
+                        'time': None,
+                        'type': 'tracklist' if '/tracklist/' in href else 'dj_profile'
+                    })
+
+    # Sort by date and time if available
+    def sort_key(set_info: Dict[str, Any]) -> str:
+        if set_info.get('date') and set_info.get('time'):
+            return f"{set_info['date']} {set_info['time']}"
+        return set_info.get('date') or ''
+
+    sets.sort(key=sort_key)
+    return sets
+
+
+def parse_profile_page(html: str, dj_name: str, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Extract the tracklist links from a DJ profile page.
+
+    Args:
+        html: Profile page HTML
+        dj_name: DJ the profile belongs to
+        base_url: Site root for relative links
+
+    Returns:
+        Sets with url, title, dj, event, date and type in page order
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    sets = []
+    seen = set()
+
+    for link in soup.find_all('a', href=TRACKLIST_HREF_RE):
+        set_info = {
+            'url': absolute_url(base_url, link.get('href', '')),
+            'title': link.get_text(strip=True),
+            'dj': dj_name,
+            'event': None,
+            'date': None,
+            'type': 'tracklist'
+        }
+        if set_info['url'] in seen:
+            continue
+
+        # Try to extract event and date from surrounding text
+        parent = link.find_parent(['div', 'article', 'li', 'tr'])
+        if parent:
+            parent_text = parent.get_text()
+
+            # Common patterns: "@ Event" or "at Venue"
+            event_match = PROFILE_EVENT_RE.search(parent_text)
+            if event_match:
+                set_info['event'] = (event_match.group(1) or event_match.group(2)).strip()
+
+            date_match = DATE_RE.search(parent_text)
+            if date_match:
+                set_info['date'] = date_match.group(0)
+
+        seen.add(set_info['url'])
+        sets.append(set_info)
+
+    return sets
+
+
+def parse_next_pages(html: str, page_url: str) -> List[str]:
+    """
+    Extract further pages of a paginated listing.
+
+    Only links inside pagination controls (or marked ``rel="next"``) that
+    stay under the listing's own path are returned.
+
+    Args:
+        html: Listing page HTML
+        page_url: URL of the page
+
+    Returns:
+        Absolute URLs of other listing pages
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    listing = urlparse(page_url)
+    prefix = listing.path.rsplit('/', 1)[0] + '/'
+
+    links = soup.find_all('a', rel='next')
+    for container in soup.find_all(class_=PAGINATION_CLASS_RE):
+        links.extend(container.find_all('a', href=True))
+
+    pages = []
+    for link in links:
+        href = link.get('href')
+        if not href:
+            continue
+        url = urljoin(page_url, href).split('#')[0]
+        parsed = urlparse(url)
+        if parsed.netloc == listing.netloc and parsed.path.startswith(prefix) and url != page_url and url not in pages:
+            pages.append(url)
+
+    return pages
+
+
+def get_tracklist_parser(backend: Optional[str] = None) -> TracklistParser:
+    """
+    Get a tracklist parser.
+
+    Args:
+        backend: ``lxml``, ``soup`` or ``auto`` (defaults to the
+            ``TRACKLISTS_PARSER`` environment variable, then ``auto``)
+
+    Returns:
+        Parser instance (lxml when available for ``auto``)
+    """
+    backend = (backend or os.getenv("TRACKLISTS_PARSER", "auto")).lower()
+
+    if backend == "soup":
+        return SoupTracklistParser()
+    if backend == "lxml" or (backend == "auto" and LXML_AVAILABLE):
+        return LxmlTracklistParser()
+    return SoupTracklistParser()
+
+
+__all__ = [
+    "TracklistParser",
+    "SoupTracklistParser",
+    "LxmlTracklistParser",
+    "get_tracklist_parser",
+    "parse_track_text",
+    "parse_festival_page",
+    "parse_profile_page",
+    "parse_next_pages",
+    "LXML_AVAILABLE",
+]
@@ -9,25 +9,24 @@ import re
 import time
 import logging
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
 from urllib.parse import urlparse, parse_qs
-import hashlib
 
 import requests
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-# Import Playwright for JavaScript rendering
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    logger.warning("Playwright not available - JavaScript rendering disabled")
+# Pooled async Playwright renderer for JavaScript rendering
+from ..utils.browser import BrowserPool, RenderedPage, PLAYWRIGHT_AVAILABLE
+from ..cache.pages import get_page_cache
+from ..utils.runtime import get_runtime, run_sync
+from .tracklists_parser import get_tracklist_parser, parse_festival_page, parse_profile_page
 
 logger = logging.getLogger(__name__)
 
+if not PLAYWRIGHT_AVAILABLE:
+    logger.warning("Playwright not available - JavaScript rendering disabled")
+
 
 class TracklistsScraper:
     """
@@ -42,6 +41,12 @@ class TracklistsScraper:
     
     BASE_URL = "https://www.1001tracklists.com"
     
+    # Bump when extraction output changes so cached parses are invalidated
+    PARSER_VERSION = "1"
+    
+    # Any of these indicates the JavaScript-rendered content is present
+    CONTENT_SELECTOR = '[data-trackid], .tlpTog, .tlpItem, .search-result, a[href*="/tracklist/"]'
+    
     def __init__(self):
         """Initialize the scraper with session management."""
         # Create session with retry strategy
@@ -66,17 +71,21 @@ class TracklistsScraper:
             'Upgrade-Insecure-Requests': '1'
         })
         
-        # Simple cache
-        self._cache = {}
+        # Shared on-disk page cache; pages older than the TTL are revalidated
+        # with a conditional request instead of being re-fetched
+        self.page_cache = get_page_cache()
         self._cache_ttl = 3600  # 1 hour
         
         # Rate limiting
         self._last_request_time = 0
         self._min_delay = 2.0  # 2 seconds between requests
         
-        # Playwright browser (initialized on first use)
-        self._playwright = None
-        self._browser = None
+        # Rendering goes through a browser pool shared by every scraper and
+        # owned by the runtime loop (launched on first use)
+        self._renderer: Optional[BrowserPool] = None
+        
+        # Page parser (lxml single-pass when installed, BeautifulSoup otherwise)
+        self.parser = get_tracklist_parser()
     
     def _rate_limit(self):
         """Enforce rate limiting."""
@@ -88,45 +97,63 @@ class TracklistsScraper:
         
         self._last_request_time = time.time()
     
-    def _get_cache_key(self, url: str) -> str:
-        """Generate cache key for URL."""
-        return hashlib.md5(url.encode()).hexdigest()
+    def _needs_rendering(self, url: str) -> bool:
+        """Whether a URL is fetched through the browser pool."""
+        return '1001tracklists.com' in url and PLAYWRIGHT_AVAILABLE
     
     def _get_cached(self, url: str) -> Optional[str]:
-        """Get cached HTML if available and not expired."""
-        cache_key = self._get_cache_key(url)
-        if cache_key in self._cache:
-            cached_time, html = self._cache[cache_key]
-            if time.time() - cached_time < self._cache_ttl:
-                logger.debug(f"Using cached data for {url}")
-                return html
+        """
+        Get cached HTML, revalidating stale pages.
+        
+        A stale page with validators is checked with a conditional GET: a 304
+        keeps the cached (possibly browser-rendered) copy.
+        """
+        page = self.page_cache.get(url)
+        if page is None:
+            return None
+        if page.is_fresh(self._cache_ttl):
+            logger.debug(f"Using cached data for {url}")
+            return page.html
+        
+        headers = page.conditional_headers()
+        if not headers:
+            return None
+        
+        self._rate_limit()
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Revalidation failed for {url}: {e}")
+            return None
+        
+        if response.status_code == 304:
+            logger.debug(f"Revalidated cached data for {url}")
+            self.page_cache.touch(url)
+            return page.html
+        
+        # Changed: plain pages can use this response, rendered pages re-render
+        if response.ok and not self._needs_rendering(url):
+            self.page_cache.put_response(url, response.text, response.headers)
+            return response.text
         return None
     
-    def _cache_html(self, url: str, html: str):
-        """Cache HTML content."""
-        cache_key = self._get_cache_key(url)
-        self._cache[cache_key] = (time.time(), html)
+    def _cache_html(self, url: str, html: str, headers: Optional[Dict[str, str]] = None):
+        """Cache HTML content with its HTTP validators."""
+        self.page_cache.put_response(url, html, headers or {})
+    
+    async def _get_renderer(self) -> BrowserPool:
+        """Get the shared browser pool (must run on the runtime loop)."""
+        if self._renderer is None:
+            self._renderer = await get_runtime().get_client("tracklists_browser", BrowserPool)
+        return self._renderer
     
-    def _init_playwright(self):
-        """Initialize Playwright browser on first use."""
-        if not PLAYWRIGHT_AVAILABLE:
-            return False
-        
-        if self._playwright is None:
-            try:
-                self._playwright = sync_playwright().start()
-                self._browser = self._playwright.chromium.launch(
-                    headless=True,
-                    args=['--disable-blink-features=AutomationControlled']
-                )
-                logger.info("Playwright browser initialized")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to initialize Playwright: {e}")
-                return False
-        return True
+    def _render_timeout(self, count: int = 1) -> float:
+        """Upper bound for rendering ``count`` pages through the pool."""
+        config = self._renderer.config if self._renderer else None
+        per_page = (config.navigation_timeout + config.selector_timeout) if config else 25.0
+        return per_page * max(count, 1) + 10.0
     
-    def _fetch_with_playwright(self, url: str) -> Optional[str]:
+    def _fetch_with_playwright(self, url: str) -> Optional[RenderedPage]:
         """
         Fetch a page using Playwright for JavaScript rendering.
         
@@ -134,46 +161,38 @@ class TracklistsScraper:
             url: URL to fetch
             
         Returns:
-            HTML content or None if failed
+            Rendered page or None if failed
         """
-        if not self._init_playwright():
-            return None
+        async def _render():
+            renderer = await self._get_renderer()
+            return await renderer.fetch(url, wait_for=self.CONTENT_SELECTOR)
         
         try:
-            # Create a new page with custom settings
-            page = self._browser.new_page(
-                # Set viewport to avoid mobile versions
-                viewport={'width': 1920, 'height': 1080},
-                # Set user agent to avoid bot detection
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            # Navigate to the URL with relaxed waiting
-            # 'domcontentloaded' is faster than 'networkidle' and usually sufficient
-            page.goto(url, wait_until='domcontentloaded', timeout=20000)
-            
-            # Wait for content to load
-            # Try to wait for specific elements that indicate content is loaded
-            try:
-                # Wait for any of these selectors (more flexible)
-                page.wait_for_selector('[data-trackid], .tlpTog, .tlpItem, .search-result, a[href*="/tracklist/"]', 
-                                      timeout=5000)
-            except:
-                # If specific elements not found, just wait a bit for JS to execute
-                page.wait_for_timeout(3000)
-            
-            # Get the full page HTML
-            html = page.content()
-            
-            # Close the page
-            page.close()
-            
-            return html
-            
+            return run_sync(_render(), timeout=self._render_timeout())
         except Exception as e:
             logger.error(f"Playwright failed to fetch {url}: {e}")
             return None
     
+    def _fetch_many_with_playwright(self, urls: List[str]) -> Dict[str, Optional[RenderedPage]]:
+        """
+        Render several pages concurrently through the browser pool.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Dictionary mapping each URL to its rendered page (None on failure)
+        """
+        async def _render_many():
+            renderer = await self._get_renderer()
+            return await renderer.fetch_many(urls, wait_for=self.CONTENT_SELECTOR)
+        
+        try:
+            return run_sync(_render_many(), timeout=self._render_timeout(len(urls)))
+        except Exception as e:
+            logger.error(f"Playwright failed to fetch {len(urls)} pages: {e}")
+            return {url: None for url in urls}
+    
     def fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch a page with rate limiting and caching.
@@ -190,20 +209,58 @@ class TracklistsScraper:
         if cached:
             return cached
         
-        # Rate limit
-        self._rate_limit()
-        
-        # Use Playwright for 1001 Tracklists pages
-        if '1001tracklists.com' in url and PLAYWRIGHT_AVAILABLE:
-            html = self._fetch_with_playwright(url)
-            if html:
+        # Use Playwright for 1001 Tracklists pages (the pool applies its own
+        # per-domain politeness budget)
+        if self._needs_rendering(url):
+            rendered = self._fetch_with_playwright(url)
+            if rendered:
                 # Cache successful response
-                self._cache_html(url, html)
-                return html
+                self._cache_html(url, rendered.html, rendered.headers)
+                return rendered.html
             else:
                 logger.warning("Playwright fetch failed, falling back to requests")
         
-        # Fallback to regular requests (or for non-1001TL sites)
+        return self._fetch_with_requests(url)
+    
+    def fetch_pages(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch several pages, rendering 1001 Tracklists pages concurrently.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Dictionary mapping each URL to its HTML (None if failed)
+        """
+        pages: Dict[str, Optional[str]] = {}
+        to_render = []
+        
+        for url in dict.fromkeys(urls):
+            cached = self._get_cached(url)
+            if cached:
+                pages[url] = cached
+            elif self._needs_rendering(url):
+                to_render.append(url)
+            else:
+                pages[url] = None
+        
+        if to_render:
+            for url, rendered in self._fetch_many_with_playwright(to_render).items():
+                if rendered:
+                    self._cache_html(url, rendered.html, rendered.headers)
+                pages[url] = rendered.html if rendered else None
+        
+        # Anything not rendered falls back to plain requests, one at a time
+        for url, html in pages.items():
+            if html is None:
+                pages[url] = self._fetch_with_requests(url)
+        
+        return pages
+    
+    def _fetch_with_requests(self, url: str) -> Optional[str]:
+        """Fetch a page with plain requests under the global rate limit."""
+        self._rate_limit()
+        
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
@@ -211,7 +268,7 @@ class TracklistsScraper:
             html = response.text
             
             # Cache successful response
-            self._cache_html(url, html)
+            self._cache_html(url, html, response.headers)
             
             return html
             
@@ -219,13 +276,6 @@ class TracklistsScraper:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
     
-    def __del__(self):
-        """Clean up Playwright resources."""
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
-    
     def extract_tracklist(self, url: str) -> Dict[str, Any]:
         """
         Extract tracklist data from a 1001 Tracklists URL.
@@ -240,292 +290,39 @@ class TracklistsScraper:
         if not html:
             return {'error': 'Failed to fetch page', 'url': url}
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Extract basic metadata
-        data = {
-            'url': url,
-            'title': self._extract_title(soup),
-            'dj': self._extract_dj(soup),
-            'event': self._extract_event(soup),
-            'date': self._extract_date(soup),
-            'genres': self._extract_genres(soup),
-            'tracks': self._extract_tracks(soup),
-            'recording_links': self._extract_recording_links(soup),
-            'stats': self._extract_stats(soup),
-            'extracted_at': datetime.utcnow().isoformat()
-        }
-        
-        return data
-    
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract tracklist title."""
-        # Try meta property first
-        meta = soup.find('meta', {'property': 'og:title'})
-        if meta and meta.get('content'):
-            return meta['content']
-        
-        # Try h1 title
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text(strip=True)
-        
-        # Fallback to page title
-        title = soup.find('title')
-        if title:
-            return title.get_text(strip=True)
-        
-        return "Unknown Tracklist"
-    
-    def _extract_dj(self, soup: BeautifulSoup) -> str:
-        """Extract DJ/artist name."""
-        # Look for DJ name in various places
-        dj_elem = soup.find('span', {'class': 'djName'})
-        if dj_elem:
-            return dj_elem.get_text(strip=True)
-        
-        # Try to extract from title
-        title = self._extract_title(soup)
-        if ' @ ' in title:
-            return title.split(' @ ')[0].strip()
-        
-        return "Unknown DJ"
-    
-    def _extract_event(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract event/venue name."""
-        # Look for event info
-        event_elem = soup.find('span', {'class': 'eventName'})
-        if event_elem:
-            return event_elem.get_text(strip=True)
-        
-        # Try meta description
-        meta = soup.find('meta', {'name': 'description'})
-        if meta and meta.get('content'):
-            content = meta['content']
-            if ' at ' in content:
-                parts = content.split(' at ')
-                if len(parts) > 1:
-                    return parts[1].split(',')[0].strip()
-        
-        return None
-    
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract date of the set."""
-        # Look for date element
-        date_elem = soup.find('time')
-        if date_elem:
-            return date_elem.get('datetime', date_elem.get_text(strip=True))
-        
-        # Look in various date classes
-        for class_name in ['date', 'eventDate', 'tlDate']:
-            elem = soup.find(class_=class_name)
-            if elem:
-                date_text = elem.get_text(strip=True)
-                # Basic date parsing
-                return date_text
-        
-        return None
-    
-    def _extract_genres(self, soup: BeautifulSoup) -> List[str]:
-        """Extract music genres."""
-        genres = []
-        
-        # Look for genre tags
-        genre_elems = soup.find_all('a', {'class': re.compile('tag|genre')})
-        for elem in genre_elems:
-            genre = elem.get_text(strip=True)
-            if genre and genre not in genres:
-                genres.append(genre)
-        
-        return genres
-    
-    def _extract_tracks(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Extract track information."""
-        tracks = []
-        
-        # Find track container (varies by page type)
-        track_containers = (
-            soup.find_all('div', {'class': re.compile('tlpItem|trackItem|track')}) or
-            soup.find_all('tr', {'class': re.compile('tlpItem|track')}) or
-            soup.find_all('li', {'class': re.compile('track')})
-        )
-        
-        for idx, container in enumerate(track_containers, 1):
-            track = self._parse_track(container, idx)
-            if track:
-                tracks.append(track)
-        
-        # If no tracks found with class, try alternative parsing
-        if not tracks:
-            tracks = self._extract_tracks_fallback(soup)
-        
-        return tracks
-    
-    def _parse_track(self, container, position: int) -> Optional[Dict[str, Any]]:
-        """Parse individual track from container."""
-        track = {
-            'position': position,
-            'cue': None,
-            'artist': None,
-            'title': None,
-            'remix': None,
-            'label': None,
-            'mix_type': None,
-            'is_id': False
-        }
-        
-        # Extract cue time
-        cue_elem = container.find(class_=re.compile('cue|time|timestamp'))
-        if cue_elem:
-            track['cue'] = cue_elem.get_text(strip=True)
-        
-        # Extract track info
-        track_text = container.get_text(' ', strip=True)
-        
-        # Check if it's an ID track
-        if 'ID - ID' in track_text or 'Unknown' in track_text:
-            track['is_id'] = True
-            track['artist'] = 'ID'
-            track['title'] = 'ID'
-        else:
-            # Parse artist - title pattern
-            parts = self._parse_track_text(track_text)
-            track.update(parts)
-        
-        # Extract mix type (w/, into, etc.)
-        if ' w/ ' in track_text:
-            track['mix_type'] = 'w/'
-        elif ' into ' in track_text.lower():
-            track['mix_type'] = 'into'
-        
-        # Extract label if present
-        label_elem = container.find(class_=re.compile('label'))
-        if label_elem:
-            track['label'] = label_elem.get_text(strip=True)
-        
-        return track if (track['artist'] or track['is_id']) else None
+        return self._parse_tracklist(url, html)
     
-    def _parse_track_text(self, text: str) -> Dict[str, str]:
-        """Parse track text into components."""
-        result = {
-            'artist': None,
-            'title': None,
-            'remix': None
-        }
+    def extract_tracklists(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract several tracklists, fetching their pages concurrently.
         
-        # Clean up text
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'^\d+\.?\s*', '', text)  # Remove leading number
-        text = re.sub(r'^\[?[\d:]+\]?\s*', '', text)  # Remove timestamp
-        
-        # Common patterns
-        patterns = [
-            # Artist - Title (Remix)
-            r'^([^-]+?)\s*-\s*([^(]+?)(?:\s*\(([^)]+)\))?$',
-            # Artist - Title [Label]
-            r'^([^-]+?)\s*-\s*([^[]+?)(?:\s*\[[^\]]+\])?$',
-            # Artist: Title
-            r'^([^:]+?):\s*(.+)$',
+        Args:
+            urls: Tracklist URLs
+            
+        Returns:
+            Structured tracklist data in input order
+        """
+        pages = self.fetch_pages(urls)
+        return [
+            self._parse_tracklist(url, pages[url]) if pages.get(url)
+            else {'error': 'Failed to fetch page', 'url': url}
+            for url in urls
         ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, text)
-            if match:
-                groups = match.groups()
-                result['artist'] = groups[0].strip() if groups[0] else None
-                result['title'] = groups[1].strip() if len(groups) > 1 and groups[1] else None
-                if len(groups) > 2 and groups[2]:
-                    result['remix'] = groups[2].strip()
-                break
-        
-        # Fallback: assume entire text is title
-        if not result['artist'] and not result['title']:
-            result['title'] = text.strip()
-        
-        return result
     
-    def _extract_tracks_fallback(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Fallback track extraction method."""
-        tracks = []
-        
-        # Look for any text that looks like tracks
-        # This is a simple pattern matching approach
-        text = soup.get_text()
-        lines = text.split('\n')
-        
-        track_pattern = re.compile(r'(?:^\d+\.?\s*)?(?:\[?[\d:]+\]?\s*)?([^-]+?)\s*-\s*(.+)')
-        
-        position = 1
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 5:
-                continue
-            
-            match = track_pattern.match(line)
-            if match:
-                tracks.append({
-                    'position': position,
-                    'cue': None,
-                    'artist': match.group(1).strip(),
-                    'title': match.group(2).strip(),
-                    'remix': None,
-                    'label': None,
-                    'mix_type': None,
-                    'is_id': 'ID' in line
-                })
-                position += 1
-            
-            if position > 200:  # Sanity limit
-                break
+    def _parse_tracklist(self, url: str, html: str) -> Dict[str, Any]:
+        """Parse tracklist data from page HTML (cached per page content)."""
+        content_hash = self.page_cache.hash_content(html)
+        cached = self.page_cache.get_parsed(url, 'tracklist', self.PARSER_VERSION, content_hash)
+        if cached is not None:
+            return cached
         
-        return tracks
-    
-    def _extract_recording_links(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract links to recordings (SoundCloud, Mixcloud, etc.)."""
-        links = {}
-        
-        # Look for player embeds and links
-        for platform, patterns in {
-            'soundcloud': ['soundcloud.com'],
-            'mixcloud': ['mixcloud.com'],
-            'youtube': ['youtube.com', 'youtu.be'],
-            'spotify': ['spotify.com']
-        }.items():
-            for pattern in patterns:
-                link = soup.find('a', href=re.compile(pattern))
-                if link:
-                    links[platform] = link['href']
-                # Also check iframes
-                iframe = soup.find('iframe', src=re.compile(pattern))
-                if iframe:
-                    links[platform] = iframe['src']
-        
-        return links
+        data = self._extract_tracklist_data(url, html)
+        self.page_cache.put_parsed(url, 'tracklist', self.PARSER_VERSION, data, content_hash)
+        return data
     
-    def _extract_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract view counts, favorites, etc."""
-        stats = {
-            'views': None,
-            'favorites': None,
-            'comments': None
-        }
-        
-        # Look for stat elements
-        for stat_type in ['views', 'plays', 'likes', 'favorites']:
-            elem = soup.find(text=re.compile(stat_type, re.I))
-            if elem:
-                # Try to extract number
-                parent = elem.parent
-                if parent:
-                    text = parent.get_text()
-                    numbers = re.findall(r'\d+', text)
-                    if numbers:
-                        if 'view' in stat_type.lower() or 'play' in stat_type.lower():
-                            stats['views'] = int(numbers[0])
-                        elif 'fav' in stat_type.lower() or 'like' in stat_type.lower():
-                            stats['favorites'] = int(numbers[0])
-        
-        return stats
+    def _extract_tracklist_data(self, url: str, html: str) -> Dict[str, Any]:
+        """Extract tracklist data from page HTML."""
+        return self.parser.parse(url, html)
     
     def search_tracks(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -715,45 +512,18 @@ class TracklistsScraper:
                 f"{self.BASE_URL}/djs/{dj_slug}"
             ]
             
+            seen = {s['url'] for s in sets}
             for profile_url in profile_urls:
                 html = self.fetch_page(profile_url)
                 if html and '404' not in html[:1000]:  # Quick 404 check
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
                     # Look for tracklist links on the profile page
-                    tracklist_links = soup.find_all('a', href=re.compile(r'/tracklist/[a-z0-9]+/', re.I))
-                    
-                    for link in tracklist_links:
+                    for set_info in parse_profile_page(html, dj_name, self.BASE_URL):
                         if len(sets) >= limit:
                             break
                         
-                        # Extract set information
-                        set_info = {
-                            'url': self.BASE_URL + link.get('href', ''),
-                            'title': link.get_text(strip=True),
-                            'dj': dj_name,
-                            'event': None,
-                            'date': None,
-                            'type': 'tracklist'
-                        }
-                        
-                        # Try to extract event and date from surrounding text
-                        parent = link.find_parent(['div', 'article', 'li', 'tr'])
-                        if parent:
-                            parent_text = parent.get_text()
-                            
-                            # Extract event (common patterns: "@ Event" or "at Venue")
-                            event_match = re.search(r'@\s+([^,\n]+)|at\s+([^,\n]+)', parent_text, re.I)
-                            if event_match:
-                                set_info['event'] = (event_match.group(1) or event_match.group(2)).strip()
-                            
-                            # Extract date
-                            date_match = re.search(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}', parent_text)
-                            if date_match:
-                                set_info['date'] = date_match.group(0)
-                        
                         # Avoid duplicates
-                        if not any(s['url'] == set_info['url'] for s in sets):
+                        if set_info['url'] not in seen:
+                            seen.add(set_info['url'])
                             sets.append(set_info)
                     
                     if sets:
@@ -784,136 +554,7 @@ class TracklistsScraper:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        sets = []
-        
-        # Extract festival name from page
-        festival_name = None
-        title_elem = soup.find(['h1', 'h2', 'title'])
-        if title_elem:
-            festival_name = title_elem.get_text(strip=True)
-        
-        # Find all set links on festival page
-        # Strategy 1: Look for tracklist links
-        tracklist_links = soup.find_all('a', href=re.compile(r'/tracklist/[a-z0-9]+/', re.I))
-        
-        for link in tracklist_links:
-            set_info = {
-                'url': self.BASE_URL + link.get('href', ''),
-                'title': link.get_text(strip=True),
-                'festival': festival_name,
-                'dj': None,
-                'stage': None,
-                'date': None,
-                'time': None,
-                'type': 'tracklist'
-            }
-            
-            # Extract DJ name from link text or surrounding context
-            link_text = link.get_text(strip=True)
-            
-            # Common patterns: "DJ Name @ Stage" or "DJ Name - Time"
-            if ' @ ' in link_text:
-                parts = link_text.split(' @ ')
-                set_info['dj'] = parts[0].strip()
-                if len(parts) > 1:
-                    set_info['stage'] = parts[1].strip()
-            elif ' - ' in link_text:
-                parts = link_text.split(' - ')
-                set_info['dj'] = parts[0].strip()
-            else:
-                # Try to extract DJ from the URL or title
-                url_match = re.search(r'/([^/]+)-at-', link.get('href', ''), re.I)
-                if url_match:
-                    set_info['dj'] = url_match.group(1).replace('-', ' ').title()
-                else:
-                    set_info['dj'] = link_text
-            
-            # Look for additional metadata in parent container
-            parent = link.find_parent(['div', 'article', 'li', 'tr', 'section'])
-            if parent:
-                parent_text = parent.get_text(' ', strip=True)
-                
-                # Extract stage information
-                stage_patterns = [
-                    r'(?:stage|room|arena|floor)[:\s]+([^,\n]+)',
-                    r'@\s+([^,\n]+(?:stage|room|arena|tent))',
-                ]
-                for pattern in stage_patterns:
-                    stage_match = re.search(pattern, parent_text, re.I)
-                    if stage_match:
-                        set_info['stage'] = stage_match.group(1).strip()
-                        break
-                
-                # Extract date
-                date_match = re.search(
-                    r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
-                    parent_text, re.I
-                )
-                if date_match:
-                    set_info['date'] = date_match.group(0)
-                
-                # Extract time
-                time_match = re.search(r'\b(\d{1,2}:\d{2})\s*(?:AM|PM|am|pm)?\b', parent_text)
-                if time_match:
-                    set_info['time'] = time_match.group(0)
-            
-            # Avoid duplicates
-            if not any(s['url'] == set_info['url'] for s in sets):
-                sets.append(set_info)
-        
-        # Strategy 2: If no tracklist links found, look for any festival lineup structure
-        if not sets:
-            # Look for common lineup containers
-            lineup_containers = soup.find_all(['div', 'section', 'article'], 
-                                             class_=re.compile(r'(lineup|artist|performer|dj|set)', re.I))
-            
-            for container in lineup_containers:
-                # Find links within the container
-                links = container.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    if '/tracklist/' in href or '/dj/' in href or '/artist/' in href:
-                        set_info = {
-                            'url': self.BASE_URL + href if not href.startswith('http') else href,
-                            'title': link.get_text(strip=True),
-                            'festival': festival_name,
-                            'dj': link.get_text(strip=True),
-                            'stage': None,
-                            'date': None,
-                            'time': None,
-                            'type': 'tracklist' if '/tracklist/' in href else 'dj_profile'
-                        }
-                        
-                        # Extract additional info from container
-                        container_text = container.get_text()
-                        
-                        # Date extraction
-                        date_match = re.search(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}', container_text)
-                        if date_match:
-                            set_info['date'] = date_match.group(0)
-                        
-                        # Avoid duplicates
-                        if not any(s['url'] == set_info['url'] for s in sets):
-                            sets.append(set_info)
-        
-        # Sort by date and time if available
-        for set_info in sets:
-            if set_info.get('date') and set_info.get('time'):
-                try:
-                    # Create a sortable datetime string
-                    set_info['_sort_key'] = f"{set_info['date']} {set_info['time']}"
-                except:
-                    set_info['_sort_key'] = set_info.get('date', '')
-            else:
-                set_info['_sort_key'] = set_info.get('date', '')
-        
-        # Sort and remove sort key
-        sets.sort(key=lambda x: x.get('_sort_key', ''))
-        for set_info in sets:
-            set_info.pop('_sort_key', None)
-        
-        return sets
+        return parse_festival_page(html, self.BASE_URL)
 
 
 # Main integration class
@@ -944,6 +585,10 @@ class OneThousandOneTracklists:
         """Get DJ's recent sets."""
         return self.scraper.get_dj_sets(dj_name, limit)
     
+    def get_tracklists(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Get several tracklists, fetching pages concurrently."""
+        return self.scraper.extract_tracklists(urls)
+    
     def get_festival(self, festival_url: str) -> List[Dict[str, Any]]:
         """Get all sets from a festival."""
         return self.scraper.get_festival_sets(festival_url)
\ No newline at end of file
@@ -84,6 +84,15 @@ class Album(BaseModel):
     upc: Optional[str] = Field(None, description="Universal Product Code")
 
 
+class Label(BaseModel):
+    """Record label"""
+    name: str = Field(description="Label name")
+    country: Optional[str] = Field(None, description="Country of origin")
+    parent_label: Optional[str] = Field(None, description="Parent label if imprint")
+    discogs_id: Optional[str] = Field(None)
+    beatport_id: Optional[str] = Field(None)
+
+
 class Genre(BaseModel):
     """Musical genre or style"""
     name: str = Field(description="Genre name")
@@ -199,7 +208,12 @@ class PerformedBy(BaseModel):
 class BelongsToAlbum(BaseModel):
     """Track belongs to album"""
     track_number: Optional[int] = Field(None)
-    disc_number: Optional[int] = Field(None, default=1)
+    disc_number: Optional[int] = Field(default=1)
+
+
+class ReleasedOn(BaseModel):
+    """Track or album released on label"""
+    catalog_number: Optional[str] = Field(None, description="Label catalog number")
 
 
 class RemixOf(BaseModel):
@@ -249,6 +263,7 @@ MUSIC_ENTITY_TYPES = {
     'Track': Track,
     'Artist': Artist,
     'Album': Album,
+    'Label': Label,
     'Genre': Genre,
     'Playlist': Playlist,
     
@@ -271,6 +286,7 @@ MUSIC_EDGE_TYPES = {
     # Basic relationships
     'PERFORMED_BY': PerformedBy,
     'BELONGS_TO_ALBUM': BelongsToAlbum,
+    'RELEASED_ON': ReleasedOn,
     'REMIX_OF': RemixOf,
     'SIMILAR_TO': SimilarTo,
     'MIXED_WITH': MixedWith,
@@ -0,0 +1,418 @@
+"""
+Shared cover artwork fetcher for the download managers.
+
+Every track of an album points at the same cover image, and the download
+managers used to fetch it once per track. ``ArtworkService`` fetches each
+image once: concurrent requests for the same URL share a single download,
+the processed bytes stay in memory for the rest of the batch, and a
+content-addressed on-disk store keeps them across runs.
+
+Images larger than the configured maximum dimension are downscaled and
+re-encoded once, before they are stored, so every file of an album embeds
+the same, reasonably sized bytes. Resizing needs Pillow; without it images
+are stored as downloaded.
+
+On disk, image bytes live under ``objects/`` named by their SHA-256, and
+small ``urls/`` entries map a request (URL plus processing settings) to
+the image, so identical images behind different URLs are stored once.
+"""
+
+import io
+import os
+import asyncio
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from ..cache import CacheManager, build_cache
+from ..utils.http import shared_session
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None
+    PIL_AVAILABLE = False
+
+_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+
+def detect_image_mime(data: bytes) -> str:
+    """
+    Detect an image's MIME type from its magic bytes.
+
+    Args:
+        data: Image bytes
+
+    Returns:
+        MIME type (JPEG if unrecognized)
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return "image/png"
+    if data[:3] == b'\xff\xd8\xff':
+        return "image/jpeg"
+    if data[:4] == b'GIF8':
+        return "image/gif"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/jpeg"
+
+
+@dataclass
+class ArtworkConfig:
+    """Artwork cache configuration."""
+
+    cache_dir: str = "~/.music_agent_cache/artwork"
+    max_dimension: int = 1400  # Longest side in pixels (0 = keep original size)
+    jpeg_quality: int = 90
+    max_disk_bytes: int = 500 * 1024 * 1024
+    max_memory_bytes: int = 64 * 1024 * 1024
+    timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "ArtworkConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            cache_dir=os.getenv("ARTWORK_CACHE_DIR", "~/.music_agent_cache/artwork"),
+            max_dimension=int(os.getenv("ARTWORK_MAX_DIMENSION", "1400")),
+            jpeg_quality=int(os.getenv("ARTWORK_JPEG_QUALITY", "90")),
+            max_disk_bytes=int(os.getenv("ARTWORK_CACHE_MAX_MB", "500")) * 1024 * 1024,
+        )
+
+
+@dataclass(frozen=True)
+class Artwork:
+    """Processed artwork, shared by every caller that asked for it."""
+
+    data: bytes
+    mime: str
+    digest: str  # SHA-256 of data
+    path: Optional[Path] = None  # Cached file, for writers that take a path
+
+    @property
+    def size(self) -> int:
+        """Size in bytes."""
+        return len(self.data)
+
+
+@dataclass
+class ArtworkStats:
+    """Artwork fetch counters."""
+
+    requests: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    downloads: int = 0
+    download_failures: int = 0
+    bytes_downloaded: int = 0
+    resized: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary with derived ratios."""
+        fetched = self.downloads + self.download_failures
+        return {
+            **self.__dict__,
+            "shared": self.requests - fetched,
+            "share_rate": round((self.requests - fetched) / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+class ArtworkStore:
+    """
+    Content-addressed image files with a size bound.
+
+    Blocking; ``ArtworkService`` calls it from worker threads.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        """
+        Initialize artwork store.
+
+        Args:
+            root: Store directory
+            max_bytes: Bound on total image size (least recently used go first)
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str, mime: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.{_EXTENSIONS.get(mime, 'img')}"
+
+    def _ref_path(self, key: str) -> Path:
+        return self.root / "urls" / key[:2] / key
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[Artwork]:
+        """
+        Load the image stored for a request key.
+
+        Args:
+            key: Request key
+
+        Returns:
+            Artwork or None if never stored or evicted
+        """
+        try:
+            digest, mime = self._ref_path(key).read_text().split()
+            path = self._object_path(digest, mime)
+            data = path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return Artwork(data=data, mime=mime, digest=digest, path=path)
+
+    def put(self, key: str, data: bytes, mime: str) -> Artwork:
+        """
+        Store an image and map a request key to it.
+
+        Args:
+            key: Request key
+            data: Image bytes
+            mime: Image MIME type
+
+        Returns:
+            Stored artwork
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, mime)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            if not path.exists():
+                self._write_atomic(path, data)
+                self._size += len(data)
+            self._write_atomic(self._ref_path(key), f"{digest} {mime}".encode())
+
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+        return Artwork(data=data, mime=mime, digest=digest, path=path)
+
+    def _objects(self):
+        objects_dir = self.root / "objects"
+        return objects_dir.glob("*/*") if objects_dir.exists() else ()
+
+    def _scan_size(self) -> int:
+        return sum(path.stat().st_size for path in self._objects())
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used images until under the size bound."""
+        entries = []
+        for path in self._objects():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        # References to evicted images are left behind and read as misses
+        self._size = total
+
+
+class ArtworkService:
+    """
+    Fetches cover artwork once per image and shares the bytes.
+
+    Lookups go memory, then disk, then network; concurrent requests for the
+    same image wait for one fetch.
+    """
+
+    def __init__(self, config: Optional[ArtworkConfig] = None):
+        """
+        Initialize artwork service.
+
+        Args:
+            config: Artwork configuration (defaults to environment)
+        """
+        self.config = config or ArtworkConfig.from_env()
+        self.store = ArtworkStore(
+            Path(os.path.expanduser(self.config.cache_dir)),
+            self.config.max_disk_bytes
+        )
+        # Memory tier plus single-flight for concurrent fetches
+        self.memory: CacheManager = build_cache(
+            namespace="artwork",
+            default_ttl=3600,
+            max_entries=256,
+            max_memory_bytes=self.config.max_memory_bytes,
+        )
+        self.stats = ArtworkStats()
+
+    def request_key(self, url: str) -> str:
+        """Cache key for a URL under the current processing settings."""
+        settings = f"{url}|{self.config.max_dimension}|{self.config.jpeg_quality}"
+        return hashlib.sha256(settings.encode()).hexdigest()
+
+    async def fetch(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Optional[Artwork]:
+        """
+        Get artwork for a URL.
+
+        Args:
+            url: Image URL
+            session: Session to download with (defaults to the shared pool)
+
+        Returns:
+            Artwork, or None if it could not be downloaded
+        """
+        if not url:
+            return None
+
+        self.stats.requests += 1
+        key = self.request_key(url)
+        loaded = False
+
+        async def load() -> Optional[Artwork]:
+            nonlocal loaded
+            loaded = True
+            artwork = await asyncio.to_thread(self.store.get, key)
+            if artwork is not None:
+                self.stats.disk_hits += 1
+                return artwork
+            return await self._download(url, key, session)
+
+        artwork = await self.memory.get_or_set(key, load)
+        if not loaded and artwork is not None:
+            self.stats.memory_hits += 1
+        return artwork
+
+    async def _download(
+        self,
+        url: str,
+        key: str,
+        session: Optional[aiohttp.ClientSession]
+    ) -> Optional[Artwork]:
+        """Download, process and store an image."""
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        try:
+            if session is not None:
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    data = await response.read()
+            else:
+                async with await shared_session() as pooled:
+                    async with pooled.get(url, timeout=timeout) as response:
+                        response.raise_for_status()
+                        data = await response.read()
+        except Exception as e:
+            self.stats.download_failures += 1
+            logger.warning(f"Failed to download artwork {url}: {e}")
+            return None
+
+        self.stats.downloads += 1
+        self.stats.bytes_downloaded += len(data)
+
+        data, mime = await asyncio.to_thread(self.process, data)
+        try:
+            return await asyncio.to_thread(self.store.put, key, data, mime)
+        except OSError as e:
+            logger.warning(f"Failed to cache artwork {url}: {e}")
+            return Artwork(data=data, mime=mime, digest=hashlib.sha256(data).hexdigest())
+
+    def process(self, data: bytes) -> Tuple[bytes, str]:
+        """
+        Downscale an image to the configured maximum dimension.
+
+        Images within the bound, and all images when Pillow is not
+        installed, are returned unchanged.
+
+        Args:
+            data: Downloaded image bytes
+
+        Returns:
+            Image bytes and MIME type
+        """
+        mime = detect_image_mime(data)
+        max_dimension = self.config.max_dimension
+        if not PIL_AVAILABLE or max_dimension <= 0:
+            return data, mime
+
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                if max(image.size) <= max_dimension:
+                    return data, mime
+
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+                if image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+
+                output = io.BytesIO()
+                image.save(output, format="JPEG", quality=self.config.jpeg_quality, optimize=True)
+        except Exception as e:
+            logger.warning(f"Failed to resize artwork, keeping original: {e}")
+            return data, mime
+
+        self.stats.resized += 1
+        return output.getvalue(), "image/jpeg"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get artwork statistics.
+
+        Returns:
+            Request, hit and download counters
+        """
+        return self.stats.to_dict()
+
+    async def close(self) -> None:
+        """Release the memory tier."""
+        await self.memory.close()
+
+
+# Shared by all download managers so an album's tracks share one fetch
+_artwork_service: Optional[ArtworkService] = None
+
+
+def get_artwork_service() -> ArtworkService:
+    """Get or create the global artwork service."""
+    global _artwork_service
+    if _artwork_service is None:
+        _artwork_service = ArtworkService()
+    return _artwork_service
+
+
+__all__ = [
+    "Artwork",
+    "ArtworkConfig",
+    "ArtworkService",
+    "ArtworkStats",
+    "ArtworkStore",
+    "PIL_AVAILABLE",
+    "detect_image_mime",
+    "get_artwork_service",
+]
@@ -3,11 +3,24 @@ General LLM service for the Music Agent.
 
 Provides a reusable interface for LLM operations throughout the application,
 including structured data extraction, text generation, and analysis.
+
+Completions and embeddings are cached on disk, keyed by a hash of the exact
+request (model, messages and parameters), so repeated research queries and
+re-extraction of the same page don't pay for the same tokens twice.
+
+All requests go through the async OpenAI client. A semaphore bounds how many
+are in flight and an optional tokens-per-minute budget paces them, so callers
+can fan out with ``asyncio.gather`` without tripping the API rate limits.
 """
 
+import os
+import copy
 import json
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List, Union, Type
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Union, Type, AsyncIterator
 from enum import Enum
 from dataclasses import dataclass
 
@@ -20,7 +33,9 @@ from tenacity import (
     retry_if_exception_type
 )
 
+from ..cache import CacheManager, build_cache
 from ..utils.config import get_config
+from ..utils.rate_limit import TokenBudget
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +79,60 @@ class LLMResponse:
             return {}
 
 
+def request_key(kind: str, params: Dict[str, Any]) -> str:
+    """
+    Content address of an API request.
+    
+    Args:
+        kind: Request type (chat, embedding)
+        params: Exact request parameters
+    
+    Returns:
+        SHA-256 hex digest of the canonical request
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+    return f"{kind}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+
+def estimate_tokens(params: Dict[str, Any]) -> int:
+    """
+    Rough token cost of a request, for budgeting before it is sent.
+    
+    Args:
+        params: Request parameters
+    
+    Returns:
+        Estimated prompt tokens (about four characters per token) plus the
+        completion allowance, which the API also counts against the limit
+    """
+    prompt = params.get("messages", params.get("input", ""))
+    prompt_tokens = len(json.dumps(prompt, default=str)) // 4 + 1
+    return prompt_tokens + int(params.get("max_tokens") or 0)
+
+
+def create_llm_cache(config) -> CacheManager:
+    """
+    Create the LLM response cache.
+    
+    Args:
+        config: OpenAI configuration
+    
+    Returns:
+        Memory + SQLite cache, or a disabled cache when caching is off
+    """
+    if not config.cache_enabled:
+        return CacheManager(namespace="llm")
+    
+    return build_cache(
+        namespace="llm",
+        default_ttl=config.cache_ttl,
+        max_entries=1000,
+        max_memory_bytes=64 * 1024 * 1024,
+        disk_path=os.path.expanduser(config.cache_path),
+        max_disk_bytes=config.cache_max_mb * 1024 * 1024,
+    )
+
+
 class LLMService:
     """
     General LLM service for the application.
@@ -74,19 +143,24 @@ class LLMService:
     - Automatic retries with exponential backoff
     - Token usage tracking
     - Conversation history management
+    - Content-addressed response and embedding cache
+    - Batched embeddings
+    - Bounded concurrency and tokens-per-minute budgeting
+    - Streaming completions
     """
     
-    def __init__(self, model: Optional[LLMModel] = None):
+    def __init__(self, model: Optional[LLMModel] = None, cache: Optional[CacheManager] = None):
         """
         Initialize LLM service.
         
         Args:
             model: Default model to use (defaults to config)
+            cache: Response cache (defaults to the on-disk LLM cache)
         """
         config = get_config()
         
         # Initialize OpenAI client
-        self.client = openai.OpenAI(
+        self.client = openai.AsyncOpenAI(
             api_key=config.openai.api_key,
             base_url=config.openai.base_url,
             organization=config.openai.organization
@@ -99,9 +173,100 @@ class LLMService:
         self.default_temperature = config.openai.temperature
         self.default_max_tokens = config.openai.max_tokens
         
+        # Embeddings
+        self.embedding_model = config.openai.embedding_model
+        self.embedding_batch_size = max(1, config.openai.embedding_batch_size)
+        
+        # Response cache
+        self.cache = cache if cache is not None else create_llm_cache(config.openai)
+        self.cache_hits = 0
+        self.tokens_saved = 0
+        
         # Token tracking
         self.total_tokens_used = 0
         
+        # Concurrency and rate budget shared by all requests
+        self.max_concurrency = max(1, config.openai.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        tokens_per_minute = config.openai.tokens_per_minute
+        self.budget = TokenBudget(tokens_per_minute) if tokens_per_minute > 0 else None
+    
+    @asynccontextmanager
+    async def _request_slot(self, estimated_tokens: int):
+        """
+        Hold a concurrency slot and reserve budget for one API request.
+        
+        The caller records the actual usage in the yielded dict; the budget
+        keeps the estimate if the request fails before reporting any.
+        
+        Args:
+            estimated_tokens: Token cost reserved up front
+        
+        Yields:
+            Usage dict whose ``tokens`` entry the caller sets
+        """
+        usage: Dict[str, Optional[int]] = {"tokens": None}
+        async with self._semaphore:
+            if self.budget:
+                await self.budget.acquire(estimated_tokens)
+            try:
+                yield usage
+            finally:
+                used = usage["tokens"]
+                if used is not None:
+                    self.total_tokens_used += used
+                if self.budget:
+                    self.budget.settle(estimated_tokens, estimated_tokens if used is None else used)
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        model: Optional[LLMModel],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        response_format: ResponseFormat,
+        messages: Optional[List[Dict[str, str]]],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters (see ``complete``)."""
+        # Build messages
+        if messages is None:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+        else:
+            messages = [dict(message) for message in messages]
+        
+        api_params = {
+            "model": (model or self.default_model).value,
+            "messages": messages,
+            "temperature": temperature or self.default_temperature,
+            "max_tokens": max_tokens or self.default_max_tokens,
+            **kwargs
+        }
+        
+        # Handle response format
+        if response_format == ResponseFormat.JSON:
+            api_params["response_format"] = {"type": "json_object"}
+            # Add JSON instruction to last message if not present
+            if "json" not in messages[-1]["content"].lower():
+                messages[-1]["content"] += "\n\nReturn your response as valid JSON."
+        
+        return api_params
+    
+    async def _get_cached_response(self, cache_key: Optional[str]) -> Optional[LLMResponse]:
+        """Look up a cached completion, counting the hit."""
+        if not cache_key:
+            return None
+        cached = await self.cache.get(cache_key)
+        if cached is None:
+            return None
+        self.cache_hits += 1
+        self.tokens_saved += cached.tokens_used
+        return copy.deepcopy(cached)
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -116,6 +281,7 @@ class LLMService:
         max_tokens: Optional[int] = None,
         response_format: ResponseFormat = ResponseFormat.TEXT,
         messages: Optional[List[Dict[str, str]]] = None,
+        cache: bool = True,
         **kwargs
     ) -> LLMResponse:
         """
@@ -129,53 +295,35 @@ class LLMService:
             max_tokens: Maximum tokens in response
             response_format: Expected response format
             messages: Full conversation history (overrides prompt)
+            cache: Reuse a cached response for an identical request
             **kwargs: Additional OpenAI parameters
         
         Returns:
             LLM response with content and metadata
         """
-        # Build messages
-        if messages is None:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-        
-        # Set parameters
-        model_name = (model or self.default_model).value
-        temperature = temperature or self.default_temperature
-        max_tokens = max_tokens or self.default_max_tokens
-        
-        # Handle response format
-        api_params = {
-            "model": model_name,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            **kwargs
-        }
+        api_params = self._build_request(
+            prompt, system_prompt, model, temperature, max_tokens,
+            response_format, messages, **kwargs
+        )
         
-        if response_format == ResponseFormat.JSON:
-            api_params["response_format"] = {"type": "json_object"}
-            # Add JSON instruction to last message if not present
-            if "json" not in messages[-1]["content"].lower():
-                messages[-1]["content"] += "\n\nReturn your response as valid JSON."
+        cache_key = request_key("chat", api_params) if cache else None
+        cached = await self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Make API call
-            response = await self.client.chat.completions.create(**api_params)
+            async with self._request_slot(estimate_tokens(api_params)) as usage:
+                response = await self.client.chat.completions.create(**api_params)
+                
+                # Track tokens
+                tokens_used = response.usage.total_tokens if getattr(response, 'usage', None) else 0
+                usage["tokens"] = tokens_used
             
             # Parse response
             choice = response.choices[0]
             content = choice.message.content
             
-            # Track tokens
-            if hasattr(response, 'usage'):
-                tokens_used = response.usage.total_tokens
-                self.total_tokens_used += tokens_used
-            else:
-                tokens_used = 0
-            
             # Parse JSON if expected
             if response_format == ResponseFormat.JSON:
                 try:
@@ -183,17 +331,127 @@ class LLMService:
                 except json.JSONDecodeError:
                     logger.warning("Failed to parse JSON response, returning as text")
             
-            return LLMResponse(
+            result = LLMResponse(
                 content=content,
-                model=model_name,
+                model=api_params["model"],
                 tokens_used=tokens_used,
                 finish_reason=choice.finish_reason
             )
             
+            # Truncated or filtered responses are not worth replaying
+            if cache_key and choice.finish_reason == "stop":
+                await self.cache.set(cache_key, copy.deepcopy(result))
+            
+            return result
+            
         except Exception as e:
             logger.error(f"LLM completion failed: {e}")
             raise
     
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[LLMModel] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        cache: bool = True,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text completion as it is generated.
+        
+        Shares the response cache with ``complete``: a cached response is
+        yielded in one piece, and a completed stream is cached under the
+        same key a non-streaming request would use. The response is read
+        in the background and buffered, so the concurrency slot is released
+        when the server finishes, however slowly fragments are consumed.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt for context
+            model: Model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            messages: Full conversation history (overrides prompt)
+            cache: Reuse a cached response for an identical request
+            **kwargs: Additional OpenAI parameters
+        
+        Yields:
+            Content fragments in order
+        """
+        api_params = self._build_request(
+            prompt, system_prompt, model, temperature, max_tokens,
+            ResponseFormat.TEXT, messages, **kwargs
+        )
+        
+        cache_key = request_key("chat", api_params) if cache else None
+        cached = await self._get_cached_response(cache_key)
+        if cached is not None:
+            yield cached.content if isinstance(cached.content, str) else json.dumps(cached.content)
+            return
+        
+        parts: List[str] = []
+        finish_reason = None
+        tokens_used = 0
+        fragments: asyncio.Queue = asyncio.Queue()
+        end = object()
+        
+        async def receive():
+            # Holds the request slot only while the server is sending, so a
+            # slow consumer doesn't keep other calls waiting
+            nonlocal finish_reason, tokens_used
+            try:
+                async with self._request_slot(estimate_tokens(api_params)) as usage:
+                    response = await self.client.chat.completions.create(
+                        **api_params,
+                        stream=True,
+                        stream_options={"include_usage": True}
+                    )
+                    try:
+                        async for chunk in response:
+                            if getattr(chunk, 'usage', None):
+                                tokens_used = chunk.usage.total_tokens
+                                usage["tokens"] = tokens_used
+                            if not chunk.choices:
+                                continue
+                            
+                            choice = chunk.choices[0]
+                            if choice.finish_reason:
+                                finish_reason = choice.finish_reason
+                            if choice.delta and choice.delta.content:
+                                fragments.put_nowait(choice.delta.content)
+                    finally:
+                        await response.close()
+            except Exception as e:
+                fragments.put_nowait(e)
+            else:
+                fragments.put_nowait(end)
+        
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                fragment = await fragments.get()
+                if fragment is end:
+                    break
+                if isinstance(fragment, Exception):
+                    logger.error(f"LLM streaming failed: {fragment}")
+                    raise fragment
+                parts.append(fragment)
+                yield fragment
+        finally:
+            # Consumer stopped early: abandon the rest of the response
+            receiver.cancel()
+        
+        if cache_key and finish_reason == "stop":
+            await self.cache.set(cache_key, LLMResponse(
+                content="".join(parts),
+                model=api_params["model"],
+                tokens_used=tokens_used,
+                finish_reason=finish_reason
+            ))
+    
     async def extract_structured_data(
         self,
         text: str,
@@ -371,27 +629,87 @@ Text to classify:
     async def generate_embedding(
         self,
         text: str,
-        model: str = "text-embedding-3-small"
+        model: Optional[str] = None
     ) -> List[float]:
         """
         Generate embedding for text.
         
         Args:
             text: Text to embed
-            model: Embedding model to use
+            model: Embedding model to use (defaults to config)
         
         Returns:
             Embedding vector
         """
-        try:
-            response = await self.client.embeddings.create(
-                input=text,
-                model=model
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
-            raise
+        return (await self.embed_many([text], model))[0]
+    
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for many texts.
+        
+        Cached embeddings are reused and duplicate texts are embedded once;
+        the rest are sent ``batch_size`` inputs per request.
+        
+        Args:
+            texts: Texts to embed
+            model: Embedding model to use (defaults to config)
+            batch_size: Inputs per request (defaults to config)
+        
+        Returns:
+            Embedding vectors in input order
+        """
+        model = model or self.embedding_model
+        batch_size = max(1, batch_size or self.embedding_batch_size)
+        
+        unique = list(dict.fromkeys(texts))
+        keys = {text: request_key("embedding", {"model": model, "input": text}) for text in unique}
+        
+        vectors: Dict[str, List[float]] = {}
+        for text in unique:
+            cached = await self.cache.get(keys[text])
+            if cached is not None:
+                self.cache_hits += 1
+                vectors[text] = cached
+        
+        async def embed_batch(batch: List[str]) -> None:
+            params = {"input": batch, "model": model}
+            try:
+                async with self._request_slot(estimate_tokens(params)) as usage:
+                    response = await self.client.embeddings.create(**params)
+                    usage["tokens"] = response.usage.total_tokens if getattr(response, 'usage', None) else 0
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings: {e}")
+                raise
+            
+            for item in response.data:
+                text = batch[item.index]
+                vectors[text] = item.embedding
+                await self.cache.set(keys[text], item.embedding)
+        
+        # Batches run concurrently, bounded by the request semaphore
+        missing = [text for text in unique if text not in vectors]
+        await asyncio.gather(*(
+            embed_batch(missing[start:start + batch_size])
+            for start in range(0, len(missing), batch_size)
+        ))
+        
+        return [list(vectors[text]) for text in texts]
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+        
+        Returns:
+            Hit/miss counts, completion tokens saved, and per-tier stats
+        """
+        stats = self.cache.get_stats()
+        stats["tokens_saved"] = self.tokens_saved
+        return stats
     
     async def moderate(self, text: str) -> Dict[str, Any]:
         """
@@ -439,6 +757,13 @@ async def quick_complete(prompt: str, **kwargs) -> str:
     return response.content if isinstance(response.content, str) else json.dumps(response.content)
 
 
+async def quick_stream(prompt: str, **kwargs) -> AsyncIterator[str]:
+    """Quick streaming completion."""
+    service = get_llm_service()
+    async for fragment in service.stream(prompt, **kwargs):
+        yield fragment
+
+
 async def quick_extract(text: str, schema: Type[BaseModel], **kwargs) -> BaseModel:
     """Quick structured extraction."""
     service = get_llm_service()
@@ -14,10 +14,12 @@ from ...database.schema import (
     SearchHistory,
     init_database,
 )
+from ...integrations.catalog_search import CatalogSearch
 from ...integrations.deezer import DeezerIntegration
 from ...integrations.spotify import SpotifyIntegration
 from ...integrations.youtube import YouTubeIntegration
 from ...utils.config import config
+from ...utils.runtime import get_runtime, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,12 @@ logger = logging.getLogger(__name__)
 db_engine, db_session_maker = init_database(config.database.url)
 
 
+async def _search_catalog(query: str, limit: int, **filters) -> List[Dict[str, Any]]:
+    # The pool is owned by the runtime loop, so it survives across tool calls
+    catalog = await get_runtime().get_client("catalog_search", CatalogSearch)
+    return await catalog.search(query, limit, **filters)
+
+
 @tool
 def search_music(query: str, platform: str = "all", limit: int = 10) -> List[Dict[str, Any]]:
     """
@@ -32,11 +40,13 @@ def search_music(query: str, platform: str = "all", limit: int = 10) -> List[Dic
     
     Args:
         query: Search query (artist, track name, etc.)
-        platform: Platform to search ("all", "deezer", "spotify", "youtube")
+        platform: Platform to search ("all", "local", "deezer", "spotify", "youtube")
         limit: Maximum number of results to return
     
     Returns:
-        List of standardized track results from specified platform(s)
+        List of standardized track results from specified platform(s).
+        With "all", the local catalog is searched first and remote
+        platforms only when it has fewer than ``limit`` matches.
     
     Example:
         >>> results = search_music("Daft Punk Get Lucky", platform="all", limit=5)
@@ -56,6 +66,19 @@ def search_music(query: str, platform: str = "all", limit: int = 10) -> List[Dic
         )
         session.add(search_entry)
         
+        if platform in ["all", "local"]:
+            try:
+                local_results = run_sync(_search_catalog(query, limit))
+                results.extend(local_results)
+                logger.info(f"Found {len(local_results)} results in the local catalog")
+            except ConnectionError as e:
+                logger.debug(f"Local catalog skipped: {e}")
+            except Exception as e:
+                logger.error(f"Local catalog search failed: {e}")
+        
+        if platform == "all" and len(results) >= limit:
+            platform = "local"  # Enough local matches; skip the remote platforms
+        
         if platform in ["all", "deezer"]:
             try:
                 deezer = DeezerIntegration()
@@ -98,6 +121,39 @@ def search_music(query: str, platform: str = "all", limit: int = 10) -> List[Dic
         return []
 
 
+@tool
+def search_local_catalog(
+    query: str = "",
+    bpm_min: Optional[float] = None,
+    bpm_max: Optional[float] = None,
+    keys: Optional[List[str]] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Search the local music catalog (synced Rekordbox library and saved tracks).
+    
+    Args:
+        query: Title, artist or album text (fuzzy; empty to filter only)
+        bpm_min: Lowest BPM
+        bpm_max: Highest BPM
+        keys: Accepted musical keys (e.g. ["8A", "9A"])
+        limit: Maximum number of results to return
+    
+    Returns:
+        List of local tracks, best match first
+    
+    Example:
+        >>> tracks = search_local_catalog("burial", bpm_min=130, bpm_max=140)
+        >>> for track in tracks:
+        >>>     print(f"{track['artist']} - {track['title']} ({track['bpm']} BPM, {track['key']})")
+    """
+    try:
+        return run_sync(_search_catalog(query, limit, bpm_min=bpm_min, bpm_max=bpm_max, keys=keys))
+    except Exception as e:
+        logger.error(f"Local catalog search failed: {e}")
+        return []
+
+
 @tool
 def match_track_across_platforms(title: str, artist: str) -> Dict[str, Any]:
     """
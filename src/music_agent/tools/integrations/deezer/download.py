@@ -12,6 +12,7 @@ import logging
 
 from ...operations.download import DownloadOperation
 from ....integrations.deezer import DeezerIntegration
+from ....utils.runtime import download_timeout, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -106,13 +107,11 @@ def download_deezer_track(track_id: str, output_dir: str = None) -> str:
         >>> result = download_deezer_track("123456789")
         >>> print(result)
     """
-    import asyncio
-    
     output_path = None
     if output_dir:
         output_path = Path(output_dir)
     
-    result = asyncio.run(deezer_download.download_track(track_id, output_path))
+    result = run_sync(deezer_download.download_track(track_id, output_path), timeout=download_timeout())
     
     if result.get('success'):
         return f"""✅ Download Complete!
@@ -9,6 +9,7 @@ from strands import tool
 
 from ...operations.metadata import MetadataOperation
 from ....integrations.deezer import DeezerIntegration
+from ....utils.runtime import run_sync
 
 
 class DeezerMetadata(MetadataOperation):
@@ -70,5 +71,4 @@ def get_deezer_track_info(track_id: str) -> Dict[str, Any]:
         >>> print(f"Title: {info['title']}")
         >>> print(f"Artist: {info['artist']['name']}")
     """
-    import asyncio
-    return asyncio.run(deezer_metadata.get_track_metadata(track_id))
\ No newline at end of file
+    return run_sync(deezer_metadata.get_track_metadata(track_id))
\ No newline at end of file
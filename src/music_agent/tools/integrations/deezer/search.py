@@ -9,6 +9,7 @@ from strands import tool
 
 from ...operations.search import SearchOperation
 from ....integrations.deezer import DeezerIntegration
+from ....utils.runtime import run_sync
 
 
 class DeezerSearch(SearchOperation):
@@ -63,8 +64,7 @@ def search_deezer_tracks(query: str, limit: int = 10) -> List[Dict[str, Any]]:
         >>> results = search_deezer_tracks("Daft Punk Get Lucky")
         >>> print(f"Found {len(results)} tracks")
     """
-    import asyncio
-    return asyncio.run(deezer_search.search_tracks(query, limit))
+    return run_sync(deezer_search.search_tracks(query, limit))
 
 
 @tool
@@ -83,5 +83,4 @@ def search_deezer_albums(query: str, limit: int = 10) -> List[Dict[str, Any]]:
         >>> results = search_deezer_albums("Random Access Memories")
         >>> print(f"Found {len(results)} albums")
     """
-    import asyncio
-    return asyncio.run(deezer_search.search_albums(query, limit))
\ No newline at end of file
+    return run_sync(deezer_search.search_albums(query, limit))
\ No newline at end of file
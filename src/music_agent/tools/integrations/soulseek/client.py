@@ -0,0 +1,22 @@
+"""
+Shared Soulseek discovery instance for the Soulseek tools.
+"""
+
+from ....integrations.soulseek import SoulseekDiscovery
+from ....utils.runtime import get_runtime
+
+
+async def _create_discovery() -> SoulseekDiscovery:
+    discovery = SoulseekDiscovery()
+    await discovery.initialize()
+    return discovery
+
+
+async def get_discovery_instance() -> SoulseekDiscovery:
+    """
+    Get or create the Soulseek discovery instance.
+    
+    The instance is owned by the shared runtime loop, so its connections
+    stay alive across tool calls.
+    """
+    return await get_runtime().get_client("soulseek_discovery", _create_discovery)
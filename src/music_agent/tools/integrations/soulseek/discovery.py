@@ -8,22 +8,11 @@ import logging
 from typing import List, Dict, Any, Optional
 from strands import tool
 
-from ....integrations.soulseek import SoulseekDiscovery
+from ....utils.runtime import run_sync
+from .client import get_discovery_instance
 
 logger = logging.getLogger(__name__)
 
-# Global Soulseek discovery instance (shared across tools)
-_discovery_instance = None
-
-
-async def get_discovery_instance():
-    """Get or create Soulseek discovery instance."""
-    global _discovery_instance
-    if _discovery_instance is None:
-        _discovery_instance = SoulseekDiscovery()
-        await _discovery_instance.initialize()
-    return _discovery_instance
-
 
 @tool
 def soulseek_discover(
@@ -58,8 +47,6 @@ def soulseek_discover(
         >>>     bpm_range="128,135"
         >>> )
     """
-    import asyncio
-    
     async def _discover():
         discovery = await get_discovery_instance()
         
@@ -105,4 +92,4 @@ def soulseek_discover(
         logger.info(f"Discovered {len(formatted)} tracks using {mode} mode")
         return formatted
     
-    return asyncio.run(_discover())
\ No newline at end of file
+    return run_sync(_discover())
\ No newline at end of file
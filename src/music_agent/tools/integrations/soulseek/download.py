@@ -9,22 +9,11 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 from strands import tool
 
-from ....integrations.soulseek import SoulseekDiscovery
+from ....utils.runtime import download_timeout, run_sync
+from .client import get_discovery_instance
 
 logger = logging.getLogger(__name__)
 
-# Global Soulseek discovery instance (shared across tools)
-_discovery_instance = None
-
-
-async def get_discovery_instance():
-    """Get or create Soulseek discovery instance."""
-    global _discovery_instance
-    if _discovery_instance is None:
-        _discovery_instance = SoulseekDiscovery()
-        await _discovery_instance.initialize()
-    return _discovery_instance
-
 
 async def extract_metadata(file_path: str) -> Dict[str, Any]:
     """Extract metadata from downloaded file."""
@@ -83,8 +72,6 @@ def soulseek_download(
         >>> if result.get("success"):
         >>>     print(f"Downloaded to: {result['file_path']}")
     """
-    import asyncio
-    
     async def _download():
         discovery = await get_discovery_instance()
         
@@ -119,4 +106,5 @@ def soulseek_download(
         logger.info(f"Successfully downloaded: {downloaded_path}")
         return result
     
-    return asyncio.run(_download())
\ No newline at end of file
+    # Transfers can sit in a peer's queue for a long time
+    return run_sync(_download(), timeout=download_timeout())
\ No newline at end of file
@@ -8,22 +8,11 @@ import logging
 from typing import List, Dict, Any, Optional
 from strands import tool
 
-from ....integrations.soulseek import SoulseekDiscovery
+from ....utils.runtime import run_sync
+from .client import get_discovery_instance
 
 logger = logging.getLogger(__name__)
 
-# Global Soulseek discovery instance (shared across tools)
-_discovery_instance = None
-
-
-async def get_discovery_instance():
-    """Get or create Soulseek discovery instance."""
-    global _discovery_instance
-    if _discovery_instance is None:
-        _discovery_instance = SoulseekDiscovery()
-        await _discovery_instance.initialize()
-    return _discovery_instance
-
 
 @tool
 def soulseek_search(
@@ -49,8 +38,6 @@ def soulseek_search(
         >>> for result in results:
         >>>     print(f"{result['filename']} from {result['username']}")
     """
-    import asyncio
-    
     async def _search():
         discovery = await get_discovery_instance()
         
@@ -85,4 +72,4 @@ def soulseek_search(
         logger.info(f"Found {len(formatted_results)} files for query: {query}")
         return formatted_results
     
-    return asyncio.run(_search())
\ No newline at end of file
+    return run_sync(_search())
\ No newline at end of file
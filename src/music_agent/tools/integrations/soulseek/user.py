@@ -8,22 +8,11 @@ import logging
 from typing import Dict, Any
 from strands import tool
 
-from ....integrations.soulseek import SoulseekDiscovery
+from ....utils.runtime import run_sync
+from .client import get_discovery_instance
 
 logger = logging.getLogger(__name__)
 
-# Global Soulseek discovery instance (shared across tools)
-_discovery_instance = None
-
-
-async def get_discovery_instance():
-    """Get or create Soulseek discovery instance."""
-    global _discovery_instance
-    if _discovery_instance is None:
-        _discovery_instance = SoulseekDiscovery()
-        await _discovery_instance.initialize()
-    return _discovery_instance
-
 
 @tool
 def soulseek_user_info(username: str) -> Dict[str, Any]:
@@ -41,8 +30,6 @@ def soulseek_user_info(username: str) -> Dict[str, Any]:
         >>> if info.get("success"):
         >>>     print(f"User info: {info['info']}")
     """
-    import asyncio
-    
     async def _get_user_info():
         discovery = await get_discovery_instance()
         
@@ -62,7 +49,7 @@ def soulseek_user_info(username: str) -> Dict[str, Any]:
                 "success": False
             }
     
-    return asyncio.run(_get_user_info())
+    return run_sync(_get_user_info())
 
 
 @tool
@@ -83,8 +70,6 @@ def soulseek_browse_user(username: str, limit: int = 50) -> Dict[str, Any]:
         >>>     for file in files["files"]:
         >>>         print(f"{file['filename']} ({file['size_mb']:.2f} MB)")
     """
-    import asyncio
-    
     async def _browse_user():
         discovery = await get_discovery_instance()
         
@@ -109,4 +94,4 @@ def soulseek_browse_user(username: str, limit: int = 50) -> Dict[str, Any]:
             "success": True
         }
     
-    return asyncio.run(_browse_user())
\ No newline at end of file
+    return run_sync(_browse_user())
\ No newline at end of file
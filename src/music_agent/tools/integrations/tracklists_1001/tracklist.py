@@ -4,7 +4,6 @@
 Provides comprehensive tracklist analysis and DJ discovery functionality.
 """
 
-import asyncio
 from typing import Optional, List, Dict, Any
 from strands import tool
 
@@ -13,10 +12,12 @@ from ....integrations.tracklists_1001 import (
     DJSetInfo,
     DJSetTrack
 )
+from ....utils.runtime import get_runtime, run_sync
 
 
-# Initialize integration
-tracklists = OneThousandOneTracklistsIntegration()
+async def get_tracklists() -> OneThousandOneTracklistsIntegration:
+    """Get the integration owned by the shared runtime loop."""
+    return await get_runtime().get_client("tracklists_1001", OneThousandOneTracklistsIntegration)
 
 
 @tool
@@ -37,10 +38,11 @@ def get_1001_tracklist(url: str, enhance: bool = True) -> Dict[str, Any]:
         >>> print(f"Tracks: {tracklist['track_count']}")
     """
     async def _fetch():
+        tracklists = await get_tracklists()
         dj_set = await tracklists.get_tracklist(url, enhance=enhance)
         return dj_set.to_dict()
     
-    return asyncio.run(_fetch())
+    return run_sync(_fetch())
 
 
 @tool
@@ -66,10 +68,11 @@ def analyze_dj_style(dj_name: str, num_sets: int = 10) -> Dict[str, Any]:
         >>> print(f"Average BPM: {analysis['avg_bpm']}")
     """
     async def _analyze():
+        tracklists = await get_tracklists()
         analysis = await tracklists.analyze_dj_style(dj_name, num_sets)
         return analysis.to_dict()
     
-    return asyncio.run(_analyze())
+    return run_sync(_analyze())
 
 
 @tool
@@ -97,6 +100,7 @@ def discover_festival_tracks(
         >>>     print(f"{track['artist']} - {track['title']} ({track['play_count']} plays)")
     """
     async def _discover():
+        tracklists = await get_tracklists()
         trends = await tracklists.discover_festival_tracks(
             festival_name, 
             year=year,
@@ -105,4 +109,4 @@ def discover_festival_tracks(
         )
         return [track.to_dict() for track in trends]
     
-    return asyncio.run(_discover())
\ No newline at end of file
+    return run_sync(_discover())
\ No newline at end of file
@@ -166,6 +166,7 @@ class ToolRegistry:
         try:
             from .core import (
                 search_music,
+                search_local_catalog,
                 match_track_across_platforms,
                 search_and_download,
                 create_cross_platform_playlist,
@@ -176,6 +177,7 @@ class ToolRegistry:
             
             core_tools = [
                 (search_music, ToolCategory.SEARCH, "Search music across all platforms"),
+                (search_local_catalog, ToolCategory.SEARCH, "Search the local catalog by text, BPM and key"),
                 (match_track_across_platforms, ToolCategory.SEARCH, "Find same track across platforms"),
                 (search_and_download, ToolCategory.DOWNLOAD, "Search and download with intelligent routing"),
                 (create_cross_platform_playlist, ToolCategory.PLAYLIST, "Create playlists from multiple platforms"),
@@ -0,0 +1,376 @@
+"""
+Pooled headless-browser renderer for JavaScript-heavy pages.
+
+Launching a page per URL and letting it download every image, font, ad and
+analytics script makes each render slow, and a serial fetch loop multiplies
+that by every page of a crawl. ``BrowserPool`` keeps one Chromium instance
+with a fixed set of reusable contexts/pages, aborts requests for heavy or
+third-party resources at the context level, waits on DOM events instead of
+fixed sleeps, and renders concurrently under a per-domain politeness budget.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+from .rate_limit import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.async_api import async_playwright, Error as PlaywrightError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    async_playwright = None
+    PlaywrightError = Exception
+    PLAYWRIGHT_AVAILABLE = False
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Hosts whose requests never affect page content we parse
+DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "amazon-adsystem.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+)
+
+
+@dataclass
+class RenderedPage:
+    """Rendered HTML plus the main document's HTTP response details."""
+
+    url: str
+    html: str
+    status: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Browser pool configuration."""
+
+    pool_size: int = 4  # Reusable pages (one per browser context)
+    headless: bool = True
+    navigation_timeout: float = 20.0
+    selector_timeout: float = 5.0
+    requests_per_second: float = 1.0  # Per-domain politeness budget
+    burst: int = 2
+    per_domain_concurrency: int = 4
+    recycle_after: int = 50  # Renders before a page is replaced (bounds leaks)
+    blocked_resource_types: Tuple[str, ...] = ("image", "media", "font")
+    blocked_hosts: Tuple[str, ...] = DEFAULT_BLOCKED_HOSTS
+    user_agent: str = DEFAULT_USER_AGENT
+    viewport: Dict[str, int] = field(default_factory=lambda: {"width": 1920, "height": 1080})
+
+    @classmethod
+    def from_env(cls) -> "BrowserPoolConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            pool_size=int(os.getenv("BROWSER_POOL_SIZE", "4")),
+            headless=os.getenv("BROWSER_HEADLESS", "true").lower() == "true",
+            navigation_timeout=float(os.getenv("BROWSER_NAVIGATION_TIMEOUT", "20")),
+            selector_timeout=float(os.getenv("BROWSER_SELECTOR_TIMEOUT", "5")),
+            requests_per_second=float(os.getenv("BROWSER_REQUESTS_PER_SECOND", "1.0")),
+            burst=int(os.getenv("BROWSER_BURST", "2")),
+            per_domain_concurrency=int(os.getenv("BROWSER_PER_DOMAIN_CONCURRENCY", "4")),
+        )
+
+
+class BrowserPool:
+    """
+    Pool of reusable Playwright pages for concurrent rendering.
+
+    Must be used from a single event loop (e.g. the shared runtime loop).
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        """
+        Initialize browser pool (the browser launches on first use).
+
+        Args:
+            config: Pool configuration (loads from environment if not provided)
+        """
+        self.config = config or BrowserPoolConfig.from_env()
+
+        self._playwright = None
+        self._browser = None
+        self._contexts: List = []
+        self._pages: Optional[asyncio.Queue] = None
+        self._uses: Dict[int, int] = {}
+        self._domain_limiters: Dict[str, AsyncRateLimiter] = {}
+        self._start_lock = asyncio.Lock()
+
+        # Counters for tuning
+        self.rendered = 0
+        self.failed = 0
+        self.blocked_requests = 0
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    @property
+    def started(self) -> bool:
+        """Whether the browser is running."""
+        return self._browser is not None
+
+    async def start(self) -> None:
+        """Launch the browser and open the pooled pages."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise ImportError(
+                "playwright is required for browser rendering. "
+                "Install with: pip install playwright && playwright install chromium"
+            )
+
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.config.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+            )
+
+            self._pages = asyncio.Queue()
+            for _ in range(max(1, self.config.pool_size)):
+                await self._pages.put(await self._new_page())
+
+            logger.info(f"Browser pool started with {self.config.pool_size} pages")
+
+    async def _new_page(self):
+        """Open a page in a fresh context with request blocking installed."""
+        context = await self._browser.new_context(
+            viewport=self.config.viewport,
+            user_agent=self.config.user_agent,
+        )
+        context.set_default_navigation_timeout(self.config.navigation_timeout * 1000)
+        await context.route("**/*", self._route)
+        self._contexts.append(context)
+
+        page = await context.new_page()
+        self._uses[id(page)] = 0
+        return page
+
+    async def _retire_page(self, page) -> None:
+        """Close a page and its context."""
+        self._uses.pop(id(page), None)
+        context = page.context
+        try:
+            await context.close()
+        except PlaywrightError:
+            pass
+        if context in self._contexts:
+            self._contexts.remove(context)
+
+    async def _route(self, route) -> None:
+        """Abort heavy and third-party tracking requests."""
+        request = route.request
+        if request.resource_type in self.config.blocked_resource_types or self._is_blocked_host(request.url):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _is_blocked_host(self, url: str) -> bool:
+        host = urlparse(url).hostname or ""
+        return any(host == blocked or host.endswith("." + blocked) for blocked in self.config.blocked_hosts)
+
+    def _limiter_for(self, url: str) -> AsyncRateLimiter:
+        """Get the politeness budget for a URL's domain."""
+        domain = urlparse(url).hostname or ""
+        limiter = self._domain_limiters.get(domain)
+        if limiter is None:
+            limiter = AsyncRateLimiter(
+                self.config.requests_per_second,
+                burst=self.config.burst,
+                max_concurrency=self.config.per_domain_concurrency,
+            )
+            self._domain_limiters[domain] = limiter
+        return limiter
+
+    async def render(self, url: str, wait_for: Optional[str] = None) -> Optional[str]:
+        """
+        Render a page and return its HTML.
+
+        Args:
+            url: URL to render
+            wait_for: CSS selector indicating the content has rendered
+
+        Returns:
+            HTML content or None if rendering failed
+        """
+        page = await self.fetch(url, wait_for)
+        return page.html if page else None
+
+    async def fetch(self, url: str, wait_for: Optional[str] = None) -> Optional[RenderedPage]:
+        """
+        Render a page and return its HTML with the document response headers.
+
+        Waits for DOMContentLoaded and then, if ``wait_for`` is given, for the
+        first matching element (bounded by ``selector_timeout``). Cancelling
+        the calling task aborts the navigation; the page is then replaced so
+        the pool never hands out a page in an unknown state.
+
+        Args:
+            url: URL to render
+            wait_for: CSS selector indicating the content has rendered
+
+        Returns:
+            RenderedPage or None if rendering failed
+        """
+        await self.start()
+
+        async with self._limiter_for(url):
+            page = await self._pages.get()
+            healthy = True
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded")
+
+                if wait_for:
+                    try:
+                        await page.wait_for_selector(wait_for, timeout=self.config.selector_timeout * 1000)
+                    except PlaywrightError:
+                        logger.debug(f"Selector not found on {url}, using DOM as loaded")
+
+                html = await page.content()
+                self.rendered += 1
+                return RenderedPage(
+                    url=url,
+                    html=html,
+                    status=response.status if response else None,
+                    headers=await response.all_headers() if response else {},
+                )
+
+            except asyncio.CancelledError:
+                healthy = False
+                raise
+            except PlaywrightError as e:
+                healthy = False
+                self.failed += 1
+                logger.error(f"Browser failed to render {url}: {e}")
+                return None
+
+            finally:
+                self._uses[id(page)] = self._uses.get(id(page), 0) + 1
+                if not healthy or self._uses[id(page)] >= self.config.recycle_after:
+                    await self._replace_page(page)
+                else:
+                    self._pages.put_nowait(page)
+
+    async def _replace_page(self, page) -> None:
+        """Swap a used page for a fresh one, keeping the pool size constant."""
+        await self._retire_page(page)
+        if self._browser is None:
+            return
+        try:
+            self._pages.put_nowait(await self._new_page())
+        except PlaywrightError as e:
+            logger.error(f"Failed to replace browser page: {e}")
+
+    async def render_many(
+        self,
+        urls: Sequence[str],
+        wait_for: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Render several pages concurrently.
+
+        Args:
+            urls: URLs to render
+            wait_for: CSS selector indicating the content has rendered
+
+        Returns:
+            Dictionary mapping each URL to its HTML (None on failure)
+        """
+        pages = await self.fetch_many(urls, wait_for)
+        return {url: page.html if page else None for url, page in pages.items()}
+
+    async def fetch_many(
+        self,
+        urls: Sequence[str],
+        wait_for: Optional[str] = None
+    ) -> Dict[str, Optional[RenderedPage]]:
+        """
+        Render several pages concurrently, keeping response headers.
+
+        Args:
+            urls: URLs to render
+            wait_for: CSS selector indicating the content has rendered
+
+        Returns:
+            Dictionary mapping each URL to its RenderedPage (None on failure)
+        """
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self.fetch(url, wait_for) for url in unique),
+            return_exceptions=True,
+        )
+        return {
+            url: None if isinstance(result, BaseException) else result
+            for url, result in zip(unique, results)
+        }
+
+    async def close(self) -> None:
+        """Close every page, context and the browser."""
+        async with self._start_lock:
+            for context in list(self._contexts):
+                try:
+                    await context.close()
+                except PlaywrightError:
+                    pass
+            self._contexts.clear()
+            self._uses.clear()
+            self._pages = None
+
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get renderer counters.
+
+        Returns:
+            Dictionary of render, failure and blocked-request counts
+        """
+        return {
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "blocked_requests": self.blocked_requests,
+            "pool_size": self.config.pool_size,
+            "idle_pages": self._pages.qsize() if self._pages else 0,
+        }
+
+
+__all__ = [
+    "RenderedPage",
+    "BrowserPoolConfig",
+    "BrowserPool",
+    "PLAYWRIGHT_AVAILABLE",
+]
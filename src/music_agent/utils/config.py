@@ -168,6 +168,13 @@ class OpenAIConfig(BaseModel):
     organization: Optional[str] = Field(default=None, description="OpenAI organization")
     max_tokens: int = Field(default=200000, description="Max tokens for completion")
     temperature: float = Field(default=0.7, description="Temperature for completion")
+    embedding_batch_size: int = Field(default=256, description="Inputs per embeddings request")
+    cache_enabled: bool = Field(default=True, description="Cache LLM responses and embeddings on disk")
+    cache_path: str = Field(default="~/.music_agent_cache/llm.db", description="LLM response cache file")
+    cache_ttl: int = Field(default=7 * 24 * 3600, description="LLM response cache TTL in seconds")
+    cache_max_mb: int = Field(default=500, description="LLM response cache size bound in MB")
+    max_concurrency: int = Field(default=8, description="Maximum OpenAI requests in flight")
+    tokens_per_minute: int = Field(default=0, description="Token budget per minute (0 = unlimited)")
 
 
 class AWSConfig(BaseModel):
@@ -364,6 +371,13 @@ class Config(BaseModel):
                 organization=os.getenv("OPENAI_ORGANIZATION"),
                 max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "200000")),
                 temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.7")),
+                embedding_batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "256")),
+                cache_enabled=os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true",
+                cache_path=os.getenv("LLM_CACHE_PATH", "~/.music_agent_cache/llm.db"),
+                cache_ttl=int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600))),
+                cache_max_mb=int(os.getenv("LLM_CACHE_MAX_MB", "500")),
+                max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+                tokens_per_minute=int(os.getenv("OPENAI_TPM", "0")),
             ),
             aws=AWSConfig(
                 region=os.getenv("AWS_REGION", "us-east-1"),
@@ -0,0 +1,319 @@
+"""
+Concurrent, resumable crawl engine.
+
+A crawl starts from seed tasks and expands as each task is handled: a
+handler fetches a page, may produce a result, and may discover further
+tasks (e.g. the set pages linked from a festival page). ``Crawler`` keeps
+a frontier queue, skips URLs it has already seen, runs a bounded number of
+handlers concurrently, and streams results as an async generator as soon
+as they are ready.
+
+The crawl state (pending tasks, completed and failed URLs) is checkpointed
+to a JSON file, so a crawl that is interrupted (cancelled, timed out,
+process killed) picks up where it stopped instead of starting over. Tasks
+that were in flight when it stopped are still pending and are retried.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def default_state_dir() -> Path:
+    """Directory for crawl checkpoints (``CRAWL_STATE_DIR``)."""
+    return Path(os.getenv("CRAWL_STATE_DIR", "~/.music_agent_cache/crawls")).expanduser()
+
+
+@dataclass
+class CrawlTask:
+    """A URL to visit and what kind of page it is."""
+
+    url: str
+    kind: str
+    depth: int = 0
+    data: Dict[str, Any] = field(default_factory=dict)  # Context from the page that linked here
+
+
+@dataclass
+class CrawlState:
+    """Frontier and visited sets of a crawl."""
+
+    pending: Dict[str, CrawlTask] = field(default_factory=dict)  # Queued or in flight, in discovery order
+    done: Set[str] = field(default_factory=set)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    def seen(self, url: str) -> bool:
+        """Whether a URL has already been queued or visited."""
+        return url in self.pending or url in self.done or url in self.failed
+
+    @property
+    def finished(self) -> bool:
+        """Whether nothing is left to visit."""
+        return not self.pending
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "pending": [asdict(task) for task in self.pending.values()],
+            "done": sorted(self.done),
+            "failed": self.failed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CrawlState":
+        """Create state from a dictionary written by ``to_dict``."""
+        pending = {}
+        for item in data.get("pending", []):
+            task = CrawlTask(**item)
+            pending[task.url] = task
+        return cls(
+            pending=pending,
+            done=set(data.get("done", [])),
+            failed=dict(data.get("failed", {})),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["CrawlState"]:
+        """
+        Load a checkpoint.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            Saved state, or None if there is no usable checkpoint
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable crawl checkpoint {path}: {e}")
+            return None
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write a checkpoint atomically.
+
+        Args:
+            path: Checkpoint file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict()))
+        os.replace(tmp_path, path)
+
+
+# Handles a task: returns an optional result and newly discovered tasks
+CrawlHandler = Callable[[CrawlTask], Awaitable[Tuple[Optional[T], Iterable[CrawlTask]]]]
+
+
+class Crawler(Generic[T]):
+    """
+    Frontier-queue crawler with bounded concurrency and checkpointing.
+
+    Fetch politeness (rate limits, per-domain budgets) is the handler's
+    job; the crawler only bounds how many handlers run at once.
+    """
+
+    def __init__(
+        self,
+        handler: CrawlHandler,
+        concurrency: int = 4,
+        state_path: Optional[Union[str, Path]] = None,
+        resume: bool = True,
+        max_depth: Optional[int] = None,
+        max_tasks: Optional[int] = None,
+        checkpoint_every: int = 10
+    ):
+        """
+        Initialize crawler.
+
+        Args:
+            handler: Coroutine function handling one task
+            concurrency: Maximum tasks handled at once
+            state_path: Checkpoint file (no checkpointing if not set)
+            resume: Continue from an existing checkpoint instead of starting over
+            max_depth: Ignore discovered tasks deeper than this
+            max_tasks: Stop queueing new tasks after this many have been seen
+            checkpoint_every: Completed tasks between checkpoints
+        """
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.state_path = Path(state_path) if state_path else None
+        self.max_depth = max_depth
+        self.max_tasks = max_tasks
+        self.checkpoint_every = max(1, checkpoint_every)
+
+        loaded = CrawlState.load(self.state_path) if self.state_path and resume else None
+        self.state = loaded or CrawlState()
+        if loaded:
+            logger.info(
+                f"Resuming crawl from {self.state_path}: "
+                f"{len(loaded.pending)} pending, {len(loaded.done)} done"
+            )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._since_checkpoint = 0
+
+    def _add(self, task: CrawlTask) -> bool:
+        """Add a task to the frontier unless it was seen or is out of bounds."""
+        if self.state.seen(task.url):
+            return False
+        if self.max_depth is not None and task.depth > self.max_depth:
+            return False
+        if self.max_tasks is not None:
+            seen = len(self.state.pending) + len(self.state.done) + len(self.state.failed)
+            if seen >= self.max_tasks:
+                return False
+
+        self.state.pending[task.url] = task
+        if self._queue is not None:
+            self._queue.put_nowait(task)
+        return True
+
+    def checkpoint(self) -> None:
+        """Write the crawl state (removing the checkpoint once the crawl is finished)."""
+        self._since_checkpoint = 0
+        if not self.state_path:
+            return
+        try:
+            if self.state.finished:
+                self.state_path.unlink(missing_ok=True)
+            else:
+                self.state.save(self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to write crawl checkpoint {self.state_path}: {e}")
+
+    def _finish(self, task: CrawlTask, error: Optional[str] = None) -> None:
+        """Move a task out of the frontier, checkpointing periodically."""
+        self.state.pending.pop(task.url, None)
+        if error is None:
+            self.state.done.add(task.url)
+        else:
+            self.state.failed[task.url] = error
+
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    async def _worker(self, results: asyncio.Queue) -> None:
+        """Handle tasks from the frontier until cancelled."""
+        while True:
+            task = await self._queue.get()
+            try:
+                result, discovered = await self.handler(task)
+
+                for new_task in discovered or ():
+                    self._add(new_task)
+
+                if result is None:
+                    self._finish(task)
+                else:
+                    # Finished once delivered; bounded, so this waits for
+                    # the consumer (backpressure)
+                    await results.put((task, result))
+
+            except asyncio.CancelledError:
+                # Still pending: retried when the crawl resumes
+                raise
+            except Exception as e:
+                logger.warning(f"Crawl task failed for {task.url}: {e}")
+                self._finish(task, str(e))
+            finally:
+                self._queue.task_done()
+
+    async def crawl(self, seeds: Iterable[CrawlTask] = ()) -> AsyncIterator[T]:
+        """
+        Crawl from the seeds (plus anything pending from a checkpoint).
+
+        Results are yielded as soon as handlers produce them, so their order
+        follows completion rather than discovery. Stopping iteration early
+        (``break`` inside ``contextlib.aclosing``) cancels in-flight tasks
+        and checkpoints them as pending.
+
+        Args:
+            seeds: Initial tasks (already-seen URLs are skipped)
+
+        Yields:
+            Handler results
+        """
+        self._queue = asyncio.Queue()
+        for task in self.state.pending.values():
+            self._queue.put_nowait(task)
+        for task in seeds:
+            self._add(task)
+
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._worker(results)) for _ in range(self.concurrency)]
+        frontier_done = asyncio.create_task(self._queue.join())
+
+        try:
+            while True:
+                get_result = asyncio.ensure_future(results.get())
+                done, _ = await asyncio.wait({get_result, frontier_done}, return_when=asyncio.FIRST_COMPLETED)
+
+                if get_result in done:
+                    task, result = get_result.result()
+                    self._finish(task)
+                    yield result
+                    continue
+
+                get_result.cancel()
+                # Frontier drained; flush anything produced meanwhile
+                while not results.empty():
+                    task, result = results.get_nowait()
+                    self._finish(task)
+                    yield result
+                break
+
+        finally:
+            for worker in workers:
+                worker.cancel()
+            frontier_done.cancel()
+            await asyncio.gather(*workers, frontier_done, return_exceptions=True)
+            self._queue = None
+            self.checkpoint()
+
+    async def collect(self, seeds: Iterable[CrawlTask] = ()) -> List[T]:
+        """
+        Run a crawl to completion.
+
+        Args:
+            seeds: Initial tasks
+
+        Returns:
+            All results in completion order
+        """
+        return [result async for result in self.crawl(seeds)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get crawl progress.
+
+        Returns:
+            Pending, done and failed task counts
+        """
+        return {
+            "pending": len(self.state.pending),
+            "done": len(self.state.done),
+            "failed": len(self.state.failed),
+        }
+
+
+__all__ = [
+    "CrawlTask",
+    "CrawlState",
+    "Crawler",
+    "default_state_dir",
+]
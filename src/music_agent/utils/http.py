@@ -0,0 +1,336 @@
+"""
+Process-wide HTTP connection pooling for the asyncio integrations.
+
+Every integration used to create its own ``aiohttp.ClientSession`` (and with
+it a private connection pool and DNS cache), so clients instantiated per
+research task paid for fresh TCP/TLS handshakes and DNS lookups every time.
+
+``HTTPSessionManager`` owns one ``TCPConnector`` per event loop with
+per-host limits, keep-alive and DNS caching. Integrations borrow lightweight
+sessions that share that connector: each session keeps its own headers,
+timeouts and cookie jar, and closing it leaves the pool warm for the next
+client. Request/connection tracing feeds ``PoolMetrics`` for tuning.
+
+aiohttp speaks HTTP/1.1 only, so pooled connections are not multiplexed;
+``limit_per_host`` is the concurrency per host.
+
+Sessions default to a 30 s total timeout. Sessions that stream whole
+tracks or mixes pass ``DOWNLOAD_TIMEOUT`` instead, which only bounds stalls.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Callable, Awaitable
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+LifecycleHook = Callable[["HTTPSessionManager"], Awaitable[None]]
+
+# No total cap (a long mix can take minutes); fail only when reads stall
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_read=60)
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool configuration."""
+
+    limit: int = 100  # Total connections across all hosts
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300  # Seconds; None disables expiry
+    use_dns_cache: bool = True
+    default_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "HTTPPoolConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10")),
+            keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")),
+            dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+            default_timeout=float(os.getenv("HTTP_DEFAULT_TIMEOUT", "30")),
+        )
+
+
+@dataclass
+class PoolMetrics:
+    """Pool utilization counters collected through aiohttp tracing."""
+
+    requests_total: int = 0
+    requests_failed: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    in_flight_by_host: Dict[str, int] = field(default_factory=dict)
+    requests_by_host: Dict[str, int] = field(default_factory=dict)
+    connections_created: int = 0
+    connections_reused: int = 0
+    connection_queue_waits: int = 0
+    connection_queue_time: float = 0.0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    def to_dict(self, limit: int, limit_per_host: int) -> Dict[str, Any]:
+        """Convert to a dictionary with derived ratios."""
+        connections = self.connections_created + self.connections_reused
+        dns_lookups = self.dns_cache_hits + self.dns_cache_misses
+        return {
+            "requests_total": self.requests_total,
+            "requests_failed": self.requests_failed,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilization": self.in_flight / limit if limit else 0.0,
+            "host_utilization": {
+                host: count / limit_per_host if limit_per_host else 0.0
+                for host, count in self.in_flight_by_host.items() if count
+            },
+            "requests_by_host": dict(self.requests_by_host),
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connection_reuse_rate": self.connections_reused / connections if connections else 0.0,
+            "connection_queue_waits": self.connection_queue_waits,
+            "avg_connection_queue_time": (
+                self.connection_queue_time / self.connection_queue_waits
+                if self.connection_queue_waits else 0.0
+            ),
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "dns_cache_hit_rate": self.dns_cache_hits / dns_lookups if dns_lookups else 0.0,
+        }
+
+
+class HTTPSessionManager:
+    """Owns the shared connection pool(s) and hands out sessions."""
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        """
+        Initialize session manager.
+
+        Args:
+            config: Pool configuration (loads from environment if not provided)
+        """
+        self.config = config or HTTPPoolConfig.from_env()
+        self.metrics = PoolMetrics()
+
+        # aiohttp connectors are bound to the loop they were created on
+        self._connectors: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = {}
+        self._startup_hooks: List[LifecycleHook] = []
+        self._shutdown_hooks: List[LifecycleHook] = []
+        self._trace_config = self._build_trace_config()
+
+    # Lifecycle hooks
+
+    def on_startup(self, hook: LifecycleHook) -> LifecycleHook:
+        """Register a coroutine run when a pool is created on a loop."""
+        self._startup_hooks.append(hook)
+        return hook
+
+    def on_shutdown(self, hook: LifecycleHook) -> LifecycleHook:
+        """Register a coroutine run before a loop's pool is closed."""
+        self._shutdown_hooks.append(hook)
+        return hook
+
+    async def _run_hooks(self, hooks: List[LifecycleHook]) -> None:
+        for hook in hooks:
+            try:
+                await hook(self)
+            except Exception as e:
+                logger.warning(f"HTTP lifecycle hook {hook!r} failed: {e}")
+
+    # Pool management
+
+    def _prune_closed_loops(self) -> None:
+        """Forget pools whose event loop has been closed."""
+        for loop in [loop for loop in self._connectors if loop.is_closed()]:
+            self._connectors.pop(loop, None)
+
+    async def get_connector(self) -> aiohttp.TCPConnector:
+        """
+        Get the shared connector for the running event loop.
+
+        Returns:
+            TCPConnector shared by all borrowed sessions on this loop
+        """
+        loop = asyncio.get_running_loop()
+        connector = self._connectors.get(loop)
+
+        if connector is None or connector.closed:
+            self._prune_closed_loops()
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                use_dns_cache=self.config.use_dns_cache,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+            )
+            self._connectors[loop] = connector
+            logger.debug(
+                f"Created shared HTTP pool (limit={self.config.limit}, "
+                f"per_host={self.config.limit_per_host})"
+            )
+            await self._run_hooks(self._startup_hooks)
+
+        return connector
+
+    async def session(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        **kwargs
+    ) -> aiohttp.ClientSession:
+        """
+        Borrow a session backed by the shared pool.
+
+        The caller owns (and should close) the returned session; closing it
+        does not close the shared connector.
+
+        Args:
+            headers: Default headers for this session
+            timeout: Default timeout for this session
+            **kwargs: Extra ClientSession arguments (cookie_jar, ...)
+
+        Returns:
+            aiohttp ClientSession
+        """
+        connector = await self.get_connector()
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=False,
+            headers=headers,
+            timeout=timeout or aiohttp.ClientTimeout(total=self.config.default_timeout),
+            trace_configs=[self._trace_config],
+            **kwargs
+        )
+
+    async def close(self) -> None:
+        """Close the pools bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        connector = self._connectors.pop(loop, None)
+        if connector is None:
+            return
+
+        await self._run_hooks(self._shutdown_hooks)
+        if not connector.closed:
+            await connector.close()
+
+    # Metrics
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool utilization metrics.
+
+        Returns:
+            Dictionary of counters and derived ratios
+        """
+        stats = self.metrics.to_dict(self.config.limit, self.config.limit_per_host)
+        stats["pools"] = sum(1 for c in self._connectors.values() if not c.closed)
+        return stats
+
+    def reset_metrics(self) -> None:
+        """Reset metric counters (in-flight gauges are preserved)."""
+        in_flight = self.metrics.in_flight
+        by_host = dict(self.metrics.in_flight_by_host)
+        self.metrics = PoolMetrics(in_flight=in_flight, in_flight_by_host=by_host)
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Wire aiohttp tracing signals to the metric counters."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            host = params.url.host or ""
+            ctx.host = host
+            m = self.metrics
+            m.requests_total += 1
+            m.in_flight += 1
+            m.peak_in_flight = max(m.peak_in_flight, m.in_flight)
+            m.in_flight_by_host[host] = m.in_flight_by_host.get(host, 0) + 1
+            m.requests_by_host[host] = m.requests_by_host.get(host, 0) + 1
+
+        def finish(ctx) -> None:
+            m = self.metrics
+            host = getattr(ctx, "host", "")
+            m.in_flight = max(0, m.in_flight - 1)
+            if m.in_flight_by_host.get(host):
+                m.in_flight_by_host[host] -= 1
+
+        async def on_request_end(session, ctx, params):
+            finish(ctx)
+
+        async def on_request_exception(session, ctx, params):
+            self.metrics.requests_failed += 1
+            finish(ctx)
+
+        async def on_connection_create_end(session, ctx, params):
+            self.metrics.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.metrics.connections_reused += 1
+
+        async def on_connection_queued_start(session, ctx, params):
+            ctx.queued_at = asyncio.get_running_loop().time()
+
+        async def on_connection_queued_end(session, ctx, params):
+            self.metrics.connection_queue_waits += 1
+            self.metrics.connection_queue_time += asyncio.get_running_loop().time() - ctx.queued_at
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.metrics.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.metrics.dns_cache_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_connection_queued_start.append(on_connection_queued_start)
+        trace.on_connection_queued_end.append(on_connection_queued_end)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+
+# Global session manager instance
+_manager: Optional[HTTPSessionManager] = None
+
+
+def get_http_manager() -> HTTPSessionManager:
+    """Get the process-wide session manager."""
+    global _manager
+    if _manager is None:
+        _manager = HTTPSessionManager()
+    return _manager
+
+
+async def shared_session(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+    **kwargs
+) -> aiohttp.ClientSession:
+    """
+    Borrow a session backed by the process-wide pool.
+
+    Args:
+        headers: Default headers for this session
+        timeout: Default timeout for this session
+        **kwargs: Extra ClientSession arguments
+
+    Returns:
+        aiohttp ClientSession (close it when done; the pool stays open)
+    """
+    return await get_http_manager().session(headers=headers, timeout=timeout, **kwargs)
+
+
+__all__ = [
+    "DOWNLOAD_TIMEOUT",
+    "HTTPPoolConfig",
+    "PoolMetrics",
+    "HTTPSessionManager",
+    "get_http_manager",
+    "shared_session",
+]
@@ -0,0 +1,540 @@
+"""
+Background jobs on the shared runtime loop.
+
+Research and download requests can take minutes (several agent turns, each
+calling platform tools), and ``MusicAgent.chat`` blocks its caller for all of
+it. ``JobManager`` runs that work in the background instead: ``submit``
+returns a job ID immediately, the job reports progress as it goes, and
+callers poll ``updates``/``get`` or block on ``wait``.
+
+Concurrency is capped twice: a global worker limit, and a per-platform limit
+so that queuing fifty lookups doesn't open fifty Deezer sessions at once. A
+job that queries several platforms takes a slot on each of them.
+Synchronous work (agent turns, the sync tool wrappers) runs in a dedicated
+thread pool sized to the worker limit.
+
+Cancelling a queued job drops it. A running job stops at its next
+``report``/``raise_if_cancelled`` call; threads can't be interrupted, so work
+that never checks runs to completion and its result is discarded. Until its
+thread returns, the job stays running and keeps its worker and platform
+slots, so the next "conversation" job can't overlap a cancelled turn.
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import atexit
+import inspect
+import logging
+import threading
+import functools
+import concurrent.futures
+from contextlib import AsyncExitStack
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .runtime import AsyncRuntime, get_runtime
+
+logger = logging.getLogger(__name__)
+
+# Platforms without an explicit limit; "conversation" serializes turns on the
+# shared chat agent, whose message history can't take concurrent calls
+DEFAULT_PLATFORM_LIMITS = {
+    "conversation": 1,
+    "deezer": 2,
+    "soulseek": 3,
+    "spotify": 2,
+    "youtube": 2,
+}
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+class JobCancelled(Exception):
+    """Raised inside a job that was cancelled while running."""
+
+
+@dataclass
+class JobUpdate:
+    """One progress report from a job."""
+    seq: int
+    timestamp: float
+    message: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "timestamp": self.timestamp, "message": self.message, "data": self.data}
+
+
+@dataclass
+class Job:
+    """A unit of background work and its progress."""
+    id: str
+    kind: str
+    description: str
+    platform: Optional[str] = None
+    platforms: List[str] = field(default_factory=list)  # Slots held while running
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    updates: List[JobUpdate] = field(default_factory=list)
+
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _future: Optional[concurrent.futures.Future] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (in any way)."""
+        return self.status in FINISHED
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._cancel.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent running (so far)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def raise_if_cancelled(self):
+        """
+        Stop the job if it was cancelled.
+
+        Raises:
+            JobCancelled: If cancellation was requested
+        """
+        if self._cancel.is_set():
+            raise JobCancelled(self.id)
+
+    def report(self, message: str, **data) -> JobUpdate:
+        """
+        Record a progress update (callable from any thread).
+
+        Args:
+            message: Human-readable status
+            **data: Partial results or details
+
+        Returns:
+            The recorded update
+
+        Raises:
+            JobCancelled: If the job was cancelled
+        """
+        self.raise_if_cancelled()
+        with self._lock:
+            update = JobUpdate(len(self.updates) + 1, time.time(), message, data)
+            self.updates.append(update)
+        return update
+
+    def updates_since(self, seq: int = 0) -> List[JobUpdate]:
+        """
+        Get updates after a sequence number.
+
+        Args:
+            seq: Last sequence number already seen
+
+        Returns:
+            Newer updates, oldest first
+        """
+        with self._lock:
+            return self.updates[seq:]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job and its updates."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "description": self.description,
+            "platform": self.platform,
+            "platforms": list(self.platforms),
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed": round(self.elapsed, 2),
+            "result": self.result,
+            "error": self.error,
+            "updates": [u.to_dict() for u in self.updates_since()],
+        }
+
+
+@dataclass
+class JobConfig:
+    """Worker pool configuration."""
+
+    max_workers: int = 8
+    default_platform_limit: int = 4
+    platform_limits: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_PLATFORM_LIMITS))
+    keep_finished: int = 200       # Finished jobs kept for `jobs`/`job <id>`
+
+    @classmethod
+    def from_env(cls) -> "JobConfig":
+        """
+        Create configuration from environment variables.
+
+        ``MUSIC_AGENT_JOB_LIMITS`` overrides per-platform limits, e.g.
+        ``deezer=1,soulseek=5``.
+        """
+        limits = dict(DEFAULT_PLATFORM_LIMITS)
+        for entry in os.getenv("MUSIC_AGENT_JOB_LIMITS", "").split(","):
+            if "=" in entry:
+                platform, _, limit = entry.partition("=")
+                limits[platform.strip().lower()] = max(1, int(limit))
+
+        return cls(
+            max_workers=max(1, int(os.getenv("MUSIC_AGENT_JOB_WORKERS", "8"))),
+            default_platform_limit=max(1, int(os.getenv("MUSIC_AGENT_JOB_PLATFORM_LIMIT", "4"))),
+            platform_limits=limits,
+            keep_finished=int(os.getenv("MUSIC_AGENT_JOB_HISTORY", "200")),
+        )
+
+
+def _accepts(func: Callable, name: str) -> bool:
+    """Whether a callable declares a named parameter."""
+    try:
+        return name in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class JobManager:
+    """Shared worker pool for background research and download jobs."""
+
+    def __init__(self, config: Optional[JobConfig] = None, runtime: Optional[AsyncRuntime] = None):
+        """
+        Initialize the job manager.
+
+        Args:
+            config: Pool configuration (defaults to environment)
+            runtime: Runtime whose loop schedules jobs (defaults to the shared one)
+        """
+        self.config = config or JobConfig.from_env()
+        self.runtime = runtime or get_runtime()
+
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="music-agent-job"
+        )
+
+        # Created on the runtime loop by the first job that needs them
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._platforms: Dict[str, asyncio.Semaphore] = {}
+
+    def platform_limit(self, platform: str) -> int:
+        """Concurrent jobs allowed for a platform."""
+        return self.config.platform_limits.get(platform, self.config.default_platform_limit)
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[..., Any],
+        *args,
+        platform: Optional[str] = None,
+        platforms: Optional[Sequence[str]] = None,
+        description: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Queue a job (callable from any thread).
+
+        ``func`` may be a coroutine function or a plain function; plain
+        functions run in the job thread pool. If it declares a ``job``
+        parameter, it receives the ``Job`` to report progress on.
+
+        Args:
+            kind: Job type (e.g. "research", "download", "chat")
+            func: Work to run
+            *args: Positional arguments for ``func``
+            platform: Platform to count against its concurrency limit
+            platforms: Platforms whose limits the job counts against, all at
+                once (defaults to ``platform``)
+            description: Short label for listings
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Job ID
+        """
+        job = Job(
+            id=uuid.uuid4().hex[:8],
+            kind=kind,
+            description=description or kind,
+            platform=platform.lower() if platform else None,
+        )
+        if platforms is None:
+            platforms = [platform] if platform else []
+        job.platforms = sorted({name.lower() for name in platforms})
+        if _accepts(func, "job"):
+            kwargs["job"] = job
+
+        with self._lock:
+            self._jobs[job.id] = job
+        job._future = self.runtime.submit(self._run(job, func, args, kwargs))
+
+        logger.info(f"Queued {kind} job {job.id}: {job.description}")
+        return job.id
+
+    async def _run(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]):
+        """Wait for a worker and platform slot, then run the job."""
+        if self._workers is None:
+            self._workers = asyncio.Semaphore(self.config.max_workers)
+        slots = []
+        for platform in job.platforms:
+            slot = self._platforms.get(platform)
+            if slot is None:
+                slot = self._platforms[platform] = asyncio.Semaphore(self.platform_limit(platform))
+            slots.append(slot)
+
+        try:
+            # Platform slots first, so jobs stuck behind a busy platform don't
+            # hold workers; always in name order, so multi-platform jobs can't
+            # deadlock each other
+            async with AsyncExitStack() as stack:
+                for slot in slots:
+                    await stack.enter_async_context(slot)
+                async with self._workers:
+                    job.raise_if_cancelled()
+                    job.status = JobStatus.RUNNING
+                    job.started_at = time.time()
+
+                    if inspect.iscoroutinefunction(func):
+                        result = await func(*args, **kwargs)
+                    else:
+                        result = await self._run_thread(func, args, kwargs)
+
+            job.result = result
+            job.status = JobStatus.COMPLETED
+
+        except (asyncio.CancelledError, JobCancelled):
+            job._cancel.set()
+            job.status = JobStatus.CANCELLED
+
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+
+        finally:
+            job.finished_at = time.time()
+            self._prune()
+
+        return job.result
+
+    async def run_in_executor(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a plain function in the job thread pool.
+
+        For the blocking steps of coroutine jobs, so they share the pool's
+        worker limit instead of using the loop's default executor.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _run_thread(self, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Run a plain function in the pool; on cancellation, wait for its thread before raising."""
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(work)
+        except asyncio.CancelledError:
+            while not work.done():
+                try:
+                    await asyncio.shield(work)
+                except asyncio.CancelledError:
+                    continue
+                except Exception:
+                    break
+            if not work.cancelled():
+                work.exception()  # Mark it retrieved; the result is discarded
+            raise
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond ``keep_finished``."""
+        with self._lock:
+            finished = [job for job in self._jobs.values() if job.done]
+            excess = len(finished) - self.config.keep_finished
+            if excess > 0:
+                for job in sorted(finished, key=lambda j: j.finished_at or 0)[:excess]:
+                    del self._jobs[job.id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job ID (a unique prefix is enough)
+
+        Returns:
+            The job, or None if unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None and job_id:
+                matches = [j for key, j in self._jobs.items() if key.startswith(job_id)]
+                job = matches[0] if len(matches) == 1 else None
+        return job
+
+    def list_jobs(self, status: Optional[JobStatus] = None, kind: Optional[str] = None) -> List[Job]:
+        """
+        List jobs, newest first.
+
+        Args:
+            status: Only jobs in this state
+            kind: Only jobs of this type
+
+        Returns:
+            Matching jobs
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return sorted(
+            (j for j in jobs if (status is None or j.status == status) and (kind is None or j.kind == kind)),
+            key=lambda j: j.created_at,
+            reverse=True
+        )
+
+    def updates(self, job_id: str, since: int = 0) -> List[JobUpdate]:
+        """
+        Get a job's progress updates after a sequence number.
+
+        Args:
+            job_id: Job ID
+            since: Last sequence number already seen
+
+        Returns:
+            Newer updates (empty if the job is unknown)
+        """
+        job = self.get(job_id)
+        return job.updates_since(since) if job else []
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            True if the job was still active
+        """
+        job = self.get(job_id)
+        if job is None or job.done:
+            return False
+
+        job._cancel.set()
+        if job._future is not None:
+            job._future.cancel()
+        logger.info(f"Cancelled job {job.id}")
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        Block until a job finishes.
+
+        Args:
+            job_id: Job ID
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            The job (check ``done``; it may still be running after a timeout)
+        """
+        job = self.get(job_id)
+        if job is None or job._future is None:
+            return job
+        try:
+            job._future.result(timeout)
+        except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+            pass
+
+        # A cancelled future resolves before the task records its final state
+        deadline = time.time() + 1.0
+        while job.cancelled and not job.done and time.time() < deadline:
+            time.sleep(0.01)
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Job counts by status and the configured limits
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {status.value: 0 for status in JobStatus}
+        for job in jobs:
+            counts[job.status.value] += 1
+        return {
+            "jobs": counts,
+            "max_workers": self.config.max_workers,
+            "platform_limits": dict(self.config.platform_limits),
+            "default_platform_limit": self.config.default_platform_limit,
+        }
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        Cancel active jobs and stop the thread pool.
+
+        Args:
+            timeout: Seconds to wait for cancelled jobs to settle
+        """
+        active = [job for job in self.list_jobs() if not job.done]
+        for job in active:
+            self.cancel(job.id)
+        deadline = time.time() + timeout
+        for job in active:
+            self.wait(job.id, max(0.0, deadline - time.time()))
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global job manager instance
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Get the process-wide job manager."""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+            atexit.register(_job_manager.shutdown)
+        return _job_manager
+
+
+__all__ = [
+    "Job",
+    "JobCancelled",
+    "JobConfig",
+    "JobManager",
+    "JobStatus",
+    "JobUpdate",
+    "get_job_manager",
+]
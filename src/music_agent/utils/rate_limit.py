@@ -0,0 +1,193 @@
+"""
+Async rate budgeting shared by the asyncio integration clients.
+"""
+
+import asyncio
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Tokens refill continuously at ``rate`` per ``period`` seconds up to
+    ``burst``. An optional ``max_concurrency`` additionally bounds the number
+    of requests in flight, so a budget can be shared by many concurrent tasks
+    without any of them blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Requests allowed per period
+            period: Period length in seconds
+            burst: Maximum tokens that can accumulate (defaults to 1)
+            max_concurrency: Optional cap on requests in flight
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.period = period
+        self.burst = max(1, burst or 1)
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between tokens at the steady-state rate."""
+        return self.period / self.rate
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed / self.interval)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) * self.interval
+                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while.
+
+        Used when the server signals throttling (429/503, Retry-After).
+
+        Args:
+            seconds: Delay before the next request is allowed
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def set_available(self, remaining: int) -> None:
+        """
+        Clamp local tokens to a server-reported remaining budget.
+
+        Args:
+            remaining: Requests the server says are left in its window
+        """
+        self._tokens = min(self._tokens, float(max(0, remaining)))
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        if self._semaphore:
+            await self._semaphore.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            if self._semaphore:
+                self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._semaphore:
+            self._semaphore.release()
+
+
+
+class TokenBudget:
+    """
+    Tokens-per-minute budget for LLM requests.
+
+    A request reserves its estimated token cost before it is sent and
+    settles the difference once the actual usage is known, so a burst of
+    concurrent requests cannot overshoot the per-minute allowance by more
+    than the estimation error. Overspending leaves the budget in debt,
+    which delays later requests until it has refilled.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        """
+        Initialize token budget.
+
+        Args:
+            tokens_per_minute: Allowance refilled continuously over a minute
+        """
+        if tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        """Tokens available right now (negative when in debt)."""
+        self._refill(time.monotonic())
+        return self._available
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._available = min(self.capacity, self._available + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until ``tokens`` can be spent, then reserve them.
+
+        Requests larger than the whole allowance wait for a full budget.
+
+        Args:
+            tokens: Estimated token cost
+        """
+        needed = min(float(tokens), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill(time.monotonic())
+                if self._available >= needed:
+                    self._available -= tokens
+                    return
+
+                wait_time = (needed - self._available) / self.rate
+                logger.debug(f"Token budget exhausted, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+    def settle(self, reserved: int, used: int) -> None:
+        """
+        Correct a reservation with the actual usage.
+
+        Args:
+            reserved: Tokens reserved by ``acquire``
+            used: Tokens the request actually consumed
+        """
+        self._refill(time.monotonic())
+        self._available = min(self.capacity, self._available + reserved - used)
+
+
+__all__ = ["AsyncRateLimiter", "TokenBudget"]
@@ -0,0 +1,277 @@
+"""
+Persistent background event loop for the synchronous tool wrappers.
+
+Strands ``@tool`` functions are synchronous, so the integration tools used to
+wrap every coroutine in ``asyncio.run``. That creates and tears down an event
+loop per call, which strands any cached client (aiohttp sessions, the shared
+HTTP pool, the Soulseek discovery instance) on a dead loop and forces
+connections to be rebuilt on every agent turn.
+
+``AsyncRuntime`` runs one long-lived loop in a daemon thread. Integration
+clients are created on, and owned by, that loop, and ``run_sync`` submits
+coroutines to it from any thread with an optional timeout; a timed-out or
+interrupted call cancels the underlying task. Download tools use
+``download_timeout`` instead of the tool timeout, since a large file or a
+queued Soulseek transfer can take far longer.
+"""
+
+import os
+import asyncio
+import atexit
+import inspect
+import logging
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+ClientFactory = Callable[[], Union[T, Awaitable[T]]]
+
+
+def _default_timeout() -> Optional[float]:
+    """Tool call timeout from the environment (0 disables it)."""
+    timeout = float(os.getenv("MUSIC_AGENT_TOOL_TIMEOUT", "300"))
+    return timeout if timeout > 0 else None
+
+
+def download_timeout() -> float:
+    """Download tool timeout from the environment (0, the default, waits indefinitely)."""
+    return max(0.0, float(os.getenv("MUSIC_AGENT_DOWNLOAD_TIMEOUT", "0")))
+
+
+class AsyncRuntime:
+    """Long-lived event loop thread that owns the integration clients."""
+
+    def __init__(self, name: str = "music-agent-runtime", default_timeout: Optional[float] = None):
+        """
+        Initialize runtime (the loop thread starts on first use).
+
+        Args:
+            name: Thread name
+            default_timeout: Timeout for ``run_sync`` calls that don't pass one
+        """
+        self.name = name
+        self.default_timeout = default_timeout if default_timeout is not None else _default_timeout()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # Clients owned by the loop, created once per name
+        self._clients: Dict[str, Any] = {}
+        self._client_locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop (starting it if needed)."""
+        return self.start()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread if it is not already running.
+
+        Returns:
+            The runtime's event loop
+        """
+        with self._start_lock:
+            if self.running and self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._clients.clear()
+            self._client_locks.clear()
+            logger.debug(f"Started background event loop '{self.name}'")
+            return loop
+
+    def in_runtime_thread(self) -> bool:
+        """Whether the caller is running on the runtime's loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the runtime loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Thread-safe future for the result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the runtime loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (defaults to ``default_timeout``; 0
+                waits indefinitely)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the call did not finish in time (it is cancelled)
+            RuntimeError: If called from the runtime loop itself
+        """
+        if self.in_runtime_thread():
+            coro.close()
+            raise RuntimeError("run_sync() cannot be called from the runtime loop; await the coroutine instead")
+
+        if timeout is None:
+            timeout = self.default_timeout
+        elif timeout <= 0:
+            timeout = None
+        future = self.submit(coro)
+
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Operation timed out after {timeout}s")
+        except BaseException:
+            # KeyboardInterrupt etc.: don't leave the task running
+            future.cancel()
+            raise
+
+    async def get_client(self, name: str, factory: ClientFactory) -> Any:
+        """
+        Get a named client owned by the runtime, creating it on first use.
+
+        Must be awaited on the runtime loop (i.e. inside a coroutine passed
+        to ``run_sync``). Concurrent first calls share one creation.
+
+        Args:
+            name: Client name
+            factory: Callable returning the client (or an awaitable of it)
+
+        Returns:
+            The client instance
+        """
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        lock = self._client_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            client = self._clients.get(name)
+            if client is None:
+                client = factory()
+                if inspect.isawaitable(client):
+                    client = await client
+                self._clients[name] = client
+        return client
+
+    async def _close_clients(self) -> None:
+        """Close owned clients and the shared HTTP pool on the runtime loop."""
+        for name, client in list(self._clients.items()):
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Failed to close runtime client '{name}': {e}")
+        self._clients.clear()
+
+        from .http import get_http_manager
+        await get_http_manager().close()
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Close owned clients, cancel pending tasks and stop the loop thread.
+
+        Args:
+            timeout: Seconds to wait for cleanup
+        """
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None or not thread.is_alive():
+                return
+
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_clients(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Runtime cleanup failed: {e}")
+
+            async def cancel_pending():
+                current = asyncio.current_task()
+                tasks = [t for t in asyncio.all_tasks() if t is not current]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Failed to cancel pending runtime tasks: {e}")
+
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+
+            self._loop = None
+            self._thread = None
+            logger.debug(f"Stopped background event loop '{self.name}'")
+
+
+# Global runtime instance
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """Get the process-wide runtime."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime()
+            atexit.register(_runtime.shutdown)
+        return _runtime
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the shared runtime loop from synchronous code.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait (defaults to ``MUSIC_AGENT_TOOL_TIMEOUT``;
+            0 waits indefinitely)
+
+    Returns:
+        The coroutine's result
+    """
+    return get_runtime().run_sync(coro, timeout)
+
+
+__all__ = [
+    "AsyncRuntime",
+    "download_timeout",
+    "get_runtime",
+    "run_sync",
+]
@@ -0,0 +1,267 @@
+"""
+Off-loop tag writing for downloaded files.
+
+Saving tags with mutagen is blocking file I/O, and when the new tags do not
+fit in the space reserved at the start of the file, the whole file is
+rewritten. ``TagWriter`` moves that work to a bounded thread pool so
+downloads running on the event loop are never stalled by it.
+
+Tag changes are described as edit functions applied to the loaded mutagen
+file. Edits queued for the same file before its save starts are applied
+together and saved once, and saves reserve padding so later edits (cue
+points, BPM/key analysis, replaced artwork) fit in place instead of
+rewriting the audio.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    mutagen = None
+    MUTAGEN_AVAILABLE = False
+
+# Applies tag changes to a loaded mutagen file (runs in a worker thread)
+TagEdit = Callable[[Any], None]
+
+
+@dataclass
+class TagWriterConfig:
+    """Tag writer configuration."""
+
+    max_workers: int = 4  # Files saved at once
+    padding: int = 16 * 1024  # Bytes reserved for later edits when a file is rewritten
+
+    @classmethod
+    def from_env(cls) -> "TagWriterConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            max_workers=int(os.getenv("TAG_WRITER_WORKERS", "4")),
+            padding=int(os.getenv("TAG_PADDING_BYTES", str(16 * 1024))),
+        )
+
+
+@dataclass
+class TagWriterStats:
+    """Tag writing counters."""
+
+    edits: int = 0
+    saves: int = 0
+    failures: int = 0
+    save_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary with derived values."""
+        return {
+            **self.__dict__,
+            "coalesced": self.edits - self.saves - self.failures,
+            "avg_save_ms": round(self.save_time / self.saves * 1000, 2) if self.saves else 0.0,
+        }
+
+
+def ensure_tags(audio: Any) -> Any:
+    """
+    Get a file's tag container, creating an empty one if it has none.
+
+    Args:
+        audio: Loaded mutagen file
+
+    Returns:
+        The file's tags
+    """
+    if audio.tags is None:
+        audio.add_tags()
+    return audio.tags
+
+
+class TagWriter:
+    """
+    Bounded thread pool that applies tag edits, one save per file.
+
+    Edits for a file are serialized: while a file is being saved, new
+    edits for it wait and are applied together in its next save.
+    """
+
+    def __init__(self, config: Optional[TagWriterConfig] = None):
+        """
+        Initialize tag writer.
+
+        Args:
+            config: Tag writer configuration (defaults to environment)
+        """
+        self.config = config or TagWriterConfig.from_env()
+        self.stats = TagWriterStats()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_workers),
+            thread_name_prefix="tag-writer"
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Tuple[TagEdit, Future]]] = {}
+        self._running: Set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether mutagen is available."""
+        return MUTAGEN_AVAILABLE
+
+    def _padding(self, info) -> int:
+        """
+        Padding policy for saves.
+
+        Keeps whatever padding is left when the tags still fit (no
+        rewrite), and reserves the configured amount when they don't.
+        """
+        if info.padding >= 0:
+            return info.padding
+        return self.config.padding
+
+    def submit(self, path: Union[str, Path], edit: TagEdit) -> Future:
+        """
+        Queue a tag edit for a file.
+
+        Args:
+            path: Audio file
+            edit: Function applying tag changes to the loaded file
+
+        Returns:
+            Future resolving to True once the edit is saved
+        """
+        if not MUTAGEN_AVAILABLE:
+            raise ImportError("mutagen is required for tag writing: pip install mutagen")
+
+        key = os.path.abspath(path)
+        future: Future = Future()
+        with self._lock:
+            self.stats.edits += 1
+            batch = self._pending.setdefault(key, [])
+            batch.append((edit, future))
+            if len(batch) == 1 and key not in self._running:
+                self._executor.submit(self._run, key)
+        return future
+
+    async def update(self, path: Union[str, Path], edit: TagEdit) -> bool:
+        """
+        Apply a tag edit off the event loop.
+
+        Args:
+            path: Audio file
+            edit: Function applying tag changes to the loaded file
+
+        Returns:
+            True once the edit is saved
+
+        Raises:
+            Exception: Whatever loading, the edit or saving raised
+        """
+        return await asyncio.wrap_future(self.submit(path, edit))
+
+    def update_sync(self, path: Union[str, Path], edit: TagEdit) -> bool:
+        """Blocking ``update`` for synchronous callers."""
+        return self.submit(path, edit).result()
+
+    def _run(self, key: str) -> None:
+        """Apply and save every edit queued for a file."""
+        with self._lock:
+            batch = self._pending.pop(key, [])
+            self._running.add(key)
+        try:
+            self._apply(key, batch)
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                # Edits that arrived during the save get their own
+                if key in self._pending:
+                    self._executor.submit(self._run, key)
+
+    def _apply(self, key: str, batch: List[Tuple[TagEdit, Future]]) -> None:
+        """Load a file once, apply the edits in order and save once."""
+        try:
+            audio = mutagen.File(key)
+            if audio is None:
+                raise ValueError(f"Unsupported audio file: {key}")
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        applied = []
+        for edit, future in batch:
+            try:
+                edit(audio)
+                applied.append(future)
+            except Exception as e:
+                logger.warning(f"Tag edit failed for {key}: {e}")
+                with self._lock:
+                    self.stats.failures += 1
+                future.set_exception(e)
+
+        if not applied:
+            return
+
+        start = time.perf_counter()
+        try:
+            audio.save(padding=self._padding)
+        except Exception as e:
+            self._fail([(None, future) for future in applied], e)
+            return
+
+        with self._lock:
+            self.stats.saves += 1
+            self.stats.save_time += time.perf_counter() - start
+        for future in applied:
+            future.set_result(True)
+
+    def _fail(self, batch: List[Tuple[Optional[TagEdit], Future]], error: Exception) -> None:
+        logger.warning(f"Failed to write tags: {error}")
+        with self._lock:
+            self.stats.failures += len(batch)
+        for _, future in batch:
+            future.set_exception(error)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tag writing statistics.
+
+        Returns:
+            Edit, save and failure counts, coalesced edits and save time
+        """
+        with self._lock:
+            return self.stats.to_dict()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+
+# Shared by all download managers, so the pool bound holds process-wide
+_tag_writer: Optional[TagWriter] = None
+
+
+def get_tag_writer() -> TagWriter:
+    """Get or create the global tag writer."""
+    global _tag_writer
+    if _tag_writer is None:
+        _tag_writer = TagWriter()
+    return _tag_writer
+
+
+__all__ = [
+    "MUTAGEN_AVAILABLE",
+    "TagEdit",
+    "TagWriter",
+    "TagWriterConfig",
+    "TagWriterStats",
+    "ensure_tags",
+    "get_tag_writer",
+]